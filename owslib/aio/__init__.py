@@ -0,0 +1,12 @@
+"""
+Asynchronous (asyncio) API for OGC web services.
+
+The modules of this package mirror the synchronous ones (wms, wfs, wmts,
+csw, wcs, ogcapi).  Their factories are coroutines that fetch the
+capabilities document without blocking the event loop, and the data
+requests (getmap, getfeature, gettile, getrecords2, getCoverage and the
+OGC API endpoints) are coroutines too.  Parsing is shared with the
+synchronous classes.
+
+Requires the aiohttp package.
+"""
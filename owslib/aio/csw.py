@@ -0,0 +1,98 @@
+""" Asynchronous CSW request and response processor """
+
+from urllib.parse import urlencode
+
+from owslib import csw
+from owslib.aio.util import openURL, http_post
+from owslib.csw import namespaces, outputformat
+from owslib.util import bind_url
+
+
+async def CatalogueServiceWeb(url, lang='en-US', version='2.0.2', timeout=10, skip_caps=False,
+                              username=None, password=None, auth=None, session=None):
+    """
+
+    Construct an AsyncCatalogueServiceWeb and asynchronously process a GetCapabilities request
+
+    Parameters
+    ----------
+
+    - url: the URL of the CSW
+    - lang: the language (default is 'en-US')
+    - version: version (default is '2.0.2')
+    - timeout: timeout in seconds
+    - skip_caps: whether to skip GetCapabilities processing (default is False)
+    - username: username for HTTP basic authentication
+    - password: password for HTTP basic authentication
+    - auth: instance of owslib.util.Authentication
+    - session: aiohttp.ClientSession to send requests with (default is the shared session)
+
+    """
+
+    service = AsyncCatalogueServiceWeb(url, lang=lang, version=version, timeout=timeout, skip_caps=True,
+                                       username=username, password=password, auth=auth)
+    service.aio_session = session
+
+    if not skip_caps:
+        await service.getcapabilities()
+
+    return service
+
+
+class AsyncCatalogueServiceWeb(csw.CatalogueServiceWeb):
+    """ csw request class with asynchronous GetCapabilities and GetRecords requests """
+
+    aio_session = None
+
+    async def getcapabilities(self):
+        """
+
+        Construct and process a GetCapabilities request
+
+        """
+
+        data = {'service': self.service, 'version': self.version, 'request': 'GetCapabilities'}
+
+        self.request = urlencode(data)
+
+        await self._ainvoke('getcapabilities')
+
+        if self.exceptionreport is None:
+            self._parsecapabilities()
+
+    async def getrecords2(self, constraints=[], sortby=None, typenames='csw:Record', esn='summary',
+                          outputschema=namespaces['csw'], format=outputformat, startposition=0,
+                          maxrecords=10, cql=None, xml=None, resulttype='results'):
+        """
+
+        Construct and process a GetRecords request, see CatalogueServiceWeb.getrecords2
+
+        """
+
+        esn, outputschema = self._getrecords2_request(
+            constraints=constraints, sortby=sortby, typenames=typenames, esn=esn, outputschema=outputschema,
+            format=format, startposition=startposition, maxrecords=maxrecords, cql=cql, xml=xml,
+            resulttype=resulttype)
+
+        await self._ainvoke('getrecords')
+
+        if self.exceptionreport is None:
+            self._parsesearchresults(outputschema, esn)
+
+    async def _ainvoke(self, caller):
+        # do HTTP request
+
+        request_url = self._request_url(caller)
+
+        if isinstance(self.request, str):  # GET KVP
+            self.request = '%s%s' % (bind_url(request_url), self.request)
+            u = await openURL(self.request, None, 'Get', timeout=self.timeout, auth=self.auth,
+                              session=self.aio_session)
+            self.response = u.read()
+        else:
+            self._prepare_request()
+
+            self.response = await http_post(request_url, self.request, self.lang, self.timeout, auth=self.auth,
+                                            session=self.aio_session)
+
+        self._parse_response()
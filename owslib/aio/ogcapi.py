@@ -0,0 +1,187 @@
+"""
+Asynchronous API for OGC API - Features
+"""
+
+import asyncio
+import logging
+from typing import AsyncIterator
+
+from owslib.aio.util import http_get
+from owslib.ogcapi import REQUEST_HEADERS, features
+from owslib.util import Authentication
+
+LOGGER = logging.getLogger(__name__)
+
+
+async def Features(url: str, json_: str = None, timeout: int = 30,
+                   headers: dict = None, auth: Authentication = None,
+                   session=None):
+    """
+    Asynchronously fetch the landing page of an OGC API - Features service
+
+    @type url: string
+    @param url: url of OGC API landing page document
+    @type json_: string
+    @param json_: json object
+    @param headers: HTTP headers to send with requests
+    @param timeout: time (in seconds) after which requests should timeout
+    @param auth: instance of owslib.util.Authentication
+    @param session: aiohttp.ClientSession to send requests with
+                    (default is the shared session)
+
+    @returns: `owslib.aio.ogcapi.AsyncFeatures`
+    """
+
+    if json_ is None:
+        request_headers = dict(REQUEST_HEADERS, **(headers or {}))
+        response = await http_get(url, headers=request_headers, auth=auth, timeout=timeout,
+                                  session=session)
+        json_ = response.text
+
+    api = AsyncFeatures(url, json_, timeout, headers, auth)
+    api.aio_session = session
+    return api
+
+
+class AsyncFeatures(features.Features):
+    """
+    Abstraction for OGC API - Features, with asynchronous requests
+
+    The endpoint methods (conformance, collections, collection,
+    collection_queryables, collection_items, collection_item) return
+    awaitables, and iter_collection_items an asynchronous iterator.
+    Streamed responses (collection_items_stream) are not supported.
+    """
+
+    aio_session = None
+
+    async def feature_collections(self) -> list:
+        """
+        implements /collections filtered on features
+
+        @returns: `list` of filtered collection identifiers
+        """
+
+        features_ = []
+        collections_ = await self.collections()
+
+        for c_ in collections_['collections']:
+            if 'itemType' in c_ and c_['itemType'].lower() == 'feature':
+                features_.append(c_['id'])
+
+        return features_
+
+    async def iter_collection_items(self, collection_id: str, limit: int = 1000,
+                                    max_features: int = None, prefetch: bool = True,
+                                    stream: bool = False, **kwargs: dict) -> AsyncIterator[dict]:
+        """
+        implements /collection/{collectionId}/items, asynchronously iterating
+        over the features of all pages
+
+        Pages are followed as in owslib.ogcapi.features.Features.iter_collection_items;
+        use ``async for`` to iterate.
+
+        @type collection_id: string
+        @param collection_id: id of collection
+        @type limit: int
+        @param limit: page size (number of features per request)
+        @type max_features: int
+        @param max_features: maximum number of features to return
+                             (default is all features)
+        @type prefetch: bool
+        @param prefetch: whether to request the next page while the features
+                         of the current page are consumed (default True)
+        @type stream: bool
+        @param stream: not supported: must be False
+        @param kwargs: further parameters of collection_items (bbox, datetime,
+                       startindex, q, ...)
+
+        @returns: asynchronous generator of features
+        """
+
+        if stream:
+            raise NotImplementedError('Streamed responses are not supported by the asynchronous API')
+        if 'bbox' in kwargs:
+            kwargs['bbox'] = ','.join(kwargs['bbox'])
+        if max_features is not None:
+            limit = min(limit, max_features)
+        kwargs['limit'] = limit
+
+        path = 'collections/{}/items'.format(collection_id)
+        page = (self._build_url(path), kwargs)
+        count = 0
+
+        task = None
+        try:
+            response = await self._request(url=page[0], kwargs=page[1])
+            while True:
+                features = response.get('features', [])
+                next_page = self._next_page(response, page, count + len(features), len(features), limit)
+                if max_features is not None and count + len(features) >= max_features:
+                    next_page = None
+
+                if prefetch and next_page is not None:
+                    task = asyncio.ensure_future(self._request(url=next_page[0], kwargs=next_page[1]))
+
+                for feature in features:
+                    if max_features is not None and count >= max_features:
+                        return
+                    count += 1
+                    yield feature
+
+                if next_page is None:
+                    return
+                if task is not None:
+                    response, task = await task, None
+                else:
+                    response = await self._request(url=next_page[0], kwargs=next_page[1])
+                page = next_page
+        finally:
+            if task is not None:
+                task.cancel()
+
+    def collection_items_stream(self, collection_id: str, **kwargs: dict):
+        """
+        not supported by the asynchronous API: use iter_collection_items
+        """
+
+        raise NotImplementedError('Streamed responses are not supported by the asynchronous API')
+
+    def _request_stream(self, path: str = None, kwargs: dict = {}, url: str = None):
+        raise NotImplementedError('Streamed responses are not supported by the asynchronous API')
+
+    async def _request(self, path: str = None, as_dict: bool = True,
+                       kwargs: dict = {}, url: str = None) -> dict:
+        """
+        helper coroutine for request/response patterns against OGC API endpoints
+
+        @type path: string
+        @param path: path of request
+        @type as_dict: bool
+        @param as_dict: whether to return JSON dict (default True)
+        @type kwargs: string
+        @param kwargs: ``dict`` of keyword value pair request parameters
+        @type url: string
+        @param url: absolute URL to request instead of path (e.g. a link href)
+
+        @returns: response as JSON ``dict``
+        """
+
+        if url is None:
+            url = self._build_url(path)
+
+        LOGGER.debug('Request: {}'.format(url))
+        LOGGER.debug('Params: {}'.format(kwargs))
+
+        response = await http_get(url, params=kwargs, headers=self.headers, auth=self.auth,
+                                  timeout=self.timeout, session=self.aio_session)
+
+        LOGGER.debug('URL: {}'.format(response.url))
+
+        if response.status_code != 200:
+            raise RuntimeError(response.text)
+
+        if as_dict:
+            return response.json()
+        else:
+            return response.content
@@ -0,0 +1,317 @@
+"""
+Asynchronous HTTP transport for the owslib.aio API, built on aiohttp.
+
+Mirrors openURL, http_get and http_post of owslib.util, including the
+OGC service exception checks, so that responses can be handed to the
+synchronous parsing code unchanged.
+"""
+
+import asyncio
+import json
+import ssl
+import weakref
+from urllib.parse import urlencode, urlsplit
+
+from requests.utils import requote_uri
+
+from owslib.etree import etree, ParseError
+from owslib.util import (Authentication, ServiceException, bind_url, check_service_exception, log,
+                         remote_metadata_requests, set_remote_metadata)
+
+try:
+    import aiohttp
+    from yarl import URL
+except ImportError:
+    aiohttp = None
+
+# defaults for the shared aiohttp session
+AIO_LIMIT = 100  # total number of simultaneous connections
+AIO_LIMIT_PER_HOST = 10  # number of simultaneous connections per host
+
+# one shared session per event loop, as aiohttp sessions are bound to the loop they were created in
+_sessions = weakref.WeakKeyDictionary()
+
+
+def _require_aiohttp():
+    if aiohttp is None:
+        raise ImportError('owslib.aio requires the aiohttp package')
+
+
+def create_session(limit=AIO_LIMIT, limit_per_host=AIO_LIMIT_PER_HOST, **kwargs):
+    """
+    Create an aiohttp ClientSession with a bounded connection pool.
+
+    Must be called from a running event loop.
+
+    :param limit: total number of simultaneous connections
+    :param limit_per_host: number of simultaneous connections to the same host
+    :param kwargs: extra keyword arguments for aiohttp.ClientSession
+    """
+
+    _require_aiohttp()
+    connector = aiohttp.TCPConnector(limit=limit, limit_per_host=limit_per_host)
+    return aiohttp.ClientSession(connector=connector, **kwargs)
+
+
+def get_session(session=None):
+    """
+    Return the given session, or the shared session of the running event loop.
+
+    The shared session is created on first use; close it with close_session.
+
+    :param session: (optional) aiohttp.ClientSession to use instead of the shared one
+    """
+
+    if session is not None:
+        return session
+
+    loop = asyncio.get_running_loop()
+    shared = _sessions.get(loop)
+    if shared is None or shared.closed:
+        shared = _sessions[loop] = create_session()
+    return shared
+
+
+async def close_session():
+    """Close the shared session of the running event loop, if any"""
+
+    shared = _sessions.pop(asyncio.get_running_loop(), None)
+    if shared is not None:
+        await shared.close()
+
+
+class ResponseWrapper(object):
+    """
+    Return object type from openURL and http_get.
+
+    Holds the fully read body of an aiohttp response, so it can be used in
+    place of owslib.util.ResponseWrapper and of a requests response.
+    """
+    def __init__(self, response, content):
+        self._response = response
+        self._content = content
+
+    def info(self):
+        return self._response.headers
+
+    def read(self):
+        return self._content
+
+    def geturl(self):
+        return str(self._response.url).replace('&&', '&')
+
+    @property
+    def status_code(self):
+        return self._response.status
+
+    @property
+    def url(self):
+        return str(self._response.url)
+
+    @property
+    def headers(self):
+        return self._response.headers
+
+    @property
+    def content(self):
+        return self._content
+
+    @property
+    def text(self):
+        return self._content.decode(self._response.charset or 'utf-8', errors='replace')
+
+    def json(self):
+        return json.loads(self._content)
+
+    def raise_for_status(self):
+        self._response.raise_for_status()
+
+
+def _ssl(cert=None, verify=True):
+    """Return the aiohttp ssl argument for a client certificate and a verify setting"""
+
+    if verify is False:
+        return False
+    if isinstance(verify, str) or cert:
+        context = ssl.create_default_context(cafile=verify if isinstance(verify, str) else None)
+        if isinstance(cert, (tuple, list)):
+            context.load_cert_chain(*cert)
+        elif cert:
+            context.load_cert_chain(cert)
+        return context
+    return True
+
+
+async def _request(method, url, session=None, auth=None, verify=None, timeout=30, **kwargs):
+    """Send a request and read the response body, returning a ResponseWrapper"""
+
+    _require_aiohttp()
+
+    auth = auth or Authentication()
+    if auth.username and auth.password:
+        kwargs['auth'] = aiohttp.BasicAuth(auth.username, auth.password)
+    kwargs['ssl'] = _ssl(auth.cert, auth.verify if verify is None else verify)
+    kwargs['timeout'] = aiohttp.ClientTimeout(total=timeout)
+
+    async with get_session(session).request(method, URL(requote_uri(url), encoded=True), **kwargs) as response:
+        content = await response.read()
+    return ResponseWrapper(response, content)
+
+
+async def openURL(url_base, data=None, method='Get', cookies=None, username=None, password=None, timeout=30,
+                  headers=None, verify=True, cert=None, auth=None, session=None):
+    """
+    Coroutine to open URLs, the asynchronous counterpart of owslib.util.openURL.
+
+    Takes the same arguments, except session, which is an aiohttp.ClientSession
+    (default is the shared session of the running event loop, see get_session).
+    The response body is read completely before it is returned.
+    """
+
+    headers = dict(headers) if headers is not None else {}
+    rkwargs = {}
+
+    if auth:
+        if username:
+            auth.username = username
+        if password:
+            auth.password = password
+        if cert:
+            auth.cert = cert
+        verify = verify and auth.verify
+    else:
+        auth = Authentication(username, password, cert, verify)
+
+    # FIXUP for WFS in particular, remove xml style namespace
+    method = method.split("}")[-1]
+
+    url = url_base
+    if method.lower() == 'post':
+        try:
+            etree.fromstring(data)
+            headers['Content-Type'] = 'text/xml'
+        except (ParseError, UnicodeEncodeError):
+            pass
+
+        rkwargs['data'] = data
+
+    elif method.lower() == 'get':
+        if isinstance(data, dict):
+            data = urlencode(data)
+        if data:
+            url = bind_url(url_base) + data
+
+    else:
+        raise ValueError("Unknown method ('%s'), expected 'get' or 'post'" % method)
+
+    if cookies is not None:
+        rkwargs['cookies'] = cookies
+
+    u = await _request(method.upper(), url, session=session, auth=auth, verify=verify, timeout=timeout,
+                       headers=headers, **rkwargs)
+
+    if u.status_code in [400, 401]:
+        raise ServiceException(u.text)
+
+    if u.status_code in [404, 500, 502, 503, 504]:    # add more if needed
+        u.raise_for_status()
+
+    # check for service exceptions without the http header set
+    check_service_exception(u.info(), u.read())
+
+    return u
+
+
+async def http_post(url=None, request=None, lang='en-US', timeout=10, username=None, password=None, auth=None,
+                    session=None):
+    """
+
+    Coroutine to invoke an HTTP POST request, the asynchronous counterpart of owslib.util.http_post
+
+    Parameters
+    ----------
+
+    - url: the URL of the server
+    - request: the request message
+    - lang: the language
+    - timeout: timeout in seconds
+    - session: aiohttp.ClientSession to use (default is the shared session of the running event loop)
+
+    """
+
+    if url is None:
+        raise ValueError("URL required")
+
+    u = urlsplit(url)
+
+    headers = {
+        'User-Agent': 'OWSLib (https://geopython.github.io/OWSLib)',
+        'Content-type': 'text/xml',
+        'Accept': 'text/xml',
+        'Accept-Language': lang,
+        'Accept-Encoding': 'gzip,deflate',
+        'Host': u.netloc,
+    }
+
+    if auth:
+        if username:
+            auth.username = username
+        if password:
+            auth.password = password
+    else:
+        auth = Authentication(username, password)
+
+    up = await _request('POST', url, session=session, auth=auth, timeout=timeout, data=request, headers=headers)
+    return up.content
+
+
+async def http_get(url, params=None, headers=None, auth=None, timeout=30, session=None):
+    """
+
+    Coroutine to invoke an HTTP GET request, the asynchronous counterpart of owslib.util.http_get
+
+    Parameters
+    ----------
+
+    - url: the URL of the server
+    - params: dict of query parameters
+    - headers: HTTP headers to send with the request
+    - auth: instance of owslib.util.Authentication
+    - timeout: timeout in seconds
+    - session: aiohttp.ClientSession to use (default is the shared session of the running event loop)
+
+    """
+
+    if params:
+        url = bind_url(url) + urlencode(params)
+
+    return await _request('GET', url, session=session, auth=auth, timeout=timeout, headers=headers)
+
+
+async def resolve_remote_metadata(contents, timeout=30, session=None):
+    """
+    Coroutine fetching and parsing the remote metadata of the MetadataURLs of content
+    metadata objects, the asynchronous counterpart of owslib.util.resolve_remote_metadata
+
+    Each URL is fetched once, and the documents are fetched concurrently (bounded by the
+    connection limits of the session).
+
+    :param contents: content metadata objects (e.g. the layers of a WMS)
+    :param timeout: timeout of each request, in seconds
+    :param session: aiohttp.ClientSession to use (default is the shared session of the running event loop)
+    """
+
+    requests_by_url = remote_metadata_requests(contents)
+
+    async def fetch(url, content):
+        try:
+            u = await openURL(url, timeout=timeout, headers=getattr(content, 'headers', None), auth=content.auth,
+                              session=session)
+            return etree.fromstring(u.read())
+        except Exception as err:
+            log.debug('Remote metadata %s could not be fetched: %s', url, err)
+            return None
+
+    docs = await asyncio.gather(*[fetch(url, requesters[0][0]) for url, requesters in requests_by_url.items()])
+    for (url, requesters), doc in zip(requests_by_url.items(), docs):
+        set_remote_metadata(url, requesters, doc)
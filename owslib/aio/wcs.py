@@ -0,0 +1,94 @@
+"""
+Asynchronous API for Web Coverage Server (WCS) methods and metadata.
+"""
+
+from owslib import etree
+from owslib.aio.util import openURL
+from owslib.coverage import wcs100, wcs110, wcs111, wcsBase, wcs200, wcs201
+from owslib.util import clean_ows_url, Authentication
+
+
+async def WebCoverageService(url, version=None, xml=None, cookies=None, timeout=30, auth=None, session=None):
+    ''' asynchronous wcs factory function, returns a version specific WebCoverageService object
+
+    @type url: string
+    @param url: url of WCS service
+    @type version: string
+    @param version: WCS version, read from the capabilities document if None
+    @type xml: string
+    @param xml: elementtree object
+    @param cookies: cookies to send with requests
+    @param timeout: time (in seconds) after which requests should timeout
+    @param auth: instance of owslib.util.Authentication
+    @param session: aiohttp.ClientSession to send requests with (default is the shared session)
+    @return: initialized WebCoverageService object (version dependent)
+    '''
+
+    if not auth:
+        auth = Authentication()
+
+    if xml is None:
+        reader = wcsBase.WCSCapabilitiesReader(version, auth=auth)
+        u = await openURL(reader.capabilities_url(url), cookies=cookies, timeout=timeout, auth=auth,
+                          session=session)
+        xml = u.read()
+
+    if version is None:
+        capabilities = etree.etree.fromstring(xml)
+        version = capabilities.get('version')
+        del capabilities
+
+    clean_url = clean_ows_url(url)
+
+    if version == '1.0.0':
+        cls, url = WebCoverageService_1_0_0, clean_url
+    elif version == '1.1.0':
+        cls = WebCoverageService_1_1_0
+    elif version == '1.1.1':
+        cls = WebCoverageService_1_1_1
+    elif version == '2.0.0':
+        cls = WebCoverageService_2_0_0
+    elif version == '2.0.1':
+        cls = WebCoverageService_2_0_1
+    else:
+        raise NotImplementedError('The WCS version ({}) you requested is not implemented.'.format(version))
+
+    wcs = cls.__new__(cls, url, xml, cookies, auth=auth)
+    wcs.aio_session = session
+    return wcs
+
+
+class AsyncGetCoverage(object):
+    """GetCoverage coroutine for the version specific WebCoverageService classes"""
+
+    aio_session = None
+
+    async def getCoverage(self, timeout=30, **kwargs):
+        """Request and return a coverage from the WCS as a file-like object
+
+        Takes the keyword arguments of the synchronous getCoverage.
+        """
+        base_url, data, method = self._getcoverage_request(**kwargs)
+        u = await openURL(base_url, data, method, self.cookies, auth=self.auth, timeout=timeout,
+                          session=self.aio_session)
+        return u
+
+
+class WebCoverageService_1_0_0(AsyncGetCoverage, wcs100.WebCoverageService_1_0_0):
+    """WebCoverageService 1.0.0 with an asynchronous getCoverage"""
+
+
+class WebCoverageService_1_1_0(AsyncGetCoverage, wcs110.WebCoverageService_1_1_0):
+    """WebCoverageService 1.1.0 with an asynchronous getCoverage"""
+
+
+class WebCoverageService_1_1_1(AsyncGetCoverage, wcs111.WebCoverageService_1_1_1):
+    """WebCoverageService 1.1.1 with an asynchronous getCoverage"""
+
+
+class WebCoverageService_2_0_0(AsyncGetCoverage, wcs200.WebCoverageService_2_0_0):
+    """WebCoverageService 2.0.0 with an asynchronous getCoverage"""
+
+
+class WebCoverageService_2_0_1(AsyncGetCoverage, wcs201.WebCoverageService_2_0_1):
+    """WebCoverageService 2.0.1 with an asynchronous getCoverage"""
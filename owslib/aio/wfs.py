@@ -0,0 +1,90 @@
+"""
+Asynchronous API for Web Feature Server (WFS) methods and metadata.
+"""
+
+from owslib.aio.util import openURL, resolve_remote_metadata
+from owslib.feature import wfs100, wfs110, wfs200
+from owslib.feature.common import WFSCapabilitiesReader, getfeature_response
+from owslib.util import clean_ows_url, Authentication
+
+
+async def WebFeatureService(url, version='1.0.0', xml=None,
+                            parse_remote_metadata=False, timeout=30, username=None,
+                            password=None, headers=None, auth=None, session=None):
+    ''' asynchronous wfs factory function, returns a version specific WebFeatureService object
+
+    @type url: string
+    @param url: url of WFS capabilities document
+    @type xml: string
+    @param xml: elementtree object
+    @type parse_remote_metadata: boolean
+    @param parse_remote_metadata: whether to fully process MetadataURL elements (fetched asynchronously)
+    @param headers: HTTP headers to send with requests
+    @param timeout: time (in seconds) after which requests should timeout
+    @param username: service authentication username
+    @param password: service authentication password
+    @param auth: instance of owslib.util.Authentication
+    @param session: aiohttp.ClientSession to send requests with (default is the shared session)
+    @return: initialized WebFeatureService object (version dependent)
+    '''
+    if auth:
+        if username:
+            auth.username = username
+        if password:
+            auth.password = password
+    else:
+        auth = Authentication(username, password)
+    clean_url = clean_ows_url(url)
+
+    if version in ['1.0', '1.0.0']:
+        cls = WebFeatureService_1_0_0
+    elif version in ['1.1', '1.1.0']:
+        cls = WebFeatureService_1_1_0
+    elif version in ['2.0', '2.0.0']:
+        cls = WebFeatureService_2_0_0
+    else:
+        raise NotImplementedError(
+            'The WFS version ({}) you requested is not implemented. Please use 1.0.0, 1.1.0 or 2.0.0.'.format(
+                version))
+
+    if xml is None:
+        reader = WFSCapabilitiesReader(version, headers=headers, auth=auth)
+        u = await openURL(reader.capabilities_url(clean_url), timeout=timeout, headers=headers, auth=auth,
+                          session=session)
+        xml = u.read()
+
+    wfs = cls(clean_url, version, xml, timeout=timeout, headers=headers, auth=auth)
+    wfs.aio_session = session
+    if parse_remote_metadata:
+        await resolve_remote_metadata(wfs.contents.values(), timeout=timeout, session=session)
+    return wfs
+
+
+class AsyncGetFeature(object):
+    """GetFeature coroutine for the version specific WebFeatureService classes"""
+
+    aio_session = None
+
+    async def getfeature(self, **kwargs):
+        """Request and return feature data as a file-like object.
+
+        Takes the keyword arguments of the synchronous getfeature.
+        """
+        url, data = self._getfeature_request(**kwargs)
+
+        u = await openURL(url, data, kwargs.get('method', 'Get'), timeout=self.timeout, headers=self.headers,
+                          auth=self.auth, session=self.aio_session)
+
+        return getfeature_response(u)
+
+
+class WebFeatureService_1_0_0(AsyncGetFeature, wfs100.WebFeatureService_1_0_0):
+    """WebFeatureService 1.0.0 with an asynchronous getfeature"""
+
+
+class WebFeatureService_1_1_0(AsyncGetFeature, wfs110.WebFeatureService_1_1_0):
+    """WebFeatureService 1.1.0 with an asynchronous getfeature"""
+
+
+class WebFeatureService_2_0_0(AsyncGetFeature, wfs200.WebFeatureService_2_0_0):
+    """WebFeatureService 2.0.0 with an asynchronous getfeature"""
@@ -0,0 +1,87 @@
+"""
+Asynchronous API for Web Map Service (WMS) methods and metadata.
+
+Supports versions 1.1.1 and 1.3.0 of the WMS protocol.
+"""
+
+from owslib.aio.util import openURL, resolve_remote_metadata
+from owslib.map import wms111, wms130
+from owslib.map.common import WMSCapabilitiesReader, metadata_layers
+from owslib.util import bind_url, clean_ows_url, Authentication
+
+
+async def WebMapService(url, version='1.1.1', xml=None, username=None, password=None,
+                        parse_remote_metadata=False, timeout=30, headers=None, auth=None, session=None):
+    '''asynchronous wms factory function, returns a version specific WebMapService object
+
+    @type url: string
+    @param url: url of WMS capabilities document
+    @type xml: string
+    @param xml: elementtree object
+    @type parse_remote_metadata: boolean
+    @param parse_remote_metadata: whether to fully process MetadataURL elements (fetched asynchronously)
+    @param headers: HTTP headers to send with requests
+    @param timeout: time (in seconds) after which requests should timeout
+    @param username: service authentication username
+    @param password: service authentication password
+    @param auth: instance of owslib.util.Authentication
+    @param session: aiohttp.ClientSession to send requests with (default is the shared session)
+    @return: initialized WebMapService_1_1_1 or WebMapService_1_3_0 object
+    '''
+    if auth:
+        if username:
+            auth.username = username
+        if password:
+            auth.password = password
+    else:
+        auth = Authentication(username, password)
+    clean_url = clean_ows_url(url)
+
+    if version in ['1.1.1']:
+        cls = WebMapService_1_1_1
+    elif version in ['1.3.0']:
+        cls = WebMapService_1_3_0
+    else:
+        raise NotImplementedError(
+            'The WMS version ({}) you requested is not implemented. Please use 1.1.1 or 1.3.0.'.format(version))
+
+    request = None
+    if xml is None:
+        request = WMSCapabilitiesReader(version, url=clean_url, headers=headers, auth=auth).capabilities_url(clean_url)
+        u = await openURL(request, timeout=timeout, headers=headers, auth=auth, session=session)
+        xml = u.read()
+
+    wms = cls(clean_url, version=version, xml=xml, timeout=timeout, headers=headers, auth=auth)
+    wms.request = request or wms.request
+    wms.aio_session = session
+    if parse_remote_metadata:
+        await resolve_remote_metadata(metadata_layers(wms.contents), timeout=timeout, session=session)
+    return wms
+
+
+class AsyncGetMap(object):
+    """GetMap coroutine for the version specific WebMapService classes"""
+
+    aio_session = None
+
+    async def getmap(self, timeout=None, **kwargs):
+        """Request and return an image from the WMS as a file-like object.
+
+        Takes the keyword arguments of the synchronous getmap.
+        """
+        base_url, data = self._getmap_request(**kwargs)
+
+        self.request = bind_url(base_url) + data
+
+        u = await openURL(base_url, data, kwargs.get('method', 'Get'), timeout=timeout or self.timeout,
+                          auth=self.auth, session=self.aio_session)
+
+        return self._getmap_response(u)
+
+
+class WebMapService_1_1_1(AsyncGetMap, wms111.WebMapService_1_1_1):
+    """WebMapService 1.1.1 with an asynchronous getmap"""
+
+
+class WebMapService_1_3_0(AsyncGetMap, wms130.WebMapService_1_3_0):
+    """WebMapService 1.3.0 with an asynchronous getmap"""
@@ -0,0 +1,79 @@
+"""
+Asynchronous API for OGC Web Map Tile Service (WMTS).
+"""
+
+from owslib import wmts
+from owslib.aio.util import openURL
+from owslib.util import clean_ows_url, Authentication
+
+
+async def WebMapTileService(url, version='1.0.0', xml=None, username=None, password=None,
+                            parse_remote_metadata=False, vendor_kwargs=None, headers=None, auth=None,
+                            timeout=30, session=None):
+    """Asynchronously fetch the capabilities of a WMTS and return a WebMapTileService.
+
+    Parameters
+    ----------
+    url : string
+        Base URL for the WMTS service.
+    version : string
+        Optional WMTS version. Defaults to '1.0.0'.
+    xml : string
+        Optional XML content to use as the content for the initial
+        GetCapabilities request. Typically only used for testing.
+    username : string
+        Optional user name for authentication.
+    password : string
+        Optional password for authentication.
+    parse_remote_metadata: string
+        Currently unused.
+    vendor_kwargs : dict
+        Optional vendor-specific parameters to be included in all
+        requests.
+    auth : owslib.util.Authentication
+        Instance of Authentication class to hold username/password/cert/verify
+    timeout : int
+        number of seconds for GetTile request
+    session : aiohttp.ClientSession
+        Optional session to send requests with. Defaults to the shared
+        session of the running event loop.
+
+    """
+    if auth:
+        if username:
+            auth.username = username
+        if password:
+            auth.password = password
+    else:
+        auth = Authentication(username, password)
+
+    if xml is None:
+        reader = wmts.WMTSCapabilitiesReader(version, headers=headers, auth=auth)
+        u = await openURL(reader.capabilities_url(clean_ows_url(url), vendor_kwargs), headers=headers, auth=auth,
+                          timeout=timeout, session=session)
+        xml = u.read()
+
+    service = AsyncWebMapTileService(url, version=version, xml=xml, parse_remote_metadata=parse_remote_metadata,
+                                     vendor_kwargs=vendor_kwargs, headers=headers, auth=auth, timeout=timeout)
+    service.aio_session = session
+    return service
+
+
+class AsyncWebMapTileService(wmts.WebMapTileService):
+    """WebMapTileService with an asynchronous gettile."""
+
+    aio_session = None
+
+    async def gettile(self, base_url=None, layer=None, style=None, format=None,
+                      tilematrixset=None, tilematrix=None, row=None, column=None,
+                      **kwargs):
+        """Return a tile from the WMTS.
+
+        Takes the arguments of the synchronous gettile and returns the tile
+        image as a file-like object.
+        """
+        url, data = self._gettile_request(base_url, layer, style, format, tilematrixset,
+                                          tilematrix, row, column, **kwargs)
+        u = await openURL(url, data, headers=self.headers, auth=self.auth, timeout=self.timeout,
+                          session=self.aio_session)
+        return self._gettile_response(u)
@@ -0,0 +1,236 @@
+"""
+Opt-in persistent cache of GetCapabilities documents.
+
+Capabilities documents are stored on local disk, keyed on the capabilities
+URL, and served without a request for ``ttl`` seconds.  Once stale they are
+revalidated with the server: conditionally with the ETag / Last-Modified
+validators of the cached response, or with the OGC ``updateSequence``
+parameter when the server sent no validators.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+
+from owslib.util import openURL, ServiceException
+
+LOGGER = logging.getLogger(__name__)
+
+CAPABILITIES_TTL = 3600  # seconds a cached capabilities document is used without revalidation
+
+_UPDATE_SEQUENCE = re.compile(br'<[^?!][^>]*?\supdateSequence\s*=\s*["\']([^"\']*)["\']')
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def default_cache_dir():
+    """
+    Return the default cache directory ($XDG_CACHE_HOME/owslib/capabilities)
+    """
+
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'owslib', 'capabilities')
+
+
+class CapabilitiesCache(object):
+    """
+    Capabilities documents cached on local disk.
+
+    Every entry is a single file holding a JSON metadata line (url, validators,
+    updateSequence, fetch time) followed by the document, written atomically
+    so the cache directory can be shared by several processes.
+    """
+
+    def __init__(self, directory=None, ttl=CAPABILITIES_TTL):
+        """
+        :param directory: cache directory (default is default_cache_dir())
+        :param ttl: time (in seconds) a cached document is used without revalidation.
+                    0 revalidates on every use, None never revalidates
+        """
+
+        self.directory = directory or default_cache_dir()
+        self.ttl = ttl
+
+    def _path(self, key):
+        digest = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, digest + '.xml')
+
+    def get(self, key):
+        """
+        Return the cached (metadata, content) of key, or None
+        """
+
+        try:
+            with open(self._path(key), 'rb') as f:
+                meta = json.loads(f.readline().decode('utf-8'))
+                content = f.read()
+        except (OSError, ValueError):
+            return None
+        if meta.get('key') != key:
+            return None
+        return meta, content
+
+    def put(self, key, content, meta):
+        """
+        Store content and its metadata under key
+        """
+
+        meta = dict(meta, key=key)
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(json.dumps(meta).encode('utf-8') + b'\n')
+                f.write(content)
+            os.replace(tmp, self._path(key))
+        except OSError as err:
+            LOGGER.warning('Could not write capabilities cache entry: %s', err)
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+    def remove(self, key):
+        """
+        Remove the entry of key, if any
+        """
+
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+    def clear(self):
+        """
+        Remove all entries
+        """
+
+        if not os.path.isdir(self.directory):
+            return
+        for name in os.listdir(self.directory):
+            # .tmp files are left by interrupted puts
+            if name.endswith(('.xml', '.tmp')):
+                os.remove(os.path.join(self.directory, name))
+
+    def fresh(self, meta):
+        """
+        Return whether an entry can be used without revalidation
+        """
+
+        if self.ttl is None:
+            return True
+        return time.time() - meta.get('fetched', 0) < self.ttl
+
+    def fetch(self, url, timeout=30, headers=None, auth=None, session=None, cookies=None):
+        """
+        Return the capabilities document at url, from the cache when fresh or still valid
+
+        :param url: GetCapabilities url
+        :param timeout: time (in seconds) after which the request should timeout
+        :param headers: HTTP headers to send with the request
+        :param auth: instance of owslib.util.Authentication
+        :param session: requests.Session to send the request with
+        :param cookies: cookies to send with the request
+        :return: the document as bytes
+        """
+
+        key = url if auth is None or not auth.username else '%s@%s' % (auth.username, url)
+        cached = self.get(key)
+        if cached is not None and self.fresh(cached[0]):
+            LOGGER.debug('Capabilities cache hit: %s', url)
+            return cached[1]
+
+        request_url = url
+        request_headers = dict(headers or {})
+        if cached is not None:
+            meta = cached[0]
+            if meta.get('etag'):
+                request_headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                request_headers['If-Modified-Since'] = meta['last_modified']
+            if not (meta.get('etag') or meta.get('last_modified')) and meta.get('update_sequence'):
+                separator = '&' if '?' in url else '?'
+                request_url = '%s%supdateSequence=%s' % (url, separator, meta['update_sequence'])
+
+        try:
+            u = openURL(request_url, timeout=timeout, headers=request_headers, auth=auth, session=session,
+                        cookies=cookies)
+        except ServiceException as err:
+            if cached is None or request_url == url:
+                raise
+            # the server reports the cached updateSequence as current
+            if err.code == 'CurrentUpdateSequence':
+                LOGGER.debug('Capabilities cache revalidated (updateSequence): %s', url)
+                self.put(key, cached[1], dict(cached[0], fetched=time.time()))
+                return cached[1]
+            # any other report, e.g. InvalidUpdateSequence once the server reset its sequence:
+            # drop the entry and fetch the document anew
+            LOGGER.debug('Capabilities cache entry dropped (%s): %s', err.code, url)
+            self.remove(key)
+            cached = None
+            u = openURL(url, timeout=timeout, headers=request_headers, auth=auth, session=session,
+                        cookies=cookies)
+
+        if u.status_code == 304 and cached is not None:
+            LOGGER.debug('Capabilities cache revalidated (HTTP 304): %s', url)
+            meta = dict(cached[0], fetched=time.time())
+            info = u.info()
+            meta['etag'] = info.get('ETag', meta.get('etag'))
+            meta['last_modified'] = info.get('Last-Modified', meta.get('last_modified'))
+            self.put(key, cached[1], meta)
+            return cached[1]
+
+        content = u.read()
+        info = u.info()
+        match = _UPDATE_SEQUENCE.search(content[:8192])
+        self.put(key, content, {
+            'url': url,
+            'etag': info.get('ETag'),
+            'last_modified': info.get('Last-Modified'),
+            'update_sequence': match.group(1).decode('utf-8') if match else None,
+            'fetched': time.time()
+        })
+        return content
+
+
+def get_capabilities_cache():
+    """
+    Return the capabilities cache in use, or None when caching is disabled (the default)
+    """
+
+    return _cache
+
+
+def set_capabilities_cache(cache):
+    """
+    Enable the process-wide capabilities cache.
+
+    :param cache: CapabilitiesCache instance, or None to disable caching
+    """
+
+    global _cache
+
+    with _cache_lock:
+        _cache = cache
+
+
+def read_capabilities(url, timeout=30, headers=None, auth=None, session=None, cookies=None):
+    """
+    Fetch a capabilities document, through the capabilities cache when enabled.
+
+    :param url: GetCapabilities url
+    :param timeout: time (in seconds) after which the request should timeout
+    :param headers: HTTP headers to send with the request
+    :param auth: instance of owslib.util.Authentication
+    :param session: requests.Session to send the request with
+    :param cookies: cookies to send with the request
+    :return: the document as bytes
+    """
+
+    if _cache is not None:
+        return _cache.fetch(url, timeout=timeout, headers=headers, auth=auth, session=session, cookies=cookies)
+    return openURL(url, timeout=timeout, headers=headers, auth=auth, session=session, cookies=cookies).read()
@@ -0,0 +1,235 @@
+# -*- coding: ISO-8859-15 -*-
+# =============================================================================
+# Copyright (c) 2024 OWSLib contributors
+#
+# Licensed under the BSD license, see LICENSE.txt
+# =============================================================================
+
+"""
+Chunked WCS 2.0 GetCoverage downloads.
+
+The subsets of a GetCoverage request are split into an axis-aligned grid of
+smaller requests, following the grid of the coverage (from its
+DescribeCoverage), and the chunks are downloaded concurrently, each streamed
+to its own file.  A manifest file in the download directory records the
+chunks and which of them are complete, so an interrupted download is resumed
+where it stopped, and the chunks can be consumed one by one or mosaicked.
+"""
+
+import itertools
+import json
+import math
+import mimetypes
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_EXCEPTION
+
+from owslib.util import openURL, stream_response, is_number, log
+
+try:  # optional, for mosaicking raster chunks
+    import rasterio
+    from rasterio.merge import merge
+except ImportError:
+    rasterio = None
+
+MANIFEST = 'manifest.json'  # name of the manifest file in a download directory
+CHUNK_WORKERS = 4  # default number of chunks downloaded at a time
+
+
+def grid_axes(grid):
+    """Return {axis label: (origin, resolution)} of the axes of a RectifiedGrid
+    or ReferenceableGridByVectors, the resolution being the (absolute) length
+    of the offset vector of the axis
+    """
+    axes = {}
+    for i, label in enumerate(grid.axislabels):
+        try:
+            resolution = max(abs(float(v)) for v in grid.offsetvectors[i])
+            axes[label] = (float(grid.origin[i]), resolution)
+        except (IndexError, ValueError):
+            continue
+    return axes
+
+
+def split_subsets(subsets, chunk_sizes, grid):
+    """Split GetCoverage subsets into the subsets of chunks
+
+    @param subsets: the subsets of the request, [(axis, min, max) or (axis, value), ...]
+    @param chunk_sizes: number of grid cells of a chunk along each axis to split, e.g. {'Lat': 1000, 'Long': 1000}
+    @param grid: the RectifiedGrid or ReferenceableGridByVectors of the coverage
+    @return: list of (index, subsets) of the chunks, index being the position of the chunk along each axis
+
+    The chunk boundaries lie halfway between grid points, so every grid point
+    of the requested subsets is in exactly one chunk.
+    """
+    axes = grid_axes(grid)
+    trims = dict((subset[0], subset) for subset in subsets if len(subset) > 2)
+    for axis in chunk_sizes:
+        if axis not in trims:
+            raise ValueError('Axis %s is not trimmed by the subsets, it cannot be split' % axis)
+        if axis not in axes:
+            raise ValueError('Axis %s is not an axis of the coverage grid (%s)' % (axis, ', '.join(grid.axislabels)))
+        if not (is_number(trims[axis][1]) and is_number(trims[axis][2])):
+            raise ValueError('Axis %s is not numeric, it cannot be split' % axis)
+
+    pieces = []  # per subset, the list of subsets of the chunks along its axis
+    for subset in subsets:
+        axis = subset[0]
+        if axis not in chunk_sizes:
+            pieces.append([subset])
+            continue
+        low, high = sorted((float(subset[1]), float(subset[2])))
+        origin, resolution = axes[axis]
+        step = int(chunk_sizes[axis])
+        if step < 1:
+            raise ValueError('Chunk size of axis %s should be at least 1 grid cell' % axis)
+        first = math.ceil((low - origin) / resolution)  # index of the first grid point in the subset
+        bounds = [low]
+        k = first + step
+        while origin + (k - 0.5) * resolution < high:
+            bounds.append(origin + (k - 0.5) * resolution)
+            k += step
+        bounds.append(high)
+        pieces.append([(axis, lo, hi) for lo, hi in zip(bounds[:-1], bounds[1:])])
+
+    chunks = []
+    for combination in itertools.product(*[enumerate(p) for p in pieces]):
+        index = tuple(i for (i, subset), axis_subsets in zip(combination, pieces) if len(axis_subsets) > 1)
+        chunks.append((index, [subset for i, subset in combination]))
+    return chunks
+
+
+class CoverageChunks(object):
+    """The chunks of a coverage downloaded with getCoverageChunks, as recorded
+    in the manifest of their download directory
+
+    Iterating yields the complete chunks in order, as dicts with their index,
+    subsets and path.
+    """
+
+    def __init__(self, directory, manifest):
+        self.directory = directory
+        self.manifest = manifest
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, directory):
+        """Read the manifest of a download directory, None if there is none"""
+        path = os.path.join(directory, MANIFEST)
+        if not os.path.exists(path):
+            return None
+        with open(path) as f:
+            return cls(directory, json.load(f))
+
+    def save(self):
+        """Write the manifest, atomically"""
+        path = os.path.join(self.directory, MANIFEST)
+        with self._lock:
+            with open(path + '.tmp', 'w') as f:
+                json.dump(self.manifest, f, indent=2)
+            os.replace(path + '.tmp', path)
+
+    @property
+    def chunks(self):
+        return self.manifest['chunks']
+
+    @property
+    def complete(self):
+        """Whether all the chunks have been downloaded"""
+        return all(chunk['complete'] for chunk in self.chunks)
+
+    def path(self, chunk):
+        """Path of the file of a chunk"""
+        return os.path.join(self.directory, chunk['file'])
+
+    def __len__(self):
+        return len(self.chunks)
+
+    def __iter__(self):
+        for chunk in self.chunks:
+            if chunk['complete']:
+                yield dict(chunk, path=self.path(chunk))
+
+    def mosaic(self, path, driver='GTiff'):
+        """Mosaic the chunks (raster formats readable by rasterio) into a single file"""
+        if rasterio is None:
+            raise ImportError('CoverageChunks.mosaic requires the rasterio package')
+        if not self.complete:
+            raise ValueError('The download of the coverage chunks is not complete')
+        datasets = [rasterio.open(self.path(chunk)) for chunk in self.chunks]
+        try:
+            array, transform = merge(datasets)
+            profile = datasets[0].profile
+            profile.update(driver=driver, height=array.shape[1], width=array.shape[2], transform=transform)
+            with rasterio.open(path, 'w', **profile) as dst:
+                dst.write(array)
+        finally:
+            for dataset in datasets:
+                dataset.close()
+        return path
+
+
+def get_coverage_chunks(service, identifier, directory, subsets, chunk_sizes, format=None,
+                        max_workers=CHUNK_WORKERS, timeout=30, **kwargs):
+    """Download a coverage in chunks (see WebCoverageService_2_0_0.getCoverageChunks)"""
+    grid = service.contents[identifier].grid
+    request = {
+        'identifier': identifier,
+        'format': format,
+        'subsets': [list(subset) for subset in subsets],
+        'chunk_sizes': chunk_sizes,
+        'parameters': kwargs,
+    }
+
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+    chunks = CoverageChunks.load(directory)
+    if chunks is not None:
+        # resume the download of the same request
+        previous = dict((key, chunks.manifest.get(key)) for key in request)
+        if json.loads(json.dumps(request)) != previous:
+            raise ValueError('%s holds the chunks of another GetCoverage request' % directory)
+    else:
+        extension = mimetypes.guess_extension(format or '') or '.bin'
+        manifest = dict(request, chunks=[
+            {
+                'index': list(index),
+                'subsets': [list(subset) for subset in chunk_subsets],
+                'file': 'chunk_%s%s' % ('_'.join(str(i) for i in index) or '0', extension),
+                'complete': False,
+                'size': None,
+            } for index, chunk_subsets in split_subsets(subsets, chunk_sizes, grid)])
+        chunks = CoverageChunks(directory, manifest)
+        chunks.save()
+
+    def download(chunk):
+        base_url, data, method = service._getcoverage_request(
+            identifier=[identifier], format=format, subsets=[tuple(s) for s in chunk['subsets']], **kwargs)
+        u = openURL(base_url, data, method, service.cookies, auth=service.auth, timeout=timeout,
+                    session=service.session, stream=True)
+        body = stream_response(u)
+        path = chunks.path(chunk)
+        size = 0
+        try:
+            with open(path + '.part', 'wb') as f:
+                for block in body.iter_content():
+                    f.write(block)
+                    size += len(block)
+        finally:
+            body.close()
+        os.replace(path + '.part', path)
+        chunk['size'] = size
+        chunk['complete'] = True
+        chunks.save()
+        log.debug('Coverage chunk %s of %s downloaded (%d bytes)', chunk['index'], identifier, size)
+
+    pending = [chunk for chunk in chunks.chunks if not (chunk['complete'] and os.path.exists(chunks.path(chunk)))]
+    if pending:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as executor:
+            futures = [executor.submit(download, chunk) for chunk in pending]
+            done, not_done = wait(futures, return_when=FIRST_EXCEPTION)
+            for future in not_done:
+                future.cancel()
+            for future in done:
+                future.result()  # raise the error of a failed chunk
+    return chunks
@@ -13,7 +13,7 @@ from owslib.coverage.wcsBase import WCSBase, WCSCapabilitiesReader, ServiceExcep
 from urllib.parse import urlencode
 from owslib.util import openURL, testXMLValue
 from owslib.etree import etree
-from owslib.crs import Crs
+from owslib.crs import get_crs
 import os
 import errno
 
@@ -38,14 +38,14 @@ class WebCoverageService_1_0_0(WCSBase):
         else:
             raise KeyError("No content named %s" % name)
 
-    def __init__(self, url, xml, cookies, auth=None, timeout=30):
-        super(WebCoverageService_1_0_0, self).__init__(auth)
+    def __init__(self, url, xml, cookies, auth=None, timeout=30, session=None):
+        super(WebCoverageService_1_0_0, self).__init__(auth, session=session)
         self.version = '1.0.0'
         self.url = url
         self.cookies = cookies
         self.timeout = timeout
         # initialize from saved capability document or access the server
-        reader = WCSCapabilitiesReader(self.version, self.cookies, self.auth)
+        reader = WCSCapabilitiesReader(self.version, self.cookies, self.auth, session=self.session)
         if xml:
             self._capabilities = reader.readString(xml)
         else:
@@ -95,19 +95,9 @@ class WebCoverageService_1_0_0(WCSBase):
             items.append((item, self.contents[item]))
         return items
 
-    def getCoverage(self, identifier=None, bbox=None, time=None, format=None, crs=None, width=None, height=None,
-                    resx=None, resy=None, resz=None, parameter=None, method='Get', timeout=30, **kwargs):
-        """Request and return a coverage from the WCS as a file-like object
-        note: additional **kwargs helps with multi-version implementation
-        core keyword arguments should be supported cross version
-        example:
-        cvg=wcs.getCoverage(identifier=['TuMYrRQ4'], timeSequence=['2792-06-01T00:00:00.0'], bbox=(-112,36,-106,41),
-                            format='cf-netcdf')
-
-        is equivalent to:
-        http://myhost/mywcs?SERVICE=WCS&REQUEST=GetCoverage&IDENTIFIER=TuMYrRQ4&VERSION=1.1.0&BOUNDINGBOX=-180,-90,180,90&TIME=2792-06-01T00:00:00.0&FORMAT=cf-netcdf
-
-        """
+    def _getcoverage_request(self, identifier=None, bbox=None, time=None, format=None, crs=None, width=None,
+                             height=None, resx=None, resy=None, resz=None, parameter=None, method='Get', **kwargs):
+        """Return the base url, the encoded parameters and the method of a GetCoverage request"""
         if log.isEnabledFor(logging.DEBUG):
             msg = 'WCS 1.0.0 DEBUG: Parameters passed to GetCoverage: identifier={}, bbox={}, time={}, format={}, crs={}, width={}, height={}, resx={}, resy={}, resz={}, parameter={}, method={}, other_arguments={}'  # noqa
             log.debug(msg.format(
@@ -154,8 +144,36 @@ class WebCoverageService_1_0_0(WCSBase):
         # encode and request
         data = urlencode(request)
         log.debug('WCS 1.0.0 DEBUG: Second part of URL: %s' % data)
+        return base_url, data, method
 
-        u = openURL(base_url, data, method, self.cookies, auth=self.auth, timeout=timeout)
+    def getCoverage(self, identifier=None, bbox=None, time=None, format=None, crs=None, width=None, height=None,
+                    resx=None, resy=None, resz=None, parameter=None, method='Get', timeout=30, **kwargs):
+        """Request and return a coverage from the WCS as a file-like object
+        note: additional **kwargs helps with multi-version implementation
+        core keyword arguments should be supported cross version
+        example:
+        cvg=wcs.getCoverage(identifier=['TuMYrRQ4'], timeSequence=['2792-06-01T00:00:00.0'], bbox=(-112,36,-106,41),
+                            format='cf-netcdf')
+
+        is equivalent to:
+        http://myhost/mywcs?SERVICE=WCS&REQUEST=GetCoverage&IDENTIFIER=TuMYrRQ4&VERSION=1.1.0&BOUNDINGBOX=-180,-90,180,90&TIME=2792-06-01T00:00:00.0&FORMAT=cf-netcdf
+
+        """
+        base_url, data, method = self._getcoverage_request(
+            identifier=identifier,
+            bbox=bbox,
+            time=time,
+            format=format,
+            crs=crs,
+            width=width,
+            height=height,
+            resx=resx,
+            resy=resy,
+            resz=resz,
+            parameter=parameter,
+            method=method,
+            **kwargs)
+        u = openURL(base_url, data, method, self.cookies, auth=self.auth, timeout=timeout, session=self.session)
         return u
 
     def getOperationByName(self, name):
@@ -357,15 +375,15 @@ class ContentMetadata(object):
         for elem in self._service.getDescribeCoverage(self.id).findall(
                 ns('CoverageOffering/') + ns('supportedCRSs/') + ns('responseCRSs')):
             for crs in elem.text.split(' '):
-                crss.append(Crs(crs))
+                crss.append(get_crs(crs))
         for elem in self._service.getDescribeCoverage(self.id).findall(
                 ns('CoverageOffering/') + ns('supportedCRSs/') + ns('requestResponseCRSs')):
             for crs in elem.text.split(' '):
-                crss.append(Crs(crs))
+                crss.append(get_crs(crs))
         for elem in self._service.getDescribeCoverage(self.id).findall(
                 ns('CoverageOffering/') + ns('supportedCRSs/') + ns('nativeCRSs')):
             for crs in elem.text.split(' '):
-                crss.append(Crs(crs))
+                crss.append(get_crs(crs))
         return crss
     supportedCRS = property(_getSupportedCRSProperty, None)
 
@@ -18,7 +18,7 @@ from owslib.etree import etree
 import os
 import errno
 from owslib.coverage import wcsdecoder
-from owslib.crs import Crs
+from owslib.crs import get_crs
 
 import logging
 from owslib.util import log
@@ -51,13 +51,14 @@ class WebCoverageService_1_1_0(WCSBase):
         else:
             raise KeyError("No content named %s" % name)
 
-    def __init__(self, url, xml, cookies, auth=None, timeout=30):
-        super(WebCoverageService_1_1_0, self).__init__(auth=auth)
+    def __init__(self, url, xml, cookies, auth=None, timeout=30, session=None):
+        super(WebCoverageService_1_1_0, self).__init__(auth=auth, session=session)
 
         self.url = url
         self.cookies = cookies
+        self.timeout = timeout
         # initialize from saved capability document or access the server
-        reader = WCSCapabilitiesReader(self.version, self.cookies, self.auth)
+        reader = WCSCapabilitiesReader(self.version, self.cookies, self.auth, session=self.session)
         if xml:
             self._capabilities = reader.readString(xml)
         else:
@@ -139,22 +140,10 @@ class WebCoverageService_1_1_0(WCSBase):
     #     return filenames
 
     # TO DO: Handle rest of the  WCS 1.1.0 keyword parameters e.g. GridCRS etc.
-    def getCoverage(self, identifier=None, bbox=None, time=None, format=None, store=False, rangesubset=None,
-                    gridbaseCRS=None, gridtype=None, gridCS=None, gridorigin=None, gridoffsets=None,
-                    method='Get', timeout=30, **kwargs):
-        """Request and return a coverage from the WCS as a file-like object
-        note: additional **kwargs helps with multi-version implementation
-        core keyword arguments should be supported cross version
-        example:
-        cvg=wcs.getCoverageRequest(identifier=['TuMYrRQ4'], time=['2792-06-01T00:00:00.0'], bbox=(-112,36,-106,41),
-                                   format='application/netcdf', store='true')
-
-        is equivalent to:
-        http://myhost/mywcs?SERVICE=WCS&REQUEST=GetCoverage&IDENTIFIER=TuMYrRQ4&VERSION=1.1.0&BOUNDINGBOX=-180,-90,180,90&TIMESEQUENCE=2792-06-01T00:00:00.0&FORMAT=application/netcdf
-
-        if store = true, returns a coverages XML file
-        if store = false, returns a multipart mime
-        """
+    def _getcoverage_request(self, identifier=None, bbox=None, time=None, format=None, store=False, rangesubset=None,
+                             gridbaseCRS=None, gridtype=None, gridCS=None, gridorigin=None, gridoffsets=None,
+                             method='Get', **kwargs):
+        """Return the base url, the encoded parameters and the method of a GetCoverage request"""
         if log.isEnabledFor(logging.DEBUG):
             msg = 'WCS 1.1.0 DEBUG: Parameters passed to GetCoverage: identifier={}, bbox={}, time={}, format={}, rangesubset={}, gridbaseCRS={}, gridtype={}, gridCS={}, gridorigin={}, gridoffsets={}, method={}, other_arguments={}'  # noqa
             log.debug(msg.format(
@@ -204,8 +193,39 @@ class WebCoverageService_1_1_0(WCSBase):
 
         # encode and request
         data = urlencode(request)
+        return base_url, data, method
 
-        u = openURL(base_url, data, method, self.cookies, auth=self.auth, timeout=timeout)
+    def getCoverage(self, identifier=None, bbox=None, time=None, format=None, store=False, rangesubset=None,
+                    gridbaseCRS=None, gridtype=None, gridCS=None, gridorigin=None, gridoffsets=None,
+                    method='Get', timeout=30, **kwargs):
+        """Request and return a coverage from the WCS as a file-like object
+        note: additional **kwargs helps with multi-version implementation
+        core keyword arguments should be supported cross version
+        example:
+        cvg=wcs.getCoverageRequest(identifier=['TuMYrRQ4'], time=['2792-06-01T00:00:00.0'], bbox=(-112,36,-106,41),
+                                   format='application/netcdf', store='true')
+
+        is equivalent to:
+        http://myhost/mywcs?SERVICE=WCS&REQUEST=GetCoverage&IDENTIFIER=TuMYrRQ4&VERSION=1.1.0&BOUNDINGBOX=-180,-90,180,90&TIMESEQUENCE=2792-06-01T00:00:00.0&FORMAT=application/netcdf
+
+        if store = true, returns a coverages XML file
+        if store = false, returns a multipart mime
+        """
+        base_url, data, method = self._getcoverage_request(
+            identifier=identifier,
+            bbox=bbox,
+            time=time,
+            format=format,
+            store=store,
+            rangesubset=rangesubset,
+            gridbaseCRS=gridbaseCRS,
+            gridtype=gridtype,
+            gridCS=gridCS,
+            gridorigin=gridorigin,
+            gridoffsets=gridoffsets,
+            method=method,
+            **kwargs)
+        u = openURL(base_url, data, method, self.cookies, auth=self.auth, timeout=timeout, session=self.session)
         return u
 
     def getOperationByName(self, name):
@@ -403,7 +423,7 @@ class ContentMetadata(object):
         # SupportedCRS
         self.supportedCRS = []
         for crs in elem.findall(nmSpc.WCS('SupportedCRS')):
-            self.supportedCRS.append(Crs(crs.text))
+            self.supportedCRS.append(get_crs(crs.text))
 
         # SupportedFormats
         self.supportedFormats = []
@@ -23,7 +23,8 @@ from owslib.ows import (
 from urllib.parse import urlencode
 from owslib.util import openURL, testXMLValue
 from owslib.etree import etree
-from owslib.crs import Crs
+from owslib.crs import get_crs
+from owslib.coverage import tiling
 import os
 import errno
 import dateutil.parser as parser
@@ -53,14 +54,15 @@ class WebCoverageService_2_0_1(WCSBase):
         else:
             raise KeyError("No content named %s" % name)
 
-    def __init__(self, url, xml, cookies, auth=None, timeout=30):
-        super(WebCoverageService_2_0_1, self).__init__(auth=auth)
+    def __init__(self, url, xml, cookies, auth=None, timeout=30, session=None):
+        super(WebCoverageService_2_0_1, self).__init__(auth=auth, session=session)
         self.version = "2.0.1"
         self.url = url
         self.cookies = cookies
+        self.timeout = timeout
         self.ows_common = OwsCommon(version="2.0.1")
         # initialize from saved capability document or access the server
-        reader = WCSCapabilitiesReader(self.version, self.cookies, self.auth)
+        reader = WCSCapabilitiesReader(self.version, self.cookies, self.auth, session=self.session)
         if xml:
             self._capabilities = reader.readString(xml)
         else:
@@ -113,7 +115,7 @@ class WebCoverageService_2_0_1(WCSBase):
             items.append((item, self.contents[item]))
         return items
 
-    def getCoverage(
+    def _getcoverage_request(
         self,
         identifier=None,
         bbox=None,
@@ -130,28 +132,9 @@ class WebCoverageService_2_0_1(WCSBase):
         resz=None,
         parameter=None,
         method="Get",
-        timeout=30,
         **kwargs
     ):
-        """Request and return a coverage from the WCS as a file-like object
-        note: additional **kwargs helps with multi-version implementation
-        core keyword arguments should be supported cross version
-        example:
-        cvg=wcs.getCoverage(identifier=['TuMYrRQ4'], timeSequence=['2792-06-01T00:00:00.0'], bbox=(-112,36,-106,41),
-                            format='cf-netcdf')
-
-        is equivalent to:
-        http://myhost/mywcs?SERVICE=WCS&REQUEST=GetCoverage&IDENTIFIER=TuMYrRQ4&VERSION=1.1.0&BOUNDINGBOX=-180,-90,180,90&TIME=2792-06-01T00:00:00.0&FORMAT=cf-netcdf
-
-        example 2.0.1 URL
-        http://earthserver.pml.ac.uk/rasdaman/ows?&SERVICE=WCS&VERSION=2.0.1&REQUEST=GetCoverage
-        &COVERAGEID=V2_monthly_CCI_chlor_a_insitu_test&SUBSET=Lat(40,50)&SUBSET=Long(-10,0)&SUBSET=ansi(144883,145000)&FORMAT=application/netcdf
-
-        cvg=wcs.getCoverage(identifier=['myID'], format='application/netcdf', subsets=[('axisName',min,max),
-                            ('axisName',min,max),('axisName',min,max)])
-
-
-        """
+        """Return the base url, the encoded parameters and the method of a GetCoverage request"""
         if log.isEnabledFor(logging.DEBUG):
             log.debug(
                 "WCS 2.0.1 DEBUG: Parameters passed to GetCoverage: identifier=%s, bbox=%s, time=%s, format=%s, crs=%s, width=%s, height=%s, resx=%s, resy=%s, resz=%s, parameter=%s, method=%s, other_arguments=%s"  # noqa
@@ -214,10 +197,89 @@ class WebCoverageService_2_0_1(WCSBase):
             data += param_list_to_url_string(sizes, 'size')
 
         log.debug("WCS 2.0.1 DEBUG: Second part of URL: %s" % data)
+        return base_url, data, method
 
-        u = openURL(base_url, data, method, self.cookies, auth=self.auth, timeout=timeout)
+    def getCoverage(
+        self,
+        identifier=None,
+        bbox=None,
+        time=None,
+        format=None,
+        subsets=None,
+        resolutions=None,
+        sizes=None,
+        crs=None,
+        width=None,
+        height=None,
+        resx=None,
+        resy=None,
+        resz=None,
+        parameter=None,
+        method="Get",
+        timeout=30,
+        **kwargs
+    ):
+        """Request and return a coverage from the WCS as a file-like object
+        note: additional **kwargs helps with multi-version implementation
+        core keyword arguments should be supported cross version
+        example:
+        cvg=wcs.getCoverage(identifier=['TuMYrRQ4'], timeSequence=['2792-06-01T00:00:00.0'], bbox=(-112,36,-106,41),
+                            format='cf-netcdf')
+
+        is equivalent to:
+        http://myhost/mywcs?SERVICE=WCS&REQUEST=GetCoverage&IDENTIFIER=TuMYrRQ4&VERSION=1.1.0&BOUNDINGBOX=-180,-90,180,90&TIME=2792-06-01T00:00:00.0&FORMAT=cf-netcdf
+
+        example 2.0.1 URL
+        http://earthserver.pml.ac.uk/rasdaman/ows?&SERVICE=WCS&VERSION=2.0.1&REQUEST=GetCoverage
+        &COVERAGEID=V2_monthly_CCI_chlor_a_insitu_test&SUBSET=Lat(40,50)&SUBSET=Long(-10,0)&SUBSET=ansi(144883,145000)&FORMAT=application/netcdf
+
+        cvg=wcs.getCoverage(identifier=['myID'], format='application/netcdf', subsets=[('axisName',min,max),
+                            ('axisName',min,max),('axisName',min,max)])
+
+
+        """
+        base_url, data, method = self._getcoverage_request(
+            identifier=identifier,
+            bbox=bbox,
+            time=time,
+            format=format,
+            subsets=subsets,
+            resolutions=resolutions,
+            sizes=sizes,
+            crs=crs,
+            width=width,
+            height=height,
+            resx=resx,
+            resy=resy,
+            resz=resz,
+            parameter=parameter,
+            method=method,
+            **kwargs)
+        u = openURL(base_url, data, method, self.cookies, auth=self.auth, timeout=timeout, session=self.session)
         return u
 
+    def getCoverageChunks(self, identifier, directory, subsets, chunk_sizes, format=None,
+                          max_workers=tiling.CHUNK_WORKERS, timeout=30, **kwargs):
+        """Download a large coverage as a set of smaller GetCoverage requests, made concurrently,
+        and return the CoverageChunks recorded in the manifest of the download directory
+
+        @param identifier: the coverage id
+        @param directory: directory to store the chunks and their manifest in
+        @param subsets: the subsets of the whole coverage, [('axisName', min, max), ...]
+        @param chunk_sizes: number of grid cells of a chunk along the axes to split, e.g. {'Lat': 1000, 'Long': 1000}
+        @param format: the output format of the chunks
+        @param max_workers: number of chunks downloaded at a time
+
+        Chunks are aligned with the grid of the coverage (from DescribeCoverage).  Calling this
+        again with the same request and directory downloads only the chunks that are missing.
+        example:
+        chunks=wcs.getCoverageChunks('myID', '/tmp/myID', subsets=[('Lat',40,50),('Long',-10,0)],
+                                     chunk_sizes={'Lat': 1000, 'Long': 1000}, format='image/tiff')
+        chunks.mosaic('/tmp/myID.tif')
+        """
+        return tiling.get_coverage_chunks(self, identifier, directory, subsets, chunk_sizes, format=format,
+                                          max_workers=max_workers, timeout=timeout, **kwargs)
+
     def getOperationByName(self, name):
         """Return a named operation item."""
         for item in self.operations:
@@ -382,17 +444,17 @@ class ContentMetadata(object):
             ns("CoverageOffering/") + ns("supportedCRSs/") + ns("responseCRSs")
         ):
             for crs in elem.text.split(" "):
-                crss.append(Crs(crs))
+                crss.append(get_crs(crs))
         for elem in self._service.getDescribeCoverage(self.id).findall(
             ns("CoverageOffering/") + ns("supportedCRSs/") + ns("requestResponseCRSs")
         ):
             for crs in elem.text.split(" "):
-                crss.append(Crs(crs))
+                crss.append(get_crs(crs))
         for elem in self._service.getDescribeCoverage(self.id).findall(
             ns("CoverageOffering/") + ns("supportedCRSs/") + ns("nativeCRSs")
         ):
             for crs in elem.text.split(" "):
-                crss.append(Crs(crs))
+                crss.append(get_crs(crs))
         return crss
 
     supportedCRS = property(_getSupportedCRSProperty, None)
@@ -9,9 +9,24 @@
 # Contact email: d.lowe@rl.ac.uk
 # =============================================================================
 
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlencode, parse_qsl
 from owslib.etree import etree
-from owslib.util import Authentication, openURL
+from owslib.cache import read_capabilities
+from owslib.util import Authentication, openURL, log
+
+DESCRIBE_COVERAGE_CACHE_SIZE = 256  # default number of coverage descriptions kept in memory
+DESCRIBE_COVERAGE_BATCH_SIZE = 50  # default number of coverages described by one prefetch request
+DESCRIBE_COVERAGE_WORKERS = 4  # default number of concurrent prefetch requests
+
+# child elements holding the id of a coverage description, in WCS 2.0, 1.1 and 1.0
+_COVERAGE_ID_TAGS = ('{http://www.opengis.net/wcs/2.0}CoverageId', '{http://www.opengis.net/wcs/1.1}Identifier',
+                     '{http://www.opengis.net/wcs}name')
 
 
 class ServiceException(Exception):
@@ -30,10 +45,111 @@ class ServiceException(Exception):
         return repr(self.message)
 
 
+class DescribeCoverageCache(object):
+    """Cache of DescribeCoverage documents, one per coverage, keyed on the service url,
+    version and coverage id.
+
+    The most recently used documents are kept in memory, up to maxsize.  With a directory,
+    the documents are also stored on disk, so they survive the process and evicted ones are
+    read back instead of being requested again.  A cache can be shared by several
+    WebCoverageService instances (and threads).
+    """
+
+    def __init__(self, maxsize=DESCRIBE_COVERAGE_CACHE_SIZE, directory=None):
+        """Initialize
+        @param maxsize: number of documents kept in memory, None for no limit
+        @param directory: directory to also store the documents in, None to keep them in memory only
+        """
+        self.maxsize = maxsize
+        self.directory = directory
+        self._documents = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(url, version, identifier):
+        return '%s|%s|%s' % (url, version, identifier)
+
+    def _path(self, key):
+        return os.path.join(self.directory, hashlib.sha256(key.encode('utf-8')).hexdigest() + '.xml')
+
+    def get(self, key):
+        """Return the cached document of key, or None"""
+        with self._lock:
+            if key in self._documents:
+                self._documents.move_to_end(key)
+                return self._documents[key]
+        if self.directory is None:
+            return None
+        try:
+            with open(self._path(key), 'rb') as f:
+                doc = etree.fromstring(f.read())
+        except (OSError, etree.ParseError):
+            return None
+        self._remember(key, doc)
+        return doc
+
+    def put(self, key, doc):
+        """Store the document of key"""
+        self._remember(key, doc)
+        if self.directory is None:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(etree.tostring(doc))
+            os.replace(tmp, self._path(key))
+        except OSError as err:
+            log.warning('Could not write DescribeCoverage cache entry: %s', err)
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+    def _remember(self, key, doc):
+        with self._lock:
+            self._documents[key] = doc
+            self._documents.move_to_end(key)
+            while self.maxsize is not None and len(self._documents) > self.maxsize:
+                self._documents.popitem(last=False)
+
+    def __contains__(self, key):
+        with self._lock:
+            if key in self._documents:
+                return True
+        return self.directory is not None and os.path.exists(self._path(key))
+
+    def __len__(self):
+        """Number of documents in memory"""
+        return len(self._documents)
+
+    def clear(self):
+        """Remove all documents, from memory and disk"""
+        with self._lock:
+            self._documents.clear()
+        if self.directory is not None and os.path.isdir(self.directory):
+            for name in os.listdir(self.directory):
+                if name.endswith('.xml'):
+                    os.remove(os.path.join(self.directory, name))
+
+
+def split_coverage_descriptions(doc):
+    """Split a DescribeCoverage document describing several coverages into one document per
+    coverage, with the same root element, returned as {coverage id: document}"""
+    docs = {}
+    for description in doc:
+        identifier = next((child.text.strip() for child in description
+                           if child.tag in _COVERAGE_ID_TAGS and child.text), None)
+        if identifier is None:
+            continue
+        single = etree.Element(doc.tag, doc.attrib)
+        single.append(description)
+        docs[identifier] = single
+    return docs
+
+
 class WCSBase(object):
     """Base class to be subclassed by version dependent WCS classes. Provides 'high-level'
     version independent methods"""
-    def __new__(self, url, xml, cookies, auth=None):
+    def __new__(self, url, xml, cookies, auth=None, session=None, describe_coverage_cache=None):
         """ overridden __new__ method
 
         @type url: string
@@ -41,31 +157,75 @@ class WCSBase(object):
         @type xml: string
         @param xml: elementtree object
         @param auth: instance of owslib.util.Authentication
+        @param session: requests.Session to send requests with (default is the shared pooled session)
+        @param describe_coverage_cache: DescribeCoverageCache to keep DescribeCoverage responses in
+        (default is a cache of this instance)
         @return: inititalised WCSBase object
         """
         obj = object.__new__(self)
-        obj.__init__(url, xml, cookies, auth=auth)
+        obj.__init__(url, xml, cookies, auth=auth, session=session)
         self.cookies = cookies
-        self._describeCoverage = {}  # cache for DescribeCoverage responses
+        if describe_coverage_cache is None:
+            describe_coverage_cache = DescribeCoverageCache()
+        obj.describe_coverage_cache = describe_coverage_cache
         return obj
 
-    def __init__(self, auth=None):
+    def __init__(self, auth=None, session=None):
         self.auth = auth or Authentication()
+        self.session = session
 
     def getDescribeCoverage(self, identifier):
-        ''' returns a describe coverage document - checks the internal cache to see if it has been fetched before '''
-        if identifier not in list(self._describeCoverage.keys()):
+        ''' returns a describe coverage document - checks the cache to see if it has been fetched before '''
+        key = DescribeCoverageCache.key(self.url, self.version, identifier)
+        doc = self.describe_coverage_cache.get(key)
+        if doc is None:
             reader = DescribeCoverageReader(
-                self.version, identifier, self.cookies, self.auth)
-            self._describeCoverage[identifier] = reader.read(self.url)
-        return self._describeCoverage[identifier]
+                self.version, identifier, self.cookies, self.auth, session=self.session)
+            doc = reader.read(self.url)
+            self.describe_coverage_cache.put(key, doc)
+        return doc
+
+    def prefetchDescribeCoverage(self, identifiers=None, batch_size=DESCRIBE_COVERAGE_BATCH_SIZE,
+                                 max_workers=DESCRIBE_COVERAGE_WORKERS, timeout=30):
+        ''' fetches the describe coverage documents of many coverages into the cache, requesting
+        batch_size coverages at a time (DescribeCoverage accepts a list of ids) and max_workers
+        requests concurrently. Coverages left out of a response are requested on their own.
+
+        @param identifiers: the coverage ids, default is all the coverages of the service
+        @param batch_size: number of coverages per request, 1 to request them one by one
+        @param max_workers: number of concurrent requests
+        @return: the number of DescribeCoverage requests made
+        '''
+        if identifiers is None:
+            identifiers = list(self.contents)
+        cache = self.describe_coverage_cache
+        missing = [i for i in identifiers if DescribeCoverageCache.key(self.url, self.version, i) not in cache]
+        batches = [missing[i:i + batch_size] for i in range(0, len(missing), batch_size)]
+
+        def describe(batch):
+            reader = DescribeCoverageReader(self.version, batch, self.cookies, self.auth, session=self.session)
+            doc = reader.read(self.url, timeout=timeout)
+            docs = split_coverage_descriptions(doc) if len(batch) > 1 else {batch[0]: doc}
+            for identifier, single in docs.items():
+                cache.put(DescribeCoverageCache.key(self.url, self.version, identifier), single)
+            return [i for i in batch if i not in docs]
+
+        requests = len(batches)
+        if batches:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(batches))) as executor:
+                left = [i for rest in executor.map(describe, batches) for i in rest]
+                if left:
+                    log.debug('DescribeCoverage batches left out %d coverages, requesting them one by one', len(left))
+                    list(executor.map(describe, [[i] for i in left]))
+                    requests += len(left)
+        return requests
 
 
 class WCSCapabilitiesReader(object):
     """Read and parses WCS capabilities document into a lxml.etree infoset
     """
 
-    def __init__(self, version=None, cookies=None, auth=None):
+    def __init__(self, version=None, cookies=None, auth=None, session=None):
         """Initialize
         @type version: string
         @param version: WCS Version parameter e.g '1.0.0'
@@ -74,6 +234,7 @@ class WCSCapabilitiesReader(object):
         self._infoset = None
         self.cookies = cookies
         self.auth = auth or Authentication()
+        self.session = session
 
     def capabilities_url(self, service_url):
         """Return a capabilities url
@@ -109,8 +270,9 @@ class WCSCapabilitiesReader(object):
         @return: An elementtree tree representation of the capabilities document
         """
         request = self.capabilities_url(service_url)
-        u = openURL(request, timeout=timeout, cookies=self.cookies, auth=self.auth)
-        return etree.fromstring(u.read())
+        xml = read_capabilities(request, timeout=timeout, cookies=self.cookies, auth=self.auth,
+                                session=self.session)
+        return etree.fromstring(xml)
 
     def readString(self, st):
         """Parse a WCS capabilities document, returning an
@@ -124,7 +286,7 @@ class DescribeCoverageReader(object):
     """Read and parses WCS DescribeCoverage document into a lxml.etree infoset
     """
 
-    def __init__(self, version, identifier, cookies, auth=None):
+    def __init__(self, version, identifier, cookies, auth=None, session=None):
         """Initialize
         @type version: string
         @param version: WCS Version parameter e.g '1.0.0'
@@ -134,6 +296,7 @@ class DescribeCoverageReader(object):
         self.identifier = identifier
         self.cookies = cookies
         self.auth = auth or Authentication()
+        self.session = session
 
     def descCov_url(self, service_url):
         """Return a describe coverage url
@@ -154,6 +317,8 @@ class DescribeCoverageReader(object):
             qs.append(('request', 'DescribeCoverage'))
         if 'version' not in params:
             qs.append(('version', self.version))
+        if not isinstance(self.identifier, str):
+            self.identifier = ','.join(self.identifier)
         if self.version == '1.0.0':
             if 'coverage' not in params:
                 qs.append(('coverage', self.identifier))
@@ -186,5 +351,5 @@ class DescribeCoverageReader(object):
         """
 
         request = self.descCov_url(service_url)
-        u = openURL(request, cookies=self.cookies, timeout=timeout, auth=self.auth)
+        u = openURL(request, cookies=self.cookies, timeout=timeout, auth=self.auth, session=self.session)
         return etree.fromstring(u.read())
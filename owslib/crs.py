@@ -1836,7 +1836,7 @@ class Crs(object):
         return 'http://www.opengis.net/gml/srs/epsg.xml#%s' % self.code
 
     def __eq__(self, other):
-        if isinstance(other, self.__class__):
+        if isinstance(other, Crs):
             return self.getcodeurn() == other.getcodeurn()
         else:
             return False
@@ -1846,3 +1846,73 @@ class Crs(object):
 
     def __repr__(self):
         return self.getcodeurn()
+
+
+class SharedCrs(Crs):
+    """An immutable Crs, shared by all the users of the same CRS string (see get_crs)
+
+        The code, URN and URI encodings are computed once, when it is created.
+    """
+    def __init__(self, crs, axisorder=None):
+        super(SharedCrs, self).__init__(crs, axisorder)
+        encodings = {
+            '_code': Crs.getcode(self),
+            '_codeurn': Crs.getcodeurn(self),
+            '_codeuri1': Crs.getcodeuri1(self),
+            '_codeuri2': Crs.getcodeuri2(self),
+        }
+        encodings['_hash'] = hash(encodings['_codeurn'])
+        self.__dict__.update(encodings)
+
+    def __setattr__(self, name, value):
+        if '_hash' in self.__dict__:
+            raise AttributeError('shared Crs objects cannot be modified, create a Crs instead')
+        super(SharedCrs, self).__setattr__(name, value)
+
+    def __delattr__(self, name):
+        raise AttributeError('shared Crs objects cannot be modified, create a Crs instead')
+
+    def getcode(self):
+        return self._code
+
+    def getcodeurn(self):
+        return self._codeurn
+
+    def getcodeuri1(self):
+        return self._codeuri1
+
+    def getcodeuri2(self):
+        return self._codeuri2
+
+    def __eq__(self, other):
+        return self is other or super(SharedCrs, self).__eq__(other)
+
+    def __hash__(self):
+        return self._hash
+
+
+CRS_CACHE_SIZE = 4096  # maximum number of CRS strings kept by get_crs
+_crs_cache = {}
+
+
+def get_crs(crs, axisorder=None):
+    """Return the SharedCrs of a CRS string
+
+        The string is parsed once per process: the same object is returned for
+        every later call with the same arguments, which saves parsing and memory
+        when the same CRS is listed by many layers, feature types or coverages.
+
+        :param string crs: the Coordinate reference system (see Crs)
+        :param string axisorder: Force / override axisorder ('xy' or 'yx')
+        :returns: SharedCrs
+    """
+
+    key = (crs, axisorder)
+    try:
+        return _crs_cache[key]
+    except KeyError:
+        pass
+    shared = SharedCrs(crs, axisorder)
+    if len(_crs_cache) >= CRS_CACHE_SIZE:
+        _crs_cache.clear()
+    return _crs_cache.setdefault(key, shared)
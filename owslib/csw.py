@@ -11,6 +11,10 @@
 
 import inspect
 import warnings
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from copy import deepcopy
+from functools import partial
 from io import BytesIO
 import random
 from urllib.parse import urlencode
@@ -23,12 +27,17 @@ from owslib.iso import MD_Metadata, FC_FeatureCatalogue
 from owslib.fgdc import Metadata
 from owslib.dif import DIF
 from owslib.gm03 import GM03
+from owslib.cache import read_capabilities
 from owslib.namespaces import Namespaces
 from owslib.util import cleanup_namespaces, bind_url, add_namespaces, OrderedDict, Authentication, openURL, http_post
 
 # default variables
 outputformat = 'application/xml'
 
+# with parse_workers, records are sent to the worker processes in chunks, about
+# this many per worker and response
+PARSE_CHUNKS_PER_WORKER = 4
+
 
 def get_namespaces():
     n = Namespaces()
@@ -43,7 +52,7 @@ schema_location = '%s %s' % (namespaces['csw'], schema)
 class CatalogueServiceWeb(object):
     """ csw request class """
     def __init__(self, url, lang='en-US', version='2.0.2', timeout=10, skip_caps=False,
-                 username=None, password=None, auth=None):
+                 username=None, password=None, auth=None, session=None, parse_workers=None, record_xml=True):
         """
 
         Construct and process a GetCapabilities request
@@ -59,6 +68,11 @@ class CatalogueServiceWeb(object):
         - username: username for HTTP basic authentication
         - password: password for HTTP basic authentication
         - auth: instance of owslib.util.Authentication
+        - session: requests.Session to send requests with (default is the shared pooled session)
+        - parse_workers: number of processes parsing the records of each response in parallel,
+          or a concurrent.futures.Executor to parse them with (default is None: parse serially)
+        - record_xml: whether the ISO and Dublin Core records retain their serialized XML in .xml
+          (default is True)
 
         """
         if auth:
@@ -71,6 +85,10 @@ class CatalogueServiceWeb(object):
         self.version = version
         self.timeout = timeout
         self.auth = auth or Authentication(username, password)
+        self.session = session
+        self.parse_workers = parse_workers
+        self.record_xml = record_xml
+        self._parse_pool = None
         self.service = 'CSW'
         self.exceptionreport = None
         self.owscommon = ows.OwsCommon('1.0.0')
@@ -80,39 +98,14 @@ class CatalogueServiceWeb(object):
 
             data = {'service': self.service, 'version': self.version, 'request': 'GetCapabilities'}
 
-            self.request = urlencode(data)
+            self.request = '%s%s' % (bind_url(self.url), urlencode(data))
 
-            self._invoke()
+            self.response = read_capabilities(self.request, timeout=self.timeout, auth=self.auth,
+                                              session=self.session)
+            self._parse_response()
 
             if self.exceptionreport is None:
-                self.updateSequence = self._exml.getroot().attrib.get('updateSequence')
-
-                # ServiceIdentification
-                val = self._exml.find(util.nspath_eval('ows:ServiceIdentification', namespaces))
-                if val is not None:
-                    self.identification = ows.ServiceIdentification(val, self.owscommon.namespace)
-                else:
-                    self.identification = None
-                # ServiceProvider
-                val = self._exml.find(util.nspath_eval('ows:ServiceProvider', namespaces))
-                if val is not None:
-                    self.provider = ows.ServiceProvider(val, self.owscommon.namespace)
-                else:
-                    self.provider = None
-                # ServiceOperations metadata
-                self.operations = []
-                for elem in self._exml.findall(util.nspath_eval('ows:OperationsMetadata/ows:Operation', namespaces)):
-                    self.operations.append(ows.OperationsMetadata(elem, self.owscommon.namespace))
-                self.constraints = {}
-                for elem in self._exml.findall(util.nspath_eval('ows:OperationsMetadata/ows:Constraint', namespaces)):
-                    self.constraints[elem.attrib['name']] = ows.Constraint(elem, self.owscommon.namespace)
-                self.parameters = {}
-                for elem in self._exml.findall(util.nspath_eval('ows:OperationsMetadata/ows:Parameter', namespaces)):
-                    self.parameters[elem.attrib['name']] = ows.Parameter(elem, self.owscommon.namespace)
-
-                # FilterCapabilities
-                val = self._exml.find(util.nspath_eval('ogc:Filter_Capabilities', namespaces))
-                self.filters = fes.FilterCapabilities(val)
+                self._parsecapabilities()
 
     def describerecord(self, typename='csw:Record', format=outputformat):
         """
@@ -330,78 +323,108 @@ class CatalogueServiceWeb(object):
 
         """
 
-        if xml is not None:
-            self.request = etree.fromstring(xml)
-            val = self.request.find(util.nspath_eval('csw:Query/csw:ElementSetName', namespaces))
-            if val is not None:
-                esn = util.testXMLValue(val)
-            val = self.request.attrib.get('outputSchema')
-            if val is not None:
-                outputschema = util.testXMLValue(val, True)
-        else:
-            # construct request
-            node0 = self._setrootelement('csw:GetRecords')
-            if etree.__name__ != 'lxml.etree':  # apply nsmap manually
-                node0.set('xmlns:ows', namespaces['ows'])
-                node0.set('xmlns:gmd', namespaces['gmd'])
-                node0.set('xmlns:dif', namespaces['dif'])
-                node0.set('xmlns:fgdc', namespaces['fgdc'])
-            node0.set('outputSchema', outputschema)
-            node0.set('outputFormat', format)
-            node0.set('version', self.version)
-            node0.set('service', self.service)
-            node0.set('resultType', resulttype)
-            if startposition > 0:
-                node0.set('startPosition', str(startposition))
-            node0.set('maxRecords', str(maxrecords))
-            node0.set(util.nspath_eval('xsi:schemaLocation', namespaces), schema_location)
-
-            node1 = etree.SubElement(node0, util.nspath_eval('csw:Query', namespaces))
-            node1.set('typeNames', typenames)
-
-            etree.SubElement(node1, util.nspath_eval('csw:ElementSetName', namespaces)).text = esn
+        esn, outputschema = self._getrecords2_request(
+            constraints=constraints, sortby=sortby, typenames=typenames, esn=esn, outputschema=outputschema,
+            format=format, startposition=startposition, maxrecords=maxrecords, cql=cql, xml=xml,
+            resulttype=resulttype)
 
-            if any([len(constraints) > 0, cql is not None]):
-                node2 = etree.SubElement(node1, util.nspath_eval('csw:Constraint', namespaces))
-                node2.set('version', '1.1.0')
-                flt = fes.FilterRequest()
-                if len(constraints) > 0:
-                    node2.append(flt.setConstraintList(constraints))
-                # Now add a CQL filter if passed in
-                elif cql is not None:
-                    etree.SubElement(node2, util.nspath_eval('csw:CqlText', namespaces)).text = cql
+        self._invoke()
 
-            if sortby is not None and isinstance(sortby, fes.SortBy):
-                node1.append(sortby.toXML())
+        if self.exceptionreport is None:
+            self._parsesearchresults(outputschema, esn)
 
-            self.request = node0
+    def iter_records(self, constraints=[], sortby=None, typenames='csw:Record', esn='summary',
+                     outputschema=namespaces['csw'], format=outputformat, startposition=1,
+                     page_size=100, maxrecords=None, cql=None, xml=None, prefetch=True):
+        """
 
-        self._invoke()
+        Iterate over the records matching a GetRecords query, requesting pages of
+        page_size records and following nextRecord from page to page (or advancing
+        startPosition when the server does not supply it).  Each page is released once
+        its records are consumed, and the next page is requested meanwhile.  Unlike
+        getrecords2, the request, response and records properties are left untouched.
 
-        if self.exceptionreport is None:
-            self.results = {}
+        Parameters
+        ----------
 
-            # process search results attributes
-            val = self._exml.find(
-                util.nspath_eval('csw:SearchResults', namespaces)).attrib.get('numberOfRecordsMatched')
-            self.results['matches'] = int(util.testXMLValue(val, True))
-            val = self._exml.find(
-                util.nspath_eval('csw:SearchResults', namespaces)).attrib.get('numberOfRecordsReturned')
-            self.results['returned'] = int(util.testXMLValue(val, True))
-            val = self._exml.find(util.nspath_eval('csw:SearchResults', namespaces)).attrib.get('nextRecord')
-            if val is not None:
-                self.results['nextrecord'] = int(util.testXMLValue(val, True))
-            else:
-                warnings.warn("""CSW Server did not supply a nextRecord value (it is optional), so the client
-                should page through the results in another way.""")
-                # For more info, see:
-                # https://github.com/geopython/OWSLib/issues/100
-                self.results['nextrecord'] = None
+        - constraints: the list of constraints (OgcExpression from owslib.fes module)
+        - sortby: an OGC SortBy object (SortBy from owslib.fes module)
+        - typenames: the typeNames to query against (default is csw:Record)
+        - esn: the ElementSetName 'full', 'brief' or 'summary' (default is 'summary')
+        - outputschema: the outputSchema (default is 'http://www.opengis.net/cat/csw/2.0.2')
+        - format: the outputFormat (default is 'application/xml')
+        - startposition: position of the first record to return (default is 1)
+        - page_size: the number of records requested per GetRecords request (default is 100)
+        - maxrecords: the maximum number of records to return (default is all records)
+        - cql: common query language text.  Note this overrides bbox, qtype, keywords
+        - xml: raw XML request.  Note this overrides all other options except paging
+        - prefetch: whether to request the next page while the records of the current page
+          are consumed (default is True)
 
-            # process list of matching records
-            self.records = OrderedDict()
+        """
 
-            self._parserecords(outputschema, esn)
+        if maxrecords is not None:
+            page_size = min(page_size, maxrecords)
+        request, esn, outputschema = self._getrecords2_element(
+            constraints=constraints, sortby=sortby, typenames=typenames, esn=esn, outputschema=outputschema,
+            format=format, maxrecords=page_size, cql=cql, xml=xml)
+        request.set('resultType', 'results')
+        request.set('maxRecords', str(page_size))
+
+        count = 0
+        position = max(startposition, 1)
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        try:
+            exml = self._getrecords_page(request, position)
+            while True:
+                results = self._searchresults(exml)
+                position = self._nextrecord(results, position)
+                if maxrecords is not None and count + results['returned'] >= maxrecords:
+                    position = None
+
+                future = None
+                if executor is not None and position is not None:
+                    future = executor.submit(self._getrecords_page, request, position)
+
+                records, exml = self._iterrecords(exml, outputschema, esn), None
+                for identifier, record in records:
+                    if maxrecords is not None and count >= maxrecords:
+                        return
+                    count += 1
+                    yield record
+
+                if position is None:
+                    return
+                if future is not None:
+                    exml = future.result()
+                else:
+                    exml = self._getrecords_page(request, position)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False)
+
+    def _getrecords_page(self, request, startposition):
+        """ Request a page of a GetRecords request element, returning the parsed response """
+
+        request = deepcopy(request)
+        request.set('startPosition', str(startposition))
+        response = http_post(self._request_url('getrecords', request), self._serialize_request(request),
+                             self.lang, self.timeout, auth=self.auth, session=self.session)
+        exml = etree.parse(BytesIO(response))
+        self._check_response(exml)
+        return exml
+
+    def _nextrecord(self, results, position):
+        """ Return the position of the page after the one at position, or None if it is the last one """
+
+        if results['returned'] == 0:
+            return None
+        nextrecord = results['nextrecord']
+        if nextrecord is None or 0 < nextrecord <= position:  # not supplied or not advancing
+            nextrecord = position + results['returned']
+        if nextrecord == 0 or nextrecord > results['matches']:
+            return None
+        return nextrecord
 
     def transaction(self, ttype=None, typename='csw:Record', record=None, propertyname=None, propertyvalue=None,
                     bbox=None, keywords=[], cql=None, identifier=None):
@@ -541,6 +564,147 @@ class CatalogueServiceWeb(object):
                 urls.append(url)
         return urls
 
+    def close(self):
+        """Shut down the worker processes parsing the records, if this instance created them
+
+        An executor given as parse_workers is left running, for its owner to shut down.
+        """
+        if self._parse_pool is not None and self._parse_pool is not self.parse_workers:
+            self._parse_pool.shutdown()
+        self._parse_pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _parsecapabilities(self):
+        self.updateSequence = self._exml.getroot().attrib.get('updateSequence')
+
+        # ServiceIdentification
+        val = self._exml.find(util.nspath_eval('ows:ServiceIdentification', namespaces))
+        if val is not None:
+            self.identification = ows.ServiceIdentification(val, self.owscommon.namespace)
+        else:
+            self.identification = None
+        # ServiceProvider
+        val = self._exml.find(util.nspath_eval('ows:ServiceProvider', namespaces))
+        if val is not None:
+            self.provider = ows.ServiceProvider(val, self.owscommon.namespace)
+        else:
+            self.provider = None
+        # ServiceOperations metadata
+        self.operations = []
+        for elem in self._exml.findall(util.nspath_eval('ows:OperationsMetadata/ows:Operation', namespaces)):
+            self.operations.append(ows.OperationsMetadata(elem, self.owscommon.namespace))
+        self.constraints = {}
+        for elem in self._exml.findall(util.nspath_eval('ows:OperationsMetadata/ows:Constraint', namespaces)):
+            self.constraints[elem.attrib['name']] = ows.Constraint(elem, self.owscommon.namespace)
+        self.parameters = {}
+        for elem in self._exml.findall(util.nspath_eval('ows:OperationsMetadata/ows:Parameter', namespaces)):
+            self.parameters[elem.attrib['name']] = ows.Parameter(elem, self.owscommon.namespace)
+
+        # FilterCapabilities
+        val = self._exml.find(util.nspath_eval('ogc:Filter_Capabilities', namespaces))
+        self.filters = fes.FilterCapabilities(val)
+
+    def _getrecords2_request(self, constraints=[], sortby=None, typenames='csw:Record', esn='summary',
+                             outputschema=namespaces['csw'], format=outputformat, startposition=0,
+                             maxrecords=10, cql=None, xml=None, resulttype='results'):
+        """ Set self.request to a GetRecords request, returning the requested ElementSetName and outputSchema """
+
+        self.request, esn, outputschema = self._getrecords2_element(
+            constraints=constraints, sortby=sortby, typenames=typenames, esn=esn, outputschema=outputschema,
+            format=format, startposition=startposition, maxrecords=maxrecords, cql=cql, xml=xml,
+            resulttype=resulttype)
+        return esn, outputschema
+
+    def _getrecords2_element(self, constraints=[], sortby=None, typenames='csw:Record', esn='summary',
+                             outputschema=namespaces['csw'], format=outputformat, startposition=0,
+                             maxrecords=10, cql=None, xml=None, resulttype='results'):
+        """ Return a GetRecords request element, with the requested ElementSetName and outputSchema """
+
+        if xml is not None:
+            request = etree.fromstring(xml)
+            val = request.find(util.nspath_eval('csw:Query/csw:ElementSetName', namespaces))
+            if val is not None:
+                esn = util.testXMLValue(val)
+            val = request.attrib.get('outputSchema')
+            if val is not None:
+                outputschema = util.testXMLValue(val, True)
+        else:
+            # construct request
+            node0 = self._setrootelement('csw:GetRecords')
+            if etree.__name__ != 'lxml.etree':  # apply nsmap manually
+                node0.set('xmlns:ows', namespaces['ows'])
+                node0.set('xmlns:gmd', namespaces['gmd'])
+                node0.set('xmlns:dif', namespaces['dif'])
+                node0.set('xmlns:fgdc', namespaces['fgdc'])
+            node0.set('outputSchema', outputschema)
+            node0.set('outputFormat', format)
+            node0.set('version', self.version)
+            node0.set('service', self.service)
+            node0.set('resultType', resulttype)
+            if startposition > 0:
+                node0.set('startPosition', str(startposition))
+            node0.set('maxRecords', str(maxrecords))
+            node0.set(util.nspath_eval('xsi:schemaLocation', namespaces), schema_location)
+
+            node1 = etree.SubElement(node0, util.nspath_eval('csw:Query', namespaces))
+            node1.set('typeNames', typenames)
+
+            etree.SubElement(node1, util.nspath_eval('csw:ElementSetName', namespaces)).text = esn
+
+            if any([len(constraints) > 0, cql is not None]):
+                node2 = etree.SubElement(node1, util.nspath_eval('csw:Constraint', namespaces))
+                node2.set('version', '1.1.0')
+                flt = fes.FilterRequest()
+                if len(constraints) > 0:
+                    node2.append(flt.setConstraintList(constraints))
+                # Now add a CQL filter if passed in
+                elif cql is not None:
+                    etree.SubElement(node2, util.nspath_eval('csw:CqlText', namespaces)).text = cql
+
+            if sortby is not None and isinstance(sortby, fes.SortBy):
+                node1.append(sortby.toXML())
+
+            request = node0
+
+        return request, esn, outputschema
+
+    def _parsesearchresults(self, outputschema, esn):
+        self.results = self._searchresults(self._exml)
+
+        if self.results['nextrecord'] is None:
+            warnings.warn("""CSW Server did not supply a nextRecord value (it is optional), so the client
+            should page through the results in another way.""")
+            # For more info, see:
+            # https://github.com/geopython/OWSLib/issues/100
+
+        # process list of matching records
+        self.records = OrderedDict()
+
+        self._parserecords(outputschema, esn)
+
+    def _searchresults(self, exml):
+        """ Return the matches, returned and nextrecord (None if not supplied) of a GetRecords response """
+        results = {}
+
+        # process search results attributes
+        searchresults = exml.find(util.nspath_eval('csw:SearchResults', namespaces))
+        val = searchresults.attrib.get('numberOfRecordsMatched')
+        results['matches'] = int(util.testXMLValue(val, True))
+        val = searchresults.attrib.get('numberOfRecordsReturned')
+        results['returned'] = int(util.testXMLValue(val, True))
+        val = searchresults.attrib.get('nextRecord')
+        if val is not None:
+            results['nextrecord'] = int(util.testXMLValue(val, True))
+        else:
+            results['nextrecord'] = None
+
+        return results
+
     def _parseinsertresult(self):
         self.results['insertresults'] = []
         for i in self._exml.findall('.//' + util.nspath_eval('csw:InsertResult', namespaces)):
@@ -548,35 +712,63 @@ class CatalogueServiceWeb(object):
                 self.results['insertresults'].append(util.testXMLValue(j))
 
     def _parserecords(self, outputschema, esn):
+        for identifier, record in self._iterrecords(self._exml, outputschema, esn):
+            self.records[identifier] = record
+
+    def _iterrecords(self, exml, outputschema, esn):
+        """ Parse the records of a response, yielding (identifier, record) pairs in document order """
+        elements = self._recordelements(exml, outputschema, esn)
+        pool = self._get_parse_pool()
+        if pool is None:
+            for identifier, parser, element in elements:
+                yield identifier, parser(element)
+            return
+
+        # parse the serialized records in worker processes
+        elements = list(elements)
+        chunksize = max(1, len(elements) // (PARSE_CHUNKS_PER_WORKER * self._parse_workers))
+        records = pool.map(_parse_record, [parser for identifier, parser, element in elements],
+                           [etree.tostring(element) for identifier, parser, element in elements],
+                           chunksize=chunksize)
+        for (identifier, parser, element), record in zip(elements, records):
+            yield identifier, record
+
+    def _recordelements(self, exml, outputschema, esn):
+        """ Yield the (identifier, record class, element) of each record of a response """
+        if self.record_xml:
+            MD_Metadata_, CswRecord_ = MD_Metadata, CswRecord
+        else:
+            MD_Metadata_, CswRecord_ = partial(MD_Metadata, xml=False), partial(CswRecord, xml=False)
+
         if outputschema == namespaces['gmd']:  # iso 19139
-            for i in self._exml.findall('.//' + util.nspath_eval('gmd:MD_Metadata', namespaces)) or \
-                    self._exml.findall('.//' + util.nspath_eval('gmi:MI_Metadata', namespaces)):
+            for i in exml.findall('.//' + util.nspath_eval('gmd:MD_Metadata', namespaces)) or \
+                    exml.findall('.//' + util.nspath_eval('gmi:MI_Metadata', namespaces)):
                 val = i.find(util.nspath_eval('gmd:fileIdentifier/gco:CharacterString', namespaces))
                 identifier = self._setidentifierkey(util.testXMLValue(val))
-                self.records[identifier] = MD_Metadata(i)
-            for i in self._exml.findall('.//' + util.nspath_eval('gfc:FC_FeatureCatalogue', namespaces)):
+                yield identifier, MD_Metadata_, i
+            for i in exml.findall('.//' + util.nspath_eval('gfc:FC_FeatureCatalogue', namespaces)):
                 identifier = self._setidentifierkey(util.testXMLValue(i.attrib['uuid'], attrib=True))
-                self.records[identifier] = FC_FeatureCatalogue(i)
+                yield identifier, FC_FeatureCatalogue, i
         elif outputschema == namespaces['fgdc']:  # fgdc csdgm
-            for i in self._exml.findall('.//metadata'):
+            for i in exml.findall('.//metadata'):
                 val = i.find('idinfo/datasetid')
                 identifier = self._setidentifierkey(util.testXMLValue(val))
-                self.records[identifier] = Metadata(i)
+                yield identifier, Metadata, i
         elif outputschema == namespaces['dif']:  # nasa dif
-            for i in self._exml.findall('.//' + util.nspath_eval('dif:DIF', namespaces)):
+            for i in exml.findall('.//' + util.nspath_eval('dif:DIF', namespaces)):
                 val = i.find(util.nspath_eval('dif:Entry_ID', namespaces))
                 identifier = self._setidentifierkey(util.testXMLValue(val))
-                self.records[identifier] = DIF(i)
+                yield identifier, DIF, i
         elif outputschema == namespaces['gm03']:  # GM03
-            for i in self._exml.findall('.//' + util.nspath_eval('gm03:TRANSFER', namespaces)):
+            for i in exml.findall('.//' + util.nspath_eval('gm03:TRANSFER', namespaces)):
                 val = i.find(util.nspath_eval('gm03:fileIdentifier', namespaces))
                 identifier = self._setidentifierkey(util.testXMLValue(val))
-                self.records[identifier] = GM03(i)
+                yield identifier, GM03, i
         else:  # process default
-            for i in self._exml.findall('.//' + util.nspath_eval('csw:%s' % self._setesnel(esn), namespaces)):
+            for i in exml.findall('.//' + util.nspath_eval('csw:%s' % self._setesnel(esn), namespaces)):
                 val = i.find(util.nspath_eval('dc:identifier', namespaces))
                 identifier = self._setidentifierkey(util.testXMLValue(val))
-                self.records[identifier] = CswRecord(i)
+                yield identifier, CswRecord_, i
 
     def _parsetransactionsummary(self):
         val = self._exml.find(util.nspath_eval('csw:TransactionResponse/csw:TransactionSummary', namespaces))
@@ -590,6 +782,22 @@ class CatalogueServiceWeb(object):
             ts = val.find(util.nspath_eval('csw:totalDeleted', namespaces))
             self.results['deleted'] = int(util.testXMLValue(ts))
 
+    def _get_parse_pool(self):
+        """ Return the executor parsing records in parallel, if any (creating it on first use) """
+        if self._parse_pool is None and self.parse_workers:
+            if isinstance(self.parse_workers, Executor):
+                self._parse_pool = self.parse_workers
+            else:
+                self._parse_pool = ProcessPoolExecutor(max_workers=self.parse_workers)
+        return self._parse_pool
+
+    @property
+    def _parse_workers(self):
+        """ Number of worker processes parsing records """
+        if isinstance(self.parse_workers, int):
+            return self.parse_workers
+        return getattr(self.parse_workers, '_max_workers', None) or os.cpu_count() or 1
+
     def _setesnel(self, esn):
         """ Set the element name to parse depending on the ElementSetName requested """
         el = 'Record'
@@ -631,19 +839,38 @@ class CatalogueServiceWeb(object):
     def _invoke(self):
         # do HTTP request
 
-        request_url = self.url
+        request_url = self._request_url(inspect.stack()[1][3])
+
+        if isinstance(self.request, str):  # GET KVP
+            self.request = '%s%s' % (bind_url(request_url), self.request)
+            self.response = openURL(
+                self.request, None, 'Get', timeout=self.timeout, auth=self.auth, session=self.session
+            ).read()
+        else:
+            self._prepare_request()
+
+            self.response = http_post(request_url, self.request, self.lang, self.timeout, auth=self.auth,
+                                      session=self.session)
+
+        self._parse_response()
 
-        # Get correct URL based on Operation list.
+    def _request_url(self, caller, request=None):
+        """ Return the URL of the operation named caller, based on the Operation list and the
+        request (default is self.request) """
+
+        if request is None:
+            request = self.request
+
+        request_url = self.url
 
         # If skip_caps=True, then self.operations has not been set, so use
         # default URL.
         if hasattr(self, 'operations'):
-            caller = inspect.stack()[1][3]
             if caller == 'getrecords2':
                 caller = 'getrecords'
             try:
                 op = self.get_operation_by_name(caller)
-                if isinstance(self.request, str):  # GET KVP
+                if isinstance(request, str):  # GET KVP
                     get_verbs = [x for x in op.methods if x.get('type').lower() == 'get']
                     request_url = get_verbs[0].get('url')
                 else:
@@ -665,31 +892,42 @@ class CatalogueServiceWeb(object):
             except Exception:  # no such luck, just go with request_url
                 pass
 
-        if isinstance(self.request, str):  # GET KVP
-            self.request = '%s%s' % (bind_url(request_url), self.request)
-            self.response = openURL(
-                self.request, None, 'Get', timeout=self.timeout, auth=self.auth
-            ).read()
-        else:
-            self.request = cleanup_namespaces(self.request)
-            # Add any namespaces used in the "typeNames" attribute of the
-            # csw:Query element to the query's xml namespaces.
-            for query in self.request.findall(util.nspath_eval('csw:Query', namespaces)):
-                ns = query.get("typeNames", None)
-                if ns is not None:
-                    # Pull out "gmd" from something like "gmd:MD_Metadata" from the list
-                    # of typenames
-                    ns_keys = [x.split(':')[0] for x in ns.split(' ')]
-                    self.request = add_namespaces(self.request, ns_keys)
-            self.request = add_namespaces(self.request, 'ows')
-
-            self.request = util.element_to_string(self.request, encoding='utf-8')
-
-            self.response = http_post(request_url, self.request, self.lang, self.timeout, auth=self.auth)
+        return request_url
+
+    def _prepare_request(self):
+        """ Serialize the XML request in self.request for an HTTP POST """
+
+        self.request = self._serialize_request(self.request)
+
+    def _serialize_request(self, request):
+        """ Return the serialized XML request element for an HTTP POST """
+
+        request = cleanup_namespaces(request)
+        # Add any namespaces used in the "typeNames" attribute of the
+        # csw:Query element to the query's xml namespaces.
+        for query in request.findall(util.nspath_eval('csw:Query', namespaces)):
+            ns = query.get("typeNames", None)
+            if ns is not None:
+                # Pull out "gmd" from something like "gmd:MD_Metadata" from the list
+                # of typenames
+                ns_keys = [x.split(':')[0] for x in ns.split(' ')]
+                request = add_namespaces(request, ns_keys)
+        request = add_namespaces(request, 'ows')
+
+        return util.element_to_string(request, encoding='utf-8')
+
+    def _parse_response(self):
+        """ Parse self.response, raising an ExceptionReport if it is an OGC Exception """
 
         # parse result see if it's XML
         self._exml = etree.parse(BytesIO(self.response))
 
+        self._check_response(self._exml)
+        self.exceptionreport = None
+
+    def _check_response(self, exml):
+        """ Raise an ExceptionReport if a parsed response is an OGC Exception (or not a CSW response) """
+
         # it's XML.  Attempt to decipher whether the XML response is CSW-ish """
         valid_xpaths = [
             util.nspath_eval('ows:ExceptionReport', namespaces),
@@ -702,22 +940,27 @@ class CatalogueServiceWeb(object):
             util.nspath_eval('csw:TransactionResponse', namespaces)
         ]
 
-        if self._exml.getroot().tag not in valid_xpaths:
+        if exml.getroot().tag not in valid_xpaths:
             raise RuntimeError('Document is XML, but not CSW-ish')
 
         # check if it's an OGC Exception
-        val = self._exml.find(util.nspath_eval('ows:Exception', namespaces))
+        val = exml.find(util.nspath_eval('ows:Exception', namespaces))
         if val is not None:
-            raise ows.ExceptionReport(self._exml, self.owscommon.namespace)
-        else:
-            self.exceptionreport = None
+            raise ows.ExceptionReport(exml, self.owscommon.namespace)
 
 
 class CswRecord(object):
     """ Process csw:Record, csw:BriefRecord, csw:SummaryRecord """
-    def __init__(self, record):
+    __slots__ = ('rdf', 'identifier', 'identifiers', 'type', 'title', 'alternative', 'ispartof', 'abstract', 'date',
+                 'created', 'issued', 'relation', 'temporal', 'uris', 'references', 'modified', 'creator', 'publisher',
+                 'coverage', 'contributor', 'language', 'source', 'rightsholder', 'accessrights', 'license', 'format',
+                 'subjects', 'rights', 'spatial', 'xml', 'bbox', 'bbox_wgs84')
+
+    def __init__(self, record, xml=True):
 
-        if hasattr(record, 'getroot'):  # standalone document
+        if not xml:  # the serialized record is not retained
+            self.xml = None
+        elif hasattr(record, 'getroot'):  # standalone document
             self.xml = etree.tostring(record.getroot())
         else:  # part of a larger document
             self.xml = etree.tostring(record)
@@ -847,3 +1090,8 @@ class CswRecord(object):
             self.bbox_wgs84 = ows.WGS84BoundingBox(val, namespaces['ows'])
         else:
             self.bbox_wgs84 = None
+
+
+def _parse_record(parser, xml):
+    """ Parse a serialized record with the record class parser (in a worker process) """
+    return parser(etree.fromstring(xml))
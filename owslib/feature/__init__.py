@@ -5,13 +5,41 @@
 #
 # =============================================================================
 
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+import json
 from urllib.parse import urlencode
-from owslib.crs import Crs
-from owslib.util import log, Authentication
+from owslib.crs import Crs, get_crs
+from owslib.etree import etree
+from owslib.util import log, Authentication, openURL
 from owslib.feature.schema import get_schema
 from owslib.feature.postrequest import PostRequest_1_1_0, PostRequest_2_0_0
 
 
+def _number_returned(content):
+    """Return the number of features of a GetFeature response (GML or GeoJSON)"""
+    try:
+        root = etree.fromstring(content)
+    except Exception:
+        try:
+            return len(json.loads(content).get("features", []))
+        except (ValueError, AttributeError):
+            return 0
+    returned = root.get("numberReturned", root.get("numberOfFeatures"))
+    if returned is not None and returned.isdigit():
+        return int(returned)
+    # count the feature members
+    count = 0
+    for elem in root:
+        tag = str(elem.tag).split("}")[-1]
+        if tag in ("member", "featureMember"):
+            count += 1
+        elif tag == "featureMembers":
+            count += len(elem)
+    return count
+
+
 class WebFeatureService_(object):
     """Base class for WebFeatureService implementations"""
 
@@ -32,7 +60,7 @@ class WebFeatureService_(object):
 
         # srs of the bbox is specified in the bbox as fifth paramter
         if len(bbox) == 5:
-            srs = Crs(bbox[4])
+            srs = get_crs(bbox[4])
         # take default srs
         else:
             srs = self.contents[typename[0]].crsOptions[0]
@@ -90,7 +118,7 @@ class WebFeatureService_(object):
 
         # srs of the bbox is specified in the bbox as fifth paramter
         if len(bbox) == 5:
-            srs = Crs(bbox[4])
+            srs = get_crs(bbox[4])
         # take default srs
         else:
             srs = self.contents[typename[0]].crsOptions[0]
@@ -126,7 +154,7 @@ class WebFeatureService_(object):
         @type typename: String
         """
         if not isinstance(srsname, Crs):
-            srs = Crs(srsname)
+            srs = get_crs(srsname)
         else:
             srs = srsname
 
@@ -373,6 +401,120 @@ class WebFeatureService_(object):
         data = request.to_string()
         return base_url, data
 
+    def getfeature_hits(self, method="Get", **kwargs):
+        """Return the number of features matched by a GetFeature request,
+        using a resultType=hits request
+
+        Parameters
+        ----------
+        method : string
+            Qualified name of the HTTP DCP method to use.
+        kwargs : dict
+            The parameters of getfeature (typename, filter, bbox, ...)
+
+        Returns:
+            int -- numberMatched (WFS 2.0.0) or numberOfFeatures (WFS 1.1.0),
+            or None when the service does not know it
+        """
+        kwargs.pop("outputFormat", None)
+        kwargs.pop("maxfeatures", None)
+        kwargs.pop("startindex", None)
+        url, data = self._getfeature_request(method=method, **kwargs)
+
+        if method.lower() == "get":
+            if data:
+                data += "&resultType=hits"
+            else:
+                url += ("&" if "?" in url else "?") + "resultType=hits"
+        else:
+            request = etree.fromstring(data)
+            request.set("resultType", "hits")
+            data = etree.tostring(request)
+
+        u = openURL(url, data, method, timeout=self.timeout, headers=self.headers, auth=self.auth,
+                    session=self.session)
+        root = etree.fromstring(u.read())
+
+        if int(self.version.split(".")[0]) >= 2:
+            number = root.get("numberMatched")
+        else:
+            number = root.get("numberOfFeatures")
+        if number is None or not number.isdigit():
+            return None
+        return int(number)
+
+    def iter_features(self, page_size=1000, max_workers=4, maxfeatures=None, startindex=0, **kwargs):
+        """Request all features of a GetFeature request in pages, and yield
+        the pages in order as file-like objects.
+
+        The number of matching features is first requested with a
+        resultType=hits request; the range is then split into pages of
+        page_size features (with startindex), which are requested
+        concurrently.  At most 2 * max_workers pages are requested ahead of
+        the page being consumed.  Use sortby for a stable order of the
+        features across pages.
+
+        When the service does not report the number of matching features,
+        the pages are requested one after the other until an empty page is
+        returned.
+
+        Parameters
+        ----------
+        page_size : int
+            Number of features per page (GetFeature request).
+        max_workers : int
+            Maximum number of concurrent requests.
+        maxfeatures : int
+            Maximum number of features to be returned (default is all).
+        startindex: int
+            Start position of the first page.
+        kwargs : dict
+            The other parameters of getfeature (typename, filter, bbox,
+            propertyname, sortby, outputFormat, method, ...)
+        """
+        total = self.getfeature_hits(**dict(kwargs))
+        if total is None:
+            for page in self._iter_features_serial(page_size, maxfeatures, startindex, kwargs):
+                yield page
+            return
+
+        end = total if maxfeatures is None else min(total, startindex + maxfeatures)
+        pages = ((start, min(page_size, end - start)) for start in range(startindex, end, page_size))
+
+        def fetch(page):
+            return self.getfeature(startindex=page[0], maxfeatures=page[1], **kwargs)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = deque()
+            for page in pages:
+                futures.append(executor.submit(fetch, page))
+                if len(futures) >= 2 * max_workers:
+                    yield futures.popleft().result()
+            while futures:
+                yield futures.popleft().result()
+
+    def _iter_features_serial(self, page_size, maxfeatures, startindex, kwargs):
+        """Yield pages one after the other until an empty (or last) page"""
+        count = 0
+        while maxfeatures is None or count < maxfeatures:
+            size = page_size if maxfeatures is None else min(page_size, maxfeatures - count)
+            content = self.getfeature(startindex=startindex + count, maxfeatures=size, **kwargs).read()
+            returned = _number_returned(content)
+            if not returned:
+                return
+            yield BytesIO(content)
+            count += returned
+            if returned < size:
+                return
+
+    def getfeature_all(self, **kwargs):
+        """Request all features of a GetFeature request in concurrent pages,
+        returning the list of pages (file-like objects) in order.
+
+        Takes the parameters of iter_features.
+        """
+        return list(self.iter_features(**kwargs))
+
     def get_schema(self, typename):
         """
         Get layer schema compatible with :class:`fiona` schema object
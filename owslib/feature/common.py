@@ -1,5 +1,9 @@
+from io import BytesIO
+
+from owslib.cache import read_capabilities
 from owslib.etree import etree
-from owslib.util import Authentication, openURL
+from owslib.namespaces import Namespaces
+from owslib.util import Authentication, openURL, nspath, ServiceException, stream_response
 
 from urllib.parse import urlencode, parse_qsl
 
@@ -8,7 +12,7 @@ class WFSCapabilitiesReader(object):
     """Read and parse capabilities document into a lxml.etree infoset
     """
 
-    def __init__(self, version="1.0", username=None, password=None, headers=None, auth=None):
+    def __init__(self, version="1.0", username=None, password=None, headers=None, auth=None, session=None):
         """Initialize"""
         self.headers = headers
         if auth:
@@ -17,6 +21,7 @@ class WFSCapabilitiesReader(object):
             if password:
                 auth.password = password
         self.auth = auth or Authentication(username, password)
+        self.session = session
         self.version = version
         self._infoset = None
 
@@ -51,8 +56,9 @@ class WFSCapabilitiesReader(object):
             A timeout value (in seconds) for the request.
         """
         request = self.capabilities_url(url)
-        u = openURL(request, timeout=timeout, headers=self.headers, auth=self.auth)
-        return etree.fromstring(u.read())
+        xml = read_capabilities(request, timeout=timeout, headers=self.headers, auth=self.auth,
+                                session=self.session)
+        return etree.fromstring(xml)
 
     def readString(self, st):
         """Parse a WFS capabilities document, returning an
@@ -78,3 +84,49 @@ class AbstractContentMetadata(object):
             for m in self.metadataUrls
             if m.get("metadata", None) is not None
         ]
+
+
+def getfeature_response(u):
+    """Check a GetFeature response for a ServiceExceptionReport and
+    return the feature data as a file-like object
+    """
+    ogc_namespace = Namespaces().get_namespace("ogc")
+
+    # check for service exceptions, rewrap, and return
+    # We're going to assume that anything with a content-length > 32k
+    # is data. We'll check anything smaller.
+    if "Content-Length" in u.info():
+        length = int(u.info()["Content-Length"])
+        have_read = False
+    else:
+        data = u.read()
+        have_read = True
+        length = len(data)
+
+    if length < 32000:
+        if not have_read:
+            data = u.read()
+
+        try:
+            tree = etree.fromstring(data)
+        except BaseException:
+            # Not XML
+            return BytesIO(data)
+        else:
+            if tree.tag == "{%s}ServiceExceptionReport" % ogc_namespace:
+                se = tree.find(nspath("ServiceException", ogc_namespace))
+                raise ServiceException(str(se.text).strip())
+            else:
+                return BytesIO(data)
+    else:
+        if have_read:
+            return BytesIO(data)
+        return u
+
+
+def getfeature_stream(u):
+    """Check a streamed GetFeature response (openURL(..., stream=True)) for an
+    exception report, reading only its first bytes, and return the feature data
+    as a file-like object read while it is downloaded (see stream_response)
+    """
+    return stream_response(u)
@@ -22,12 +22,14 @@ from owslib.util import (
 from owslib.etree import etree
 from owslib.fgdc import Metadata
 from owslib.iso import MD_Metadata
-from owslib.crs import Crs
+from owslib.crs import get_crs
 from owslib.namespaces import Namespaces
 from owslib.feature.schema import get_schema
 from owslib.feature.common import (
     WFSCapabilitiesReader,
     AbstractContentMetadata,
+    getfeature_response,
+    getfeature_stream,
 )
 
 import pyproj
@@ -75,6 +77,7 @@ class WebFeatureService_1_0_0(object):
         username=None,
         password=None,
         auth=None,
+        session=None,
     ):
         """ overridden __new__ method
 
@@ -89,6 +92,7 @@ class WebFeatureService_1_0_0(object):
         @param username: service authentication username
         @param password: service authentication password
         @param auth: instance of owslib.util.Authentication
+        @param session: requests.Session to send requests with (default is the shared pooled session)
         @return: initialized WebFeatureService_1_0_0 object
         """
         obj = object.__new__(self)
@@ -102,6 +106,7 @@ class WebFeatureService_1_0_0(object):
             username=username,
             password=password,
             auth=auth,
+            session=session,
         )
         return obj
 
@@ -123,6 +128,7 @@ class WebFeatureService_1_0_0(object):
         username=None,
         password=None,
         auth=None,
+        session=None,
     ):
         """Initialize."""
         if auth:
@@ -135,8 +141,9 @@ class WebFeatureService_1_0_0(object):
         self.timeout = timeout
         self.headers = headers
         self.auth = auth or Authentication(username, password)
+        self.session = session
         self._capabilities = None
-        reader = WFSCapabilitiesReader(self.version, headers=self.headers, auth=self.auth)
+        reader = WFSCapabilitiesReader(self.version, headers=self.headers, auth=self.auth, session=self.session)
         if xml:
             self._capabilities = reader.readString(xml)
         else:
@@ -167,11 +174,13 @@ class WebFeatureService_1_0_0(object):
         featuretypelist = self._capabilities.find(nspath("FeatureTypeList"))
         features = self._capabilities.findall(nspath("FeatureTypeList/FeatureType"))
         for feature in features:
-            cm = ContentMetadata(
-                feature, featuretypelist, parse_remote_metadata, auth=self.auth
-            )
+            cm = ContentMetadata(feature, featuretypelist, auth=self.auth)
             self.contents[cm.id] = cm
 
+        # the remote metadata of all feature types, fetched concurrently and once per URL
+        if parse_remote_metadata:
+            util.resolve_remote_metadata(self.contents.values(), timeout=self.timeout, session=self.session)
+
         # exceptions
         self.exceptions = [
             f.text for f in self._capabilities.findall("Capability/Exception/Format")
@@ -181,10 +190,10 @@ class WebFeatureService_1_0_0(object):
         """Request and return capabilities document from the WFS as a
         file-like object.
         NOTE: this is effectively redundant now"""
-        reader = WFSCapabilitiesReader(self.version, auth=self.auth)
+        reader = WFSCapabilitiesReader(self.version, auth=self.auth, session=self.session)
         return openURL(
             reader.capabilities_url(self.url), timeout=self.timeout,
-            headers=self.headers, auth=self.auth
+            headers=self.headers, auth=self.auth, session=self.session
         )
 
     def items(self):
@@ -194,7 +203,7 @@ class WebFeatureService_1_0_0(object):
             items.append((item, self.contents[item]))
         return items
 
-    def getfeature(
+    def _getfeature_request(
         self,
         typename=None,
         filter=None,
@@ -208,40 +217,7 @@ class WebFeatureService_1_0_0(object):
         method="{http://www.opengis.net/wfs}Get",
         startindex=None,
     ):
-        """Request and return feature data as a file-like object.
-
-        Parameters
-        ----------
-        typename : list
-            List of typenames (string)
-        filter : string
-            XML-encoded OGC filter expression.
-        bbox : tuple
-            (left, bottom, right, top) in the feature type's coordinates.
-        featureid : list
-            List of unique feature ids (string)
-        featureversion : string
-            Default is most recent feature version.
-        propertyname : list
-            List of feature property names. '*' matches all.
-        maxfeatures : int
-            Maximum number of features to be returned.
-        method : string
-            Qualified name of the HTTP DCP method to use.
-        srsname: string
-            EPSG code to request the data in
-        outputFormat: string (optional)
-            Requested response format of the request.
-        startindex: int (optional)
-            Start position to return feature set (paging in combination with maxfeatures)
-
-
-        There are 3 different modes of use
-
-        1) typename and bbox (simple spatial query)
-        2) typename and filter (more expressive)
-        3) featureid (direct access to known features)
-        """
+        """Return the url and the encoded parameters of a GetFeature request"""
         try:
             base_url = next(
                 (
@@ -285,40 +261,81 @@ class WebFeatureService_1_0_0(object):
 
         data = urlencode(request)
         log.debug("Making request: %s?%s" % (base_url, data))
-        u = openURL(base_url, data, method, timeout=self.timeout,
-                    headers=self.headers, auth=self.auth)
+        return base_url, data
+
+    def getfeature(
+        self,
+        typename=None,
+        filter=None,
+        bbox=None,
+        featureid=None,
+        featureversion=None,
+        propertyname="*",
+        maxfeatures=None,
+        srsname=None,
+        outputFormat=None,
+        method="{http://www.opengis.net/wfs}Get",
+        startindex=None,
+        stream=False,
+    ):
+        """Request and return feature data as a file-like object.
 
-        # check for service exceptions, rewrap, and return
-        # We're going to assume that anything with a content-length > 32k
-        # is data. We'll check anything smaller.
+        Parameters
+        ----------
+        typename : list
+            List of typenames (string)
+        filter : string
+            XML-encoded OGC filter expression.
+        bbox : tuple
+            (left, bottom, right, top) in the feature type's coordinates.
+        featureid : list
+            List of unique feature ids (string)
+        featureversion : string
+            Default is most recent feature version.
+        propertyname : list
+            List of feature property names. '*' matches all.
+        maxfeatures : int
+            Maximum number of features to be returned.
+        method : string
+            Qualified name of the HTTP DCP method to use.
+        srsname: string
+            EPSG code to request the data in
+        outputFormat: string (optional)
+            Requested response format of the request.
+        startindex: int (optional)
+            Start position to return feature set (paging in combination with maxfeatures)
+        stream: bool (optional)
+            Whether to read the response while it is downloaded instead of
+            into memory. Only the first bytes are checked for an exception
+            report; the file-like object returned supports iter_content().
 
-        if "Content-Length" in u.info():
-            length = int(u.info()["Content-Length"])
-            have_read = False
-        else:
-            data = u.read()
-            have_read = True
-            length = len(data)
 
-        if length < 32000:
-            if not have_read:
-                data = u.read()
+        There are 3 different modes of use
 
-            try:
-                tree = etree.fromstring(data)
-            except BaseException:
-                # Not XML
-                return BytesIO(data)
-            else:
-                if tree.tag == "{%s}ServiceExceptionReport" % OGC_NAMESPACE:
-                    se = tree.find(nspath("ServiceException", OGC_NAMESPACE))
-                    raise ServiceException(str(se.text).strip())
-                else:
-                    return BytesIO(data)
-        else:
-            if have_read:
-                return BytesIO(data)
-            return u
+        1) typename and bbox (simple spatial query)
+        2) typename and filter (more expressive)
+        3) featureid (direct access to known features)
+        """
+        base_url, data = self._getfeature_request(
+            typename=typename,
+            filter=filter,
+            bbox=bbox,
+            featureid=featureid,
+            featureversion=featureversion,
+            propertyname=propertyname,
+            maxfeatures=maxfeatures,
+            srsname=srsname,
+            outputFormat=outputFormat,
+            method=method,
+            startindex=startindex,
+        )
+
+        u = openURL(base_url, data, method, timeout=self.timeout,
+                    headers=self.headers, auth=self.auth, session=self.session, stream=stream)
+
+        if stream:
+            return getfeature_stream(u)
+        return getfeature_response(u)
 
     def getOperationByName(self, name):
         """Return a named content item."""
@@ -388,7 +405,7 @@ class ContentMetadata(AbstractContentMetadata):
                 float(b.attrib["miny"]),
                 float(b.attrib["maxx"]),
                 float(b.attrib["maxy"]),
-                Crs(srs.text),
+                get_crs(srs.text),
             )
 
         # transform wgs84 bbox from given default bboxt
@@ -417,7 +434,7 @@ class ContentMetadata(AbstractContentMetadata):
                 pass
 
         # crs options
-        self.crsOptions = [Crs(srs.text) for srs in elem.findall(nspath("SRS"))]
+        self.crsOptions = [get_crs(srs.text) for srs in elem.findall(nspath("SRS"))]
 
         # verbs
         self.verbOptions = [op.tag for op in parent.findall(nspath("Operations/*"))]
@@ -444,33 +461,30 @@ class ContentMetadata(AbstractContentMetadata):
 
     def parse_remote_metadata(self, timeout=30):
         """Parse remote metadata for MetadataURL of format 'XML' and add it as metadataUrl['metadata']"""
-        for metadataUrl in self.metadataUrls:
-            if (
-                metadataUrl["url"] is not None and metadataUrl["format"].lower() == "xml"
-            ):
-                try:
-                    content = openURL(
-                        metadataUrl["url"], timeout=timeout, headers=self.headers, auth=self.auth
-                    )
-                    doc = etree.fromstring(content.read())
-                    if metadataUrl["type"] == "FGDC":
-                        mdelem = doc.find(".//metadata")
-                        if mdelem is not None:
-                            metadataUrl["metadata"] = Metadata(mdelem)
-                        else:
-                            metadataUrl["metadata"] = None
-                    elif metadataUrl["type"] == "TC211":
-                        mdelem = doc.find(
-                            ".//" + util.nspath_eval("gmd:MD_Metadata", n.get_namespaces(["gmd"]))
-                        ) or doc.find(
-                            ".//" + util.nspath_eval("gmi:MI_Metadata", n.get_namespaces(["gmi"]))
-                        )
-                        if mdelem is not None:
-                            metadataUrl["metadata"] = MD_Metadata(mdelem)
-                        else:
-                            metadataUrl["metadata"] = None
-                except Exception:
-                    metadataUrl["metadata"] = None
+        util.resolve_remote_metadata([self], timeout=timeout)
+
+    def _remote_metadata_urls(self):
+        """MetadataURLs of which to parse the remote metadata (see resolve_remote_metadata)"""
+        return [
+            metadataUrl for metadataUrl in self.metadataUrls
+            if metadataUrl["url"] is not None and metadataUrl["format"].lower() == "xml"
+        ]
+
+    def _parse_remote_metadata(self, metadataUrl, doc):
+        """Parse the remote metadata document of a MetadataURL"""
+        if metadataUrl["type"] == "FGDC":
+            mdelem = doc.find(".//metadata")
+            if mdelem is not None:
+                return Metadata(mdelem)
+        elif metadataUrl["type"] == "TC211":
+            mdelem = doc.find(
+                ".//" + util.nspath_eval("gmd:MD_Metadata", n.get_namespaces(["gmd"]))
+            ) or doc.find(
+                ".//" + util.nspath_eval("gmi:MI_Metadata", n.get_namespaces(["gmi"]))
+            )
+            if mdelem is not None:
+                return MD_Metadata(mdelem)
+        return None
 
 
 class OperationMetadata:
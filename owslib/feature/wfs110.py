@@ -14,6 +14,7 @@ from owslib.util import (
     nspath_eval,
     ServiceException,
     Authentication,
+    resolve_remote_metadata,
     # openURL,
 )
 from owslib.etree import etree
@@ -29,11 +30,13 @@ from owslib.ows import (
     BoundingBox
 )
 from owslib.fes import FilterCapabilities
-from owslib.crs import Crs
+from owslib.crs import get_crs
 from owslib.feature import WebFeatureService_
 from owslib.feature.common import (
     WFSCapabilitiesReader,
     AbstractContentMetadata,
+    getfeature_response,
+    getfeature_stream,
 )
 from owslib.namespaces import Namespaces
 from owslib.util import log, openURL
@@ -64,6 +67,7 @@ class WebFeatureService_1_1_0(WebFeatureService_):
         username=None,
         password=None,
         auth=None,
+        session=None,
     ):
         """ overridden __new__ method
 
@@ -78,6 +82,7 @@ class WebFeatureService_1_1_0(WebFeatureService_):
         @param username: service authentication username
         @param password: service authentication password
         @param auth: instance of owslib.util.Authentication
+        @param session: requests.Session to send requests with (default is the shared pooled session)
         @return: initialized WebFeatureService_1_1_0 object
         """
         obj = object.__new__(self)
@@ -91,6 +96,7 @@ class WebFeatureService_1_1_0(WebFeatureService_):
             username=username,
             password=password,
             auth=auth,
+            session=session,
         )
         return obj
 
@@ -112,6 +118,7 @@ class WebFeatureService_1_1_0(WebFeatureService_):
         username=None,
         password=None,
         auth=None,
+        session=None,
     ):
         """Initialize."""
         if auth:
@@ -126,9 +133,10 @@ class WebFeatureService_1_1_0(WebFeatureService_):
         self.version = version
         self.headers = headers
         self.timeout = timeout
+        self.session = session
         self._capabilities = None
         self.owscommon = OwsCommon("1.0.0")
-        reader = WFSCapabilitiesReader(self.version, headers=self.headers, auth=self.auth)
+        reader = WFSCapabilitiesReader(self.version, headers=self.headers, auth=self.auth, session=self.session)
         if xml:
             self._capabilities = reader.readString(xml)
         else:
@@ -188,9 +196,13 @@ class WebFeatureService_1_1_0(WebFeatureService_):
         )
         if features is not None:
             for feature in features:
-                cm = ContentMetadata(feature, parse_remote_metadata, headers=self.headers, auth=self.auth)
+                cm = ContentMetadata(feature, headers=self.headers, auth=self.auth)
                 self.contents[cm.id] = cm
 
+        # the remote metadata of all feature types, fetched concurrently and once per URL
+        if parse_remote_metadata:
+            resolve_remote_metadata(self.contents.values(), timeout=self.timeout, session=self.session)
+
         # exceptions
         self.exceptions = [
             f.text for f in self._capabilities.findall("Capability/Exception/Format")
@@ -200,10 +212,10 @@ class WebFeatureService_1_1_0(WebFeatureService_):
         """Request and return capabilities document from the WFS as a
         file-like object.
         NOTE: this is effectively redundant now"""
-        reader = WFSCapabilitiesReader(self.version, auth=self.auth)
+        reader = WFSCapabilitiesReader(self.version, auth=self.auth, session=self.session)
         return openURL(
             reader.capabilities_url(self.url), timeout=self.timeout,
-            headers=self.headers, auth=self.auth
+            headers=self.headers, auth=self.auth, session=self.session
         )
 
     def items(self):
@@ -213,7 +225,7 @@ class WebFeatureService_1_1_0(WebFeatureService_):
             items.append((item, self.contents[item]))
         return items
 
-    def getfeature(
+    def _getfeature_request(
         self,
         typename=None,
         filter=None,
@@ -228,45 +240,7 @@ class WebFeatureService_1_1_0(WebFeatureService_):
         startindex=None,
         sortby=None,
     ):
-        """Request and return feature data as a file-like object.
-
-        Parameters
-        ----------
-        typename : list
-            List of typenames (string)
-        filter : string
-            XML-encoded OGC filter expression.
-        bbox : tuple
-            (left, bottom, right, top) in the feature type's coordinates.
-        featureid : list
-            List of unique feature ids (string)
-        featureversion : string
-            Default is most recent feature version.
-        propertyname : list
-            List of feature property names. For Get request, '*' matches all.
-            For Post request, leave blank (None) to get all properties.
-        maxfeatures : int
-            Maximum number of features to be returned.
-        method : string
-            Qualified name of the HTTP DCP method to use.
-        srsname: string
-            EPSG code to request the data in
-        outputFormat: string (optional)
-            Requested response format of the request.
-        startindex: int (optional)
-            Start position to return feature set (paging in combination with maxfeatures)
-        sortby: list (optional)
-            List of property names whose values should be used to order
-            (upon presentation) the set of feature instances that
-            satify the query.
-
-        There are 3 different modes of use
-
-        1) typename and bbox (simple spatial query). It is assumed, that
-            bbox coordinates are given *always* in the east,north order
-        2) typename and filter (more expressive)
-        3) featureid (direct access to known features)
-        """
+        """Return the url and the encoded parameters of a GetFeature request"""
         try:
             base_url = next(
                 (
@@ -344,40 +318,88 @@ class WebFeatureService_1_1_0(WebFeatureService_):
                 startindex=startindex,
                 sortby=sortby,
             )
+        return base_url, data
 
-        u = openURL(base_url, data, method, timeout=self.timeout,
-                    headers=self.headers, auth=self.auth)
-
-        # check for service exceptions, rewrap, and return
-        # We're going to assume that anything with a content-length > 32k
-        # is data. We'll check anything smaller.
-        if "Content-Length" in u.info():
-            length = int(u.info()["Content-Length"])
-            have_read = False
-        else:
-            data = u.read()
-            have_read = True
-            length = len(data)
+    def getfeature(
+        self,
+        typename=None,
+        filter=None,
+        bbox=None,
+        featureid=None,
+        featureversion=None,
+        propertyname=None,
+        maxfeatures=None,
+        srsname=None,
+        outputFormat=None,
+        method="Get",
+        startindex=None,
+        sortby=None,
+        stream=False,
+    ):
+        """Request and return feature data as a file-like object.
 
-        if length < 32000:
-            if not have_read:
-                data = u.read()
+        Parameters
+        ----------
+        typename : list
+            List of typenames (string)
+        filter : string
+            XML-encoded OGC filter expression.
+        bbox : tuple
+            (left, bottom, right, top) in the feature type's coordinates.
+        featureid : list
+            List of unique feature ids (string)
+        featureversion : string
+            Default is most recent feature version.
+        propertyname : list
+            List of feature property names. For Get request, '*' matches all.
+            For Post request, leave blank (None) to get all properties.
+        maxfeatures : int
+            Maximum number of features to be returned.
+        method : string
+            Qualified name of the HTTP DCP method to use.
+        srsname: string
+            EPSG code to request the data in
+        outputFormat: string (optional)
+            Requested response format of the request.
+        startindex: int (optional)
+            Start position to return feature set (paging in combination with maxfeatures)
+        sortby: list (optional)
+            List of property names whose values should be used to order
+            (upon presentation) the set of feature instances that
+            satify the query.
+        stream: bool (optional)
+            Whether to read the response while it is downloaded instead of
+            into memory. Only the first bytes are checked for an exception
+            report; the file-like object returned supports iter_content().
 
-            try:
-                tree = etree.fromstring(data)
-            except BaseException:
-                # Not XML
-                return BytesIO(data)
-            else:
-                if tree.tag == "{%s}ServiceExceptionReport" % namespaces["ogc"]:
-                    se = tree.find(nspath_eval("ServiceException", namespaces["ogc"]))
-                    raise ServiceException(str(se.text).strip())
-                else:
-                    return BytesIO(data)
-        else:
-            if have_read:
-                return BytesIO(data)
-            return u
+        There are 3 different modes of use
+
+        1) typename and bbox (simple spatial query). It is assumed, that
+            bbox coordinates are given *always* in the east,north order
+        2) typename and filter (more expressive)
+        3) featureid (direct access to known features)
+        """
+        base_url, data = self._getfeature_request(
+            typename=typename,
+            filter=filter,
+            bbox=bbox,
+            featureid=featureid,
+            featureversion=featureversion,
+            propertyname=propertyname,
+            maxfeatures=maxfeatures,
+            srsname=srsname,
+            outputFormat=outputFormat,
+            method=method,
+            startindex=startindex,
+            sortby=sortby,
+        )
+
+        u = openURL(base_url, data, method, timeout=self.timeout,
+                    headers=self.headers, auth=self.auth, session=self.session, stream=stream)
+
+        if stream:
+            return getfeature_stream(u)
+        return getfeature_response(u)
 
     def getOperationByName(self, name):
         """Return a named content item."""
@@ -422,12 +444,12 @@ class ContentMetadata(AbstractContentMetadata):
                 self.boundingBoxWGS84 = None
         # crs options
         self.crsOptions = [
-            Crs(srs.text)
+            get_crs(srs.text)
             for srs in elem.findall(nspath_eval("wfs:OtherSRS", namespaces))
         ]
         dsrs = testXMLValue(elem.find(nspath_eval("wfs:DefaultSRS", namespaces)))
         if dsrs is not None:  # first element is default srs
-            self.crsOptions.insert(0, Crs(dsrs))
+            self.crsOptions.insert(0, get_crs(dsrs))
 
         # verbs
         self.verbOptions = [
@@ -465,29 +487,27 @@ class ContentMetadata(AbstractContentMetadata):
 
     def parse_remote_metadata(self, timeout=30):
         """Parse remote metadata for MetadataURL of format 'text/xml' and add it as metadataUrl['metadata']"""
-        for metadataUrl in self.metadataUrls:
-            if (
-                metadataUrl["url"] is not None and metadataUrl["format"].lower() == "text/xml"
-            ):
-                try:
-                    content = openURL(metadataUrl["url"], timeout=timeout, headers=self.headers, auth=self.auth)
-                    doc = etree.fromstring(content.read())
-
-                    if metadataUrl["type"] == "FGDC":
-                        mdelem = doc.find(".//metadata")
-                        if mdelem is not None:
-                            metadataUrl["metadata"] = Metadata(mdelem)
-                        else:
-                            metadataUrl["metadata"] = None
-                    elif metadataUrl["type"] in ["TC211", "19115", "19139"]:
-                        mdelem = doc.find(
-                            ".//" + nspath_eval("gmd:MD_Metadata", namespaces)
-                        ) or doc.find(
-                            ".//" + nspath_eval("gmi:MI_Metadata", namespaces)
-                        )
-                        if mdelem is not None:
-                            metadataUrl["metadata"] = MD_Metadata(mdelem)
-                        else:
-                            metadataUrl["metadata"] = None
-                except Exception:
-                    metadataUrl["metadata"] = None
+        resolve_remote_metadata([self], timeout=timeout)
+
+    def _remote_metadata_urls(self):
+        """MetadataURLs of which to parse the remote metadata (see resolve_remote_metadata)"""
+        return [
+            metadataUrl for metadataUrl in self.metadataUrls
+            if metadataUrl["url"] is not None and metadataUrl["format"].lower() == "text/xml"
+        ]
+
+    def _parse_remote_metadata(self, metadataUrl, doc):
+        """Parse the remote metadata document of a MetadataURL"""
+        if metadataUrl["type"] == "FGDC":
+            mdelem = doc.find(".//metadata")
+            if mdelem is not None:
+                return Metadata(mdelem)
+        elif metadataUrl["type"] in ["TC211", "19115", "19139"]:
+            mdelem = doc.find(
+                ".//" + nspath_eval("gmd:MD_Metadata", namespaces)
+            ) or doc.find(
+                ".//" + nspath_eval("gmi:MI_Metadata", namespaces)
+            )
+            if mdelem is not None:
+                return MD_Metadata(mdelem)
+        return None
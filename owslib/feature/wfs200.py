@@ -13,11 +13,13 @@ from owslib.iso import MD_Metadata
 from owslib.ows import Constraint, ServiceIdentification, ServiceProvider, OperationsMetadata
 from owslib.etree import etree
 from owslib.util import nspath, testXMLValue, openURL, Authentication
-from owslib.crs import Crs
+from owslib.crs import get_crs
 from owslib.feature import WebFeatureService_
 from owslib.feature.common import (
     WFSCapabilitiesReader,
     AbstractContentMetadata,
+    getfeature_response,
+    getfeature_stream,
 )
 from owslib.namespaces import Namespaces
 
@@ -57,6 +59,7 @@ class WebFeatureService_2_0_0(WebFeatureService_):
         username=None,
         password=None,
         auth=None,
+        session=None,
     ):
         """ overridden __new__ method
 
@@ -71,6 +74,7 @@ class WebFeatureService_2_0_0(WebFeatureService_):
         @param username: service authentication username
         @param password: service authentication password
         @param auth: instance of owslib.util.Authentication
+        @param session: requests.Session to send requests with (default is the shared pooled session)
         @return: initialized WebFeatureService_2_0_0 object
         """
         obj = object.__new__(self)
@@ -84,6 +88,7 @@ class WebFeatureService_2_0_0(WebFeatureService_):
             username=username,
             password=password,
             auth=auth,
+            session=session,
         )
         return obj
 
@@ -105,6 +110,7 @@ class WebFeatureService_2_0_0(WebFeatureService_):
         username=None,
         password=None,
         auth=None,
+        session=None,
     ):
         """Initialize."""
         if auth:
@@ -120,8 +126,9 @@ class WebFeatureService_2_0_0(WebFeatureService_):
         self.version = version
         self.timeout = timeout
         self.headers = headers
+        self.session = session
         self._capabilities = None
-        reader = WFSCapabilitiesReader(self.version, headers=self.headers, auth=self.auth)
+        reader = WFSCapabilitiesReader(self.version, headers=self.headers, auth=self.auth, session=self.session)
         if xml:
             self._capabilities = reader.readString(xml)
         else:
@@ -190,11 +197,13 @@ class WebFeatureService_2_0_0(WebFeatureService_):
             nspath("FeatureTypeList/FeatureType", ns=WFS_NAMESPACE)
         )
         for feature in features:
-            cm = ContentMetadata(
-                feature, featuretypelist, parse_remote_metadata, auth=self.auth
-            )
+            cm = ContentMetadata(feature, featuretypelist, auth=self.auth)
             self.contents[cm.id] = cm
 
+        # the remote metadata of all feature types, fetched concurrently and once per URL
+        if parse_remote_metadata:
+            util.resolve_remote_metadata(self.contents.values(), timeout=self.timeout, session=self.session)
+
         # exceptions
         self.exceptions = [
             f.text for f in self._capabilities.findall("Capability/Exception/Format")
@@ -204,10 +213,10 @@ class WebFeatureService_2_0_0(WebFeatureService_):
         """Request and return capabilities document from the WFS as a
         file-like object.
         NOTE: this is effectively redundant now"""
-        reader = WFSCapabilitiesReader(self.version, auth=self.auth)
+        reader = WFSCapabilitiesReader(self.version, auth=self.auth, session=self.session)
         return openURL(
             reader.capabilities_url(self.url), timeout=self.timeout,
-            headers=self.headers, auth=self.auth
+            headers=self.headers, auth=self.auth, session=self.session
         )
 
     def items(self):
@@ -217,6 +226,61 @@ class WebFeatureService_2_0_0(WebFeatureService_):
             items.append((item, self.contents[item]))
         return items
 
+    def _getfeature_request(
+        self,
+        typename=None,
+        filter=None,
+        bbox=None,
+        featureid=None,
+        featureversion=None,
+        propertyname=None,
+        maxfeatures=None,
+        storedQueryID=None,
+        storedQueryParams=None,
+        method="Get",
+        outputFormat=None,
+        startindex=None,
+        sortby=None,
+    ):
+        """Return the url and the encoded parameters of a GetFeature request"""
+        storedQueryParams = storedQueryParams or {}
+        url = data = None
+        if typename and type(typename) == type(""):  # noqa: E721
+            typename = [typename]
+        if method.upper() == "GET":
+            (url) = self.getGETGetFeatureRequest(
+                typename,
+                filter,
+                bbox,
+                featureid,
+                featureversion,
+                propertyname,
+                maxfeatures,
+                storedQueryID,
+                storedQueryParams,
+                outputFormat,
+                "Get",
+                startindex,
+                sortby,
+            )
+            log.debug("GetFeature WFS GET url %s" % url)
+        else:
+            url, data = self.getPOSTGetFeatureRequest(
+                typename,
+                filter,
+                bbox,
+                featureid,
+                featureversion,
+                propertyname,
+                maxfeatures,
+                storedQueryID,
+                storedQueryParams,
+                outputFormat,
+                "Post",
+                startindex,
+                sortby)
+        return url, data
+
     def getfeature(
         self,
         typename=None,
@@ -232,6 +296,7 @@ class WebFeatureService_2_0_0(WebFeatureService_):
         outputFormat=None,
         startindex=None,
         sortby=None,
+        stream=False,
     ):
         """Request and return feature data as a file-like object.
 
@@ -270,6 +335,10 @@ class WebFeatureService_2_0_0(WebFeatureService_):
             List of property names whose values should be used to order
             (upon presentation) the set of feature instances that
             satify the query.
+        stream: bool (optional)
+            Whether to read the response while it is downloaded instead of
+            into memory. Only the first bytes are checked for an exception
+            report; the file-like object returned supports iter_content().
 
         There are 5 different modes of use
 
@@ -285,75 +354,28 @@ class WebFeatureService_2_0_0(WebFeatureService_):
         Returns:
             BytesIO -- Data returned from the service as a file-like object
         """
-        storedQueryParams = storedQueryParams or {}
-        url = data = None
-        if typename and type(typename) == type(""):  # noqa: E721
-            typename = [typename]
-        if method.upper() == "GET":
-            (url) = self.getGETGetFeatureRequest(
-                typename,
-                filter,
-                bbox,
-                featureid,
-                featureversion,
-                propertyname,
-                maxfeatures,
-                storedQueryID,
-                storedQueryParams,
-                outputFormat,
-                "Get",
-                startindex,
-                sortby,
-            )
-            log.debug("GetFeature WFS GET url %s" % url)
-        else:
-            url, data = self.getPOSTGetFeatureRequest(
-                typename,
-                filter,
-                bbox,
-                featureid,
-                featureversion,
-                propertyname,
-                maxfeatures,
-                storedQueryID,
-                storedQueryParams,
-                outputFormat,
-                "Post",
-                startindex,
-                sortby)
-
-        u = openURL(url, data, method, timeout=self.timeout, headers=self.headers, auth=self.auth)
-
-        # check for service exceptions, rewrap, and return
-        # We're going to assume that anything with a content-length > 32k
-        # is data. We'll check anything smaller.
-        if "Content-Length" in u.info():
-            length = int(u.info()["Content-Length"])
-            have_read = False
-        else:
-            data = u.read()
-            have_read = True
-            length = len(data)
+        url, data = self._getfeature_request(
+            typename=typename,
+            filter=filter,
+            bbox=bbox,
+            featureid=featureid,
+            featureversion=featureversion,
+            propertyname=propertyname,
+            maxfeatures=maxfeatures,
+            storedQueryID=storedQueryID,
+            storedQueryParams=storedQueryParams,
+            method=method,
+            outputFormat=outputFormat,
+            startindex=startindex,
+            sortby=sortby,
+        )
 
-        if length < 32000:
-            if not have_read:
-                data = u.read()
+        u = openURL(url, data, method, timeout=self.timeout, headers=self.headers, auth=self.auth,
+                    session=self.session, stream=stream)
 
-            try:
-                tree = etree.fromstring(data)
-            except BaseException:
-                # Not XML
-                return BytesIO(data)
-            else:
-                if tree.tag == "{%s}ServiceExceptionReport" % OGC_NAMESPACE:
-                    se = tree.find(nspath("ServiceException", OGC_NAMESPACE))
-                    raise ServiceException(str(se.text).strip())
-                else:
-                    return BytesIO(data)
-        else:
-            if have_read:
-                return BytesIO(data)
-            return u
+        if stream:
+            return getfeature_stream(u)
+        return getfeature_response(u)
 
     def getpropertyvalue(
         self,
@@ -392,7 +414,8 @@ class WebFeatureService_2_0_0(WebFeatureService_):
             for kw in list(kwargs.keys()):
                 request[kw] = str(kwargs[kw])
         encoded_request = urlencode(request)
-        u = openURL(base_url + encoded_request, timeout=self.timeout, headers=self.headers, auth=self.auth)
+        u = openURL(base_url + encoded_request, timeout=self.timeout, headers=self.headers, auth=self.auth,
+                    session=self.session)
         return u.read()
 
     def _getStoredQueries(self):
@@ -422,7 +445,8 @@ class WebFeatureService_2_0_0(WebFeatureService_):
         }
         encoded_request = urlencode(request)
         u = openURL(
-            base_url, data=encoded_request, timeout=self.timeout, headers=self.headers, auth=self.auth
+            base_url, data=encoded_request, timeout=self.timeout, headers=self.headers, auth=self.auth,
+            session=self.session
         )
         tree = etree.fromstring(u.read())
         tempdict = {}
@@ -454,7 +478,8 @@ class WebFeatureService_2_0_0(WebFeatureService_):
         }
         encoded_request = urlencode(request)
         u = openURL(
-            base_url, data=encoded_request, timeout=self.timeout, headers=self.headers, auth=self.auth
+            base_url, data=encoded_request, timeout=self.timeout, headers=self.headers, auth=self.auth,
+            session=self.session
         )
         tree = etree.fromstring(u.read())
         tempdict2 = {}
@@ -550,17 +575,17 @@ class ContentMetadata(AbstractContentMetadata):
                     self.boundingBoxWGS84[1],
                     self.boundingBoxWGS84[2],
                     self.boundingBoxWGS84[3],
-                    Crs("epsg:4326"),
+                    get_crs("epsg:4326"),
                 )
             except AttributeError:
                 self.boundingBoxWGS84 = None
         # crs options
         self.crsOptions = [
-            Crs(srs.text) for srs in elem.findall(nspath("OtherCRS", ns=WFS_NAMESPACE))
+            get_crs(srs.text) for srs in elem.findall(nspath("OtherCRS", ns=WFS_NAMESPACE))
         ]
         defaultCrs = elem.findall(nspath("DefaultCRS", ns=WFS_NAMESPACE))
         if len(defaultCrs) > 0:
-            self.crsOptions.insert(0, Crs(defaultCrs[0].text))
+            self.crsOptions.insert(0, get_crs(defaultCrs[0].text))
 
         # verbs
         self.verbOptions = [
@@ -592,24 +617,23 @@ class ContentMetadata(AbstractContentMetadata):
 
     def parse_remote_metadata(self, timeout=30):
         """Parse remote metadata for MetadataURL and add it as metadataUrl['metadata']"""
-        for metadataUrl in self.metadataUrls:
-            if metadataUrl["url"] is not None:
-                try:
-                    content = openURL(metadataUrl["url"], timeout=timeout, headers=self.headers, auth=self.auth)
-                    doc = etree.fromstring(content.read())
-
-                    mdelem = doc.find(".//metadata")
-                    if mdelem is not None:
-                        metadataUrl["metadata"] = Metadata(mdelem)
-                        continue
-
-                    mdelem = doc.find(
-                        ".//" + util.nspath_eval("gmd:MD_Metadata", n.get_namespaces(["gmd"]))
-                    ) or doc.find(
-                        ".//" + util.nspath_eval("gmi:MI_Metadata", n.get_namespaces(["gmi"]))
-                    )
-                    if mdelem is not None:
-                        metadataUrl["metadata"] = MD_Metadata(mdelem)
-                        continue
-                except Exception:
-                    metadataUrl["metadata"] = None
+        util.resolve_remote_metadata([self], timeout=timeout)
+
+    def _remote_metadata_urls(self):
+        """MetadataURLs of which to parse the remote metadata (see resolve_remote_metadata)"""
+        return [metadataUrl for metadataUrl in self.metadataUrls if metadataUrl["url"] is not None]
+
+    def _parse_remote_metadata(self, metadataUrl, doc):
+        """Parse the remote metadata document of a MetadataURL"""
+        mdelem = doc.find(".//metadata")
+        if mdelem is not None:
+            return Metadata(mdelem)
+
+        mdelem = doc.find(
+            ".//" + util.nspath_eval("gmd:MD_Metadata", n.get_namespaces(["gmd"]))
+        ) or doc.find(
+            ".//" + util.nspath_eval("gmi:MI_Metadata", n.get_namespaces(["gmi"]))
+        )
+        if mdelem is not None:
+            return MD_Metadata(mdelem)
+        return None
@@ -10,7 +10,9 @@
 
 """ ISO metadata parser """
 
+import sys
 import warnings
+from collections import OrderedDict
 
 from owslib.etree import etree
 from owslib import util
@@ -28,9 +30,115 @@ def get_namespaces():
 namespaces = get_namespaces()
 
 
-class MD_Metadata(object):
-    """ Process gmd:MD_Metadata """
-    def __init__(self, md=None):
+class _LazySections(object):
+    """
+    Base class of the parsers whose attributes are grouped in sections, which are
+    parsed on first access unless selected (fields) when the object is created.
+    Subclasses list the attributes of each section in _sections, and implement
+    _parse_<section>(md) setting them
+    """
+
+    _sections = OrderedDict()
+
+    def _parse_sections(self, md, fields=None):
+        """ parse the sections holding fields (all sections if fields is None) """
+
+        if fields is None:
+            selected = set(self._sections)
+        else:
+            selected = set()
+            for field in fields:
+                section = self._section_of(field)
+                if section is None:
+                    raise ValueError('Unknown field: %s (known fields are %s)' % (
+                        field, ', '.join(self._field_names())))
+                selected.add(section)
+
+        pending = [section for section in self._sections if section not in selected]
+        if pending:
+            self._md = md
+            self._pending = set(pending)
+
+        for section in self._sections:
+            if section in selected:
+                getattr(self, '_parse_%s' % section)(md)
+
+    @classmethod
+    def _field_names(cls):
+        """ names accepted in fields: the section names and their attribute names """
+        names = list(cls._sections)
+        for attributes in cls._sections.values():
+            names.extend(attribute for attribute in attributes if attribute not in names)
+        return names
+
+    @classmethod
+    def _own_section(cls, field):
+        """ section of _sections holding field (or named field), None if there is none """
+        if field in cls._sections:
+            return field
+        for section, attributes in cls._sections.items():
+            if field in attributes:
+                return section
+        return None
+
+    @classmethod
+    def _section_of(cls, field):
+        return cls._own_section(field)
+
+    def _load_section(self, section):
+        pending = self.__dict__.get('_pending')
+        if not pending or section not in pending:
+            return
+        getattr(self, '_parse_%s' % section)(self._md)
+        pending.discard(section)
+        if not pending:  # everything is parsed: release the element
+            del self._md
+            del self._pending
+
+    def load(self):
+        """ parse the sections not parsed yet """
+        for section in list(self.__dict__.get('_pending', ())):
+            self._load_section(section)
+        return self
+
+    def __getattr__(self, name):
+        # only called for attributes not set (yet)
+        if name.startswith('_') or '_pending' not in self.__dict__:
+            raise AttributeError(name)
+        self._load_section(self._section_of(name))
+        try:
+            return self.__dict__[name]
+        except KeyError:
+            raise AttributeError(name)
+
+
+class MD_Metadata(_LazySections):
+    """ Process gmd:MD_Metadata
+
+    Passing fields (attribute or section names, see _sections) parses only the sections
+    holding these attributes: the other sections, including those of the identification
+    objects, are parsed on first access (keeping a reference to the element until then).
+    The fields of the identification (title, abstract, date, keywords, bbox, ... see
+    MD_DataIdentification._sections) select the identification section, and the sections
+    of the identification objects holding them.  The serialized element (.xml) is not
+    stored when xml is False.
+    """
+
+    _sections = OrderedDict([
+        ('header', ('identifier', 'parentidentifier', 'language', 'dataseturi', 'languagecode', 'datestamp',
+                    'charset', 'hierarchy', 'datetimestamp', 'stdname', 'stdver')),
+        ('contact', ('contact',)),
+        ('locales', ('locales',)),
+        ('referencesystem', ('referencesystem',)),
+        ('identification', ('identification', 'serviceidentification')),
+        ('identificationinfo', ('identificationinfo',)),
+        ('contentinfo', ('contentinfo',)),
+        ('distribution', ('distribution',)),
+        ('dataquality', ('dataquality',)),
+        ('acquisition', ('acquisition',)),
+    ])
+
+    def __init__(self, md=None, fields=None, xml=True):
 
         if md is None:
             self.xml = None
@@ -57,122 +165,175 @@ class MD_Metadata(object):
             self.dataquality = None
             self.acquisition = None
         else:
-            if hasattr(md, 'getroot'):  # standalone document
+            if not xml:
+                self.xml = None
+            elif hasattr(md, 'getroot'):  # standalone document
                 self.xml = etree.tostring(md.getroot())
             else:  # part of a larger document
                 self.xml = etree.tostring(md)
 
-            val = md.find(util.nspath_eval('gmd:fileIdentifier/gco:CharacterString', namespaces))
-            self.identifier = util.testXMLValue(val)
+            if hasattr(md, 'getroot'):
+                md = md.getroot()
 
-            val = md.find(util.nspath_eval('gmd:parentIdentifier/gco:CharacterString', namespaces))
-            self.parentidentifier = util.testXMLValue(val)
+            # the identification objects of a selection parse the fields selected in them,
+            # and the others lazily
+            self._nested_fields = None if fields is None else tuple(
+                field for field in fields if self._own_section(field) is None)
+            self._parse_sections(md, fields)
 
-            val = md.find(util.nspath_eval('gmd:language/gco:CharacterString', namespaces))
-            self.language = util.testXMLValue(val)
+    @classmethod
+    def _field_names(cls):
+        names = super(MD_Metadata, cls)._field_names()
+        return names + [name for name in MD_DataIdentification._field_names() if name not in names]
 
-            val = md.find(util.nspath_eval('gmd:dataSetURI/gco:CharacterString', namespaces))
-            self.dataseturi = util.testXMLValue(val)
+    @classmethod
+    def _section_of(cls, field):
+        section = cls._own_section(field)
+        if section is None and MD_DataIdentification._own_section(field) is not None:
+            return 'identification'
+        return section
 
-            val = md.find(util.nspath_eval('gmd:language/gmd:LanguageCode', namespaces))
-            self.languagecode = util.testXMLAttribute(val, 'codeListValue')
+    def _parse_header(self, md):
+        """ parse the simple metadata elements """
 
-            val = md.find(util.nspath_eval('gmd:dateStamp/gco:Date', namespaces))
-            self.datestamp = util.testXMLValue(val)
+        val = md.find(util.nspath_eval('gmd:fileIdentifier/gco:CharacterString', namespaces))
+        self.identifier = util.testXMLValue(val)
 
-            if not self.datestamp:
-                val = md.find(util.nspath_eval('gmd:dateStamp/gco:DateTime', namespaces))
-                self.datestamp = util.testXMLValue(val)
+        val = md.find(util.nspath_eval('gmd:parentIdentifier/gco:CharacterString', namespaces))
+        self.parentidentifier = util.testXMLValue(val)
 
-            self.charset = _testCodeListValue(md.find(
-                util.nspath_eval('gmd:characterSet/gmd:MD_CharacterSetCode', namespaces)))
+        val = md.find(util.nspath_eval('gmd:language/gco:CharacterString', namespaces))
+        self.language = util.testXMLValue(val)
 
-            self.hierarchy = _testCodeListValue(md.find(
-                util.nspath_eval('gmd:hierarchyLevel/gmd:MD_ScopeCode', namespaces)))
+        val = md.find(util.nspath_eval('gmd:dataSetURI/gco:CharacterString', namespaces))
+        self.dataseturi = util.testXMLValue(val)
 
-            self.contact = []
-            for i in md.findall(util.nspath_eval('gmd:contact/gmd:CI_ResponsibleParty', namespaces)):
-                o = CI_ResponsibleParty(i)
-                self.contact.append(o)
+        val = md.find(util.nspath_eval('gmd:language/gmd:LanguageCode', namespaces))
+        self.languagecode = util.testXMLAttribute(val, 'codeListValue')
+
+        val = md.find(util.nspath_eval('gmd:dateStamp/gco:Date', namespaces))
+        self.datestamp = util.testXMLValue(val)
 
+        if not self.datestamp:
             val = md.find(util.nspath_eval('gmd:dateStamp/gco:DateTime', namespaces))
-            self.datetimestamp = util.testXMLValue(val)
+            self.datestamp = util.testXMLValue(val)
 
-            val = md.find(util.nspath_eval('gmd:metadataStandardName/gco:CharacterString', namespaces))
-            self.stdname = util.testXMLValue(val)
+        self.charset = _testCodeListValue(md.find(
+            util.nspath_eval('gmd:characterSet/gmd:MD_CharacterSetCode', namespaces)))
 
-            val = md.find(util.nspath_eval('gmd:metadataStandardVersion/gco:CharacterString', namespaces))
-            self.stdver = util.testXMLValue(val)
+        self.hierarchy = _testCodeListValue(md.find(
+            util.nspath_eval('gmd:hierarchyLevel/gmd:MD_ScopeCode', namespaces)))
 
-            self.locales = []
-            for i in md.findall(util.nspath_eval('gmd:locale/gmd:PT_Locale', namespaces)):
-                self.locales.append(PT_Locale(i))
+        val = md.find(util.nspath_eval('gmd:dateStamp/gco:DateTime', namespaces))
+        self.datetimestamp = util.testXMLValue(val)
 
-            val = md.find(util.nspath_eval('gmd:referenceSystemInfo/gmd:MD_ReferenceSystem', namespaces))
-            if val is not None:
-                self.referencesystem = MD_ReferenceSystem(val)
-            else:
-                self.referencesystem = None
+        val = md.find(util.nspath_eval('gmd:metadataStandardName/gco:CharacterString', namespaces))
+        self.stdname = util.testXMLValue(val)
 
-            # TODO: merge .identificationinfo into .identification
-            warnings.warn(
-                'the .identification and .serviceidentification properties will merge into '
-                '.identification being a list of properties.  This is currently implemented '
-                'in .identificationinfo.  '
-                'Please see https://github.com/geopython/OWSLib/issues/38 for more information',
-                FutureWarning)
+        val = md.find(util.nspath_eval('gmd:metadataStandardVersion/gco:CharacterString', namespaces))
+        self.stdver = util.testXMLValue(val)
 
-            val = md.find(util.nspath_eval('gmd:identificationInfo/gmd:MD_DataIdentification', namespaces))
-            val2 = md.find(util.nspath_eval('gmd:identificationInfo/srv:SV_ServiceIdentification', namespaces))
+    def _parse_contact(self, md):
+        """ parse gmd:contact """
 
-            if val is not None:
-                self.identification = MD_DataIdentification(val, 'dataset')
-                self.serviceidentification = None
-            elif val2 is not None:
-                self.identification = MD_DataIdentification(val2, 'service')
-                self.serviceidentification = SV_ServiceIdentification(val2)
-            else:
-                self.identification = None
-                self.serviceidentification = None
+        self.contact = []
+        for i in md.findall(util.nspath_eval('gmd:contact/gmd:CI_ResponsibleParty', namespaces)):
+            o = CI_ResponsibleParty(i)
+            self.contact.append(o)
 
-            self.identificationinfo = []
-            for idinfo in md.findall(util.nspath_eval('gmd:identificationInfo', namespaces)):
-                if len(idinfo) > 0:
-                    val = list(idinfo)[0]
-                    tagval = util.xmltag_split(val.tag)
-                    if tagval == 'MD_DataIdentification':
-                        self.identificationinfo.append(MD_DataIdentification(val, 'dataset'))
-                    elif tagval == 'MD_ServiceIdentification':
-                        self.identificationinfo.append(MD_DataIdentification(val, 'service'))
-                    elif tagval == 'SV_ServiceIdentification':
-                        self.identificationinfo.append(SV_ServiceIdentification(val))
+    def _parse_locales(self, md):
+        """ parse gmd:locale """
 
-            self.contentinfo = []
-            for contentinfo in md.findall(
-                    util.nspath_eval('gmd:contentInfo/gmd:MD_FeatureCatalogueDescription', namespaces)):
-                self.contentinfo.append(MD_FeatureCatalogueDescription(contentinfo))
-            for contentinfo in md.findall(
-                    util.nspath_eval('gmd:contentInfo/gmd:MD_ImageDescription', namespaces)):
-                self.contentinfo.append(MD_ImageDescription(contentinfo))
+        self.locales = []
+        for i in md.findall(util.nspath_eval('gmd:locale/gmd:PT_Locale', namespaces)):
+            self.locales.append(PT_Locale(i))
 
-            val = md.find(util.nspath_eval('gmd:distributionInfo/gmd:MD_Distribution', namespaces))
+    def _parse_referencesystem(self, md):
+        """ parse gmd:referenceSystemInfo """
 
-            if val is not None:
-                self.distribution = MD_Distribution(val)
-            else:
-                self.distribution = None
+        val = md.find(util.nspath_eval('gmd:referenceSystemInfo/gmd:MD_ReferenceSystem', namespaces))
+        if val is not None:
+            self.referencesystem = MD_ReferenceSystem(val)
+        else:
+            self.referencesystem = None
 
-            val = md.find(util.nspath_eval('gmd:dataQualityInfo/gmd:DQ_DataQuality', namespaces))
-            if val is not None:
-                self.dataquality = DQ_DataQuality(val)
-            else:
-                self.dataquality = None
+    def _parse_identification(self, md):
+        """ parse the first gmd:identificationInfo """
 
-            val = md.find(util.nspath_eval('gmi:acquisitionInformation/gmi:MI_AcquisitionInformation', namespaces))
-            if val is not None:
-                self.acquisition = MI_AcquisitionInformation(val)
-            else:
-                self.acquisition = None
+        # TODO: merge .identificationinfo into .identification
+        warnings.warn(
+            'the .identification and .serviceidentification properties will merge into '
+            '.identification being a list of properties.  This is currently implemented '
+            'in .identificationinfo.  '
+            'Please see https://github.com/geopython/OWSLib/issues/38 for more information',
+            FutureWarning)
+
+        val = md.find(util.nspath_eval('gmd:identificationInfo/gmd:MD_DataIdentification', namespaces))
+        val2 = md.find(util.nspath_eval('gmd:identificationInfo/srv:SV_ServiceIdentification', namespaces))
+
+        if val is not None:
+            self.identification = MD_DataIdentification(val, 'dataset', self._nested_fields)
+            self.serviceidentification = None
+        elif val2 is not None:
+            self.identification = MD_DataIdentification(val2, 'service', self._nested_fields)
+            self.serviceidentification = SV_ServiceIdentification(val2)
+        else:
+            self.identification = None
+            self.serviceidentification = None
+
+    def _parse_identificationinfo(self, md):
+        """ parse all gmd:identificationInfo """
+
+        self.identificationinfo = []
+        for idinfo in md.findall(util.nspath_eval('gmd:identificationInfo', namespaces)):
+            if len(idinfo) > 0:
+                val = list(idinfo)[0]
+                tagval = util.xmltag_split(val.tag)
+                if tagval == 'MD_DataIdentification':
+                    self.identificationinfo.append(MD_DataIdentification(val, 'dataset', self._nested_fields))
+                elif tagval == 'MD_ServiceIdentification':
+                    self.identificationinfo.append(MD_DataIdentification(val, 'service', self._nested_fields))
+                elif tagval == 'SV_ServiceIdentification':
+                    self.identificationinfo.append(SV_ServiceIdentification(val))
+
+    def _parse_contentinfo(self, md):
+        """ parse gmd:contentInfo """
+
+        self.contentinfo = []
+        for contentinfo in md.findall(
+                util.nspath_eval('gmd:contentInfo/gmd:MD_FeatureCatalogueDescription', namespaces)):
+            self.contentinfo.append(MD_FeatureCatalogueDescription(contentinfo))
+        for contentinfo in md.findall(
+                util.nspath_eval('gmd:contentInfo/gmd:MD_ImageDescription', namespaces)):
+            self.contentinfo.append(MD_ImageDescription(contentinfo))
+
+    def _parse_distribution(self, md):
+        """ parse gmd:distributionInfo """
+
+        val = md.find(util.nspath_eval('gmd:distributionInfo/gmd:MD_Distribution', namespaces))
+
+        if val is not None:
+            self.distribution = MD_Distribution(val)
+        else:
+            self.distribution = None
+
+    def _parse_dataquality(self, md):
+        """ parse gmd:dataQualityInfo """
+
+        val = md.find(util.nspath_eval('gmd:dataQualityInfo/gmd:DQ_DataQuality', namespaces))
+        if val is not None:
+            self.dataquality = DQ_DataQuality(val)
+        else:
+            self.dataquality = None
+
+    def _parse_acquisition(self, md):
+        """ parse gmi:acquisitionInformation """
+
+        val = md.find(util.nspath_eval('gmi:acquisitionInformation/gmi:MI_AcquisitionInformation', namespaces))
+        if val is not None:
+            self.acquisition = MI_AcquisitionInformation(val)
+        else:
+            self.acquisition = None
 
     def get_default_locale(self):
         """ get default gmd:PT_Locale based on gmd:language """
@@ -185,6 +346,7 @@ class MD_Metadata(object):
 
 class PT_Locale(object):
     """ process PT_Locale """
+    __slots__ = ('id', 'languagecode', 'charset')
 
     def __init__(self, md=None):
         if md is None:
@@ -202,6 +364,8 @@ class PT_Locale(object):
 
 class CI_Date(object):
     """ process CI_Date """
+    __slots__ = ('date', 'type')
+
     def __init__(self, md=None):
         if md is None:
             self.date = None
@@ -223,6 +387,9 @@ class CI_Date(object):
 
 class CI_ResponsibleParty(object):
     """ process CI_ResponsibleParty """
+    __slots__ = ('name', 'organization', 'position', 'phone', 'fax', 'address', 'city', 'region', 'postcode', 'country',
+                 'email', 'onlineresource', 'role')
+
     def __init__(self, md=None):
 
         if md is None:
@@ -302,6 +469,8 @@ class MD_Keywords(object):
     """
     Class for the metadata MD_Keywords element
     """
+    __slots__ = ('keywords', 'type', 'thesaurus', 'kwdtype_codeList')
+
     def __init__(self, md=None):
         if md is None:
             self.keywords = []
@@ -341,9 +510,22 @@ class MD_Keywords(object):
                 self.thesaurus['datetype'] = util.testXMLAttribute(thesaurus, 'codeListValue')
 
 
-class MD_DataIdentification(object):
-    """ process MD_DataIdentification """
-    def __init__(self, md=None, identtype=None):
+class MD_DataIdentification(_LazySections):
+    """ process MD_DataIdentification (selecting fields as MD_Metadata does) """
+
+    _sections = OrderedDict([
+        ('description', ('title', 'alternatetitle', 'aggregationinfo', 'uricode', 'uricodespace', 'date', 'datetype',
+                         'denominators', 'distance', 'uom', 'resourcelanguagecode', 'resourcelanguage', 'edition',
+                         'abstract', 'abstract_url', 'purpose', 'status', 'spatialrepresentationtype',
+                         'topiccategory', 'supplementalinformation')),
+        ('constraints', ('uselimitation', 'uselimitation_url', 'accessconstraints', 'classification',
+                         'otherconstraints', 'securityconstraints', 'useconstraints')),
+        ('contacts', ('creator', 'publisher', 'contributor', 'contact')),
+        ('keywords', ('keywords', 'keywords2')),
+        ('extent', ('extent', 'bbox', 'temporalextent_start', 'temporalextent_end')),
+    ])
+
+    def __init__(self, md=None, identtype=None, fields=None):
         if md is None:
             self.identtype = None
             self.title = None
@@ -385,274 +567,293 @@ class MD_DataIdentification(object):
             self.spatialrepresentationtype = []
         else:
             self.identtype = identtype
-            val = md.find(util.nspath_eval('gmd:citation/gmd:CI_Citation/gmd:title/gco:CharacterString', namespaces))
-            self.title = util.testXMLValue(val)
-
-            val = md.find(util.nspath_eval(
-                'gmd:citation/gmd:CI_Citation/gmd:alternateTitle/gco:CharacterString', namespaces))
-            self.alternatetitle = util.testXMLValue(val)
-
-            val = md.find(util.nspath_eval('gmd:aggregationInfo', namespaces))
-            self.aggregationinfo = util.testXMLValue(val)
-
-            self.uricode = []
-            _values = md.findall(util.nspath_eval(
-                'gmd:citation/gmd:CI_Citation/gmd:identifier/gmd:RS_Identifier/gmd:code/gco:CharacterString',
-                namespaces))
-            _values += md.findall(util.nspath_eval(
-                'gmd:citation/gmd:CI_Citation/gmd:identifier/gmd:MD_Identifier/gmd:code/gco:CharacterString',
-                namespaces))
-            for i in _values:
-                val = util.testXMLValue(i)
-                if val is not None:
-                    self.uricode.append(val)
-
-            self.uricodespace = []
-            for i in md.findall(util.nspath_eval(
-                    'gmd:citation/gmd:CI_Citation/gmd:identifier/gmd:RS_Identifier/gmd:codeSpace/gco:CharacterString',
-                    namespaces)):
-                val = util.testXMLValue(i)
-                if val is not None:
-                    self.uricodespace.append(val)
-
-            self.date = []
-            self.datetype = []
-
-            for i in md.findall(util.nspath_eval('gmd:citation/gmd:CI_Citation/gmd:date/gmd:CI_Date', namespaces)):
-                self.date.append(CI_Date(i))
-
-            self.uselimitation = []
-            self.uselimitation_url = []
-            _values = md.findall(util.nspath_eval(
-                'gmd:resourceConstraints/gmd:MD_LegalConstraints/gmd:useLimitation/gco:CharacterString', namespaces))
-            _values += md.findall(util.nspath_eval(
-                'gmd:resourceConstraints/gmd:MD_Constraints/gmd:useLimitation/gco:CharacterString', namespaces))
-            for i in _values:
-                val = util.testXMLValue(i)
-                if val is not None:
-                    self.uselimitation.append(val)
-
-            _values = md.findall(util.nspath_eval(
-                'gmd:resourceConstraints/gmd:MD_LegalConstraints/gmd:useLimitation/gmx:Anchor', namespaces))
-            _values += md.findall(util.nspath_eval(
-                'gmd:resourceConstraints/gmd:MD_Constraints/gmd:useLimitation/gmx:Anchor', namespaces))
-            for i in _values:
-                val = util.testXMLValue(i)
-                val1 = i.attrib.get(util.nspath_eval('xlink:href', namespaces))
-
-                if val is not None:
-                    self.uselimitation.append(val)
-                    self.uselimitation_url.append(val1)
+            self._parse_sections(md, fields)
+
+    def _parse_description(self, md):
+        """ parse the citation and descriptive elements """
+
+        val = md.find(util.nspath_eval('gmd:citation/gmd:CI_Citation/gmd:title/gco:CharacterString', namespaces))
+        self.title = util.testXMLValue(val)
+
+        val = md.find(util.nspath_eval(
+            'gmd:citation/gmd:CI_Citation/gmd:alternateTitle/gco:CharacterString', namespaces))
+        self.alternatetitle = util.testXMLValue(val)
+
+        val = md.find(util.nspath_eval('gmd:aggregationInfo', namespaces))
+        self.aggregationinfo = util.testXMLValue(val)
+
+        self.uricode = []
+        _values = md.findall(util.nspath_eval(
+            'gmd:citation/gmd:CI_Citation/gmd:identifier/gmd:RS_Identifier/gmd:code/gco:CharacterString',
+            namespaces))
+        _values += md.findall(util.nspath_eval(
+            'gmd:citation/gmd:CI_Citation/gmd:identifier/gmd:MD_Identifier/gmd:code/gco:CharacterString',
+            namespaces))
+        for i in _values:
+            val = util.testXMLValue(i)
+            if val is not None:
+                self.uricode.append(val)
 
-            self.accessconstraints = []
-            for i in md.findall(util.nspath_eval(
-                    'gmd:resourceConstraints/gmd:MD_LegalConstraints/gmd:accessConstraints/gmd:MD_RestrictionCode',
-                    namespaces)):
-                val = _testCodeListValue(i)
-                if val is not None:
-                    self.accessconstraints.append(val)
+        self.uricodespace = []
+        for i in md.findall(util.nspath_eval(
+                'gmd:citation/gmd:CI_Citation/gmd:identifier/gmd:RS_Identifier/gmd:codeSpace/gco:CharacterString',
+                namespaces)):
+            val = util.testXMLValue(i)
+            if val is not None:
+                self.uricodespace.append(val)
 
-            self.classification = []
-            for i in md.findall(util.nspath_eval(
-                    'gmd:resourceConstraints/gmd:MD_LegalConstraints/gmd:accessConstraints/gmd:MD_ClassificationCode',
-                    namespaces)):
-                val = _testCodeListValue(i)
-                if val is not None:
-                    self.classification.append(val)
+        self.date = []
+        self.datetype = []
 
-            self.otherconstraints = []
-            for i in md.findall(util.nspath_eval(
-                    'gmd:resourceConstraints/gmd:MD_LegalConstraints/gmd:otherConstraints/gco:CharacterString',
-                    namespaces)):
-                val = util.testXMLValue(i)
-                if val is not None:
-                    self.otherconstraints.append(val)
+        for i in md.findall(util.nspath_eval('gmd:citation/gmd:CI_Citation/gmd:date/gmd:CI_Date', namespaces)):
+            self.date.append(CI_Date(i))
 
-            self.securityconstraints = []
-            for i in md.findall(util.nspath_eval(
-                    'gmd:resourceConstraints/gmd:MD_SecurityConstraints/gmd:classification/gmd:MD_ClassificationCode',
-                    namespaces)):
-                val = _testCodeListValue(i)
-                if val is not None:
-                    self.securityconstraints.append(val)
+        self.denominators = []
+        for i in md.findall(util.nspath_eval(
+                'gmd:spatialResolution/gmd:MD_Resolution/gmd:equivalentScale/gmd:MD_RepresentativeFraction/gmd:denominator/gco:Integer',  # noqa
+                namespaces)):
+            val = util.testXMLValue(i)
+            if val is not None:
+                self.denominators.append(val)
 
-            self.useconstraints = []
-            for i in md.findall(util.nspath_eval(
-                    'gmd:resourceConstraints/gmd:MD_LegalConstraints/gmd:useConstraints/gmd:MD_RestrictionCode',
-                    namespaces)):
-                val = _testCodeListValue(i)
-                if val is not None:
-                    self.useconstraints.append(val)
+        self.distance = []
+        self.uom = []
+        for i in md.findall(util.nspath_eval(
+                'gmd:spatialResolution/gmd:MD_Resolution/gmd:distance/gco:Distance', namespaces)):
+            val = util.testXMLValue(i)
+            if val is not None:
+                self.distance.append(val)
+            self.uom.append(i.get("uom"))
 
-            self.denominators = []
-            for i in md.findall(util.nspath_eval(
-                    'gmd:spatialResolution/gmd:MD_Resolution/gmd:equivalentScale/gmd:MD_RepresentativeFraction/gmd:denominator/gco:Integer',  # noqa
-                    namespaces)):
-                val = util.testXMLValue(i)
-                if val is not None:
-                    self.denominators.append(val)
+        self.resourcelanguagecode = []
+        for i in md.findall(util.nspath_eval('gmd:language/gmd:LanguageCode', namespaces)):
+            val = _testCodeListValue(i)
+            if val is not None:
+                self.resourcelanguagecode.append(val)
 
-            self.distance = []
-            self.uom = []
-            for i in md.findall(util.nspath_eval(
-                    'gmd:spatialResolution/gmd:MD_Resolution/gmd:distance/gco:Distance', namespaces)):
-                val = util.testXMLValue(i)
-                if val is not None:
-                    self.distance.append(val)
-                self.uom.append(i.get("uom"))
+        self.resourcelanguage = []
+        for i in md.findall(util.nspath_eval('gmd:language/gco:CharacterString', namespaces)):
+            val = util.testXMLValue(i)
+            if val is not None:
+                self.resourcelanguage.append(val)
 
-            self.resourcelanguagecode = []
-            for i in md.findall(util.nspath_eval('gmd:language/gmd:LanguageCode', namespaces)):
-                val = _testCodeListValue(i)
-                if val is not None:
-                    self.resourcelanguagecode.append(val)
+        val = md.find(util.nspath_eval('gmd:edition/gco:CharacterString', namespaces))
+        self.edition = util.testXMLValue(val)
 
-            self.resourcelanguage = []
-            for i in md.findall(util.nspath_eval('gmd:language/gco:CharacterString', namespaces)):
-                val = util.testXMLValue(i)
-                if val is not None:
-                    self.resourcelanguage.append(val)
+        val = md.find(util.nspath_eval('gmd:abstract/gco:CharacterString', namespaces))
+        self.abstract = util.testXMLValue(val)
 
-            self.creator = []
-            self.publisher = []
-            self.contributor = []
-            for val in md.findall(util.nspath_eval('gmd:pointOfContact/gmd:CI_ResponsibleParty', namespaces)):
-                role = val.find(util.nspath_eval('gmd:role/gmd:CI_RoleCode', namespaces))
-                if role is not None:
-                    clv = _testCodeListValue(role)
-                    rp = CI_ResponsibleParty(val)
-                    if clv == 'originator':
-                        self.creator.append(rp)
-                    elif clv == 'publisher':
-                        self.publisher.append(rp)
-                    elif clv == 'author':
-                        self.contributor.append(rp)
-
-            val = md.find(util.nspath_eval('gmd:edition/gco:CharacterString', namespaces))
-            self.edition = util.testXMLValue(val)
+        val = md.find(util.nspath_eval('gmd:abstract/gmx:Anchor', namespaces))
 
-            val = md.find(util.nspath_eval('gmd:abstract/gco:CharacterString', namespaces))
+        self.abstract_url = None
+        if val is not None:
             self.abstract = util.testXMLValue(val)
+            self.abstract_url = val.attrib.get(util.nspath_eval('xlink:href', namespaces))
 
-            val = md.find(util.nspath_eval('gmd:abstract/gmx:Anchor', namespaces))
-
-            self.abstract_url = None
-            if val is not None:
-                self.abstract = util.testXMLValue(val)
-                self.abstract_url = val.attrib.get(util.nspath_eval('xlink:href', namespaces))
-
-            val = md.find(util.nspath_eval('gmd:purpose/gco:CharacterString', namespaces))
-            self.purpose = util.testXMLValue(val)
+        val = md.find(util.nspath_eval('gmd:purpose/gco:CharacterString', namespaces))
+        self.purpose = util.testXMLValue(val)
 
-            self.status = _testCodeListValue(md.find(util.nspath_eval('gmd:status/gmd:MD_ProgressCode', namespaces)))
+        self.status = _testCodeListValue(md.find(util.nspath_eval('gmd:status/gmd:MD_ProgressCode', namespaces)))
 
-            self.contact = []
-            for i in md.findall(util.nspath_eval('gmd:pointOfContact/gmd:CI_ResponsibleParty', namespaces)):
-                o = CI_ResponsibleParty(i)
-                self.contact.append(o)
-
-            self.spatialrepresentationtype = []
-            for val in md.findall(util.nspath_eval(
-                    'gmd:spatialRepresentationType/gmd:MD_SpatialRepresentationTypeCode', namespaces)):
-                val = util.testXMLAttribute(val, 'codeListValue')
-                if val:
-                    self.spatialrepresentationtype.append(val)
-
-            warnings.warn(
-                'The .keywords and .keywords2 properties will merge into the '
-                '.keywords property in the future, with .keywords becoming a list '
-                'of MD_Keywords instances. This is currently implemented in .keywords2. '
-                'Please see https://github.com/geopython/OWSLib/issues/301 for more information',
-                FutureWarning)
+        self.spatialrepresentationtype = []
+        for val in md.findall(util.nspath_eval(
+                'gmd:spatialRepresentationType/gmd:MD_SpatialRepresentationTypeCode', namespaces)):
+            val = util.testXMLAttribute(val, 'codeListValue')
+            if val:
+                self.spatialrepresentationtype.append(val)
 
-            self.keywords = []
-
-            for i in md.findall(util.nspath_eval('gmd:descriptiveKeywords', namespaces)):
-                mdkw = {}
-                mdkw['type'] = _testCodeListValue(i.find(util.nspath_eval(
-                    'gmd:MD_Keywords/gmd:type/gmd:MD_KeywordTypeCode', namespaces)))
+        self.topiccategory = []
+        for i in md.findall(util.nspath_eval('gmd:topicCategory/gmd:MD_TopicCategoryCode', namespaces)):
+            val = util.testXMLValue(i)
+            if val is not None:
+                self.topiccategory.append(val)
+
+        val = md.find(util.nspath_eval('gmd:supplementalInformation/gco:CharacterString', namespaces))
+        self.supplementalinformation = util.testXMLValue(val)
+
+    def _parse_constraints(self, md):
+        """ parse gmd:resourceConstraints """
+
+        self.uselimitation = []
+        self.uselimitation_url = []
+        _values = md.findall(util.nspath_eval(
+            'gmd:resourceConstraints/gmd:MD_LegalConstraints/gmd:useLimitation/gco:CharacterString', namespaces))
+        _values += md.findall(util.nspath_eval(
+            'gmd:resourceConstraints/gmd:MD_Constraints/gmd:useLimitation/gco:CharacterString', namespaces))
+        for i in _values:
+            val = util.testXMLValue(i)
+            if val is not None:
+                self.uselimitation.append(val)
 
-                mdkw['thesaurus'] = {}
+        _values = md.findall(util.nspath_eval(
+            'gmd:resourceConstraints/gmd:MD_LegalConstraints/gmd:useLimitation/gmx:Anchor', namespaces))
+        _values += md.findall(util.nspath_eval(
+            'gmd:resourceConstraints/gmd:MD_Constraints/gmd:useLimitation/gmx:Anchor', namespaces))
+        for i in _values:
+            val = util.testXMLValue(i)
+            val1 = i.attrib.get(util.nspath_eval('xlink:href', namespaces))
 
-                val = i.find(util.nspath_eval(
-                    'gmd:MD_Keywords/gmd:thesaurusName/gmd:CI_Citation/gmd:title/gco:CharacterString', namespaces))
-                mdkw['thesaurus']['title'] = util.testXMLValue(val)
+            if val is not None:
+                self.uselimitation.append(val)
+                self.uselimitation_url.append(val1)
+
+        self.accessconstraints = []
+        for i in md.findall(util.nspath_eval(
+                'gmd:resourceConstraints/gmd:MD_LegalConstraints/gmd:accessConstraints/gmd:MD_RestrictionCode',
+                namespaces)):
+            val = _testCodeListValue(i)
+            if val is not None:
+                self.accessconstraints.append(val)
 
-                val = i.find(util.nspath_eval(
-                    'gmd:MD_Keywords/gmd:thesaurusName/gmd:CI_Citation/gmd:date/gmd:CI_Date/gmd:date/gco:Date',
-                    namespaces))
-                mdkw['thesaurus']['date'] = util.testXMLValue(val)
+        self.classification = []
+        for i in md.findall(util.nspath_eval(
+                'gmd:resourceConstraints/gmd:MD_LegalConstraints/gmd:accessConstraints/gmd:MD_ClassificationCode',
+                namespaces)):
+            val = _testCodeListValue(i)
+            if val is not None:
+                self.classification.append(val)
 
-                val = i.find(util.nspath_eval(
-                    'gmd:MD_Keywords/gmd:thesaurusName/gmd:CI_Citation/gmd:date/gmd:CI_Date/gmd:dateType/gmd:CI_DateTypeCode',  # noqa
-                    namespaces))
-                mdkw['thesaurus']['datetype'] = util.testXMLAttribute(val, 'codeListValue')
+        self.otherconstraints = []
+        for i in md.findall(util.nspath_eval(
+                'gmd:resourceConstraints/gmd:MD_LegalConstraints/gmd:otherConstraints/gco:CharacterString',
+                namespaces)):
+            val = util.testXMLValue(i)
+            if val is not None:
+                self.otherconstraints.append(val)
 
-                mdkw['keywords'] = []
+        self.securityconstraints = []
+        for i in md.findall(util.nspath_eval(
+                'gmd:resourceConstraints/gmd:MD_SecurityConstraints/gmd:classification/gmd:MD_ClassificationCode',
+                namespaces)):
+            val = _testCodeListValue(i)
+            if val is not None:
+                self.securityconstraints.append(val)
 
-                for k in i.findall(util.nspath_eval('gmd:MD_Keywords/gmd:keyword', namespaces)):
-                    val = k.find(util.nspath_eval('gco:CharacterString', namespaces))
-                    if val is not None:
-                        val2 = util.testXMLValue(val)
-                        if val2 is not None:
-                            mdkw['keywords'].append(val2)
+        self.useconstraints = []
+        for i in md.findall(util.nspath_eval(
+                'gmd:resourceConstraints/gmd:MD_LegalConstraints/gmd:useConstraints/gmd:MD_RestrictionCode',
+                namespaces)):
+            val = _testCodeListValue(i)
+            if val is not None:
+                self.useconstraints.append(val)
+
+    def _parse_contacts(self, md):
+        """ parse gmd:pointOfContact """
+
+        self.creator = []
+        self.publisher = []
+        self.contributor = []
+        for val in md.findall(util.nspath_eval('gmd:pointOfContact/gmd:CI_ResponsibleParty', namespaces)):
+            role = val.find(util.nspath_eval('gmd:role/gmd:CI_RoleCode', namespaces))
+            if role is not None:
+                clv = _testCodeListValue(role)
+                rp = CI_ResponsibleParty(val)
+                if clv == 'originator':
+                    self.creator.append(rp)
+                elif clv == 'publisher':
+                    self.publisher.append(rp)
+                elif clv == 'author':
+                    self.contributor.append(rp)
+
+        self.contact = []
+        for i in md.findall(util.nspath_eval('gmd:pointOfContact/gmd:CI_ResponsibleParty', namespaces)):
+            o = CI_ResponsibleParty(i)
+            self.contact.append(o)
+
+    def _parse_keywords(self, md):
+        """ parse gmd:descriptiveKeywords """
+
+        warnings.warn(
+            'The .keywords and .keywords2 properties will merge into the '
+            '.keywords property in the future, with .keywords becoming a list '
+            'of MD_Keywords instances. This is currently implemented in .keywords2. '
+            'Please see https://github.com/geopython/OWSLib/issues/301 for more information',
+            FutureWarning)
+
+        self.keywords = []
+
+        for i in md.findall(util.nspath_eval('gmd:descriptiveKeywords', namespaces)):
+            mdkw = {}
+            mdkw['type'] = _testCodeListValue(i.find(util.nspath_eval(
+                'gmd:MD_Keywords/gmd:type/gmd:MD_KeywordTypeCode', namespaces)))
+
+            mdkw['thesaurus'] = {}
+
+            val = i.find(util.nspath_eval(
+                'gmd:MD_Keywords/gmd:thesaurusName/gmd:CI_Citation/gmd:title/gco:CharacterString', namespaces))
+            mdkw['thesaurus']['title'] = util.testXMLValue(val)
+
+            val = i.find(util.nspath_eval(
+                'gmd:MD_Keywords/gmd:thesaurusName/gmd:CI_Citation/gmd:date/gmd:CI_Date/gmd:date/gco:Date',
+                namespaces))
+            mdkw['thesaurus']['date'] = util.testXMLValue(val)
 
-                self.keywords.append(mdkw)
+            val = i.find(util.nspath_eval(
+                'gmd:MD_Keywords/gmd:thesaurusName/gmd:CI_Citation/gmd:date/gmd:CI_Date/gmd:dateType/gmd:CI_DateTypeCode',  # noqa
+                namespaces))
+            mdkw['thesaurus']['datetype'] = util.testXMLAttribute(val, 'codeListValue')
 
-            self.keywords2 = []
-            for mdkw in md.findall(util.nspath_eval('gmd:descriptiveKeywords/gmd:MD_Keywords', namespaces)):
-                self.keywords2.append(MD_Keywords(mdkw))
+            mdkw['keywords'] = []
 
-            self.topiccategory = []
-            for i in md.findall(util.nspath_eval('gmd:topicCategory/gmd:MD_TopicCategoryCode', namespaces)):
-                val = util.testXMLValue(i)
+            for k in i.findall(util.nspath_eval('gmd:MD_Keywords/gmd:keyword', namespaces)):
+                val = k.find(util.nspath_eval('gco:CharacterString', namespaces))
                 if val is not None:
-                    self.topiccategory.append(val)
-
-            val = md.find(util.nspath_eval('gmd:supplementalInformation/gco:CharacterString', namespaces))
-            self.supplementalinformation = util.testXMLValue(val)
-
-            # There may be multiple geographicElement, create an extent
-            # from the one containing either an EX_GeographicBoundingBox or EX_BoundingPolygon.
-            # The schema also specifies an EX_GeographicDescription. This is not implemented yet.
-            val = None
-            val2 = None
-            val3 = None
-            extents = md.findall(util.nspath_eval('gmd:extent', namespaces))
-            extents.extend(md.findall(util.nspath_eval('srv:extent', namespaces)))
-            for extent in extents:
-                if val is None:
-                    for e in extent.findall(util.nspath_eval('gmd:EX_Extent/gmd:geographicElement', namespaces)):
-                        if e.find(util.nspath_eval('gmd:EX_GeographicBoundingBox', namespaces)) is not None or \
-                                e.find(util.nspath_eval('gmd:EX_BoundingPolygon', namespaces)) is not None:
-                            val = e
-                            break
-                    self.extent = EX_Extent(val)
-                    self.bbox = self.extent.boundingBox  # for backwards compatibility
-
+                    val2 = util.testXMLValue(val)
+                    if val2 is not None:
+                        mdkw['keywords'].append(val2)
+
+            self.keywords.append(mdkw)
+
+        self.keywords2 = []
+        for mdkw in md.findall(util.nspath_eval('gmd:descriptiveKeywords/gmd:MD_Keywords', namespaces)):
+            self.keywords2.append(MD_Keywords(mdkw))
+
+    def _parse_extent(self, md):
+        """ parse gmd:extent and srv:extent """
+
+        # There may be multiple geographicElement, create an extent
+        # from the one containing either an EX_GeographicBoundingBox or EX_BoundingPolygon.
+        # The schema also specifies an EX_GeographicDescription. This is not implemented yet.
+        val = None
+        val2 = None
+        val3 = None
+        extents = md.findall(util.nspath_eval('gmd:extent', namespaces))
+        extents.extend(md.findall(util.nspath_eval('srv:extent', namespaces)))
+        for extent in extents:
+            if val is None:
+                for e in extent.findall(util.nspath_eval('gmd:EX_Extent/gmd:geographicElement', namespaces)):
+                    if e.find(util.nspath_eval('gmd:EX_GeographicBoundingBox', namespaces)) is not None or \
+                            e.find(util.nspath_eval('gmd:EX_BoundingPolygon', namespaces)) is not None:
+                        val = e
+                        break
+                self.extent = EX_Extent(val)
+                self.bbox = self.extent.boundingBox  # for backwards compatibility
+
+            if val2 is None:
+                val2 = extent.find(util.nspath_eval(
+                    'gmd:EX_Extent/gmd:temporalElement/gmd:EX_TemporalExtent/gmd:extent/gml:TimePeriod/gml:beginPosition',  # noqa
+                    namespaces))
                 if val2 is None:
                     val2 = extent.find(util.nspath_eval(
-                        'gmd:EX_Extent/gmd:temporalElement/gmd:EX_TemporalExtent/gmd:extent/gml:TimePeriod/gml:beginPosition',  # noqa
+                        'gmd:EX_Extent/gmd:temporalElement/gmd:EX_TemporalExtent/gmd:extent/gml32:TimePeriod/gml32:beginPosition',  # noqa
                         namespaces))
-                    if val2 is None:
-                        val2 = extent.find(util.nspath_eval(
-                            'gmd:EX_Extent/gmd:temporalElement/gmd:EX_TemporalExtent/gmd:extent/gml32:TimePeriod/gml32:beginPosition',  # noqa
-                            namespaces))
-                    self.temporalextent_start = util.testXMLValue(val2)
+                self.temporalextent_start = util.testXMLValue(val2)
 
+            if val3 is None:
+                val3 = extent.find(util.nspath_eval(
+                    'gmd:EX_Extent/gmd:temporalElement/gmd:EX_TemporalExtent/gmd:extent/gml:TimePeriod/gml:endPosition',  # noqa
+                    namespaces))
                 if val3 is None:
                     val3 = extent.find(util.nspath_eval(
-                        'gmd:EX_Extent/gmd:temporalElement/gmd:EX_TemporalExtent/gmd:extent/gml:TimePeriod/gml:endPosition',  # noqa
+                        'gmd:EX_Extent/gmd:temporalElement/gmd:EX_TemporalExtent/gmd:extent/gml32:TimePeriod/gml32:endPosition',  # noqa
                         namespaces))
-                    if val3 is None:
-                        val3 = extent.find(util.nspath_eval(
-                            'gmd:EX_Extent/gmd:temporalElement/gmd:EX_TemporalExtent/gmd:extent/gml32:TimePeriod/gml32:endPosition',  # noqa
-                            namespaces))
-                    self.temporalextent_end = util.testXMLValue(val3)
+                self.temporalextent_end = util.testXMLValue(val3)
 
 
 class MD_Distributor(object):
     """ process MD_Distributor """
+    __slots__ = ('contact', 'online')
+
     def __init__(self, md=None):
         if md is None:
             self.contact = None
@@ -674,6 +875,8 @@ class MD_Distributor(object):
 
 class MD_Distribution(object):
     """ process MD_Distribution """
+    __slots__ = ('format', 'version', 'distributor', 'online')
+
     def __init__(self, md=None):
         if md is None:
             self.format = None
@@ -704,6 +907,9 @@ class MD_Distribution(object):
 
 class DQ_DataQuality(object):
     ''' process DQ_DataQuality'''
+    __slots__ = ('conformancetitle', 'conformancedate', 'conformancedatetype', 'conformancedegree', 'lineage',
+                 'lineage_url', 'specificationtitle', 'specificationdate')
+
     def __init__(self, md=None):
         if md is None:
             self.conformancetitle = []
@@ -772,6 +978,9 @@ class DQ_DataQuality(object):
 
 class SV_ServiceIdentification(object):
     """ process SV_ServiceIdentification """
+    __slots__ = ('title', 'abstract', 'contact', 'identtype', 'type', 'version', 'fees', 'bbox', 'couplingtype',
+                 'operations', 'operateson')
+
     def __init__(self, md=None):
         if md is None:
             self.title = None
@@ -850,6 +1059,8 @@ class SV_ServiceIdentification(object):
 
 class CI_OnlineResource(object):
     """ process CI_OnlineResource """
+    __slots__ = ('url', 'protocol', 'name', 'description', 'function')
+
     def __init__(self, md=None):
         if md is None:
             self.url = None
@@ -875,6 +1086,8 @@ class CI_OnlineResource(object):
 
 
 class EX_GeographicBoundingBox(object):
+    __slots__ = ('minx', 'maxx', 'miny', 'maxy')
+
     def __init__(self, md=None):
         if md is None:
             self.minx = None
@@ -893,6 +1106,8 @@ class EX_GeographicBoundingBox(object):
 
 
 class EX_Polygon(object):
+    __slots__ = ('exterior_ring', 'interior_rings')
+
     def __init__(self, md=None):
         if md is None:
             self.exterior_ring = None
@@ -919,6 +1134,8 @@ class EX_Polygon(object):
 
 
 class EX_GeographicBoundingPolygon(object):
+    __slots__ = ('is_extent', 'polygons')
+
     def __init__(self, md=None):
         if md is None:
             self.is_extent = None
@@ -936,6 +1153,8 @@ class EX_GeographicBoundingPolygon(object):
 
 class EX_Extent(object):
     """ process EX_Extent """
+    __slots__ = ('boundingBox', 'boundingPolygon', 'description_code')
+
     def __init__(self, md=None):
         if md is None:
             self.boundingBox = None
@@ -962,6 +1181,8 @@ class EX_Extent(object):
 
 class MD_ReferenceSystem(object):
     """ process MD_ReferenceSystem """
+    __slots__ = ('code', 'codeSpace', 'version')
+
     def __init__(self, md=None):
         if md is None:
             self.code = None
@@ -997,10 +1218,11 @@ def _testCodeListValue(elpath):
     """ get gco:CodeListValue_Type attribute, else get text content """
     if elpath is not None:  # try to get @codeListValue
         val = util.testXMLValue(elpath.attrib.get('codeListValue'), True)
-        if val is not None:
-            return val
-        else:  # see if there is element text
-            return util.testXMLValue(elpath)
+        if val is None:  # see if there is element text
+            val = util.testXMLValue(elpath)
+        if val is not None:  # code list values repeat across records: share them
+            val = sys.intern(val)
+        return val
     else:
         return None
 
@@ -1247,6 +1469,8 @@ class FC_ListedValue(object):
 
 class MD_ImageDescription(object):
     """Process gmd:MD_ImageDescription"""
+    __slots__ = ('type', 'bands', 'attribute_description', 'cloud_cover', 'processing_level')
+
     def __init__(self, img_desc=None):
         self.type = 'image'
         self.bands = []
@@ -1276,6 +1500,8 @@ class MD_ImageDescription(object):
 
 class MD_Band(object):
     """Process gmd:MD_Band"""
+    __slots__ = ('id', 'units', 'min', 'max')
+
     def __init__(self, band, band_id=None):
         if band is None:
             self.id = None
@@ -1297,6 +1523,7 @@ class MD_Band(object):
 
 class MI_AcquisitionInformation(object):
     """Process gmi:MI_AcquisitionInformation"""
+    __slots__ = ('platforms',)
 
     def __init__(self, acq=None):
         self.platforms = []
@@ -1307,6 +1534,7 @@ class MI_AcquisitionInformation(object):
 
 class MI_Platform(object):
     """Process gmi:MI_Platform"""
+    __slots__ = ('instruments', 'identifier', 'description')
 
     def __init__(self, plt=None):
         self.instruments = []
@@ -1327,6 +1555,7 @@ class MI_Platform(object):
 
 class MI_Instrument(object):
     """Process gmi:MI_Instrument"""
+    __slots__ = ('identifier', 'type')
 
     def __init__(self, inst=None):
         if inst is None:
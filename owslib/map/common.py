@@ -1,14 +1,23 @@
+from collections import OrderedDict
+from collections.abc import ItemsView, ValuesView
+from io import BytesIO
+import re
 from urllib.parse import urlencode, parse_qsl
+import warnings
 
+from owslib.cache import get_capabilities_cache, read_capabilities
 from owslib.etree import etree
-from owslib.util import strip_bom, Authentication, openURL
+from owslib.util import strip_bom, testXMLValue, Authentication, openURL, stream_response
+
+# XML declaration of a document, which names its encoding
+_XML_DECLARATION = re.compile(r'^\s*<\?xml[^>]*\?>')
 
 
 class WMSCapabilitiesReader(object):
     """Read and parse capabilities document into a lxml.etree infoset
     """
 
-    def __init__(self, version='1.1.1', url=None, un=None, pw=None, headers=None, auth=None):
+    def __init__(self, version='1.1.1', url=None, un=None, pw=None, headers=None, auth=None, session=None):
         """Initialize"""
         self.version = version
         self._infoset = None
@@ -21,6 +30,7 @@ class WMSCapabilitiesReader(object):
         self.headers = headers
         self.request = None
         self.auth = auth or Authentication(un, pw)
+        self.session = session
 
         # if self.username and self.password:
         #     # Provide login information in order to use the WMS server
@@ -60,12 +70,8 @@ class WMSCapabilitiesReader(object):
         """
         self.request = self.capabilities_url(service_url)
 
-        # now split it up again to use the generic openURL function...
-        spliturl = self.request.split('?')
-        u = openURL(spliturl[0], spliturl[1], method='Get',
-                    timeout=timeout, headers=self.headers, auth=self.auth)
-
-        raw_text = strip_bom(u.read())
+        raw_text = strip_bom(read_capabilities(self.request, timeout=timeout, headers=self.headers,
+                                               auth=self.auth, session=self.session))
         return etree.fromstring(raw_text)
 
     def readString(self, st):
@@ -78,6 +84,204 @@ class WMSCapabilitiesReader(object):
         raw_text = strip_bom(st)
         return etree.fromstring(raw_text)
 
+    def iterparse(self, service_url=None, xml=None, timeout=30):
+        """Return an iterator of ('start', element) and ('end', element)
+        events over a WMS capabilities document, parsed as it is read
+
+        The document is streamed from the server, or read from xml when
+        given.  Use with iterparse_layers to keep memory use bounded.
+        """
+        if xml is not None:
+            if not isinstance(xml, str) and not isinstance(xml, bytes):
+                raise ValueError("String must be of type string or bytes, not %s" % type(xml))
+            if isinstance(xml, str):
+                # the text is encoded anew as UTF-8: drop the declaration of its original encoding
+                xml = _XML_DECLARATION.sub('', xml.lstrip('\ufeff'), count=1).encode('utf-8')
+            source = BytesIO(strip_bom(xml))
+        else:
+            self.request = self.capabilities_url(service_url)
+            if get_capabilities_cache() is not None:
+                source = BytesIO(strip_bom(read_capabilities(self.request, timeout=timeout, headers=self.headers,
+                                                             auth=self.auth, session=self.session)))
+            else:
+                source = stream_response(openURL(self.request, timeout=timeout, headers=self.headers,
+                                                 auth=self.auth, session=self.session, stream=True), skip_bom=True)
+        return etree.iterparse(source, events=('start', 'end'))
+
+
+def iterparse_layers(events, layer_path, factory):
+    """Build the content metadata of the layers of a WMS capabilities
+    document from iterparse events, returning (root element, contents)
+
+    The content metadata of a layer is built as soon as its own properties
+    have been read (at the start of its first sublayer, or at its end), and
+    its element is then removed from the tree, so only the layers being
+    read are held in memory.  factory(elem, parent, index) returns the
+    content metadata of a Layer element.
+    """
+    contents = OrderedDict()
+    stack = []  # open elements
+    top = _LayerNode(None, None, None, 0)  # parent node of the top-level layers
+    nodes = [top]  # open layers
+
+    def build(node):
+        parent = node.parent.metadata if node.parent is not top else None
+        cm = node.metadata = factory(node.elem, parent, node.index)
+        cm.children = []
+        cm._layer_elems = []
+        cm._layers = []
+        if parent is not None:
+            parent.layers.append(cm)
+        if cm.id:
+            if cm.id in contents:
+                warnings.warn('Content metadata for layer "%s" already exists. Using child layer' % cm.id)
+            contents[cm.id] = cm
+            if parent is not None:
+                parent.children.append(cm)
+
+    for event, elem in events:
+        if event == 'start':
+            if elem.tag == layer_path:
+                parent = nodes[-1]
+                if parent is not top and parent.metadata is None:
+                    build(parent)
+                node = _LayerNode(elem, None, parent, len(parent.children) + 1)
+                parent.children.append(node)
+                nodes.append(node)
+            stack.append(elem)
+        else:
+            stack.pop()
+            if elem.tag == layer_path:
+                node = nodes.pop()
+                if node.metadata is None:
+                    build(node)
+                node.elem = None
+                elem.clear()
+                if stack:
+                    stack[-1].remove(elem)
+
+    return elem, contents
+
+
+def metadata_layers(contents):
+    """Return the content metadata of the layers of contents and of their
+    parent layers (which may have no name, and so not be in contents)
+    """
+    layers = OrderedDict()
+    for layer in contents.values():
+        while layer is not None and id(layer) not in layers:
+            layers[id(layer)] = layer
+            layer = layer.parent
+    return list(layers.values())
+
+
+class _LayerNode(object):
+    """A Layer element and its position in the layer tree"""
+
+    __slots__ = ('elem', 'name', 'parent', 'index', 'children', 'metadata')
+
+    def __init__(self, elem, name, parent, index):
+        self.elem = elem
+        self.name = name
+        self.parent = parent
+        self.index = index
+        self.children = []
+        self.metadata = None
+
+
+class LazyContents(OrderedDict):
+    """Ordered mapping of layer names to content metadata, built on demand
+
+    The Layer elements of the capabilities document are indexed by name in a
+    single pass; the content metadata of a layer (and of the parent layers it
+    inherits from) is only built when the layer is first accessed.
+    """
+
+    def __init__(self, caps, layer_path, name_path, factory):
+        """Initialize
+
+        caps is the Capability element, layer_path and name_path are the paths
+        of the Layer and Name elements, and factory(elem, parent, index)
+        returns the content metadata of a Layer element
+        """
+        super(LazyContents, self).__init__()
+        self._factory = factory
+        self._index_layers(caps, None, layer_path, name_path)
+
+    def _index_layers(self, parent_elem, parent_node, layer_path, name_path):
+        nodes = []
+        for index, elem in enumerate(parent_elem.findall(layer_path)):
+            node = _LayerNode(elem, testXMLValue(elem.find(name_path)), parent_node, index + 1)
+            if node.name:
+                if OrderedDict.__contains__(self, node.name):
+                    warnings.warn('Content metadata for layer "%s" already exists. Using child layer' % node.name)
+                OrderedDict.__setitem__(self, node.name, node)
+            nodes.append(node)
+            node.children = self._index_layers(elem, node, layer_path, name_path)
+        return nodes
+
+    def _metadata(self, node):
+        if node.metadata is None:
+            parent = self._metadata(node.parent) if node.parent is not None else None
+            node.metadata = self._factory(node.elem, parent, node.index)
+            node.metadata._children_loader = \
+                lambda: [self._metadata(child) for child in node.children if child.name]
+        return node.metadata
+
+    def __getitem__(self, key):
+        value = OrderedDict.__getitem__(self, key)
+        if isinstance(value, _LayerNode):
+            value = self._metadata(value)
+            OrderedDict.__setitem__(self, key, value)
+        return value
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def pop(self, key, *args):
+        if key in self:
+            value = self[key]
+            OrderedDict.__delitem__(self, key)
+            return value
+        return OrderedDict.pop(self, key, *args)
+
+    def popitem(self, last=True):
+        if not self:
+            raise KeyError('dictionary is empty')
+        key = next(reversed(self)) if last else next(iter(self))
+        return key, self.pop(key)
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def items(self):
+        return ItemsView(self)
+
+    def values(self):
+        return ValuesView(self)
+
+    def load(self):
+        """Build the content metadata of all layers"""
+        for key in self:
+            self[key]
+
+    def copy(self):
+        return OrderedDict(self.items())
+
+    def __eq__(self, other):
+        return OrderedDict(self.items()) == other
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        return '%s(%r)' % (self.__class__.__name__, list(self))
+
+    def __reduce__(self):
+        return OrderedDict, (list(self.items()),)
+
 
 class AbstractContentMetadata(object):
 
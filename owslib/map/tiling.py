@@ -0,0 +1,246 @@
+# -*- coding: ISO-8859-15 -*-
+# =============================================================================
+# Copyright (c) 2024 OWSLib contributors
+#
+# Licensed under the BSD license, see LICENSE.txt
+# =============================================================================
+
+"""
+Tiled WMS GetMap requests.
+
+A GetMap request larger than the server accepts (MaxWidth / MaxHeight) is split
+into tiles that the server accepts, fetched concurrently, and either assembled
+into a single image (with Pillow) or written to a directory with a manifest of
+the tiles, so that an interrupted download is resumed where it stopped.
+"""
+
+import json
+import mimetypes
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_EXCEPTION
+from io import BytesIO
+
+from owslib.util import openURL, log
+
+try:  # optional, for assembling the tiles
+    from PIL import Image
+except ImportError:
+    Image = None
+
+MANIFEST = 'manifest.json'  # name of the manifest file in a tiles directory
+TILE_WORKERS = 4  # default number of tiles fetched at a time
+MAX_TILE_SIZE = 2048  # default tile width and height, when the server sets no limit
+
+
+def tile_size_limits(service, tile_size=None):
+    """Return the (width, height) of the tiles of a service: tile_size (default MAX_TILE_SIZE),
+    reduced to the MaxWidth and MaxHeight of the service
+    """
+    width, height = tile_size or (MAX_TILE_SIZE, MAX_TILE_SIZE)
+    maxwidth = getattr(service.identification, 'maxwidth', None)
+    maxheight = getattr(service.identification, 'maxheight', None)
+    if maxwidth:
+        width = min(width, maxwidth) if tile_size else maxwidth
+    if maxheight:
+        height = min(height, maxheight) if tile_size else maxheight
+    return int(width), int(height)
+
+
+def split_getmap(bbox, size, tile_size):
+    """Split the bbox and size of a GetMap request into tiles
+
+    @param bbox: (left, bottom, right, top), in the order of the bbox of getmap, whatever the axis order of the crs
+    @param size: (width, height) of the image in pixels
+    @param tile_size: (width, height) of the tiles in pixels
+    @return: list of tiles, as dicts of index (column, row), offset (x, y) in the image, size and bbox
+
+    Tiles are split at pixel boundaries: the image columns follow the x axis (left to right) and the
+    rows the y axis (top to bottom), so the tiles can be put side by side.  The axis order of the crs
+    is applied to the bbox of every tile when its request is built, as for getmap.
+    """
+    left, bottom, right, top = [float(v) for v in bbox]
+    width, height = [int(v) for v in size]
+    tile_width, tile_height = [int(v) for v in tile_size]
+    if tile_width < 1 or tile_height < 1:
+        raise ValueError('Tile size should be at least 1 pixel')
+
+    def x(column):
+        return right if column == width else left + column * (right - left) / width
+
+    def y(row):
+        return bottom if row == height else top - row * (top - bottom) / height
+
+    tiles = []
+    for j, y0 in enumerate(range(0, height, tile_height)):
+        y1 = min(y0 + tile_height, height)
+        for i, x0 in enumerate(range(0, width, tile_width)):
+            x1 = min(x0 + tile_width, width)
+            tiles.append({
+                'index': [i, j],
+                'offset': [x0, y0],
+                'size': [x1 - x0, y1 - y0],
+                'bbox': [x(x0), y(y1), x(x1), y(y0)],
+            })
+    return tiles
+
+
+def assemble(tiles, size, format=None):
+    """Assemble tiles, as (offset, file-like object or path) pairs, into a PIL Image of size"""
+    if Image is None:
+        raise ImportError('Assembling GetMap tiles requires the Pillow package')
+    image = None
+    for offset, source in tiles:
+        tile = Image.open(source)
+        if image is None:
+            mode = 'RGBA' if tile.mode in ('P', 'PA', 'LA') else tile.mode
+            if format is not None and 'jpeg' in format:
+                mode = 'RGB'
+            image = Image.new(mode, tuple(size))
+        if tile.mode != image.mode:
+            tile = tile.convert(image.mode)
+        image.paste(tile, tuple(offset))
+    return image
+
+
+def image_format(format):
+    """Return the Pillow format name of a GetMap format, e.g. PNG for image/png; mode=8bit"""
+    return format.split(';')[0].split('/')[-1].strip().upper()
+
+
+class MapTiles(object):
+    """The tiles of a GetMap request fetched with getmap_tiled, as recorded in the manifest of
+    their directory
+
+    Iterating yields the complete tiles in order, as dicts with their index, offset, size,
+    bbox and path.
+    """
+
+    def __init__(self, directory, manifest):
+        self.directory = directory
+        self.manifest = manifest
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, directory):
+        """Read the manifest of a tiles directory, None if there is none"""
+        path = os.path.join(directory, MANIFEST)
+        if not os.path.exists(path):
+            return None
+        with open(path) as f:
+            return cls(directory, json.load(f))
+
+    def save(self):
+        """Write the manifest, atomically"""
+        path = os.path.join(self.directory, MANIFEST)
+        with self._lock:
+            with open(path + '.tmp', 'w') as f:
+                json.dump(self.manifest, f, indent=2)
+            os.replace(path + '.tmp', path)
+
+    @property
+    def tiles(self):
+        return self.manifest['tiles']
+
+    @property
+    def complete(self):
+        """Whether all the tiles have been fetched"""
+        return all(tile['complete'] for tile in self.tiles)
+
+    def path(self, tile):
+        """Path of the file of a tile"""
+        return os.path.join(self.directory, tile['file'])
+
+    def __len__(self):
+        return len(self.tiles)
+
+    def __iter__(self):
+        for tile in self.tiles:
+            if tile['complete']:
+                yield dict(tile, path=self.path(tile))
+
+    def assemble(self, path=None):
+        """Assemble the tiles into a PIL Image (requires Pillow), saved to path when given"""
+        if not self.complete:
+            raise ValueError('The tiles of the GetMap request are not all fetched')
+        format = self.manifest['format']
+        image = assemble([(tile['offset'], self.path(tile)) for tile in self.tiles], self.manifest['size'], format)
+        if path is not None:
+            image.save(path, image_format(format))
+        return image
+
+
+def get_map_tiled(service, layers=None, srs=None, bbox=None, format=None, size=None, tile_size=None,
+                  max_workers=TILE_WORKERS, directory=None, method='Get', timeout=None, **kwargs):
+    """Fetch a GetMap request as tiles (see WebMapService_1_3_0.getmap_tiled)"""
+    tile_size = tile_size_limits(service, tile_size)
+    tiles = split_getmap(bbox, size, tile_size)
+    log.debug('GetMap of %s pixels split into %d tiles of %s pixels', size, len(tiles), tile_size)
+
+    def fetch(tile):
+        base_url, data = service._getmap_request(layers=layers, srs=srs, bbox=tuple(tile['bbox']), format=format,
+                                                 size=tuple(tile['size']), method=method, **kwargs)
+        u = openURL(base_url, data, method, timeout=timeout or service.timeout, auth=service.auth,
+                    session=service.session)
+        return service._getmap_response(u).read()
+
+    if directory is None:
+        if Image is None:
+            raise ImportError('Assembling GetMap tiles requires the Pillow package')
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(tiles))) as executor:
+            futures = dict((executor.submit(fetch, tile), tile) for tile in tiles)
+            try:
+                # each tile is pasted as it arrives, and its content then released
+                image = assemble(((futures.pop(future)['offset'], BytesIO(future.result()))
+                                  for future in as_completed(futures)), size, format)
+            finally:
+                for future in futures:
+                    future.cancel()
+        out = BytesIO()
+        image.save(out, image_format(format))
+        out.seek(0)
+        return out
+
+    request = {
+        'layers': list(layers),
+        'srs': srs,
+        'bbox': [float(v) for v in bbox],
+        'format': format,
+        'size': [int(v) for v in size],
+        'tile_size': list(tile_size),
+        'parameters': kwargs,
+    }
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+    map_tiles = MapTiles.load(directory)
+    if map_tiles is not None:
+        # resume the same request
+        previous = dict((key, map_tiles.manifest.get(key)) for key in request)
+        if json.loads(json.dumps(request)) != previous:
+            raise ValueError('%s holds the tiles of another GetMap request' % directory)
+    else:
+        extension = mimetypes.guess_extension(format.split(';')[0].strip()) or '.bin'
+        for tile in tiles:
+            tile.update(file='tile_%d_%d%s' % (tile['index'][0], tile['index'][1], extension), complete=False)
+        map_tiles = MapTiles(directory, dict(request, tiles=tiles))
+        map_tiles.save()
+
+    def download(tile):
+        content = fetch(tile)
+        path = map_tiles.path(tile)
+        with open(path + '.part', 'wb') as f:
+            f.write(content)
+        os.replace(path + '.part', path)
+        tile['complete'] = True
+        map_tiles.save()
+
+    pending = [tile for tile in map_tiles.tiles if not (tile['complete'] and os.path.exists(map_tiles.path(tile)))]
+    if pending:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as executor:
+            futures = [executor.submit(download, tile) for tile in pending]
+            done, not_done = wait(futures, return_when=FIRST_EXCEPTION)
+            for future in not_done:
+                future.cancel()
+            for future in done:
+                future.result()  # raise the error of a failed tile
+    return map_tiles
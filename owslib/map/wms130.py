@@ -20,12 +20,14 @@ from math import sqrt
 from owslib.etree import etree
 from owslib.util import (openURL, ServiceException, testXMLValue,
                          extract_xml_list, xmltag_split, OrderedDict, nspath,
-                         nspath_eval, bind_url, Authentication)
+                         nspath_eval, bind_url, Authentication, resolve_remote_metadata)
 from owslib.fgdc import Metadata
 from owslib.iso import MD_Metadata
-from owslib.crs import Crs
+from owslib.crs import get_crs
 from owslib.namespaces import Namespaces
-from owslib.map.common import WMSCapabilitiesReader, AbstractContentMetadata
+from owslib.map import tiling
+from owslib.map.common import (WMSCapabilitiesReader, AbstractContentMetadata, LazyContents, iterparse_layers,
+                               metadata_layers)
 
 from owslib.util import log
 
@@ -52,7 +54,7 @@ class WebMapService_1_3_0(object):
 
     def __init__(self, url, version='1.3.0', xml=None, username=None,
                  password=None, parse_remote_metadata=False, timeout=30,
-                 headers=None, auth=None):
+                 headers=None, auth=None, session=None, stream=False):
         """initialize"""
         if auth:
             if username:
@@ -64,12 +66,19 @@ class WebMapService_1_3_0(object):
         self.timeout = timeout
         self.headers = headers
         self._capabilities = None
+        self._contents = None
         self.auth = auth or Authentication(username, password)
+        self.session = session
 
         # Authentication handled by Reader
         reader = WMSCapabilitiesReader(
-            self.version, url=self.url, headers=headers, auth=self.auth)
-        if xml:  # read from stored xml
+            self.version, url=self.url, headers=headers, auth=self.auth, session=self.session)
+        if stream:  # build the layers while the document is parsed, then drop their elements
+            events = reader.iterparse(self.url, xml, timeout=self.timeout)
+            self._capabilities, self._contents = iterparse_layers(
+                events, nspath('Layer', WMS_NAMESPACE),
+                lambda elem, parent, index: ContentMetadata(elem, parent=parent, index=index))
+        elif xml:  # read from stored xml
             self._capabilities = reader.readString(xml)
         else:  # read from server
             self._capabilities = reader.read(self.url, timeout=self.timeout)
@@ -107,24 +116,20 @@ class WebMapService_1_3_0(object):
 
         # serviceContents metadata: our assumption is that services use a top-level
         # layer as a metadata organizer, nothing more.
-        self.contents = OrderedDict()
-        caps = self._capabilities.find(nspath('Capability', WMS_NAMESPACE))
-
-        # recursively gather content metadata for all layer elements.
+        # The layer elements are indexed by name, and the content metadata of a
+        # layer is only built when it is first accessed.
         # To the WebMapService.contents store only metadata of named layers.
-        def gather_layers(parent_elem, parent_metadata):
-            layers = []
-            for index, elem in enumerate(parent_elem.findall(nspath('Layer', WMS_NAMESPACE))):
-                cm = ContentMetadata(elem, parent=parent_metadata, index=index + 1,
-                                     parse_remote_metadata=parse_remote_metadata)
-                if cm.id:
-                    if cm.id in self.contents:
-                        warnings.warn('Content metadata for layer "%s" already exists. Using child layer' % cm.id)
-                    layers.append(cm)
-                    self.contents[cm.id] = cm
-                cm.children = gather_layers(elem, cm)
-            return layers
-        gather_layers(caps, None)
+        if self._contents is not None:  # built while streaming
+            self.contents = self._contents
+        else:
+            caps = self._capabilities.find(nspath('Capability', WMS_NAMESPACE))
+            self.contents = LazyContents(
+                caps, nspath('Layer', WMS_NAMESPACE), nspath('Name', WMS_NAMESPACE),
+                lambda elem, parent, index: ContentMetadata(elem, parent=parent, index=index))
+
+        # the remote metadata of all layers, fetched concurrently and once per URL
+        if parse_remote_metadata:
+            resolve_remote_metadata(metadata_layers(self.contents), timeout=self.timeout, session=self.session)
 
         # exceptions
         self.exceptions = [f.text for f
@@ -176,7 +181,7 @@ class WebMapService_1_3_0(object):
             # if it's esri's unknown spatial ref code, bail
             raise Exception('Undefined spatial reference (%s).' % srs)
 
-        sref = Crs(srs)
+        sref = get_crs(srs)
         if sref.axisorder == 'yx':
             # remap the given bbox
             bbox = (bbox[1], bbox[0], bbox[3], bbox[2])
@@ -204,6 +209,51 @@ class WebMapService_1_3_0(object):
                 request[kw] = kwargs[kw]
         return request
 
+    def _getmap_request(self, layers=None, styles=None, srs=None, bbox=None, format=None, size=None, time=None,
+                        elevation=None, dimensions={}, transparent=False, bgcolor='#FFFFFF', exceptions='XML',
+                        method='Get', **kwargs):
+        """Return the base url and the encoded parameters of a GetMap request"""
+
+        try:
+            base_url = next((m.get('url') for m in
+                            self.getOperationByName('GetMap').methods if
+                            m.get('type').lower() == method.lower()))
+        except StopIteration:
+            base_url = self.url
+
+        request = self.__build_getmap_request(
+            layers=layers,
+            styles=styles,
+            srs=srs,
+            bbox=bbox,
+            dimensions=dimensions,
+            elevation=elevation,
+            format=format,
+            size=size,
+            time=time,
+            transparent=transparent,
+            bgcolor=bgcolor,
+            exceptions=exceptions,
+            **kwargs)
+
+        return base_url, urlencode(request)
+
+    def _getmap_response(self, u):
+        """Raise a ServiceException if a GetMap response is an exception report"""
+
+        # need to handle casing in the header keys
+        headers = {}
+        for k, v in list(u.info().items()):
+            headers[k.lower()] = v
+
+        # handle the potential charset def
+        if headers.get('content-type', '').split(';')[0] in ['application/vnd.ogc.se_xml', 'text/xml']:
+            se_xml = u.read()
+            se_tree = etree.fromstring(se_xml)
+            err_message = str(se_tree.find(nspath('ServiceException', OGC_NAMESPACE)).text).strip()
+            raise ServiceException(err_message)
+        return u
+
     def getmap(self, layers=None,
                styles=None,
                srs=None,
@@ -279,14 +329,7 @@ class WebMapService_1_3_0(object):
 
         """
 
-        try:
-            base_url = next((m.get('url') for m in
-                            self.getOperationByName('GetMap').methods if
-                            m.get('type').lower() == method.lower()))
-        except StopIteration:
-            base_url = self.url
-
-        request = self.__build_getmap_request(
+        base_url, data = self._getmap_request(
             layers=layers,
             styles=styles,
             srs=srs,
@@ -299,26 +342,49 @@ class WebMapService_1_3_0(object):
             transparent=transparent,
             bgcolor=bgcolor,
             exceptions=exceptions,
+            method=method,
             **kwargs)
 
-        data = urlencode(request)
-
         self.request = bind_url(base_url) + data
 
-        u = openURL(base_url, data, method, timeout=timeout or self.timeout, auth=self.auth)
+        u = openURL(base_url, data, method, timeout=timeout or self.timeout, auth=self.auth,
+                    session=self.session)
 
-        # need to handle casing in the header keys
-        headers = {}
-        for k, v in list(u.info().items()):
-            headers[k.lower()] = v
+        return self._getmap_response(u)
 
-        # handle the potential charset def
-        if headers.get('content-type', '').split(';')[0] in ['application/vnd.ogc.se_xml', 'text/xml']:
-            se_xml = u.read()
-            se_tree = etree.fromstring(se_xml)
-            err_message = str(se_tree.find(nspath('ServiceException', OGC_NAMESPACE)).text).strip()
-            raise ServiceException(err_message)
-        return u
+    def getmap_tiled(self, layers=None, srs=None, bbox=None, format=None, size=None, tile_size=None,
+                     max_workers=tiling.TILE_WORKERS, directory=None, method='Get', timeout=None, **kwargs):
+        """Request an image larger than the WMS accepts as tiles, fetched concurrently.
+
+        The image is split into tiles of at most tile_size pixels, and at most the MaxWidth x MaxHeight
+        of the service.
+        Without a directory, the tiles are pasted into a single image (requires Pillow) as they
+        arrive, returned as a file-like object like getmap; the whole image is held in memory, so
+        pass a directory for very large images.  With a directory, each tile is written to a file and
+        the returned MapTiles manifest lists them with their offset and bbox; calling this again
+        with the same request fetches only the missing tiles, and MapTiles.assemble() mosaics them.
+
+        Parameters
+        ----------
+        tile_size : tuple
+            Optional. (width, height) of the tiles in pixels, default is MaxWidth x MaxHeight, or
+            tiling.MAX_TILE_SIZE pixels when the service sets no limit.
+        max_workers : int
+            Optional. Number of tiles fetched at a time.
+        directory : string
+            Optional. Directory to write the tiles and their manifest to.
+
+        The other parameters are those of getmap. The bbox is given in the same order as for
+        getmap: every tile request swaps it for crs with a yx axis order.
+
+        Example
+        -------
+            img = wms.getmap_tiled(layers=['global_mosaic'], srs='EPSG:4326', bbox=(-180, -90, 180, 90),
+                                   size=(20000, 10000), format='image/png', max_workers=8)
+        """
+        return tiling.get_map_tiled(self, layers=layers, srs=srs, bbox=bbox, format=format, size=size,
+                                    tile_size=tile_size, max_workers=max_workers, directory=directory,
+                                    method=method, timeout=timeout, **kwargs)
 
     def getfeatureinfo(self, layers=None,
                        styles=None,
@@ -380,7 +446,8 @@ class WebMapService_1_3_0(object):
 
         self.request = bind_url(base_url) + data
 
-        u = openURL(base_url, data, method, timeout=timeout or self.timeout, auth=self.auth)
+        u = openURL(base_url, data, method, timeout=timeout or self.timeout, auth=self.auth,
+                    session=self.session)
 
         # check for service exceptions, and return
         if u.info()['Content-Type'] == 'XML':
@@ -401,6 +468,17 @@ class ServiceIdentification(object):
         self.keywords = extract_xml_list(self._root.findall(nspath('KeywordList/Keyword', WMS_NAMESPACE)))
         self.accessconstraints = testXMLValue(self._root.find(nspath('AccessConstraints', WMS_NAMESPACE)))
         self.fees = testXMLValue(self._root.find(nspath('Fees', WMS_NAMESPACE)))
+        # limits of GetMap requests, None when the server sets none
+        self.layerlimit = self._getInteger('LayerLimit')
+        self.maxwidth = self._getInteger('MaxWidth')
+        self.maxheight = self._getInteger('MaxHeight')
+
+    def _getInteger(self, tag):
+        value = testXMLValue(self._root.find(nspath(tag, WMS_NAMESPACE)))
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return None
 
 
 class ServiceProvider(object):
@@ -441,6 +519,7 @@ class ContentMetadata(AbstractContentMetadata):
             self.index = str(index)
 
         self._children = children
+        self._children_loader = None
 
         self.id = self.name = testXMLValue(elem.find(nspath('Name', WMS_NAMESPACE)))
 
@@ -488,7 +567,7 @@ class ContentMetadata(AbstractContentMetadata):
         crs_list = []
         for bb in elem.findall(nspath('BoundingBox', WMS_NAMESPACE)):
             srs_str = bb.attrib.get('CRS', None)
-            srs = Crs(srs_str)
+            srs = get_crs(srs_str)
 
             box = tuple(map(float, [bb.attrib['minx'],
                         bb.attrib['miny'],
@@ -679,35 +758,42 @@ class ContentMetadata(AbstractContentMetadata):
             }
             self.featureListUrls.append(featureUrl)
 
-        self.layers = []
-        for child in elem.findall(nspath('Layer', WMS_NAMESPACE)):
-            self.layers.append(ContentMetadata(child, self))
+        # sublayers are built on first access of self.layers
+        self._layer_elems = elem.findall(nspath('Layer', WMS_NAMESPACE))
+        self._layers = None
 
     def parse_remote_metadata(self, timeout=30):
         """Parse remote metadata for MetadataURL and add it as metadataUrl['metadata']"""
-        for metadataUrl in self.metadataUrls:
-            if metadataUrl['url'] is not None \
-                    and metadataUrl['format'].lower() in ['application/xml', 'text/xml']:  # download URL
-                try:
-                    content = openURL(
-                        metadataUrl['url'], timeout=timeout, auth=self.auth)
-                    doc = etree.fromstring(content.read())
-
-                    mdelem = doc.find('.//metadata')
-                    if mdelem is not None:
-                        metadataUrl['metadata'] = Metadata(mdelem)
-                        continue
-
-                    mdelem = doc.find('.//' + nspath_eval('gmd:MD_Metadata', n.get_namespaces(['gmd']))) \
-                        or doc.find('.//' + nspath_eval('gmi:MI_Metadata', n.get_namespaces(['gmi'])))
-                    if mdelem is not None:
-                        metadataUrl['metadata'] = MD_Metadata(mdelem)
-                        continue
-                except Exception:
-                    metadataUrl['metadata'] = None
+        resolve_remote_metadata([self], timeout=timeout)
+
+    def _remote_metadata_urls(self):
+        """MetadataURLs of which to parse the remote metadata (see resolve_remote_metadata)"""
+        return [metadataUrl for metadataUrl in self.metadataUrls  # download URLs
+                if metadataUrl['url'] is not None and metadataUrl['format'].lower() in ['application/xml', 'text/xml']]
+
+    def _parse_remote_metadata(self, metadataUrl, doc):
+        """Parse the remote metadata document of a MetadataURL"""
+        mdelem = doc.find('.//metadata')
+        if mdelem is not None:
+            return Metadata(mdelem)
+
+        mdelem = doc.find('.//' + nspath_eval('gmd:MD_Metadata', n.get_namespaces(['gmd']))) \
+            or doc.find('.//' + nspath_eval('gmi:MI_Metadata', n.get_namespaces(['gmi'])))
+        if mdelem is not None:
+            return MD_Metadata(mdelem)
+        return None
+
+    @property
+    def layers(self):
+        if self._layers is None:
+            self._layers = [ContentMetadata(child, self) for child in self._layer_elems]
+        return self._layers
 
     @property
     def children(self):
+        if self._children_loader is not None:
+            loader, self._children_loader = self._children_loader, None
+            self.children = loader()
         return self._children
 
     @children.setter
@@ -8,6 +8,7 @@
 
 import json
 import logging
+import re
 from urllib.parse import urljoin
 
 import requests
@@ -16,18 +17,198 @@ import yaml
 from owslib import __version__
 from owslib.util import Authentication, http_get
 
+try:  # optional fast JSON backend
+    import orjson
+except ImportError:
+    orjson = None
+
 LOGGER = logging.getLogger(__name__)
 
 REQUEST_HEADERS = {
     'User-Agent': 'OWSLib {} (https://geopython.github.io/OWSLib)'.format(__version__)
 }
 
+STREAM_CHUNK_SIZE = 65536
+
+_JSON_TOKENS = re.compile(rb'["{}\[\]]')
+_JSON_STRING_TOKENS = re.compile(rb'["\\]')
+
+
+def json_loads(content):
+    """
+    Parse a JSON document, with orjson when it is installed
+
+    @type content: bytes or string
+    @param content: JSON document
+
+    @returns: parsed JSON object
+    """
+
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+class GeoJSONFeatureParser(object):
+    """
+    Incremental parser of the features of a GeoJSON FeatureCollection
+
+    Data is fed in chunks; every feature of the top-level features array is
+    returned as soon as it is complete, and only the bytes of the feature
+    being read are buffered.  The other members of the collection (links,
+    numberMatched, ...) are returned by close().
+    """
+
+    def __init__(self, loads=json_loads):
+        """
+        @param loads: function parsing the JSON of a single feature
+        """
+
+        self.loads = loads
+        self._buffer = b''
+        self._pos = 0  # scan position in the buffer
+        self._depth = 0
+        self._in_string = False
+        self._string_start = None
+        self._key = None  # last string read at the top level
+        self._in_features = False
+        self._feature_start = None
+        self._skeleton = []  # the document without the content of the features array
+        self._skeleton_start = 0
+
+    def feed(self, data: bytes) -> list:
+        """
+        Parse a chunk of the document
+
+        @type data: bytes
+        @param data: next chunk of the document
+
+        @returns: `list` of the features completed by the chunk
+        """
+
+        features = []
+        buf = self._buffer + data
+        pos = self._pos
+
+        while True:
+            if self._in_string:
+                match = _JSON_STRING_TOKENS.search(buf, pos)
+                if match is None:
+                    pos = len(buf)
+                    break
+                if match.group() == b'\\':  # skip the escaped character
+                    if match.end() >= len(buf):
+                        pos = match.start()
+                        break
+                    pos = match.end() + 1
+                    continue
+                self._in_string = False
+                pos = match.end()
+                if self._depth == 1:
+                    self._key = buf[self._string_start:pos]
+                continue
+
+            match = _JSON_TOKENS.search(buf, pos)
+            if match is None:
+                pos = len(buf)
+                break
+            token = match.group()
+            pos = match.end()
+            if token == b'"':
+                self._in_string = True
+                self._string_start = match.start()
+            elif token in (b'{', b'['):
+                self._depth += 1
+                if token == b'[' and self._depth == 2 and self._key == b'"features"':
+                    self._in_features = True
+                    self._skeleton.append(buf[self._skeleton_start:pos])
+                    self._skeleton_start = None
+                elif self._in_features and self._depth == 3:
+                    self._feature_start = match.start()
+            else:
+                self._depth -= 1
+                if self._in_features and self._depth == 2 and token == b'}':
+                    features.append(self.loads(buf[self._feature_start:pos]))
+                    self._feature_start = None
+                elif self._in_features and self._depth == 1:
+                    self._in_features = False
+                    self._skeleton_start = match.start()
+
+        # keep only the bytes still needed
+        if self._feature_start is not None:
+            keep = self._feature_start
+        elif self._in_string and self._depth == 1:
+            keep = self._string_start
+        else:
+            keep = pos
+        if self._skeleton_start is not None:
+            self._skeleton.append(buf[self._skeleton_start:keep])
+            self._skeleton_start = 0
+        if self._feature_start is not None:
+            self._feature_start -= keep
+        if self._string_start is not None:
+            self._string_start -= keep
+        self._buffer = buf[keep:]
+        self._pos = pos - keep
+
+        return features
+
+    def close(self) -> dict:
+        """
+        Finish parsing
+
+        @returns: `dict` of the document, with an empty features array
+        """
+
+        if self._skeleton_start is not None:
+            self._skeleton.append(self._buffer[self._skeleton_start:])
+        self._buffer = b''
+        return json_loads(b''.join(self._skeleton))
+
+
+class FeatureCollectionStream(object):
+    """
+    Features of a GeoJSON FeatureCollection response, parsed while the
+    response is read
+
+    Iterating yields the features one at a time.  Once all features have
+    been read, metadata holds the other members of the collection.
+    """
+
+    def __init__(self, response: requests.Response,
+                 chunk_size: int = STREAM_CHUNK_SIZE):
+        """
+        @type response: requests.Response
+        @param response: streamed response (stream=True)
+        @type chunk_size: int
+        @param chunk_size: number of bytes read at a time
+        """
+
+        self.response = response
+        self.chunk_size = chunk_size
+        self.metadata = None
+
+    def __iter__(self):
+        parser = GeoJSONFeatureParser()
+        try:
+            for chunk in self.response.iter_content(self.chunk_size):
+                for feature in parser.feed(chunk):
+                    yield feature
+            self.metadata = parser.close()
+        finally:
+            self.close()
+
+    def close(self):
+        """Release the connection of the response"""
+        self.response.close()
+
 
 class API(object):
     """Abstraction for OGC API - Common version 1.0"""
 
     def __init__(self, url: str, json_: str = None, timeout: int = 30,
-                 headers: dict = None, auth: Authentication = None):
+                 headers: dict = None, auth: Authentication = None,
+                 session: requests.Session = None):
         """
         Initializer; implements /
 
@@ -40,6 +221,8 @@ class API(object):
         @param username: service authentication username
         @param password: service authentication password
         @param auth: instance of owslib.util.Authentication
+        @param session: requests.Session to send requests with
+                        (default is the shared pooled session)
 
         @returns: `owslib.ogcapi.API`
         """
@@ -56,11 +239,13 @@ class API(object):
         if headers:
             self.headers.update(headers)
         self.auth = auth
+        self.session = session
 
         if json_ is not None:  # static JSON string
             self.links = json.loads(json_)['links']
         else:
-            response = http_get(url, headers=self.headers, auth=self.auth).json()
+            response = http_get(url, headers=self.headers, auth=self.auth,
+                                session=self.session).json()
             self.links = response['links']
 
     def api(self) -> dict:
@@ -92,7 +277,8 @@ class API(object):
 
         if url is not None:
             LOGGER.debug('Request: {}'.format(url))
-            response = http_get(url, headers=REQUEST_HEADERS, auth=self.auth)
+            response = http_get(url, headers=REQUEST_HEADERS, auth=self.auth,
+                                session=self.session)
             if openapi_format == openapi_json_mimetype:
                 content = response.json()
             elif openapi_format == openapi_yaml_mimetype:
@@ -171,8 +357,40 @@ class API(object):
 
         return url
 
+    def _request_stream(self, path: str = None, kwargs: dict = {},
+                        url: str = None) -> FeatureCollectionStream:
+        """
+        helper function for requests returning a GeoJSON FeatureCollection,
+        whose features are parsed while the response is read
+
+        @type path: string
+        @param path: path of request
+        @type kwargs: string
+        @param kwargs: ``dict`` of keyword value pair request parameters
+        @type url: string
+        @param url: absolute URL to request instead of path (e.g. a link href)
+
+        @returns: `owslib.ogcapi.FeatureCollectionStream`
+        """
+
+        if url is None:
+            url = self._build_url(path)
+
+        LOGGER.debug('Request: {}'.format(url))
+        LOGGER.debug('Params: {}'.format(kwargs))
+
+        response = http_get(url, headers=self.headers, auth=self.auth,
+                            params=kwargs, session=self.session, stream=True)
+
+        LOGGER.debug('URL: {}'.format(response.url))
+
+        if response.status_code != requests.codes.ok:
+            raise RuntimeError(response.text)
+
+        return FeatureCollectionStream(response)
+
     def _request(self, path: str = None, as_dict: bool = True,
-                 kwargs: dict = {}) -> dict:
+                 kwargs: dict = {}, url: str = None) -> dict:
         """
         helper function for request/response patterns against OGC API endpoints
 
@@ -182,17 +400,20 @@ class API(object):
         @param as_dict: whether to return JSON dict (default True)
         @type kwargs: string
         @param kwargs: ``dict`` of keyword value pair request parameters
+        @type url: string
+        @param url: absolute URL to request instead of path (e.g. a link href)
 
         @returns: response as JSON ``dict``
         """
 
-        url = self._build_url(path)
+        if url is None:
+            url = self._build_url(path)
 
         LOGGER.debug('Request: {}'.format(url))
         LOGGER.debug('Params: {}'.format(kwargs))
 
         response = http_get(url, headers=self.headers, auth=self.auth,
-                            params=kwargs)
+                            params=kwargs, session=self.session)
 
         LOGGER.debug('URL: {}'.format(response.url))
 
@@ -200,6 +421,6 @@ class API(object):
             raise RuntimeError(response.text)
 
         if as_dict:
-            return response.json()
+            return json_loads(response.content)
         else:
             return response.content
@@ -9,6 +9,8 @@
 from io import BytesIO
 import logging
 
+import requests
+
 from owslib.ogcapi import API
 from owslib.util import Authentication
 
@@ -19,9 +21,10 @@ class Coverages(API):
     """Abstraction for OGC API - Coverages"""
 
     def __init__(self, url: str, json_: str = None, timeout: int = 30,
-                 headers: dict = None, auth: Authentication = None):
+                 headers: dict = None, auth: Authentication = None,
+                 session: requests.Session = None):
         __doc__ = API.__doc__  # noqa
-        super().__init__(url, json_, timeout, headers, auth)
+        super().__init__(url, json_, timeout, headers, auth, session)
 
     def coverages(self) -> dict:
         """
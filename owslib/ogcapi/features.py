@@ -6,21 +6,28 @@
 # Contact email: tomkralidis@gmail.com
 # =============================================================================
 
+from concurrent.futures import ThreadPoolExecutor
 import logging
+from typing import Iterator
 
-from owslib.ogcapi import API
+import requests
+
+from owslib.ogcapi import API, FeatureCollectionStream
 from owslib.util import Authentication
 
 LOGGER = logging.getLogger(__name__)
 
+GEOJSON_MEDIA_TYPES = ['application/geo+json', 'application/json']
+
 
 class Features(API):
     """Abstraction for OGC API - Features"""
 
     def __init__(self, url: str, json_: str = None, timeout: int = 30,
-                 headers: dict = None, auth: Authentication = None):
+                 headers: dict = None, auth: Authentication = None,
+                 session: requests.Session = None):
         __doc__ = API.__doc__  # noqa
-        super().__init__(url, json_, timeout, headers, auth)
+        super().__init__(url, json_, timeout, headers, auth, session)
 
     def feature_collections(self) -> dict:
         """
@@ -64,6 +71,160 @@ class Features(API):
         path = 'collections/{}/items'.format(collection_id)
         return self._request(path=path, kwargs=kwargs)
 
+    def collection_items_stream(self, collection_id: str,
+                                **kwargs: dict) -> FeatureCollectionStream:
+        """
+        implements /collection/{collectionId}/items, parsing the features
+        while the response is read
+
+        Takes the same parameters as collection_items.  Iterating over the
+        result yields the features one at a time, so that responses of any
+        size are processed in constant memory; its metadata attribute holds
+        the other members of the feature collection (links, numberMatched,
+        ...) once all features have been read.
+
+        @type collection_id: string
+        @param collection_id: id of collection
+
+        @returns: `owslib.ogcapi.FeatureCollectionStream`
+        """
+
+        if 'bbox' in kwargs:
+            kwargs['bbox'] = ','.join(kwargs['bbox'])
+
+        path = 'collections/{}/items'.format(collection_id)
+        return self._request_stream(path=path, kwargs=kwargs)
+
+    def iter_collection_items(self, collection_id: str, limit: int = 1000,
+                              max_features: int = None, prefetch: bool = True,
+                              stream: bool = False,
+                              **kwargs: dict) -> Iterator[dict]:
+        """
+        implements /collection/{collectionId}/items, iterating over the
+        features of all pages
+
+        Pages are requested by following the rel=next links of the
+        responses, or by advancing startindex when the server provides none.
+        At most the current page and the next page are held in memory.
+
+        @type collection_id: string
+        @param collection_id: id of collection
+        @type limit: int
+        @param limit: page size (number of features per request)
+        @type max_features: int
+        @param max_features: maximum number of features to return
+                             (default is all features)
+        @type prefetch: bool
+        @param prefetch: whether to request the next page while the features
+                         of the current page are consumed (default True)
+        @type stream: bool
+        @param stream: whether to parse the features of each page while it is
+                       read (see collection_items_stream), instead of
+                       prefetching pages
+        @param kwargs: further parameters of collection_items (bbox, datetime,
+                       startindex, q, ...)
+
+        @returns: generator of features
+        """
+
+        if 'bbox' in kwargs:
+            kwargs['bbox'] = ','.join(kwargs['bbox'])
+        if max_features is not None:
+            limit = min(limit, max_features)
+        kwargs['limit'] = limit
+
+        path = 'collections/{}/items'.format(collection_id)
+        page = (self._build_url(path), kwargs)
+        count = 0
+
+        if stream:
+            while page is not None:
+                features = self._request_stream(url=page[0], kwargs=page[1])
+                returned = 0
+                for feature in features:
+                    if max_features is not None and count >= max_features:
+                        features.close()
+                        return
+                    count += 1
+                    returned += 1
+                    yield feature
+                page = self._next_page(features.metadata, page, count, returned, limit)
+                if max_features is not None and count >= max_features:
+                    return
+            return
+
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        try:
+            response = self._request(url=page[0], kwargs=page[1])
+            while True:
+                features = response.get('features', [])
+                next_page = self._next_page(response, page, count + len(features), len(features), limit)
+                if max_features is not None and count + len(features) >= max_features:
+                    next_page = None
+
+                future = None
+                if executor is not None and next_page is not None:
+                    future = executor.submit(self._request, url=next_page[0], kwargs=next_page[1])
+
+                for feature in features:
+                    if max_features is not None and count >= max_features:
+                        return
+                    count += 1
+                    yield feature
+
+                if next_page is None:
+                    return
+                if future is not None:
+                    response = future.result()
+                else:
+                    response = self._request(url=next_page[0], kwargs=next_page[1])
+                page = next_page
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False)
+
+    def _next_page(self, response: dict, page: tuple, count: int,
+                   returned: int, limit: int) -> tuple:
+        """
+        helper function to find the (url, parameters) of the page after
+        a collection items response
+
+        @type response: dict
+        @param response: the feature collection of the current page
+        @type page: tuple
+        @param page: (url, parameters) of the current page
+        @type count: int
+        @param count: number of features returned up to the current page
+        @type returned: int
+        @param returned: number of features of the current page
+        @type limit: int
+        @param limit: page size
+
+        @returns: (url, parameters) of the next page, or None on the last page
+        """
+
+        if not returned:
+            return None
+
+        number_matched = response.get('numberMatched')
+        if number_matched is not None and count >= number_matched:
+            return None
+
+        for link in response.get('links', []):
+            if link.get('rel') == 'next' and link.get('type', GEOJSON_MEDIA_TYPES[0]) in GEOJSON_MEDIA_TYPES:
+                if link['href'] == page[0] and not page[1]:
+                    return None
+                return link['href'], {}
+
+        # a short page is the last one, unless the server reports more matches
+        # (it may clamp the page size below limit)
+        if (returned < limit and number_matched is None) or not page[1]:
+            return None
+
+        params = dict(page[1])
+        params['startindex'] = int(params.get('startindex', 0)) + returned
+        return page[0], params
+
     def collection_item(self, collection_id: str, identifier: str) -> dict:
         """
         implements /collections/{collectionId}/items/{featureId}
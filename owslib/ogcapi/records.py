@@ -8,6 +8,8 @@
 
 import logging
 
+import requests
+
 from owslib.ogcapi.features import Features
 from owslib.util import Authentication
 
@@ -18,9 +20,10 @@ class Records(Features):
     """Abstraction for OGC API - Records"""
 
     def __init__(self, url: str, json_: str = None, timeout: int = 30,
-                 headers: dict = None, auth: Authentication = None):
+                 headers: dict = None, auth: Authentication = None,
+                 session: requests.Session = None):
         __doc__ = Features.__doc__  # noqa
-        super().__init__(url, json_, timeout, headers, auth)
+        super().__init__(url, json_, timeout, headers, auth, session)
 
     def records(self) -> dict:
         """
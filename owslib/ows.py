@@ -249,7 +249,7 @@ class BoundingBox(object):
         val = elem.attrib.get('crs') or elem.attrib.get('{{{}}}crs'.format(namespace))
         if val:
             try:
-                self.crs = crs.Crs(val)
+                self.crs = crs.get_crs(val)
             except (AttributeError, ValueError):
                 LOGGER.warning('Invalid CRS %r. Expected integer' % val)
         else:
@@ -287,7 +287,7 @@ class WGS84BoundingBox(BoundingBox):
     def __init__(self, elem, namespace=DEFAULT_OWS_NAMESPACE):
         BoundingBox.__init__(self, elem, namespace)
         self.dimensions = 2
-        self.crs = crs.Crs('urn:ogc:def:crs:OGC:2:84')
+        self.crs = crs.get_crs('urn:ogc:def:crs:OGC:2:84')
 
 
 class ExceptionReport(Exception):
@@ -2,7 +2,7 @@ from owslib.etree import etree
 from datetime import datetime
 from urllib.parse import urlencode, parse_qsl
 from owslib import ows
-from owslib.crs import Crs
+from owslib.crs import get_crs
 from owslib.fes import FilterCapabilities
 from owslib.util import openURL, testXMLValue, nspath_eval, nspath, extract_time
 from owslib.namespaces import Namespaces
@@ -25,10 +25,10 @@ class SensorObservationService_1_0_0(object):
         Implements ISensorObservationService.
     """
 
-    def __new__(self, url, version, xml=None, username=None, password=None):
+    def __new__(self, url, version, xml=None, username=None, password=None, session=None):
         """overridden __new__ method"""
         obj = object.__new__(self)
-        obj.__init__(url, version, xml, username, password)
+        obj.__init__(url, version, xml, username, password, session=session)
         return obj
 
     def __getitem__(self, id):
@@ -38,17 +38,19 @@ class SensorObservationService_1_0_0(object):
         else:
             raise KeyError("No Observational Offering with id: %s" % id)
 
-    def __init__(self, url, version='1.0.0', xml=None, username=None, password=None):
+    def __init__(self, url, version='1.0.0', xml=None, username=None, password=None, session=None):
         """Initialize."""
         self.url = url
         self.username = username
         self.password = password
+        self.session = session
         self.version = version
         self._capabilities = None
 
         # Authentication handled by Reader
         reader = SosCapabilitiesReader(
-            version=self.version, url=self.url, username=self.username, password=self.password
+            version=self.version, url=self.url, username=self.username, password=self.password,
+            session=self.session
         )
         if xml:  # read from stored xml
             self._capabilities = reader.read_string(xml)
@@ -131,7 +133,8 @@ class SensorObservationService_1_0_0(object):
 
         data = urlencode(request)
 
-        response = openURL(base_url, data, method, username=self.username, password=self.password, **url_kwargs).read()
+        response = openURL(base_url, data, method, username=self.username, password=self.password,
+                           session=self.session, **url_kwargs).read()
 
         tr = etree.fromstring(response)
 
@@ -188,7 +191,7 @@ class SensorObservationService_1_0_0(object):
         data = urlencode(request)
 
         response = openURL(base_url, data, method, username=self.username,
-                           password=self.password, **url_kwargs).read()
+                           password=self.password, session=self.session, **url_kwargs).read()
         try:
             tr = etree.fromstring(response)
             if tr.tag == nspath_eval("ows:ExceptionReport", namespaces):
@@ -219,7 +222,7 @@ class SosObservationOffering(object):
         self.name = testXMLValue(self._root.find(nspath_eval('gml:name', namespaces)))
         val = testXMLValue(self._root.find(nspath_eval('gml:srsName', namespaces)))
         if val is not None:
-            self.srs = Crs(val)
+            self.srs = get_crs(val)
 
         # LOOK: Check on GML boundedBy to make sure we handle all of the cases
         # gml:boundedBy
@@ -232,7 +235,7 @@ class SosObservationOffering(object):
                          float(lower_left_corner[0]),
                          float(upper_right_corner[1]),
                          float(upper_right_corner[0]))
-            self.bbox_srs = Crs(testXMLValue(envelope.attrib.get('srsName'), True))
+            self.bbox_srs = get_crs(testXMLValue(envelope.attrib.get('srsName'), True))
         except Exception:
             self.bbox = None
             self.bbox_srs = None
@@ -277,11 +280,12 @@ class SosObservationOffering(object):
 
 
 class SosCapabilitiesReader(object):
-    def __init__(self, version="1.0.0", url=None, username=None, password=None):
+    def __init__(self, version="1.0.0", url=None, username=None, password=None, session=None):
         self.version = version
         self.url = url
         self.username = username
         self.password = password
+        self.session = session
 
     def capabilities_url(self, service_url):
         """
@@ -313,7 +317,8 @@ class SosCapabilitiesReader(object):
         """
         getcaprequest = self.capabilities_url(service_url)
         spliturl = getcaprequest.split('?')
-        u = openURL(spliturl[0], spliturl[1], method='Get', username=self.username, password=self.password)
+        u = openURL(spliturl[0], spliturl[1], method='Get', username=self.username, password=self.password,
+                    session=self.session)
         return etree.fromstring(u.read())
 
     def read_string(self, st):
@@ -1,7 +1,8 @@
+from io import BytesIO
 from owslib.etree import etree
 from urllib.parse import urlencode, parse_qsl
 from owslib import ows
-from owslib.crs import Crs
+from owslib.crs import get_crs
 from owslib.fes import FilterCapabilities200
 from owslib.util import openURL, testXMLValue, testXMLAttribute, nspath_eval, extract_time
 from owslib.namespaces import Namespaces
@@ -27,10 +28,10 @@ class SensorObservationService_2_0_0(object):
         Implements ISensorObservationService.
     """
 
-    def __new__(self, url, version, xml=None, username=None, password=None):
+    def __new__(self, url, version, xml=None, username=None, password=None, session=None):
         """overridden __new__ method"""
         obj = object.__new__(self)
-        obj.__init__(url, version, xml, username, password)
+        obj.__init__(url, version, xml, username, password, session=session)
         return obj
 
     def __getitem__(self, id):
@@ -40,17 +41,19 @@ class SensorObservationService_2_0_0(object):
         else:
             raise KeyError("No Observational Offering with id: %s" % id)
 
-    def __init__(self, url, version='2.0.0', xml=None, username=None, password=None):
+    def __init__(self, url, version='2.0.0', xml=None, username=None, password=None, session=None):
         """Initialize."""
         self.url = url
         self.username = username
         self.password = password
+        self.session = session
         self.version = version
         self._capabilities = None
 
         # Authentication handled by Reader
         reader = SosCapabilitiesReader(
-            version=self.version, url=self.url, username=self.username, password=self.password
+            version=self.version, url=self.url, username=self.username, password=self.password,
+            session=self.session
         )
         if xml:  # read from stored xml
             self._capabilities = reader.read_string(xml)
@@ -141,8 +144,8 @@ class SensorObservationService_2_0_0(object):
             for kw in kwargs:
                 request[kw] = kwargs[kw]
 
-        response = openURL(base_url, request, method,
-                           username=self.username, password=self.password, **url_kwargs).read()
+        response = openURL(base_url, request, method, username=self.username, password=self.password,
+                           session=self.session, **url_kwargs).read()
         tr = etree.fromstring(response)
 
         if tr.tag == nspath_eval("ows:ExceptionReport", namespaces):
@@ -157,6 +160,7 @@ class SensorObservationService_2_0_0(object):
                         eventTime=None,
                         procedure=None,
                         method=None,
+                        stream=False,
                         **kwargs):
         """
         Parameters
@@ -165,6 +169,10 @@ class SensorObservationService_2_0_0(object):
             Output format. Provide one that is available for all offerings
         method : string
             Optional. HTTP DCP method name: Get or Post.  Must
+        stream : bool
+            Optional. If True, return an iterator decoding the observations
+            one at a time while the response is downloaded (see
+            iter_observations) instead of the response document
         **kwargs : extra arguments
             anything else e.g. vendor specific parameters
         """
@@ -202,8 +210,13 @@ class SensorObservationService_2_0_0(object):
             for kw in kwargs:
                 request[kw] = kwargs[kw]
 
-        response = openURL(base_url, request, method,
-                           username=self.username, password=self.password, **url_kwargs).read()
+        if stream:
+            u = openURL(base_url, request, method, username=self.username, password=self.password,
+                        stream=True, session=self.session, **url_kwargs)
+            return iter_observations(u.raw)
+
+        response = openURL(base_url, request, method, username=self.username, password=self.password,
+                           session=self.session, **url_kwargs).read()
         try:
             tr = etree.fromstring(response)
             if tr.tag == nspath_eval("ows:ExceptionReport", namespaces):
@@ -245,7 +258,7 @@ class SosObservationOffering(object):
                          float(lower_left_corner[0]),
                          float(upper_right_corner[1]),
                          float(upper_right_corner[0]))
-            self.bbox_srs = Crs(testXMLValue(envelope.attrib.get('srsName'), True))
+            self.bbox_srs = get_crs(testXMLValue(envelope.attrib.get('srsName'), True))
         except Exception:
             self.bbox = None
             self.bbox_srs = None
@@ -294,11 +307,12 @@ class SosObservationOffering(object):
 
 
 class SosCapabilitiesReader(object):
-    def __init__(self, version="2.0.0", url=None, username=None, password=None):
+    def __init__(self, version="2.0.0", url=None, username=None, password=None, session=None):
         self.version = version
         self.url = url
         self.username = username
         self.password = password
+        self.session = session
 
     def capabilities_url(self, service_url):
         """
@@ -330,7 +344,8 @@ class SosCapabilitiesReader(object):
         """
         getcaprequest = self.capabilities_url(service_url)
         spliturl = getcaprequest.split('?')
-        u = openURL(spliturl[0], spliturl[1], method='Get', username=self.username, password=self.password)
+        u = openURL(spliturl[0], spliturl[1], method='Get', username=self.username, password=self.password,
+                    session=self.session)
         return etree.fromstring(u.read())
 
     def read_string(self, st):
@@ -365,6 +380,41 @@ class SOSGetObservationResponse(object):
         return self.observations[index]
 
 
+def iter_observations(source, decoder=None):
+    """ Decode the observations of a GetObservation response one at a
+    time, while the document is parsed, instead of parsing the whole
+    document first as SOSGetObservationResponse does. The element of each
+    observation is removed from the tree once decoded, so memory use is
+    bounded by the size of the observations held by the caller.
+
+    'source' is the response document (str or bytes) or a file-like
+    object of it, e.g. a streamed response. 'decoder' is the
+    ObservationDecoder to use. Raises ows.ExceptionReport if the
+    response is an exception report.
+    """
+    if isinstance(source, str):
+        source = source.encode('utf-8')
+    if isinstance(source, bytes):
+        source = BytesIO(source)
+    decoder = decoder or ObservationDecoder()
+    observation_tag = nspath_eval("om20:OM_Observation", namespaces)
+    observation_data_tag = nspath_eval("sos:observationData", namespaces)
+
+    stack = []  # open elements
+    for event, elem in etree.iterparse(source, events=('start', 'end')):
+        if event == 'start':
+            stack.append(elem)
+            continue
+        stack.pop()
+        if elem.tag == observation_tag and stack and stack[-1].tag == observation_data_tag:
+            yield decoder.decode_observation(elem)
+            elem.clear()
+            stack[-1].remove(elem)
+
+    if elem.tag == nspath_eval("ows:ExceptionReport", namespaces):
+        raise ows.ExceptionReport(elem)
+
+
 class ObservationDecoder(object):
     """ Class to handle decoding different Observation types.
         The decode method inspects the type of om:result element and
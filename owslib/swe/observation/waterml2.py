@@ -6,6 +6,10 @@
 #
 # Contact email: peterataylor@gmail.com
 # =============================================================================
+import re
+from collections import namedtuple
+from datetime import datetime, timezone
+
 from owslib.util import nspath_eval
 from owslib.namespaces import Namespaces
 from owslib.util import testXMLAttribute, testXMLValue
@@ -13,6 +17,11 @@ from owslib.swe.common import Quantity
 from dateutil import parser
 from owslib.swe.observation.om import OM_Observation, Result
 
+try:  # optional, for the columnar access to time series
+    import numpy as np
+except ImportError:
+    np = None
+
 
 def get_namespaces():
     ns = Namespaces()
@@ -27,6 +36,26 @@ def nspv(path):
     return nspath_eval(path, namespaces)
 
 
+# time strings with a UTC offset, which numpy does not parse
+_UTC_OFFSET = re.compile(r'T.*[+-]\d\d(:?\d\d)?$')
+
+TimeseriesArrays = namedtuple('TimeseriesArrays', ['time', 'value', 'quality'])
+
+
+def parse_time(date_str):
+    ''' Parse an ISO 8601 time string to a naive datetime in UTC (fast path
+    for the common forms, dateutil for the others) '''
+    try:
+        if date_str.endswith('Z'):
+            date_str = date_str[:-1] + '+00:00'
+        dt = datetime.fromisoformat(date_str)
+    except (AttributeError, ValueError):  # Python < 3.7 or other forms
+        dt = parser.parse(date_str)
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt
+
+
 class MeasurementTimeseriesObservation(OM_Observation):
     ''' A timeseries observation that has a measurement timeseries as
     result. An implementation of the WaterML2
@@ -52,24 +81,101 @@ class Timeseries(Result):
 
 
 class MeasurementTimeseries(Timeseries):
-    ''' A WaterML2.0 timeseries of measurements, with per-value metadata. '''
+    ''' A WaterML2.0 timeseries of measurements, with per-value metadata.
+    The TimeValuePair objects of the points are built on first access, the
+    whole series can be extracted as arrays with to_arrays(). '''
     def __init__(self, element):
         super(MeasurementTimeseries, self).__init__(element)
 
         self.defaultTVPMetadata = TVPMeasurementMetadata(element.find(
             nspv("wml2:defaultPointMetadata/wml2:DefaultTVPMeasurementMetadata")))
 
-        elems = element.findall(nspv("wml2:point"))
-        self.points = []
-        for point in elems:
-            self.points.append(TimeValuePair(point))
+        self._point_elements = element.findall(nspv("wml2:point"))
+        self._points = None
+
+    @property
+    def points(self):
+        if self._points is None:
+            self._points = [TimeValuePair(point) for point in self._point_elements]
+        return self._points
+
+    @points.setter
+    def points(self, points):
+        self._points = points
+        self._point_elements = None  # the assigned points replace the parsed ones
 
     def __iter__(self):
-        for point in self.points:
-            yield point
+        if self._points is not None:
+            for point in self._points:
+                yield point
+        else:  # without keeping them
+            for point in self._point_elements:
+                yield TimeValuePair(point)
 
     def __len__(self):
-        return len(self.points)
+        if self._points is not None:
+            return len(self._points)
+        return len(self._point_elements)
+
+    def columns(self):
+        ''' Return the time strings, value strings (None if missing) and
+        quality codes (the default one if not given for the point) of the
+        points, as lists, in one pass over the points
+
+        Points assigned to the points property are read from their
+        TimeValuePair objects, with the default quality code. '''
+        default_quality = self.defaultTVPMetadata.quality
+        if self._point_elements is None:
+            times = [point.datetime.isoformat() for point in self._points]
+            values = [None if point.value != point.value else repr(point.value) for point in self._points]
+            return times, values, [default_quality] * len(self._points)
+
+        time_tag = nspv("wml2:time")
+        value_tag = nspv("wml2:value")
+        metadata_tag = nspv("wml2:metadata")
+        quality_path = nspv("wml2:TVPMeasurementMetadata/wml2:quality")
+        href = nspv("xlink:href")
+
+        times, values, qualities = [], [], []
+        for point in self._point_elements:
+            time = value = None
+            quality = default_quality
+            for tvp in point:  # wml2:MeasurementTVP
+                for child in tvp:
+                    if child.tag == time_tag:
+                        time = child.text
+                    elif child.tag == value_tag:
+                        value = child.text
+                    elif child.tag == metadata_tag:
+                        val = child.find(quality_path)
+                        if val is not None:
+                            quality = val.get(href, quality)
+            times.append(time.strip() if time else None)
+            values.append(value.strip() if value else None)
+            qualities.append(quality)
+        return times, values, qualities
+
+    def to_arrays(self):
+        ''' Return the series as a TimeseriesArrays of NumPy arrays: time
+        (datetime64[ms], UTC), value (float64, NaN if missing) and quality
+        (quality codes), without building TimeValuePair objects '''
+        if np is None:
+            raise ImportError('MeasurementTimeseries.to_arrays requires the numpy package')
+
+        times, values, qualities = self.columns()
+
+        if None not in times and not any(_UTC_OFFSET.search(t) for t in times):
+            # numpy parses ISO 8601 strings without an offset
+            time = np.array([t[:-1] if t.endswith('Z') else t for t in times], dtype='datetime64[ms]')
+        else:
+            time = np.array([parse_time(t) if t else None for t in times], dtype='datetime64[ms]')
+
+        try:
+            value = np.array(['nan' if v is None else v for v in values], dtype='float64')
+        except ValueError:  # values which are not numbers
+            value = np.array([_to_float(v) for v in values], dtype='float64')
+
+        return TimeseriesArrays(time, value, np.array(qualities, dtype=object))
 
     def _parse_metadata(self, element):
         ''' Parse metadata elements relating to timeseries:
@@ -102,6 +208,13 @@ class TimeValuePair(object):
         return str(self.datetime) + "," + str(self.value)
 
 
+def _to_float(value_str):
+    try:
+        return float(value_str)
+    except Exception:
+        return float('nan')
+
+
 class TVPMetadata(object):
     def __init__(self, element):
         ''' Base time-value pair metadata. Still to do:
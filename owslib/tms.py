@@ -39,7 +39,7 @@ class TileMapService(object):
     """
 
     def __init__(self, url, version='1.0.0', xml=None, username=None, password=None,
-                 parse_remote_metadata=False, timeout=30, headers=None, auth=None):
+                 parse_remote_metadata=False, timeout=30, headers=None, auth=None, session=None):
         """Initialize."""
         if auth:
             if username:
@@ -53,13 +53,15 @@ class TileMapService(object):
         self.auth = auth or Authentication(username, password)
         self.version = version
         self.timeout = timeout
+        self.session = session
         self.services = None
         self._capabilities = None
         self.contents = {}
 
         # Authentication handled by Reader
         reader = TMSCapabilitiesReader(
-            self.version, url=self.url, un=username, pw=password, headers=self.headers, auth=self.auth
+            self.version, url=self.url, un=username, pw=password, headers=self.headers, auth=self.auth,
+            session=self.session
         )
         if xml:  # read from stored xml
             self._capabilities = reader.readString(xml)
@@ -73,7 +75,7 @@ class TileMapService(object):
         # TODO: deprecated function. See ticket #453.
         if not self._capabilities:
             reader = TMSCapabilitiesReader(
-                self.version, url=self.url, un=self.username, pw=self.password
+                self.version, url=self.url, un=self.username, pw=self.password, session=self.session
             )
             # self._capabilities = ServiceMetadata(reader.read(self.url))
             self._capabilities = reader.read(self.url, timeout=self.timeout)
@@ -89,7 +91,7 @@ class TileMapService(object):
         tilemaps = self._capabilities.find('TileMaps')
         if tilemaps is not None:
             for tilemap in tilemaps.findall('TileMap'):
-                cm = ContentMetadata(tilemap, headers=self.headers, auth=self.auth)
+                cm = ContentMetadata(tilemap, headers=self.headers, auth=self.auth, session=self.session)
                 if cm.id:
                     if cm.id in self.contents:
                         raise KeyError('Content metadata for layer "%s" already exists' % cm.id)
@@ -125,7 +127,8 @@ class TileMapService(object):
         for tileset in tilesets:
             if tileset['order'] == z:
                 url = tileset['href'] + '/' + str(x) + '/' + str(y) + '.' + ext
-                u = openURL(url, '', timeout=timeout or self.timeout, headers=self.headers, auth=self.auth)
+                u = openURL(url, '', timeout=timeout or self.timeout, headers=self.headers, auth=self.auth,
+                            session=self.session)
                 return u
         else:
             raise ValueError('cannot find zoomlevel %i for TileMap' % z)
@@ -180,7 +183,7 @@ class ContentMetadata(object):
     def __str__(self):
         return 'Layer Title: %s, URL: %s' % (self.title, self.id)
 
-    def __init__(self, elem, un=None, pw=None, headers=None, auth=None):
+    def __init__(self, elem, un=None, pw=None, headers=None, auth=None, session=None):
         if elem.tag != 'TileMap':
             raise ValueError('%s should be a TileMap' % (elem,))
         self.id = elem.attrib['href']
@@ -194,12 +197,13 @@ class ContentMetadata(object):
                 auth.password = pw
         self.auth = auth or Authentication(un, pw)
         self.headers = headers
+        self.session = session
         self._tile_map = None
         self.type = elem.attrib.get('type')
 
     def _get_tilemap(self):
         if self._tile_map is None:
-            self._tile_map = TileMap(self.id, headers=self.headers, auth=self.auth)
+            self._tile_map = TileMap(self.id, headers=self.headers, auth=self.auth, session=self.session)
             assert(self._tile_map.srs == self.srs)
         return self._tile_map
 
@@ -253,7 +257,7 @@ class TileMap(object):
     tilesets = None
     profile = None
 
-    def __init__(self, url=None, xml=None, un=None, pw=None, headers=None, auth=None):
+    def __init__(self, url=None, xml=None, un=None, pw=None, headers=None, auth=None, session=None):
         self.url = url
         if auth:
             if un:
@@ -262,6 +266,7 @@ class TileMap(object):
                 auth.password = pw
         self.auth = auth or Authentication(un, pw)
         self.headers = headers
+        self.session = session
         self.tilesets = []
         if xml and not url:
             self.readString(xml)
@@ -304,7 +309,7 @@ class TileMap(object):
                     'order': order})
 
     def read(self, url):
-        u = openURL(url, '', method='Get', headers=self.headers, auth=self.auth)
+        u = openURL(url, '', method='Get', headers=self.headers, auth=self.auth, session=self.session)
         self._parse(etree.fromstring(u.read()))
 
     def readString(self, st):
@@ -317,7 +322,7 @@ class TMSCapabilitiesReader(object):
     """Read and parse capabilities document into a lxml.etree infoset
     """
 
-    def __init__(self, version='1.0.0', url=None, un=None, pw=None, headers=None, auth=None):
+    def __init__(self, version='1.0.0', url=None, un=None, pw=None, headers=None, auth=None, session=None):
         """Initialize"""
         if auth:
             if un:
@@ -329,12 +334,14 @@ class TMSCapabilitiesReader(object):
         self.url = url
         self.headers = headers
         self.auth = auth or Authentication(un, pw)
+        self.session = session
 
     def read(self, service_url, timeout=30):
         """Get and parse a TMS capabilities document, returning an
         elementtree instance
         """
-        u = openURL(service_url, '', method='Get', timeout=timeout, headers=self.headers, auth=self.auth)
+        u = openURL(service_url, '', method='Get', timeout=timeout, headers=self.headers, auth=self.auth,
+                    session=self.session)
         return etree.fromstring(u.read())
 
     def readString(self, st):
@@ -7,9 +7,12 @@
 # Contact email: tomkralidis@gmail.com
 # =============================================================================
 
+import http.cookiejar
+import io
 import os
 import sys
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dateutil import parser
 from datetime import datetime, timedelta
 import pytz
@@ -22,8 +25,11 @@ from io import StringIO, BytesIO
 
 import re
 from copy import deepcopy
+import threading
 import warnings
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import codecs
 
 """
@@ -33,7 +39,7 @@ Utility functions and classes
 
 class ServiceException(Exception):
     # TODO: this should go in ows common module when refactored.
-    pass
+    code = None  # exceptionCode of the exception report, when known
 
 
 # http://stackoverflow.com/questions/6256183/combine-two-dictionaries-of-dictionaries-python
@@ -139,23 +145,236 @@ class ResponseWrapper(object):
     def geturl(self):
         return self._response.url.replace('&&', '&')
 
+    @property
+    def status_code(self):
+        return self._response.status_code
+
+    @property
+    def raw(self):
+        """File-like object of the (decoded) response body, for streamed responses"""
+        self._response.raw.decode_content = True
+        return self._response.raw
+
     # @TODO: __getattribute__ for poking at response
 
 
+STREAM_CHUNK_SIZE = 65536  # default number of bytes read at a time from streamed responses
+
+
+class StreamingResponseWrapper(io.RawIOBase):
+    """
+    File-like object reading the body of a streamed response (openURL(..., stream=True))
+    as it arrives, after replaying the bytes already read from it (e.g. to check for an
+    exception report).
+    """
+    def __init__(self, response, head=b''):
+        """
+        :param response: ResponseWrapper of a streamed response
+        :param head: bytes already read from the start of the body
+        """
+        super(StreamingResponseWrapper, self).__init__()
+        self._response = response
+        self._raw = response.raw
+        self._head = head
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        if self._head:
+            n = min(len(b), len(self._head))
+            b[:n] = self._head[:n]
+            self._head = self._head[n:]
+            return n
+        data = self._raw.read(len(b))
+        b[:len(data)] = data
+        return len(data)
+
+    def iter_content(self, chunk_size=STREAM_CHUNK_SIZE):
+        """
+        Iterate over the body in chunks of (at most) chunk_size bytes
+        """
+        while True:
+            chunk = self.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
+    def info(self):
+        return self._response.info()
+
+    def geturl(self):
+        return self._response.geturl()
+
+    @property
+    def status_code(self):
+        return self._response.status_code
+
+    def close(self):
+        if not self.closed:
+            self._raw.close()
+        super(StreamingResponseWrapper, self).close()
+
+
+# number of bytes of a streamed response read to detect an exception report
+PEEK_SIZE = 1024
+
+_ROOT_ELEMENT = re.compile(rb'<[^?!]')
+_EXCEPTION_REPORT = re.compile(rb'<([\w.-]+:)?(Service)?ExceptionReport[\s>/]')
+
+
+def stream_response(u, skip_bom=False):
+    """
+    Check a streamed response (openURL(..., stream=True)) for an exception report,
+    reading only its first bytes, and return its body as a file-like object read
+    while it is downloaded (see StreamingResponseWrapper).
+
+    :param u: ResponseWrapper of a streamed response
+    :param skip_bom: whether to drop a leading byte order mark from the body (see strip_bom)
+    :return: StreamingResponseWrapper
+    """
+
+    head = b''
+    while len(head) < PEEK_SIZE:
+        chunk = u.raw.read(PEEK_SIZE - len(head))
+        if not chunk:
+            break
+        head += chunk
+    if skip_bom:
+        head = strip_bom(head)
+
+    root = _ROOT_ELEMENT.search(head)
+    if root is not None and _EXCEPTION_REPORT.match(head, root.start()):
+        # exception reports are small: read and parse the whole document
+        data = head + u.raw.read()
+        try:
+            tree = etree.fromstring(data)
+        except Exception:
+            raise ServiceException(data.decode('utf-8', 'replace').strip())
+        check_exception_report(tree)
+        raise ServiceException(data.decode('utf-8', 'replace').strip())
+
+    return StreamingResponseWrapper(u, head)
+
+
+# defaults for the pooled HTTP session shared by openURL, http_get and http_post
+HTTP_POOL_CONNECTIONS = 10  # number of hosts to keep connection pools for
+HTTP_POOL_MAXSIZE = 10  # number of keep-alive connections kept per host
+HTTP_MAX_RETRIES = 3
+HTTP_BACKOFF_FACTOR = 0.5
+HTTP_RETRY_STATUS = (429, 502, 503, 504)
+
+_session = None
+_session_lock = threading.Lock()
+
+
+class _RejectCookiesPolicy(http.cookiejar.DefaultCookiePolicy):
+    """Cookie policy of the shared session, which stores no cookies, so that the cookies
+    of a service are never sent to another one (cookies passed with a request are still sent)
+    """
+    def set_ok(self, cookie, request):
+        return False
+
+
+def create_session(pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE, pool_block=False,
+                   max_retries=HTTP_MAX_RETRIES, backoff_factor=HTTP_BACKOFF_FACTOR,
+                   status_forcelist=HTTP_RETRY_STATUS):
+    """
+    Create a requests Session with keep-alive connection pooling and retries.
+
+    Connections are kept open and reused for subsequent requests to the same host.
+    Idempotent requests are retried with exponential backoff on connection errors
+    and on the HTTP status codes in status_forcelist.
+
+    Unlike the default shared session (see get_session), a created session keeps the
+    cookies set by servers, so pass one with session= to services whose login sets a
+    cookie (e.g. before redirecting to the requested resource).
+
+    :param pool_connections: number of per-host connection pools to cache
+    :param pool_maxsize: maximum number of connections kept open per host
+    :param pool_block: whether to block when a host has pool_maxsize connections in use,
+                       making pool_maxsize a hard per-host connection limit
+    :param max_retries: maximum number of retries per request (0 disables retries)
+    :param backoff_factor: backoff factor between retries (factor * 2 ** (retry - 1) seconds)
+    :param status_forcelist: HTTP status codes to retry on
+    :return: requests.Session
+    """
+
+    retry = Retry(total=max_retries, connect=max_retries, read=max_retries, status=max_retries,
+                  backoff_factor=backoff_factor, status_forcelist=status_forcelist,
+                  raise_on_status=False)
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize,
+                          pool_block=pool_block, max_retries=retry)
+
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def get_session(session=None):
+    """
+    Return the HTTP session to use for a request.
+
+    The shared session is used by every service and by several threads at a time (e.g. for
+    concurrent tile or page requests): it holds no state besides its connection pools, which
+    are thread-safe, and its cookie policy rejects all cookies.  Supply a session of your own
+    (per service, or per set of credentials) to keep cookies between requests.
+
+    :param session: (optional) requests.Session supplied by the caller
+    :return: the given session, or the process-wide shared session (created on first use)
+    """
+
+    global _session
+
+    if session is not None:
+        return session
+
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                shared = create_session()
+                shared.cookies.set_policy(_RejectCookiesPolicy())
+                _session = shared
+    return _session
+
+
+def set_session(session):
+    """
+    Replace the process-wide shared HTTP session used when no session is supplied.
+
+    :param session: requests.Session (e.g. from create_session), or None to reset to the default
+    """
+
+    global _session
+
+    with _session_lock:
+        _session = session
+
+
 def openURL(url_base, data=None, method='Get', cookies=None, username=None, password=None, timeout=30, headers=None,
-            verify=True, cert=None, auth=None):
+            verify=True, cert=None, auth=None, session=None, stream=False):
     """
     Function to open URLs.
 
     Uses requests library but with additional checks for OGC service exceptions and url formatting.
     Also handles cookies and simple user password authentication.
 
+    Without a session, the request is sent through the shared session, which stores no cookies
+    set by the server: login flows that set a cookie and then redirect (which worked when every
+    request was sent on its own) fail.  Pass a session of your own (e.g. from create_session)
+    to such services.
+
     :param headers: (optional) Dictionary of HTTP Headers to send with the :class:`Request`.
     :param verify: (optional) whether the SSL cert will be verified. A CA_BUNDLE path can also be provided.
                    Defaults to ``True``.
     :param cert: (optional) A file with a client side certificate for SSL authentication
                  to send with the :class:`Request`.
     :param auth: Instance of owslib.util.Authentication
+    :param session: (optional) requests.Session to send the request with.
+                    Defaults to the shared pooled session (see get_session)
+    :param stream: (optional) whether to stream the response body (read it from
+                   ResponseWrapper.raw).  The body is then not checked for service exceptions.
     """
 
     headers = headers if headers is not None else {}
@@ -200,7 +419,10 @@ def openURL(url_base, data=None, method='Get', cookies=None, username=None, pass
     if cookies is not None:
         rkwargs['cookies'] = cookies
 
-    req = requests.request(method.upper(), url_base, headers=headers, **rkwargs)
+    if stream:
+        rkwargs['stream'] = True
+
+    req = get_session(session).request(method.upper(), url_base, headers=headers, **rkwargs)
 
     if req.status_code in [400, 401]:
         raise ServiceException(req.text)
@@ -209,29 +431,51 @@ def openURL(url_base, data=None, method='Get', cookies=None, username=None, pass
         req.raise_for_status()
 
     # check for service exceptions without the http header set
-    if 'Content-Type' in req.headers and \
-            req.headers['Content-Type'] in ['text/xml', 'application/xml', 'application/vnd.ogc.se_xml']:
-        # just in case 400 headers were not set, going to have to read the xml to see if it's an exception report.
-        se_tree = etree.fromstring(req.content)
-
-        # to handle the variety of namespaces and terms across services
-        # and versions, especially for "legacy" responses like WMS 1.3.0
-        possible_errors = [
-            '{http://www.opengis.net/ows}Exception',
-            '{http://www.opengis.net/ows/1.1}Exception',
-            '{http://www.opengis.net/ogc}ServiceException',
-            'ServiceException'
-        ]
-
-        for possible_error in possible_errors:
-            serviceException = se_tree.find(possible_error)
-            if serviceException is not None:
-                # and we need to deal with some message nesting
-                raise ServiceException('\n'.join([t.strip() for t in serviceException.itertext() if t.strip()]))
+    if not stream:
+        check_service_exception(req.headers, req.content)
 
     return ResponseWrapper(req)
 
 
+def check_service_exception(headers, content):
+    """
+    Raise a ServiceException if an XML response body is an OGC exception report.
+
+    :param headers: the response headers
+    :param content: the response body
+    """
+
+    if content and 'Content-Type' in headers and \
+            headers['Content-Type'] in ['text/xml', 'application/xml', 'application/vnd.ogc.se_xml']:
+        # just in case 400 headers were not set, going to have to read the xml to see if it's an exception report.
+        check_exception_report(etree.fromstring(content))
+
+
+def check_exception_report(se_tree):
+    """
+    Raise a ServiceException if an XML document is an OGC exception report.
+
+    :param se_tree: root element of the document
+    """
+
+    # to handle the variety of namespaces and terms across services
+    # and versions, especially for "legacy" responses like WMS 1.3.0
+    possible_errors = [
+        '{http://www.opengis.net/ows}Exception',
+        '{http://www.opengis.net/ows/1.1}Exception',
+        '{http://www.opengis.net/ogc}ServiceException',
+        'ServiceException'
+    ]
+
+    for possible_error in possible_errors:
+        serviceException = se_tree.find(possible_error)
+        if serviceException is not None:
+            # and we need to deal with some message nesting
+            exception = ServiceException('\n'.join([t.strip() for t in serviceException.itertext() if t.strip()]))
+            exception.code = serviceException.get('exceptionCode', serviceException.get('code'))
+            raise exception
+
+
 # default namespace for nspath is OWS common
 OWS_NAMESPACE = 'http://www.opengis.net/ows/1.1'
 
@@ -253,21 +497,60 @@ def nspath(path, ns=OWS_NAMESPACE):
     if ns is None or path is None:
         return -1
 
+    key = (path, ns)
+    try:
+        return _nspath_cache[key]
+    except KeyError:
+        pass
+
     components = []
     for component in path.split('/'):
         if component != '*':
             component = '{%s}%s' % (ns, component)
         components.append(component)
-    return '/'.join(components)
+    return _nspath_cache_put(_nspath_cache, key, '/'.join(components))
+
+
+# expanded paths are memoized, as the parsers evaluate the same paths for every record.
+# nspath_eval keys on the identity of its namespace mapping (keeping a reference to it, so
+# that the id is not reused) and checks the prefixes of the path against it, which costs
+# less than expanding the path and follows changes to the mapping
+NSPATH_CACHE_SIZE = 4096
+_nspath_cache = {}
+_nspath_eval_cache = {}
+
+
+def _nspath_cache_put(cache, key, value):
+    if len(cache) >= NSPATH_CACHE_SIZE:
+        # paths built on the fly (or namespace maps built per call) must not grow the cache unbounded
+        cache.clear()
+    cache[key] = value
+    return value
 
 
 def nspath_eval(xpath, namespaces):
     ''' Return an etree friendly xpath '''
+    key = (xpath, id(namespaces))
+    try:
+        mapping, prefixes, path = _nspath_eval_cache[key]
+    except KeyError:
+        pass
+    else:
+        for namespace, uri in prefixes:
+            if namespaces.get(namespace) != uri:
+                break
+        else:
+            return path
+
     out = []
+    prefixes = {}
     for chunks in xpath.split('/'):
         namespace, element = chunks.split(':')
-        out.append('{%s}%s' % (namespaces[namespace], element))
-    return '/'.join(out)
+        prefixes[namespace] = namespaces[namespace]
+        out.append('{%s}%s' % (prefixes[namespace], element))
+    path = '/'.join(out)
+    _nspath_cache_put(_nspath_eval_cache, key, (namespaces, tuple(prefixes.items()), path))
+    return path
 
 
 def cleanup_namespaces(element):
@@ -379,7 +662,8 @@ def testXMLAttribute(element, attribute):
     return None
 
 
-def http_post(url=None, request=None, lang='en-US', timeout=10, username=None, password=None, auth=None):
+def http_post(url=None, request=None, lang='en-US', timeout=10, username=None, password=None, auth=None,
+              session=None):
     """
 
     Invoke an HTTP POST request
@@ -391,6 +675,7 @@ def http_post(url=None, request=None, lang='en-US', timeout=10, username=None, p
     - request: the request message
     - lang: the language
     - timeout: timeout in seconds
+    - session: requests.Session to use (default is the shared pooled session)
 
     """
 
@@ -421,12 +706,16 @@ def http_post(url=None, request=None, lang='en-US', timeout=10, username=None, p
         rkwargs['auth'] = (auth.username, auth.password)
     rkwargs['verify'] = auth.verify
     rkwargs['cert'] = auth.cert
+    rkwargs['timeout'] = timeout
 
-    up = requests.post(url, request, headers=headers, **rkwargs)
+    up = get_session(session).post(url, request, headers=headers, **rkwargs)
     return up.content
 
 
 def http_get(*args, **kwargs):
+    # The session is shared, not copied
+    session = kwargs.pop('session', None)
+
     # Copy input kwargs so the dict can be modified
     rkwargs = copy.deepcopy(kwargs)
 
@@ -448,14 +737,87 @@ def http_get(*args, **kwargs):
     if 'verify' in rkwargs:
         auth.verify = rkwargs.pop('verify')
 
-    # Build keyword args for call to requests.get()
+    # Build keyword args for call to Session.get()
     if auth.username and auth.password:
         rkwargs.setdefault('auth', (auth.username, auth.password))
     else:
         rkwargs.setdefault('auth', None)
     rkwargs.setdefault('cert', rkwargs.get('cert'))
     rkwargs.setdefault('verify', rkwargs.get('verify', True))
-    return requests.get(*args, **rkwargs)
+    return get_session(session).get(*args, **rkwargs)
+
+
+REMOTE_METADATA_WORKERS = 8  # default number of MetadataURLs fetched concurrently
+
+
+def resolve_remote_metadata(contents, timeout=30, max_workers=REMOTE_METADATA_WORKERS, session=None):
+    """
+    Fetch and parse the remote metadata of the MetadataURLs of content metadata
+    objects (e.g. the layers of a WMS), adding it as metadataUrl['metadata']
+    (None when it cannot be fetched or parsed).
+
+    Each URL is fetched once, however many contents refer to it, and the
+    documents are fetched concurrently.  A document is parsed once per content
+    metadata class and MetadataURL type, and the parsed metadata object is
+    shared by the contents referring to it.
+
+    :param contents: content metadata objects, providing _remote_metadata_urls() (the
+                     MetadataURLs to fetch) and _parse_remote_metadata(metadataUrl, doc)
+    :param timeout: timeout of each request, in seconds
+    :param max_workers: maximum number of documents fetched at a time
+    :param session: (optional) requests.Session to send the requests with
+    """
+
+    requests_by_url = remote_metadata_requests(contents)
+    if not requests_by_url:
+        return
+
+    def fetch(url, content):
+        return etree.fromstring(openURL(url, timeout=timeout, headers=getattr(content, 'headers', None),
+                                        auth=content.auth, session=session).read())
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(requests_by_url))) as executor:
+        futures = dict((executor.submit(fetch, url, requesters[0][0]), url)
+                       for url, requesters in requests_by_url.items())
+        for future in as_completed(futures):
+            url = futures[future]
+            try:
+                doc = future.result()
+            except Exception as err:
+                log.debug('Remote metadata %s could not be fetched: %s', url, err)
+                doc = None
+            set_remote_metadata(url, requests_by_url[url], doc)
+
+
+def remote_metadata_requests(contents):
+    """
+    Return the MetadataURLs of content metadata objects to fetch (see resolve_remote_metadata),
+    as an OrderedDict of url: [(content, metadataUrl)]
+    """
+
+    requests_by_url = OrderedDict()
+    for content in contents:
+        for metadataUrl in content._remote_metadata_urls():
+            requests_by_url.setdefault(metadataUrl['url'], []).append((content, metadataUrl))
+    return requests_by_url
+
+
+def set_remote_metadata(url, requesters, doc):
+    """
+    Parse the remote metadata document doc of url (None if it could not be fetched) for
+    its (content, metadataUrl) requesters, adding it as metadataUrl['metadata']
+    """
+
+    parsed = {}
+    for content, metadataUrl in requesters:
+        key = (content.__class__, metadataUrl.get('type'))
+        if key not in parsed:
+            try:
+                parsed[key] = content._parse_remote_metadata(metadataUrl, doc) if doc is not None else None
+            except Exception as err:
+                log.debug('Remote metadata %s could not be parsed: %s', url, err)
+                parsed[key] = None
+        metadataUrl['metadata'] = parsed[key]
 
 
 def element_to_string(element, encoding=None, xml_declaration=False):
@@ -585,7 +947,11 @@ def build_get_url(base_url, params, overwrite=False):
 def dump(obj, prefix=''):
     '''Utility function to print to standard output a generic object with all its attributes.'''
 
-    print(("{} {}.{} : {}".format(prefix, obj.__module__, obj.__class__.__name__, obj.__dict__)))
+    if hasattr(obj, '__dict__'):
+        attributes = obj.__dict__
+    else:  # __slots__ class
+        attributes = {name: getattr(obj, name, None) for name in obj.__slots__}
+    print(("{} {}.{} : {}".format(prefix, obj.__module__, obj.__class__.__name__, attributes)))
 
 
 def getTypedValue(data_type, value):
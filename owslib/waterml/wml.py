@@ -4,6 +4,16 @@ from owslib.util import xml_to_dict as _xml_to_dict
 from datetime import datetime
 from dateutil import parser
 
+try:  # optional, for exporting values as arrays
+    import numpy as np
+except ImportError:
+    np = None
+
+try:  # optional, for exporting values as a DataFrame
+    import pandas as pd
+except ImportError:
+    pd = None
+
 namespaces = {
     'wml1.1': '{http://www.cuahsi.org/waterML/1.1/}',
     'wml1.0': '{http://www.cuahsi.org/waterML/1.0/}',
@@ -16,6 +26,25 @@ def ns(namespace):
     return namespaces.get(namespace)
 
 
+def _parse_datetime(date_str):
+    """Parse a dateTime attribute, with a fast path for the common ISO 8601 forms"""
+    if date_str is None:
+        return None
+    if not date_str.endswith('Z'):
+        try:
+            return datetime.fromisoformat(date_str)
+        except (AttributeError, ValueError):  # Python < 3.7 or other forms
+            pass
+    return parser.parse(date_str)
+
+
+def _to_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float('nan')
+
+
 class XMLParser(object):
     """
         Convienence class; provides some useful shortcut methods to make retrieving xml elements from etree
@@ -644,6 +673,24 @@ class TimeSeries(XMLParser):
 
 
 class Values(XMLParser):
+    """
+        The values of a time series. The value elements are parsed once into parallel columns
+        (see VALUE_COLUMNS), which are filtered with boolean masks; Value objects are only built
+        when the values attribute is accessed.
+    """
+
+    # column name -> value element attribute (None for the element text)
+    VALUE_COLUMNS = (
+        ('date_time', 'dateTime'),
+        ('date_time_utc', 'dateTimeUTC'),
+        ('value', None),
+        ('method_id', 'methodID'),
+        ('source_id', 'sourceID'),
+        ('sample_id', 'sampleID'),
+        ('quality_control_level', 'qualityControlLevel'),
+        ('censor_code', 'censorCode'),
+    )
+
     def __init__(self, xml, version='wml1.1'):
         super(Values, self).__init__(xml, version)
         self.parse_values()
@@ -652,28 +699,72 @@ class Values(XMLParser):
         for v in self.values:
             yield v
 
-    """Accessor properties/methods"""
-    def get_date_values(self, method_id=None, source_id=None, sample_id=None, quality_level=None, utc=False):
-        varl = [v for v in self.values]
-        if method_id is not None:
-            varl = [v for v in varl if v.method_id == method_id]
+    def __len__(self):
+        return len(self.columns['value'])
 
-        if source_id is not None:
-            varl = [v for v in varl if v.source_id == source_id]
+    @property
+    def values(self):
+        if self._values is None:
+            self._values = [Value(val, self._ns) for val in self._value_elements]
+        return self._values
 
-        if sample_id is not None:
-            varl = [v for v in varl if v.sample_id == sample_id]
+    """Accessor properties/methods"""
+    def mask(self, method_id=None, source_id=None, sample_id=None, quality_level=None, censor_code=None):
+        """
+            Return a list of booleans, one per value, selecting the values that match all of the given criteria
+        """
+        mask = [True] * len(self)
+        criteria = (('method_id', method_id), ('source_id', source_id), ('sample_id', sample_id),
+                    ('quality_control_level', quality_level), ('censor_code', censor_code))
+        for name, wanted in criteria:
+            if wanted is not None:
+                mask = [m and v == wanted for m, v in zip(mask, self.columns[name])]
+        return mask
+
+    def select(self, mask=None):
+        """
+            Return the columns (a dict of lists) of the values selected by a boolean mask, all values if None
+        """
+        if mask is None:
+            return dict((name, list(column)) for name, column in self.columns.items())
+        return dict((name, [v for v, m in zip(column, mask) if m]) for name, column in self.columns.items())
 
-        if quality_level is not None:
-            varl = [v for v in varl if v.quality_control_level == quality_level]
+    def get_date_values(self, method_id=None, source_id=None, sample_id=None, quality_level=None, utc=False):
+        mask = None
+        if any(c is not None for c in (method_id, source_id, sample_id, quality_level)):
+            mask = self.mask(method_id, source_id, sample_id, quality_level)
+        columns = self.select(mask)
+        return list(zip(columns['date_time_utc' if utc else 'date_time'], columns['value']))
 
-        if not utc:
-            return [(v.date_time, v.value) for v in varl]
-        else:
-            return [(v.date_time_utc, v.value) for v in varl]
+    def to_numpy(self, mask=None):
+        """
+            Return the values selected by a boolean mask (all if None) as a NumPy structured array.
+            Times are datetime64[ms], date_time in local time; values are float64 (NaN when missing).
+        """
+        if np is None:
+            raise ImportError('Values.to_numpy requires the numpy package')
+        columns = self.select(mask)
+        dtype = [('date_time', 'datetime64[ms]'), ('date_time_utc', 'datetime64[ms]'), ('value', 'f8')]
+        dtype.extend((name, object) for name, attribute in self.VALUE_COLUMNS[3:])
+        array = np.empty(len(columns['value']), dtype=dtype)
+        for name in ('date_time', 'date_time_utc'):
+            array[name] = [np.datetime64('NaT') if d is None else d.replace(tzinfo=None) for d in columns[name]]
+        array['value'] = [_to_float(v) for v in columns['value']]
+        for name, attribute in self.VALUE_COLUMNS[3:]:
+            array[name] = columns[name]
+        return array
+
+    def to_dataframe(self, mask=None):
+        """
+            Return the values selected by a boolean mask (all if None) as a pandas DataFrame
+        """
+        if pd is None:
+            raise ImportError('Values.to_dataframe requires the pandas package')
+        columns = self.select(mask)
+        columns['value'] = [_to_float(v) for v in columns['value']]
+        return pd.DataFrame(columns, columns=[name for name, attribute in self.VALUE_COLUMNS])
 
     def parse_values(self):
-        xml_dict = _xml_to_dict(self._root)  # noqa: F841
         # method info
         self.methods = [Method(method, self._ns) for method in self._findall('method')]
 
@@ -702,8 +793,20 @@ class Values(XMLParser):
             unit = self._find('unit')
             self.unit = Unit(unit, self._ns) if unit is not None else None
 
-        # values
-        self.values = [Value(val, self._ns) for val in self._findall('value')]
+        # values, in columns
+        self._value_elements = self._findall('value')
+        self._values = None
+        self.columns = dict((name, []) for name, attribute in self.VALUE_COLUMNS)
+        date_times, date_times_utc = self.columns['date_time'], self.columns['date_time_utc']
+        attributes = [(self.columns[name].append, attribute) for name, attribute in self.VALUE_COLUMNS[3:]]
+        append_value = self.columns['value'].append
+        for val in self._value_elements:
+            d = val.attrib
+            date_times.append(_parse_datetime(d.get('dateTime')))
+            date_times_utc.append(_parse_datetime(d.get('dateTimeUTC')))
+            append_value(testXMLValue(val))
+            for append, attribute in attributes:
+                append(d.get(attribute))
 
 
 class Value(XMLParser):
@@ -717,9 +820,9 @@ class Value(XMLParser):
             d = self._root.attrib
             self.qualifiers = d.get('qualifiers')
             self.censor_code = d.get('censorCode')
-            self.date_time = parser.parse(d.get('dateTime')) if d.get('dateTime') is not None else None
+            self.date_time = _parse_datetime(d.get('dateTime'))
             self.time_offset = d.get('timeOffset')
-            self.date_time_utc = parser.parse(d.get('dateTimeUTC')) if d.get('dateTimeUTC') is not None else None
+            self.date_time_utc = _parse_datetime(d.get('dateTimeUTC'))
             self.method_id = d.get('methodID')
             self.source_id = d.get('sourceID')
             self.accuracy_std_dev = d.get('accuracyStdDev')
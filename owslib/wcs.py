@@ -15,21 +15,25 @@ Web Coverage Server (WCS) methods and metadata. Factory function.
 
 from . import etree
 from .coverage import wcs100, wcs110, wcs111, wcsBase, wcs200, wcs201
-from owslib.util import clean_ows_url, Authentication, openURL
+from owslib.cache import read_capabilities
+from owslib.util import clean_ows_url, Authentication
 
 
-def WebCoverageService(url, version=None, xml=None, cookies=None, timeout=30, auth=None):
-    ''' wcs factory function, returns a version specific WebCoverageService object '''
+def WebCoverageService(url, version=None, xml=None, cookies=None, timeout=30, auth=None, session=None,
+                       describe_coverage_cache=None):
+    ''' wcs factory function, returns a version specific WebCoverageService object
+
+    describe_coverage_cache: wcsBase.DescribeCoverageCache to share DescribeCoverage responses in
+    '''
 
     if not auth:
         auth = Authentication()
 
     if version is None:
         if xml is None:
-            reader = wcsBase.WCSCapabilitiesReader(auth=auth)
+            reader = wcsBase.WCSCapabilitiesReader(auth=auth, session=session)
             request = reader.capabilities_url(url)
-            xml = openURL(
-                request, cookies=cookies, timeout=timeout, auth=auth).read()
+            xml = read_capabilities(request, cookies=cookies, timeout=timeout, auth=auth, session=session)
 
         capabilities = etree.etree.fromstring(xml)
         version = capabilities.get('version')
@@ -39,16 +43,21 @@ def WebCoverageService(url, version=None, xml=None, cookies=None, timeout=30, au
 
     if version == '1.0.0':
         return wcs100.WebCoverageService_1_0_0.__new__(
-            wcs100.WebCoverageService_1_0_0, clean_url, xml, cookies, auth=auth)
+            wcs100.WebCoverageService_1_0_0, clean_url, xml, cookies, auth=auth, session=session,
+            describe_coverage_cache=describe_coverage_cache)
     elif version == '1.1.0':
         return wcs110.WebCoverageService_1_1_0.__new__(
-            wcs110.WebCoverageService_1_1_0, url, xml, cookies, auth=auth)
+            wcs110.WebCoverageService_1_1_0, url, xml, cookies, auth=auth, session=session,
+            describe_coverage_cache=describe_coverage_cache)
     elif version == '1.1.1':
         return wcs111.WebCoverageService_1_1_1.__new__(
-            wcs111.WebCoverageService_1_1_1, url, xml, cookies, auth=auth)
+            wcs111.WebCoverageService_1_1_1, url, xml, cookies, auth=auth, session=session,
+            describe_coverage_cache=describe_coverage_cache)
     elif version == '2.0.0':
         return wcs200.WebCoverageService_2_0_0.__new__(
-            wcs200.WebCoverageService_2_0_0, url, xml, cookies, auth=auth)
+            wcs200.WebCoverageService_2_0_0, url, xml, cookies, auth=auth, session=session,
+            describe_coverage_cache=describe_coverage_cache)
     elif version == '2.0.1':
         return wcs201.WebCoverageService_2_0_1.__new__(
-            wcs201.WebCoverageService_2_0_1, url, xml, cookies, auth=auth)
+            wcs201.WebCoverageService_2_0_1, url, xml, cookies, auth=auth, session=session,
+            describe_coverage_cache=describe_coverage_cache)
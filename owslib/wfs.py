@@ -19,7 +19,7 @@ from .util import clean_ows_url, Authentication
 
 def WebFeatureService(url, version='1.0.0', xml=None,
                       parse_remote_metadata=False, timeout=30, username=None,
-                      password=None, headers=None, auth=None):
+                      password=None, headers=None, auth=None, session=None):
     ''' wfs factory function, returns a version specific WebFeatureService object
 
     @type url: string
@@ -33,6 +33,7 @@ def WebFeatureService(url, version='1.0.0', xml=None,
     @param username: service authentication username
     @param password: service authentication password
     @param auth: instance of owslib.util.Authentication
+    @param session: requests.Session to send requests with (default is the shared pooled session)
     @return: initialized WebFeatureService object (version dependent)
     '''
     if auth:
@@ -47,12 +48,12 @@ def WebFeatureService(url, version='1.0.0', xml=None,
     if version in ['1.0', '1.0.0']:
         return wfs100.WebFeatureService_1_0_0(
             clean_url, version, xml, parse_remote_metadata,
-            timeout=timeout, headers=headers, auth=auth)
+            timeout=timeout, headers=headers, auth=auth, session=session)
     elif version in ['1.1', '1.1.0']:
         return wfs110.WebFeatureService_1_1_0(
             clean_url, version, xml, parse_remote_metadata,
-            timeout=timeout, headers=headers, auth=auth)
+            timeout=timeout, headers=headers, auth=auth, session=session)
     elif version in ['2.0', '2.0.0']:
         return wfs200.WebFeatureService_2_0_0(
             clean_url, version, xml, parse_remote_metadata,
-            timeout=timeout, headers=headers, auth=auth)
+            timeout=timeout, headers=headers, auth=auth, session=session)
@@ -20,7 +20,8 @@ from .util import clean_ows_url, Authentication
 
 
 def WebMapService(url, version='1.1.1', xml=None, username=None, password=None,
-                  parse_remote_metadata=False, timeout=30, headers=None, auth=None):
+                  parse_remote_metadata=False, timeout=30, headers=None, auth=None, session=None,
+                  stream=False):
 
     '''wms factory function, returns a version specific WebMapService object
 
@@ -35,6 +36,10 @@ def WebMapService(url, version='1.1.1', xml=None, username=None, password=None,
     @param username: service authentication username
     @param password: service authentication password
     @param auth: instance of owslib.util.Authentication
+    @param session: requests.Session to send requests with (default is the shared pooled session)
+    @type stream: boolean
+    @param stream: whether to parse the capabilities document incrementally while it is read,
+                   building the layers as they are parsed and dropping their elements, to bound memory use
     @return: initialized WebFeatureService_2_0_0 object
     '''
     if auth:
@@ -49,10 +54,10 @@ def WebMapService(url, version='1.1.1', xml=None, username=None, password=None,
     if version in ['1.1.1']:
         return wms111.WebMapService_1_1_1(
             clean_url, version=version, xml=xml, parse_remote_metadata=parse_remote_metadata,
-            timeout=timeout, headers=headers, auth=auth)
+            timeout=timeout, headers=headers, auth=auth, session=session, stream=stream)
     elif version in ['1.3.0']:
         return wms130.WebMapService_1_3_0(
             clean_url, version=version, xml=xml, parse_remote_metadata=parse_remote_metadata,
-            timeout=timeout, headers=headers, auth=auth)
+            timeout=timeout, headers=headers, auth=auth, session=session, stream=stream)
     raise NotImplementedError(
         'The WMS version ({}) you requested is not implemented. Please use 1.1.1 or 1.3.0.'.format(version))
@@ -29,10 +29,17 @@ would be appreciated.
 
 """
 
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+import math
 from random import randint
 import warnings
 from urllib.parse import (urlencode, urlparse, urlunparse, parse_qs,
                           ParseResult)
+
+import pyproj
+
+from .cache import read_capabilities
+from .crs import get_crs
 from .etree import etree
 from .util import clean_ows_url, testXMLValue, getXMLInteger, Authentication, openURL
 from .fgdc import Metadata
@@ -92,6 +99,12 @@ _KEYWORDS_TAG = _OWS_NS + 'Keywords'
 _KEYWORD_TAG = _OWS_NS + 'Keyword'
 _HREF_TAG = _XLINK_NS + 'href'
 
+# Standardized rendering pixel size (0.28 mm x 0.28 mm) used to relate
+# the ScaleDenominator of a TileMatrix to the size of its pixels
+_STANDARDIZED_PIXEL_SIZE = 0.28e-3
+# Metres per degree on the equator of the WGS84 ellipsoid
+_METERS_PER_DEGREE = 2 * math.pi * 6378137 / 360
+
 
 class ServiceException(Exception):
     """WMTS ServiceException
@@ -129,7 +142,7 @@ class WebMapTileService(object):
 
     def __init__(self, url, version='1.0.0', xml=None, username=None, password=None,
                  parse_remote_metadata=False, vendor_kwargs=None, headers=None, auth=None,
-                 timeout=30):
+                 timeout=30, session=None):
         """Initialize.
 
         Parameters
@@ -154,6 +167,9 @@ class WebMapTileService(object):
             Instance of Authentication class to hold username/password/cert/verify
         timeout : int
             number of seconds for GetTile request
+        session : requests.Session
+            Optional session to send requests with. Defaults to the shared
+            pooled session.
 
         """
         self.url = clean_ows_url(url)
@@ -168,10 +184,11 @@ class WebMapTileService(object):
         self.headers = headers
         self.auth = auth or Authentication(username, password)
         self.timeout = timeout or 30
+        self.session = session
 
         # Authentication handled by Reader
         reader = WMTSCapabilitiesReader(
-            self.version, url=self.url, headers=self.headers, auth=self.auth)
+            self.version, url=self.url, headers=self.headers, auth=self.auth, session=self.session)
         if xml:  # read from stored xml
             self._capabilities = reader.readString(xml)
         else:  # read from server
@@ -192,7 +209,7 @@ class WebMapTileService(object):
         # TODO: deprecated function. See ticket #453.
         if not self._capabilities:
             reader = WMTSCapabilitiesReader(
-                self.version, url=self.url, headers=self.headers, auth=self.auth)
+                self.version, url=self.url, headers=self.headers, auth=self.auth, session=self.session)
             # xml = reader.read(self.url, self.vendor_kwargs)
             # self._capabilities = ServiceMetadata(xml)
             self._capabilities = reader.read(self.url, self.vendor_kwargs)
@@ -434,7 +451,43 @@ class WebMapTileService(object):
         **kwargs : extra arguments
             anything else e.g. vendor specific parameters
         """
-        vendor_kwargs = self.vendor_kwargs or {}
+        url, data = self._gettile_request(base_url, layer, style, format, tilematrixset,
+                                          tilematrix, row, column, **kwargs)
+        u = openURL(url, data, headers=self.headers, auth=self.auth, timeout=self.timeout,
+                    session=self.session)
+        return self._gettile_response(u)
+
+    def _gettile_url(self):
+        """Return the KVP GetTile url declared in the GetCapabilities response"""
+        base_url = self.url
+        try:
+            methods = self.getOperationByName('GetTile').methods
+            get_verbs = [x for x in methods
+                         if x.get('type').lower() == 'get']
+            if len(get_verbs) > 1:
+                # Filter by constraints
+                base_url = next(
+                    x for x in filter(
+                        list,
+                        ([pv.get('url')
+                            for const in pv.get('constraints')
+                            if 'kvp' in [x.lower() for x in const.values]]
+                         for pv in get_verbs if pv.get('constraints'))))[0]
+            elif len(get_verbs) == 1:
+                base_url = get_verbs[0].get('url')
+        except StopIteration:
+            pass
+        return base_url
+
+    def _gettile_request(self, base_url=None, layer=None, style=None, format=None,
+                         tilematrixset=None, tilematrix=None, row=None, column=None,
+                         **kwargs):
+        """Return the url and the URL-encoded parameters of a GetTile request.
+
+        The parameters are None for a REST only WMTS, where the url is the
+        tile resource itself.
+        """
+        vendor_kwargs = dict(self.vendor_kwargs or {})
         vendor_kwargs.update(kwargs)
 
         # REST only WMTS
@@ -442,42 +495,144 @@ class WebMapTileService(object):
             resurl = self.buildTileResource(
                 layer, style, format, tilematrixset, tilematrix,
                 row, column, **vendor_kwargs)
-            u = openURL(resurl, headers=self.headers, auth=self.auth, timeout=self.timeout)
-            return u
+            return resurl, None
 
         # KVP implemetation
         data = self.buildTileRequest(layer, style, format, tilematrixset,
                                      tilematrix, row, column, **vendor_kwargs)
 
         if base_url is None:
-            base_url = self.url
-            try:
-                methods = self.getOperationByName('GetTile').methods
-                get_verbs = [x for x in methods
-                             if x.get('type').lower() == 'get']
-                if len(get_verbs) > 1:
-                    # Filter by constraints
-                    base_url = next(
-                        x for x in filter(
-                            list,
-                            ([pv.get('url')
-                                for const in pv.get('constraints')
-                                if 'kvp' in [x.lower() for x in const.values]]
-                             for pv in get_verbs if pv.get('constraints'))))[0]
-                elif len(get_verbs) == 1:
-                    base_url = get_verbs[0].get('url')
-            except StopIteration:
-                pass
-        u = openURL(base_url, data, headers=self.headers, auth=self.auth, timeout=self.timeout)
+            base_url = self._gettile_url()
+        return base_url, data
 
+    def _gettile_response(self, u):
+        """Raise a ServiceException if a GetTile response is an exception report"""
         # check for service exceptions, and return
-        if u.info()['Content-Type'] == 'application/vnd.ogc.se_xml':
+        if u.info().get('Content-Type') == 'application/vnd.ogc.se_xml':
             se_xml = u.read()
             se_tree = etree.fromstring(se_xml)
             err_message = str(se_tree.find('ServiceException').text)
             raise ServiceException(err_message.strip(), se_xml)
         return u
 
+    def tileindices(self, layer, tilematrixset=None, zoom_levels=None, bbox=None):
+        """Enumerate the tiles of a layer covering a bounding box.
+
+        Returns a generator of (tilematrix, row, column) tuples.  The tile
+        ranges are computed from the TopLeftCorner, ScaleDenominator and
+        tile size of each TileMatrix, and clipped against the matrix size
+        and the TileMatrixLimits of the layer.
+
+        Parameters
+        ----------
+        layer : string
+            Content layer name.
+        tilematrixset : string
+            Optional name of tile matrix set to use.
+            Defaults to the first tile matrix set defined for the
+            relevant layer in the GetCapabilities response.
+        zoom_levels : list
+            Optional names of the tile matrices (zoom levels) to
+            enumerate. Defaults to all tile matrices of the tile matrix
+            set.
+        bbox : tuple
+            Optional (minx, miny, maxx, maxy) in the CRS of the tile
+            matrix set, with x the easting (or longitude) axis, whatever
+            the axis order of the CRS. Defaults to the whole tile matrix.
+        """
+        if tilematrixset is None:
+            tilematrixset = sorted(self[layer].tilematrixsetlinks.keys())[0]
+        tms = self.tilematrixsets[tilematrixset]
+        link = self[layer].tilematrixsetlinks.get(tilematrixset)
+        limits = link.tilematrixlimits if link is not None else {}
+        if zoom_levels is None:
+            zoom_levels = list(tms.tilematrix.keys())
+
+        for zoom in zoom_levels:
+            minrow, maxrow, mincol, maxcol = tms.tilematrix[zoom].tilerange(
+                bbox, tms.metersperunit, tms.axisorder)
+            tml = limits.get(zoom)
+            if tml is not None:
+                minrow = max(minrow, tml.mintilerow)
+                maxrow = min(maxrow, tml.maxtilerow)
+                mincol = max(mincol, tml.mintilecol)
+                maxcol = min(maxcol, tml.maxtilecol)
+            for row in range(minrow, maxrow + 1):
+                for column in range(mincol, maxcol + 1):
+                    yield zoom, row, column
+
+    def gettiles(self, layer=None, tilematrixset=None, zoom_levels=None, bbox=None,
+                 style=None, format=None, max_workers=8, **kwargs):
+        """Fetch all the tiles of a layer covering a bounding box.
+
+        The tiles are enumerated with tileindices and downloaded
+        concurrently by a bounded pool of worker threads. Returns a
+        generator of (tilematrix, row, column, tile image bytes) tuples,
+        in the order the downloads complete.
+
+        Parameters
+        ----------
+        layer : string
+            Content layer name.
+        tilematrixset : string
+            Optional name of tile matrix set to use.
+            Defaults to the first tile matrix set defined for the
+            relevant layer in the GetCapabilities response.
+        zoom_levels : list
+            Optional names of the tile matrices (zoom levels) to fetch.
+            Defaults to all tile matrices of the tile matrix set.
+        bbox : tuple
+            Optional (minx, miny, maxx, maxy) in the CRS of the tile
+            matrix set, with x the easting (or longitude) axis.
+            Defaults to the whole tile matrix.
+        style : string
+            Optional style name. Defaults to the first style defined for
+            the relevant layer in the GetCapabilities response.
+        format : string
+            Optional output image format,  such as 'image/jpeg'.
+            Defaults to the first format defined for the relevant layer
+            in the GetCapabilities response.
+        max_workers : integer
+            Maximum number of tiles downloaded at the same time.
+        **kwargs : extra arguments
+            anything else e.g. vendor specific parameters
+        """
+        if layer is None:
+            raise ValueError("layer is mandatory (cannot be None)")
+
+        # resolve the defaults once, rather than for every tile
+        if style is None:
+            style = list(self[layer].styles.keys())[0]
+        if format is None:
+            format = self[layer].formats[0]
+        if tilematrixset is None:
+            tilematrixset = sorted(self[layer].tilematrixsetlinks.keys())[0]
+        base_url = None if self.restonly else self._gettile_url()
+
+        def fetch(tile):
+            zoom, row, column = tile
+            url, data = self._gettile_request(base_url, layer, style, format, tilematrixset,
+                                              zoom, row, column, **kwargs)
+            u = openURL(url, data, headers=self.headers, auth=self.auth, timeout=self.timeout,
+                        session=self.session)
+            return zoom, row, column, self._gettile_response(u).read()
+
+        tiles = self.tileindices(layer, tilematrixset, zoom_levels, bbox)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # keep a bounded number of requests queued, so that large
+            # regions are not submitted all at once
+            pending = set()
+            for tile in tiles:
+                pending.add(executor.submit(fetch, tile))
+                if len(pending) >= 2 * max_workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+
     def getServiceXML(self):
         xml = None
         if self._capabilities is not None:
@@ -512,6 +667,50 @@ class TileMatrixSet(object):
                     raise KeyError('TileMatrix with identifier "%s" '
                                    'already exists' % tm.identifier)
                 self.tilematrix[tm.identifier] = tm
+        self._axisorder = None
+        self._metersperunit = None
+
+    def _pyproj_crs(self):
+        '''The pyproj CRS of the TileMatrixSet, None if pyproj does not know it'''
+        try:
+            code = get_crs(self.crs).getcode()
+        except ValueError:
+            # not parsed by Crs, e.g. http://www.opengis.net/def/crs/OGC/1.3/CRS84
+            code = self.crs
+        try:
+            return pyproj.CRS.from_user_input(code)
+        except pyproj.exceptions.CRSError:
+            return None
+
+    @property
+    def axisorder(self):
+        '''Axis order of the CRS of the TileMatrixSet, 'xy' or 'yx' '''
+        if self._axisorder is None:
+            try:
+                self._axisorder = get_crs(self.crs).axisorder
+            except ValueError:
+                crs = self._pyproj_crs()
+                if crs is not None and crs.axis_info[0].direction in ('north', 'south'):
+                    self._axisorder = 'yx'
+                else:
+                    self._axisorder = 'xy'
+        return self._axisorder
+
+    @property
+    def metersperunit(self):
+        '''Number of metres per unit of the CRS of the TileMatrixSet'''
+        if self._metersperunit is None:
+            crs = self._pyproj_crs()
+            if crs is None:
+                # unknown to pyproj, e.g. EPSG:900913: assume metres
+                self._metersperunit = 1.0
+            else:
+                factor = crs.axis_info[0].unit_conversion_factor
+                if crs.is_geographic:  # factor is in radians per unit
+                    self._metersperunit = math.degrees(factor) * _METERS_PER_DEGREE
+                else:
+                    self._metersperunit = factor
+        return self._metersperunit
 
 
 class TileMatrix(object):
@@ -544,6 +743,36 @@ class TileMatrix(object):
         self.matrixwidth = int(mw)
         self.matrixheight = int(mh)
 
+    def tilerange(self, bbox=None, metersperunit=1.0, axisorder='xy'):
+        '''Return the (minrow, maxrow, mincol, maxcol) indices of the tiles
+        covering bbox, clipped to the size of the matrix.
+
+        bbox is (minx, miny, maxx, maxy) with x the easting (or longitude)
+        axis, None for the whole matrix. metersperunit and axisorder are
+        those of the CRS of the TileMatrixSet.
+        '''
+        if bbox is None:
+            return 0, self.matrixheight - 1, 0, self.matrixwidth - 1
+
+        left, top = self.topleftcorner
+        if axisorder == 'yx':
+            left, top = top, left
+        pixelspan = self.scaledenominator * _STANDARDIZED_PIXEL_SIZE / metersperunit
+        tilespanx = self.tilewidth * pixelspan
+        tilespany = self.tileheight * pixelspan
+
+        # a small tolerance keeps edges on tile boundaries from
+        # selecting the neighbouring tile
+        eps = 1e-9
+        minx, miny, maxx, maxy = bbox
+        mincol = int(math.floor((minx - left) / tilespanx + eps))
+        maxcol = int(math.ceil((maxx - left) / tilespanx - eps)) - 1
+        minrow = int(math.floor((top - maxy) / tilespany + eps))
+        maxrow = int(math.ceil((top - miny) / tilespany - eps)) - 1
+
+        return (max(minrow, 0), min(maxrow, self.matrixheight - 1),
+                max(mincol, 0), min(maxcol, self.matrixwidth - 1))
+
 
 class Theme:
     """
@@ -813,7 +1042,7 @@ class WMTSCapabilitiesReader:
     """Read and parse capabilities document into a lxml.etree infoset
     """
 
-    def __init__(self, version='1.0.0', url=None, un=None, pw=None, headers=None, auth=None):
+    def __init__(self, version='1.0.0', url=None, un=None, pw=None, headers=None, auth=None, session=None):
         """Initialize"""
         self.version = version
         self._infoset = None
@@ -825,6 +1054,7 @@ class WMTSCapabilitiesReader:
                 auth.password = pw
         self.auth = auth or Authentication(un, pw)
         self.headers = headers
+        self.session = session
 
     def capabilities_url(self, service_url, vendor_kwargs=None):
         """Return a capabilities url
@@ -856,11 +1086,8 @@ class WMTSCapabilitiesReader:
         parameters can also be supplied as a dict.
         """
         getcaprequest = self.capabilities_url(service_url, vendor_kwargs)
-
-        # now split it up again to use the generic openURL function...
-        spliturl = getcaprequest.split('?')
-        u = openURL(spliturl[0], spliturl[1], method='Get', headers=self.headers, auth=self.auth)
-        return etree.fromstring(u.read())
+        xml = read_capabilities(getcaprequest, headers=self.headers, auth=self.auth, session=self.session)
+        return etree.fromstring(xml)
 
     def readString(self, st):
         """Parse a WMTS capabilities document, returning an elementtree instance
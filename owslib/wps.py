@@ -109,12 +109,21 @@ Also, the directory tests/ contains several examples of well-formed "Execute" re
 from owslib.etree import etree
 from owslib.ows import DEFAULT_OWS_NAMESPACE, XLINK_NAMESPACE
 from owslib.ows import ServiceIdentification, ServiceProvider, OperationsMetadata, BoundingBox
-from time import sleep
+from time import sleep, monotonic
 from owslib.util import (testXMLValue, testXMLAttribute, build_get_url, clean_ows_url, dump, getTypedValue,
-                         getNamespace, element_to_string, nspath, openURL, nspath_eval, log, Authentication)
+                         getNamespace, element_to_string, nspath, openURL, nspath_eval, log, Authentication,
+                         STREAM_CHUNK_SIZE)
 from xml.dom.minidom import parseString
 from owslib.namespaces import Namespaces
 from urllib.parse import urlparse
+from concurrent.futures import Future, ThreadPoolExecutor
+import heapq
+import itertools
+import json
+import os
+import re
+import shutil
+import threading
 import warnings
 
 # namespace definition
@@ -139,6 +148,17 @@ AUTO = 'auto'
 SYNC = 'sync'
 ASYNC = 'async'
 
+# WPSJobManager polling defaults
+JOB_POLL_WORKERS = 8  # number of status documents fetched at a time
+JOB_MIN_INTERVAL = 1  # seconds
+JOB_MAX_INTERVAL = 60  # seconds
+JOB_BACKOFF = 2  # factor of the polling interval of a job making no progress
+JOB_MAX_ERRORS = 5  # consecutive failed polls after which a job is given up
+
+OUTPUT_WORKERS = 4  # number of process outputs downloaded at a time
+
+_CONTENT_RANGE = re.compile(r'bytes\s+(?:(\d+)-\d+|\*)/(\d+|\*)')
+
 
 def get_namespaces():
     ns = n.get_namespaces(["ogc", "wfs", "wps", "gml", "xsi", "xlink"])
@@ -224,13 +244,14 @@ class WebProcessingService(object):
     """
 
     def __init__(self, url, version=WPS_DEFAULT_VERSION, username=None, password=None, verbose=False, skip_caps=False,
-                 headers=None, verify=None, cert=None, timeout=None, auth=None, language=None):
+                 headers=None, verify=None, cert=None, timeout=None, auth=None, language=None, session=None):
         """
         Initialization method resets the object status.
         By default it will execute a GetCapabilities invocation to the remote service,
         which can be skipped by using skip_caps=True.
 
         Parameters username, password, verify and cert are deprecated. Please use auth parameter.
+        The session parameter is the requests.Session to send requests with (default is the shared pooled session).
         """
         self.auth = auth or Authentication()
         _fix_auth(self.auth, username, password, verify, cert)
@@ -242,6 +263,7 @@ class WebProcessingService(object):
         self.headers = headers
         self.timeout = timeout
         self.language = language
+        self.session = session
 
         # fields populated by method invocations
         self._capabilities = None
@@ -266,6 +288,7 @@ class WebProcessingService(object):
             verbose=self.verbose,
             auth=self.auth,
             language=self.language,
+            session=self.session,
         )
         if xml:
             # read from stored XML file
@@ -293,6 +316,7 @@ class WebProcessingService(object):
             verbose=self.verbose,
             auth=self.auth,
             language=self.language,
+            session=self.session,
         )
         if xml:
             # read from stored XML file
@@ -345,6 +369,7 @@ class WebProcessingService(object):
             timeout=self.timeout,
             auth=self.auth,
             language=self.language,
+            session=self.session,
         )
 
         # build XML request from parameters
@@ -480,12 +505,14 @@ class WPSReader(object):
     Superclass for reading a WPS document into a lxml.etree infoset.
     """
 
-    def __init__(self, version=WPS_DEFAULT_VERSION, verbose=False, timeout=30, auth=None, language=None):
+    def __init__(self, version=WPS_DEFAULT_VERSION, verbose=False, timeout=30, auth=None, language=None,
+                 session=None):
         self.version = version
         self.verbose = verbose
         self.timeout = timeout
         self.auth = auth or Authentication()
         self.language = language
+        self.session = session
 
     def _readFromUrl(self, url, data, timeout, method='Get', username=None, password=None,
                      headers=None, verify=True, cert=None):
@@ -506,13 +533,15 @@ class WPSReader(object):
             spliturl = request_url.split('?')
             u = openURL(spliturl[0], spliturl[
                         1], method='Get', username=self.auth.username, password=self.auth.password,
-                        headers=headers, verify=self.auth.verify, cert=self.auth.cert, timeout=self.timeout)
+                        headers=headers, verify=self.auth.verify, cert=self.auth.cert, timeout=self.timeout,
+                        session=self.session)
             return etree.fromstring(u.read())
 
         elif method == 'Post':
             u = openURL(url, data, method='Post',
                         username=self.auth.username, password=self.auth.password,
-                        headers=headers, verify=self.auth.verify, cert=self.auth.cert, timeout=timeout)
+                        headers=headers, verify=self.auth.verify, cert=self.auth.cert, timeout=timeout,
+                        session=self.session)
             return etree.fromstring(u.read())
 
         else:
@@ -535,10 +564,11 @@ class WPSCapabilitiesReader(WPSReader):
     Utility class that reads and parses a WPS GetCapabilities document into a lxml.etree infoset.
     """
 
-    def __init__(self, version=WPS_DEFAULT_VERSION, verbose=False, timeout=None, auth=None, language=None):
+    def __init__(self, version=WPS_DEFAULT_VERSION, verbose=False, timeout=None, auth=None, language=None,
+                 session=None):
         # superclass initializer
         super(WPSCapabilitiesReader, self).__init__(
-            version=version, verbose=verbose, timeout=timeout, auth=auth, language=language)
+            version=version, verbose=verbose, timeout=timeout, auth=auth, language=language, session=session)
 
     def readFromUrl(self, url, username=None, password=None,
                     headers=None, verify=None, cert=None):
@@ -561,10 +591,11 @@ class WPSDescribeProcessReader(WPSReader):
     Class that reads and parses a WPS DescribeProcess document into a etree infoset
     """
 
-    def __init__(self, version=WPS_DEFAULT_VERSION, verbose=False, timeout=None, auth=None, language=None):
+    def __init__(self, version=WPS_DEFAULT_VERSION, verbose=False, timeout=None, auth=None, language=None,
+                 session=None):
         # superclass initializer
         super(WPSDescribeProcessReader, self).__init__(
-            version=version, verbose=verbose, timeout=timeout, auth=auth, language=language)
+            version=version, verbose=verbose, timeout=timeout, auth=auth, language=language, session=session)
 
     def readFromUrl(self, url, identifier, username=None, password=None,
                     headers=None, verify=None, cert=None):
@@ -588,9 +619,10 @@ class WPSExecuteReader(WPSReader):
     Class that reads and parses a WPS Execute response document into a etree infoset
     """
 
-    def __init__(self, verbose=False, timeout=None, auth=None, language=None):
+    def __init__(self, verbose=False, timeout=None, auth=None, language=None, session=None):
         # superclass initializer
-        super(WPSExecuteReader, self).__init__(verbose=verbose, timeout=timeout, auth=auth, language=language)
+        super(WPSExecuteReader, self).__init__(verbose=verbose, timeout=timeout, auth=auth, language=language,
+                                               session=session)
 
     def readFromUrl(self, url, data={}, method='Get', username=None, password=None,
                     headers=None, verify=None, cert=None):
@@ -610,7 +642,7 @@ class WPSExecution(object):
     """
 
     def __init__(self, version=WPS_DEFAULT_VERSION, url=None, username=None, password=None, verbose=False,
-                 headers=None, verify=None, cert=None, timeout=None, auth=None, language=None):
+                 headers=None, verify=None, cert=None, timeout=None, auth=None, language=None, session=None):
 
         # initialize fields
         self.url = url
@@ -621,6 +653,7 @@ class WPSExecution(object):
         _fix_auth(self.auth, username, password, verify, cert)
         self.timeout = timeout
         self.language = language
+        self.session = session
 
         # request document
         self.request = None
@@ -797,7 +830,7 @@ class WPSExecution(object):
         :param int sleepSecs: number of seconds to sleep before returning control to the caller.
         """
 
-        reader = WPSExecuteReader(verbose=self.verbose, auth=self.auth, language=self.language)
+        reader = WPSExecuteReader(verbose=self.verbose, auth=self.auth, language=self.language, session=self.session)
         if response is None:
             # override status location
             if url is not None:
@@ -863,7 +896,6 @@ class WPSExecution(object):
         """
 
         if self.isSucceded():
-            content = b''
             output = None
             if self.processOutputs:
                 if identifier:
@@ -877,27 +909,45 @@ class WPSExecution(object):
             if output:
                 # ExecuteResponse contains reference to server-side output
                 if output.reference:
-                    content = output.retrieveData(
-                        self.auth.username, self.auth.password,
-                        headers=self.headers, verify=self.auth.verify, cert=self.auth.cert)
-                    if filepath is None:
-                        filepath = output.fileName
+                    output.download(filepath, self.auth.username, self.auth.password,
+                                    headers=self.headers, verify=self.auth.verify, cert=self.auth.cert,
+                                    session=self.session)
                 # ExecuteResponse contain embedded output
                 elif len(output.data) > 0:
-                    if filepath is None:
-                        filepath = 'wps.out'
-                    for data in output.data:
-                        content = content + data.encode()
-            # write out content
-            if content != b'':
-                out = open(filepath, 'wb')
-                out.write(content)
-                out.close()
-                log.info(f'Output written to file: {filepath}')
+                    output.download(filepath or 'wps.out')
         else:
             raise Exception(
                 f"Execution not successfully completed: status={self.status}")
 
+    def getOutputs(self, directory=None, identifiers=None, max_workers=OUTPUT_WORKERS, resume=True):
+        """
+        Method to write the outputs of a WPS process to files, downloading the referenced outputs
+        in parallel and streaming each one to disk (see Output.download).
+
+        :param directory: optional directory to write the outputs in, default is the local directory.
+                  Files are named by the server, or after the output identifier for embedded output.
+        :param identifiers: optional identifiers of the outputs that should be written, default is all of them.
+        :param int max_workers: number of outputs downloaded at a time.
+        :param resume: whether to resume interrupted downloads.
+        :return: dictionary of output identifier: path of the written file.
+        """
+
+        if not self.isSucceded():
+            raise Exception(
+                f"Execution not successfully completed: status={self.status}")
+
+        outputs = [o for o in self.processOutputs if identifiers is None or o.identifier in identifiers]
+
+        def download(output):
+            name = output._localFileName() if output.reference else output.identifier
+            return output.download(os.path.join(directory or '', name), self.auth.username, self.auth.password,
+                                   headers=self.headers, verify=self.auth.verify, cert=self.auth.cert,
+                                   resume=resume, session=self.session)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            paths = list(executor.map(download, outputs))
+        return dict((o.identifier, path) for o, path in zip(outputs, paths) if path is not None)
+
     def submitRequest(self, request):
         """
         Submits a WPS Execute document to a remote service, returns the XML response document from the server.
@@ -907,7 +957,7 @@ class WPSExecution(object):
         """
 
         self.request = request
-        reader = WPSExecuteReader(verbose=self.verbose, timeout=self.timeout, auth=self.auth)
+        reader = WPSExecuteReader(verbose=self.verbose, timeout=self.timeout, auth=self.auth, session=self.session)
         response = reader.readFromUrl(
             self.url, request, method='Post', headers=self.headers)
         self.response = response
@@ -1405,13 +1455,14 @@ class Output(InputOutput):
                 if bbox:
                     self.data.append(bbox)
 
-    def retrieveData(self, username=None, password=None, headers=None, verify=True, cert=None):
+    def retrieveData(self, username=None, password=None, headers=None, verify=True, cert=None, session=None):
         """
         Method to retrieve data from server-side reference:
         returns "" if the reference is not known.
 
         :param username: credentials to access the remote WPS server
         :param password: credentials to access the remote WPS server
+        :param session: requests.Session to send the request with (default is the shared pooled session)
         """
         url = self.reference
         if url is None:
@@ -1421,8 +1472,7 @@ class Output(InputOutput):
         # b) 'http://rsg.pml.ac.uk/wps/wpsoutputs/outputImage-11294Bd6l2a.tif'
         log.info('Output URL=%s' % url)
 
-        # Extract output filepath from base URL
-        self.fileName = url.split('/')[-1]
+        self.fileName = self._referenceFileName()
 
         # The link is a local file.
         # Useful when running local tests during development.
@@ -1432,21 +1482,37 @@ class Output(InputOutput):
 
         if '?' in url:
             spliturl = url.split('?')
-            # Extract output filepath from URL query string
-            self.fileName = spliturl[1].split('=')[1]
-
             u = openURL(spliturl[0], spliturl[
                         1], method='Get', username=username, password=password,
-                        headers=headers, verify=verify, cert=cert)
+                        headers=headers, verify=verify, cert=cert, session=session)
         else:
             u = openURL(
                 url, '', method='Get', username=username, password=password,
-                headers=headers, verify=verify, cert=cert)
+                headers=headers, verify=verify, cert=cert, session=session)
 
         return u.read()
 
+    def _referenceFileName(self):
+        """
+        Name of the file of the server-side reference: from the URL query string, or the last part of its path.
+        """
+        url = self.reference
+        if '?' in url and not url.startswith("file://"):
+            return url.split('?')[1].split('=')[1]
+        return url.split('/')[-1]
+
+    def _localFileName(self):
+        """
+        Name of the local file of the server-side reference: the last part of _referenceFileName, so that
+        a name given by the server cannot point outside the directory the output is written to.
+        """
+        name = os.path.basename(self._referenceFileName().replace('\\', '/'))
+        if name in ('', '.', '..'):
+            raise ValueError('Invalid output file name in reference %s' % self.reference)
+        return name
+
     def writeToDisk(self, path=None, username=None, password=None,
-                    headers=None, verify=True, cert=None):
+                    headers=None, verify=True, cert=None, session=None):
         """
         Method to write an output of a WPS process to disk:
         it either retrieves the referenced file from the server, or write out the content of response embedded output.
@@ -1455,25 +1521,122 @@ class Output(InputOutput):
                   with the name assigned by the server,
         :param username: credentials to access the remote WPS server
         :param password: credentials to access the remote WPS server
+        :param session: requests.Session to send the request with (default is the shared pooled session)
+        """
+        name = ''
+        if self.reference is not None and self._referenceFileName():
+            name = self._localFileName()
+        self.download((path or '') + (name or self.identifier), username, password,
+                      headers=headers, verify=verify, cert=cert, session=session)
+
+    def download(self, filepath=None, username=None, password=None, headers=None, verify=True, cert=None,
+                 resume=True, chunk_size=STREAM_CHUNK_SIZE, timeout=30, session=None):
         """
-        # Check if ExecuteResponse contains reference to server-side output
-        content = self.retrieveData(username, password, headers=headers, verify=verify, cert=cert)
-
-        # ExecuteResponse contain embedded output
-        if content == "" and len(self.data) > 0:
-            self.fileName = self.identifier
-            for data in self.data:
-                content = content + data
-
-        # write out content
-        if content != "":
-            if self.fileName == "":
-                self.fileName = self.identifier
-            self.filePath = path + self.fileName
-            out = open(self.filePath, 'wb')
-            out.write(content)
-            out.close()
-            log.info('Output written to file: %s' % self.filePath)
+        Method to write an output of a WPS process to a file, streaming the referenced file from the server
+        in chunks (or writing out the content of response embedded output), so that large outputs are never
+        held in memory. The file is downloaded to filepath + '.part' first: with resume, an interrupted
+        download is continued with an HTTP range request, conditional (If-Range) on the ETag or Last-Modified
+        of the response the part was read from, which are kept in filepath + '.part.json'.
+
+        :param filepath: optional path to the output file, otherwise a file will be created in the local directory
+                  with the name assigned by the server, or the output identifier for embedded output.
+        :param username: credentials to access the remote WPS server
+        :param password: credentials to access the remote WPS server
+        :param resume: whether to resume an interrupted download
+        :param int chunk_size: number of bytes read and written at a time
+        :param session: requests.Session to send the request with (default is the shared pooled session)
+        :return: the path of the written file, None if the output has no content
+        """
+
+        if self.reference is None:
+            if len(self.data) == 0:
+                return None
+            filepath = filepath or self.identifier
+            with open(filepath, 'wb') as out:
+                for data in self.data:
+                    out.write(data if isinstance(data, bytes) else str(data).encode())
+        else:
+            log.info('Output URL=%s' % self.reference)
+            self.fileName = self._referenceFileName()
+            filepath = filepath or self._localFileName()
+            if self.reference.startswith("file://"):
+                shutil.copyfile(self.reference[7:], filepath)
+            else:
+                self._download(filepath, username, password, headers, verify, cert, resume, chunk_size, timeout,
+                               session)
+
+        self.filePath = filepath
+        log.info('Output written to file: %s' % filepath)
+        return filepath
+
+    def _download(self, filepath, username, password, headers, verify, cert, resume, chunk_size, timeout, session):
+        part = filepath + '.part'
+        validators = part + '.json'
+        validator = self._partValidator(validators) if resume and os.path.exists(part) else None
+        # a part is only resumed when the file it was read from can be recognized
+        offset = os.path.getsize(part) if validator is not None else 0
+        request_headers = dict(headers or {})
+        # byte ranges refer to the file as stored, not to a compressed transfer
+        request_headers['Accept-Encoding'] = 'identity'
+        if offset:
+            request_headers['Range'] = 'bytes=%d-' % offset
+            # the server sends the whole file (200) when it changed since the part was read
+            request_headers['If-Range'] = validator
+
+        spliturl = self.reference.split('?', 1)
+        u = openURL(spliturl[0], spliturl[1] if len(spliturl) > 1 else '', method='Get', username=username,
+                    password=password, headers=request_headers, verify=verify, cert=cert, timeout=timeout,
+                    stream=True, session=session)
+        raw = u.raw
+        try:
+            match = _CONTENT_RANGE.match(u.info().get('Content-Range', ''))
+            if u.status_code == 416 and match is not None and match.group(2) == str(offset):
+                # the part already holds the whole file
+                log.debug('Output already downloaded: %s' % filepath)
+            elif offset and u.status_code in (206, 416) and (match is None or match.group(1) != str(offset)):
+                log.debug('Cannot resume the download of %s, restarting it' % filepath)
+                raw.close()
+                os.remove(part)
+                if os.path.exists(validators):
+                    os.remove(validators)
+                return self._download(filepath, username, password, headers, verify, cert, False, chunk_size,
+                                      timeout, session)
+            else:
+                # servers ignoring the range, or whose file changed, send the whole file (200)
+                if u.status_code != 206:
+                    self._saveValidators(validators, u.info())
+                with open(part, 'ab' if u.status_code == 206 else 'wb') as out:
+                    while True:
+                        chunk = raw.read(chunk_size)
+                        if not chunk:
+                            break
+                        out.write(chunk)
+        finally:
+            raw.close()
+        os.replace(part, filepath)
+        if os.path.exists(validators):
+            os.remove(validators)
+
+    def _partValidator(self, validators):
+        """Return the If-Range validator of a partly downloaded output, None if there is none"""
+        try:
+            with open(validators) as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if meta.get('reference') != self.reference:
+            return None
+        etag = meta.get('etag')
+        # If-Range takes strong validators only
+        if etag and not etag.startswith('W/'):
+            return etag
+        return meta.get('last_modified')
+
+    def _saveValidators(self, validators, info):
+        """Keep the validators of the response a download is read from"""
+        with open(validators, 'w') as f:
+            json.dump({'reference': self.reference, 'etag': info.get('ETag'),
+                       'last_modified': info.get('Last-Modified')}, f)
 
 
 class WPSException:
@@ -1918,6 +2081,214 @@ def monitorExecution(execution, sleepSecs=3, download=False, filepath=None):
                       (ex.code, ex.locator, ex.text))
 
 
+class _Job(object):
+    """Polling state of a job tracked by a WPSJobManager"""
+
+    def __init__(self, execution, callback, interval):
+        self.execution = execution
+        self.callback = callback
+        self.future = Future()
+        self.future.execution = execution
+        self.interval = interval
+        self.progress = execution.percentCompleted or 0
+        self.progressed = monotonic()  # time of the last progress
+        self.errors = 0
+        self.resolved = False
+
+    def resolve(self, exception=None):
+        ''' set the result (the execution) or the exception of the future, unless it is cancelled '''
+        self.resolved = True
+        # once running, the future can no longer be cancelled: no race with Future.cancel()
+        if self.future.set_running_or_notify_cancel():
+            if exception is None:
+                self.future.set_result(self.execution)
+            else:
+                self.future.set_exception(exception)
+
+
+class WPSJobManager(object):
+    '''
+    Track many asynchronous WPS executions at once.
+
+    A single scheduler thread polls the status location of every job, with a small pool of
+    threads fetching the status documents over the shared pooled HTTP session, so that hundreds
+    of jobs do not need as many sleeping threads.  The polling interval of a job adapts to its
+    percentCompleted: it is set from the progress rate of the job, and backs off exponentially
+    while the job makes no progress.
+
+    submit() returns a concurrent.futures.Future resolved with the execution once it completes,
+    successfully or not (see WPSExecution.isSucceded); asyncio code can await
+    asyncio.wrap_future(future).  An optional callback is called with the execution as well.
+
+    Usage:
+        with WPSJobManager() as manager:
+            futures = [manager.submit(wps.execute(identifier, inputs)) for inputs in jobs]
+            for future in concurrent.futures.as_completed(futures):
+                execution = future.result()
+    '''
+
+    def __init__(self, max_workers=JOB_POLL_WORKERS, min_interval=JOB_MIN_INTERVAL,
+                 max_interval=JOB_MAX_INTERVAL, backoff=JOB_BACKOFF, max_errors=JOB_MAX_ERRORS, timeout=30):
+        '''
+        :param int max_workers: number of status documents fetched at a time
+        :param min_interval: shortest time (in seconds) between two polls of a job
+        :param max_interval: longest time (in seconds) between two polls of a job
+        :param backoff: factor the polling interval grows by while a job makes no progress
+        :param int max_errors: number of consecutive failed polls after which the future of a job fails
+        :param timeout: timeout (in seconds) of the status requests
+        '''
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.max_errors = max_errors
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._queue = []  # heap of (time of the next poll, sequence number, job)
+        self._counter = itertools.count()
+        self._jobs = set()
+        self._condition = threading.Condition()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name='WPSJobManager', daemon=True)
+        self._thread.start()
+
+    def submit(self, execution, callback=None):
+        '''
+        Track an execution until it completes.
+
+        :param execution: WPSExecution instance, as returned by WebProcessingService.execute
+        :param callback: optional function called with the execution once it completes
+        :return: concurrent.futures.Future resolved with the execution
+        '''
+        job = _Job(execution, callback, self.min_interval)
+        if execution.isComplete():
+            self._complete(job)
+            return job.future
+        if execution.statusLocation is None:
+            raise ValueError('The execution has no status location to poll, it should be executed in ASYNC mode')
+        with self._condition:
+            if self._closed:
+                raise RuntimeError('Cannot submit jobs to a WPSJobManager that has been shut down')
+            self._jobs.add(job)
+            self._schedule(job, self.min_interval)
+        return job.future
+
+    def __len__(self):
+        ''' number of jobs still running '''
+        with self._condition:
+            return len(self._jobs)
+
+    def wait(self, timeout=None):
+        '''
+        Wait until all the submitted jobs complete, return False on timeout
+        '''
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._jobs, timeout)
+
+    def shutdown(self, wait=True):
+        '''
+        Stop polling, after all the submitted jobs complete when wait is True.
+        The futures of jobs still running are cancelled otherwise.
+        '''
+        if wait:
+            self.wait()
+        with self._condition:
+            self._closed = True
+            jobs = list(self._jobs)
+            self._jobs.clear()
+            self._queue = []
+            self._condition.notify_all()
+        for job in jobs:
+            job.future.cancel()
+        self._thread.join()
+        self._executor.shutdown(wait=True)
+        for job in jobs:
+            if not job.resolved:
+                job.future.set_running_or_notify_cancel()  # wake up the waiters of the cancelled future
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.shutdown(wait=args[0] is None)
+
+    def _schedule(self, job, interval):
+        job.interval = interval
+        heapq.heappush(self._queue, (monotonic() + interval, next(self._counter), job))
+        self._condition.notify_all()
+
+    def _run(self):
+        ''' scheduler loop: hand the jobs due for a poll to the executor '''
+        with self._condition:
+            while not self._closed:
+                if not self._queue:
+                    self._condition.wait()
+                    continue
+                due = self._queue[0][0] - monotonic()
+                if due > 0:
+                    self._condition.wait(due)
+                    continue
+                job = heapq.heappop(self._queue)[2]
+                self._executor.submit(self._poll, job)
+
+    def _poll(self, job):
+        execution = job.execution
+        reader = WPSExecuteReader(verbose=execution.verbose, timeout=self.timeout, auth=execution.auth,
+                                  language=execution.language, session=execution.session)
+        try:
+            response = reader.readFromUrl(execution.statusLocation, headers=execution.headers)
+            execution.response = etree.tostring(response)
+            execution.parseResponse(response)
+            complete = execution.isComplete()
+        except Exception as err:
+            job.errors += 1
+            log.warning('Could not check the status of %s (%d/%d): %s', execution.statusLocation,
+                        job.errors, self.max_errors, err)
+            if job.errors >= self.max_errors:
+                job.resolve(err)
+                self._discard(job)
+                return
+            with self._condition:
+                if not self._closed:
+                    self._schedule(job, min(job.interval * self.backoff, self.max_interval))
+            return
+
+        job.errors = 0
+        if complete:
+            self._complete(job)
+            return
+        with self._condition:
+            if not self._closed:
+                self._schedule(job, self._interval(job))
+
+    def _interval(self, job):
+        ''' next polling interval of a job, from its progress since the last poll '''
+        now = monotonic()
+        progress = job.execution.percentCompleted or 0
+        if progress > job.progress:
+            # poll again halfway to the expected completion, at the rate of the last progress
+            rate = (progress - job.progress) / max(now - job.progressed, 1e-3)
+            interval = (100 - progress) / rate / 2
+            job.progress = progress
+            job.progressed = now
+        else:
+            interval = job.interval * self.backoff
+        return max(self.min_interval, min(interval, self.max_interval))
+
+    def _complete(self, job):
+        if job.callback is not None:
+            try:
+                job.callback(job.execution)
+            except Exception:
+                log.exception('WPS job callback failed')
+        job.resolve()
+        self._discard(job)
+
+    def _discard(self, job):
+        with self._condition:
+            self._jobs.discard(job)
+            self._condition.notify_all()
+
+
 def printValue(value):
     '''
     Utility method to format a value for printing.
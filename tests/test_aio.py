@@ -0,0 +1,198 @@
+import asyncio
+import json
+
+import pytest
+
+from tests.utils import resource_file
+
+from owslib.util import ServiceException
+
+aiohttp = pytest.importorskip('aiohttp')
+from aiohttp import web  # noqa: E402
+
+from owslib.aio import util as aio_util  # noqa: E402
+from owslib.aio.ogcapi import Features  # noqa: E402
+from owslib.aio.wfs import WebFeatureService  # noqa: E402
+from owslib.aio.wms import WebMapService  # noqa: E402
+
+DOV_URL = 'https://www.dov.vlaanderen.be:443/geoserver/gw_meetnetten/meetnetten'
+
+FEATURES = b'<wfs:FeatureCollection xmlns:wfs="http://www.opengis.net/wfs"/>'
+
+EXCEPTION = b"""<?xml version="1.0" encoding="UTF-8"?>
+<ServiceExceptionReport version="1.3.0" xmlns="http://www.opengis.net/ogc">
+<ServiceException code="InvalidCRS">Invalid CRS</ServiceException>
+</ServiceExceptionReport>"""
+
+
+def run_with_server(test):
+    """Run the coroutine function test(base_url, requests) against a local OWS server"""
+
+    requests = []
+
+    async def handler(request):
+        requests.append(request.query)
+        service = request.query.get('service', request.query.get('SERVICE'))
+        operation = request.query.get('request', request.query.get('REQUEST'))
+        base_url = str(request.url.with_query(None))
+        if operation == 'GetCapabilities':
+            filename = {
+                'WMS': 'wms_dov_getcapabilities_130_nometadata.xml',
+                'WFS': 'wfs_dov_getcapabilities_110_nometadata.xml'
+            }[service]
+            with open(resource_file(filename), encoding='utf-8') as f:
+                xml = f.read().replace(DOV_URL + '/ows', base_url).replace(DOV_URL + '/wfs', base_url)
+            return web.Response(body=xml.encode('utf-8'), content_type='text/xml')
+        if operation == 'GetMap':
+            if request.query['crs'] != 'EPSG:31370':
+                return web.Response(body=EXCEPTION, content_type='text/xml')
+            return web.Response(body=b'PNG', content_type='image/png')
+        if operation == 'GetFeature':
+            return web.Response(body=FEATURES, content_type='text/xml')
+        raise web.HTTPNotFound()
+
+    async def metadata(request):
+        requests.append(request.path)
+        if request.match_info['name'] == 'missing.xml':
+            raise web.HTTPNotFound()
+        with open(resource_file('csw_dov_getrecordbyid.xml'), 'rb') as f:
+            return web.Response(body=f.read(), content_type='text/xml')
+
+    async def landing_page(request):
+        return web.json_response({'links': []})
+
+    async def items(request):
+        requests.append(request.query)
+        if request.match_info['id'] == 'numbers':
+            # pages of at most 4 features, whatever the limit
+            start = int(request.query.get('startindex', 0))
+            features = [{'id': i} for i in range(start, min(start + 4, 10))]
+            return web.json_response({'type': 'FeatureCollection', 'features': features, 'numberMatched': 10})
+        return web.json_response({'type': 'FeatureCollection', 'features': [{'id': request.match_info['id']}]})
+
+    async def main():
+        app = web.Application()
+        app.router.add_get('/ows', handler)
+        app.router.add_get('/md/{name}', metadata)
+        app.router.add_get('/ogcapi/', landing_page)
+        app.router.add_get('/ogcapi/collections/{id}/items', items)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, '127.0.0.1', 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        try:
+            await test('http://127.0.0.1:%d' % port, requests)
+        finally:
+            await aio_util.close_session()
+            await runner.cleanup()
+
+    asyncio.run(main())
+
+
+def test_aio_wms_getmap():
+    async def test(url, requests):
+        wms = await WebMapService(url + '/ows', version='1.3.0')
+        assert 'meetnetten' in wms.contents
+        img = await wms.getmap(layers=['meetnetten'], srs='EPSG:31370', bbox=(0, 0, 1, 1),
+                               size=(256, 256), format='image/png')
+        assert img.read() == b'PNG'
+        assert requests[-1]['layers'] == 'meetnetten'
+
+        with pytest.raises(ServiceException, match='Invalid CRS'):
+            await wms.getmap(layers=['meetnetten'], srs='EPSG:4326', bbox=(0, 0, 1, 1),
+                             size=(256, 256), format='image/png')
+
+    run_with_server(test)
+
+
+def test_aio_wms_getmap_concurrent():
+    async def test(url, requests):
+        async with aio_util.create_session(limit_per_host=2) as session:
+            wms = await WebMapService(url + '/ows', version='1.3.0', session=session)
+            imgs = await asyncio.gather(*[
+                wms.getmap(layers=['meetnetten'], srs='EPSG:31370', bbox=(i, i, i + 1, i + 1),
+                           size=(256, 256), format='image/png')
+                for i in range(8)])
+        assert [img.read() for img in imgs] == [b'PNG'] * 8
+        assert len(requests) == 9
+
+    run_with_server(test)
+
+
+def test_aio_wms_remote_metadata():
+    layer = '''<Layer queryable="0"><Name>%s</Name><Title>%s</Title>
+      <MetadataURL type="ISO19115:2003"><Format>text/xml</Format>
+        <OnlineResource xlink:type="simple" xlink:href="%s"/></MetadataURL></Layer>'''
+    capabilities = '''<WMS_Capabilities version="1.3.0" xmlns="http://www.opengis.net/wms"
+        xmlns:xlink="http://www.w3.org/1999/xlink">
+      <Service><Name>WMS</Name><Title>Test</Title></Service>
+      <Capability><Request/><Layer><Title>Root</Title>%s</Layer></Capability>
+    </WMS_Capabilities>'''
+
+    async def test(url, requests):
+        xml = capabilities % ''.join([layer % ('a', 'A', url + '/md/shared.xml'),
+                                      layer % ('b', 'B', url + '/md/shared.xml'),
+                                      layer % ('c', 'C', url + '/md/missing.xml')])
+        wms = await WebMapService(url + '/ows', version='1.3.0', xml=xml.encode(), parse_remote_metadata=True)
+        assert sorted(requests) == ['/md/missing.xml', '/md/shared.xml']
+        metadata = wms['a'].metadataUrls[0]['metadata']
+        assert metadata.identifier == '6c39d716-aecc-4fbc-bac8-4f05a49a78d5'
+        assert wms['b'].metadataUrls[0]['metadata'] is metadata
+        assert wms['c'].metadataUrls[0]['metadata'] is None
+
+    run_with_server(test)
+
+
+def test_aio_wfs_getfeature():
+    async def test(url, requests):
+        wfs = await WebFeatureService(url + '/ows', version='1.1.0')
+        assert 'gw_meetnetten:meetnetten' in wfs.contents
+        response = await wfs.getfeature(typename=['gw_meetnetten:meetnetten'], maxfeatures=10)
+        assert response.read() == FEATURES
+        assert requests[-1]['maxfeatures'] == '10'
+
+    run_with_server(test)
+
+
+def test_aio_ogcapi_features():
+    async def test(url, requests):
+        api = await Features(url + '/ogcapi/')
+        items = await api.collection_items('lakes', limit=1)
+        assert items['features'] == [{'id': 'lakes'}]
+        assert requests[-1]['limit'] == '1'
+
+    run_with_server(test)
+
+
+def test_aio_ogcapi_features_iter():
+    async def test(url, requests):
+        api = await Features(url + '/ogcapi/')
+        features = [feature async for feature in api.iter_collection_items('numbers', limit=5)]
+        assert features == [{'id': i} for i in range(10)]
+        assert [r.get('startindex', '0') for r in requests] == ['0', '4', '8']
+
+        del requests[:]
+        items = api.iter_collection_items('numbers', max_features=6, prefetch=False)
+        features = [feature async for feature in items]
+        assert features == [{'id': i} for i in range(6)]
+        assert len(requests) == 2
+
+        # streamed responses would block the event loop
+        del requests[:]
+        with pytest.raises(NotImplementedError):
+            [feature async for feature in api.iter_collection_items('numbers', stream=True)]
+        with pytest.raises(NotImplementedError):
+            api.collection_items_stream('numbers')
+        assert requests == []
+
+    run_with_server(test)
+
+
+def test_aio_ogcapi_features_json():
+    async def test(url, requests):
+        api = await Features(url + '/ogcapi/', json_=json.dumps({'links': []}))
+        assert api.links == []
+        assert requests == []
+
+    run_with_server(test)
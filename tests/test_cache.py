@@ -0,0 +1,106 @@
+import pytest
+
+from tests.utils import FakeResponse, FakeSession, resource_file
+
+from owslib.cache import CapabilitiesCache, set_capabilities_cache
+from owslib.wms import WebMapService
+
+CAPABILITIES = b'<WMS_Capabilities version="1.3.0" updateSequence="42"/>'
+
+CURRENT_UPDATE_SEQUENCE = b"""<?xml version="1.0" encoding="UTF-8"?>
+<ServiceExceptionReport version="1.3.0" xmlns="http://www.opengis.net/ogc">
+<ServiceException code="CurrentUpdateSequence">Update sequence is current</ServiceException>
+</ServiceExceptionReport>"""
+
+INVALID_UPDATE_SEQUENCE = CURRENT_UPDATE_SEQUENCE.replace(b'CurrentUpdateSequence', b'InvalidUpdateSequence')
+
+
+class CapabilitiesSession(FakeSession):
+    """Serve a capabilities document with optional validators, answering conditional requests"""
+    def __init__(self, content=CAPABILITIES, etag=None):
+        super(CapabilitiesSession, self).__init__(content)
+        self.etag = etag
+        self.update_sequence_report = CURRENT_UPDATE_SEQUENCE
+
+    def describe(self, method, url, headers=None, **kwargs):
+        return url, headers
+
+    def respond(self, method, url, headers=None, **kwargs):
+        if self.etag is None:
+            if 'updateSequence=42' in url:
+                return self.update_sequence_report
+            return self.content
+        if headers.get('If-None-Match') == self.etag:
+            return FakeResponse(url, b'', 304, {'ETag': self.etag})
+        return FakeResponse(url, self.content, headers={'ETag': self.etag})
+
+
+@pytest.fixture
+def cache(tmpdir):
+    cache = CapabilitiesCache(str(tmpdir), ttl=3600)
+    set_capabilities_cache(cache)
+    yield cache
+    set_capabilities_cache(None)
+
+
+def test_cache_ttl(cache):
+    session = CapabilitiesSession()
+    url = 'http://example.org/wms?service=WMS&request=GetCapabilities'
+    assert cache.fetch(url, session=session) == CAPABILITIES
+    assert cache.fetch(url, session=session) == CAPABILITIES
+    assert len(session.calls) == 1
+    assert cache.get(url)[0]['update_sequence'] == '42'
+
+
+def test_cache_etag(cache):
+    session = CapabilitiesSession(etag='"v1"')
+    url = 'http://example.org/wms?service=WMS&request=GetCapabilities'
+    cache.ttl = 0
+    assert cache.fetch(url, session=session) == CAPABILITIES
+    assert cache.fetch(url, session=session) == CAPABILITIES
+    assert session.calls[1][1]['If-None-Match'] == '"v1"'
+
+    session.etag = '"v2"'
+    session.content = b'<WMS_Capabilities version="1.3.0"/>'
+    assert cache.fetch(url, session=session) == session.content
+    assert cache.get(url)[0]['etag'] == '"v2"'
+
+
+def test_cache_update_sequence(cache):
+    session = CapabilitiesSession()
+    url = 'http://example.org/wms?service=WMS&request=GetCapabilities'
+    cache.ttl = 0
+    assert cache.fetch(url, session=session) == CAPABILITIES
+    assert cache.fetch(url, session=session) == CAPABILITIES
+    assert session.calls[1][0] == url + '&updateSequence=42'
+
+
+def test_cache_invalid_update_sequence(cache):
+    session = CapabilitiesSession()
+    url = 'http://example.org/wms?service=WMS&request=GetCapabilities'
+    cache.ttl = 0
+    assert cache.fetch(url, session=session) == CAPABILITIES
+
+    # the server reset its sequence: the entry is dropped and the document fetched anew
+    session.content = b'<WMS_Capabilities version="1.3.0" updateSequence="1"/>'
+    session.update_sequence_report = INVALID_UPDATE_SEQUENCE
+    assert cache.fetch(url, session=session) == session.content
+    assert [call[0] for call in session.calls[1:]] == [url + '&updateSequence=42', url]
+    assert cache.get(url)[0]['update_sequence'] == '1'
+
+
+def test_cache_clear(cache, tmpdir):
+    session = CapabilitiesSession()
+    cache.fetch('http://example.org/wms?service=WMS&request=GetCapabilities', session=session)
+    tmpdir.join('interrupted.tmp').write_binary(b'')
+    cache.clear()
+    assert tmpdir.listdir() == []
+
+
+def test_cache_wms(cache):
+    with open(resource_file('wms_JPLCapabilities.xml'), 'rb') as f:
+        session = CapabilitiesSession(f.read())
+    wms = WebMapService('http://example.org/wms', version='1.1.1', session=session)
+    wms_cached = WebMapService('http://example.org/wms', version='1.1.1', session=session)
+    assert len(session.calls) == 1
+    assert list(wms_cached.contents) == list(wms.contents)
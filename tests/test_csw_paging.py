@@ -0,0 +1,113 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from tests.utils import FakeSession, resource_file
+
+from owslib.csw import CatalogueServiceWeb, namespaces
+from owslib.etree import etree
+
+SERVICE_URL = 'http://example.org/csw'
+NUMBER_MATCHED = 25
+
+RESPONSE = """<?xml version="1.0" encoding="UTF-8"?>
+<csw:GetRecordsResponse xmlns:csw="http://www.opengis.net/cat/csw/2.0.2" xmlns:dc="http://purl.org/dc/elements/1.1/"
+    version="2.0.2">
+<csw:SearchStatus timestamp="2020-01-01T00:00:00Z"/>
+<csw:SearchResults numberOfRecordsMatched="%d" numberOfRecordsReturned="%d" %s elementSet="summary">
+%s
+</csw:SearchResults>
+</csw:GetRecordsResponse>"""
+
+RECORD = """<csw:SummaryRecord><dc:identifier>record-%d</dc:identifier><dc:title>Record %d</dc:title>
+</csw:SummaryRecord>"""
+
+
+class CatalogueSession(FakeSession):
+    """Answer GetRecords requests from a catalogue of NUMBER_MATCHED records"""
+    def __init__(self, nextrecord=True):
+        super(CatalogueSession, self).__init__(content_type='application/xml')
+        self.nextrecord = nextrecord
+
+    def describe(self, method, url, data=None, **kwargs):
+        request = etree.fromstring(data)
+        return int(request.get('startPosition', 1)), int(request.get('maxRecords'))
+
+    def respond(self, method, url, data=None, **kwargs):
+        start, maxrecords = self.describe(method, url, data)
+        positions = range(start, min(start + maxrecords, NUMBER_MATCHED + 1))
+        nextrecord = ''
+        if self.nextrecord:
+            nextrecord = 'nextRecord="%d"' % (positions[-1] + 1 if positions[-1] < NUMBER_MATCHED else 0)
+        content = RESPONSE % (NUMBER_MATCHED, len(positions), nextrecord,
+                              ''.join(RECORD % (i, i) for i in positions))
+        return content.encode()
+
+
+@pytest.mark.parametrize('prefetch', [True, False])
+def test_csw_iter_records(prefetch):
+    session = CatalogueSession()
+    csw = CatalogueServiceWeb(SERVICE_URL, skip_caps=True, session=session)
+    records = list(csw.iter_records(page_size=10, prefetch=prefetch))
+    assert [record.identifier for record in records] == ['record-%d' % i for i in range(1, 26)]
+    assert records[0].title == 'Record 1'
+    assert session.calls == [(1, 10), (11, 10), (21, 10)]
+    assert not hasattr(csw, 'records')
+    assert records[0].xml.startswith(b'<csw:SummaryRecord')
+
+
+def test_csw_iter_records_no_xml():
+    csw = CatalogueServiceWeb(SERVICE_URL, skip_caps=True, session=CatalogueSession(), record_xml=False)
+    records = list(csw.iter_records(page_size=10))
+    assert records[0].xml is None
+    assert records[0].title == 'Record 1'
+
+
+def test_csw_iter_records_maxrecords():
+    session = CatalogueSession()
+    csw = CatalogueServiceWeb(SERVICE_URL, skip_caps=True, session=session)
+    records = list(csw.iter_records(page_size=10, startposition=5, maxrecords=12))
+    assert [record.identifier for record in records] == ['record-%d' % i for i in range(5, 17)]
+    assert session.calls == [(5, 10), (15, 10)]
+
+
+def test_csw_iter_records_no_nextrecord():
+    session = CatalogueSession(nextrecord=False)
+    csw = CatalogueServiceWeb(SERVICE_URL, skip_caps=True, session=session)
+    records = list(csw.iter_records(page_size=10))
+    assert len(records) == NUMBER_MATCHED
+    assert session.calls == [(1, 10), (11, 10), (21, 10)]
+
+
+def test_csw_iter_records_parse_workers():
+    with CatalogueServiceWeb(SERVICE_URL, skip_caps=True, session=CatalogueSession(), parse_workers=2) as csw:
+        records = list(csw.iter_records(page_size=10))
+        pool = csw._parse_pool
+    assert [record.identifier for record in records] == ['record-%d' % i for i in range(1, 26)]
+    assert csw._parse_pool is None
+    with pytest.raises(RuntimeError):
+        pool.submit(str)
+
+
+def test_csw_iter_records_parse_executor():
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        session = CatalogueSession()
+        with CatalogueServiceWeb(SERVICE_URL, skip_caps=True, session=session, parse_workers=executor) as csw:
+            records = list(csw.iter_records(page_size=10))
+        assert [record.identifier for record in records] == ['record-%d' % i for i in range(1, 26)]
+        # the executor of the caller is not shut down
+        assert executor.submit(str, 1).result() == '1'
+
+
+def test_csw_getrecordbyid_parse_workers():
+    with open(resource_file('csw_dov_getrecordbyid.xml'), 'rb') as f:
+        session = FakeSession(f.read(), content_type='application/xml')
+    serial = CatalogueServiceWeb(SERVICE_URL, skip_caps=True, session=session)
+    serial.getrecordbyid(['6c39d716-aecc-4fbc-bac8-4f05a49a78d5'], outputschema=namespaces['gmd'])
+    with CatalogueServiceWeb(SERVICE_URL, skip_caps=True, session=session, parse_workers=2) as parallel:
+        parallel.getrecordbyid(['6c39d716-aecc-4fbc-bac8-4f05a49a78d5'], outputschema=namespaces['gmd'])
+    assert list(parallel.records) == list(serial.records) == ['6c39d716-aecc-4fbc-bac8-4f05a49a78d5']
+    record = parallel.records['6c39d716-aecc-4fbc-bac8-4f05a49a78d5']
+    expected = serial.records['6c39d716-aecc-4fbc-bac8-4f05a49a78d5']
+    assert record.identification.title == expected.identification.title
+    assert record.contact[0].email == expected.contact[0].email
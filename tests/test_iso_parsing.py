@@ -1,6 +1,9 @@
 # -*- coding: utf-8 -*-
 
 import io
+import pickle
+
+import pytest
 
 from owslib import util
 from owslib.etree import etree
@@ -594,3 +597,61 @@ def test_md_parsing_19115_2():
     inst = plt.instruments[0]
     assert inst.identifier == 'OLI_TIRS'
     assert inst.type == 'INS-NOBS'
+
+
+def test_md_parsing_fields():
+    """Test the parsing of selected fields, the other sections being
+    parsed on first access
+
+    """
+    md_resource = get_md_resource('tests/resources/csw_dov_getrecordbyid.xml')
+    md = MD_Metadata(md_resource, fields=['identifier', 'identification'], xml=False)
+
+    full = MD_Metadata(md_resource)
+
+    assert md.xml is None
+    assert md.identifier == full.identifier == '6c39d716-aecc-4fbc-bac8-4f05a49a78d5'
+    assert md.identification.title == full.identification.title == 'Grondwatermeetnetten'
+
+    # the other sections are not parsed yet
+    assert not {'contact', 'referencesystem', 'distribution', 'dataquality'} & vars(md).keys()
+    assert not {'bbox', 'keywords2', 'accessconstraints', 'publisher'} & vars(md.identification).keys()
+
+    # parsed on first access, with the values of a full parse
+    assert md.referencesystem.code == full.referencesystem.code == '31370'
+    assert 'referencesystem' in vars(md)
+    assert md.contact[0].city == full.contact[0].city == 'Brussel'
+    assert md.identification.bbox.minx == full.identification.bbox.minx
+    assert [k.keywords for k in md.identification.keywords2] == [k.keywords for k in full.identification.keywords2]
+    assert md.identification.accessconstraints == full.identification.accessconstraints
+    assert md.distribution.online[0].url == full.distribution.online[0].url
+
+    # load() parses everything left
+    md = MD_Metadata(md_resource, fields=['identifier'], xml=False).load()
+    assert {'contact', 'identification', 'distribution', 'dataquality'} <= vars(md).keys()
+    assert md.identification.abstract == full.identification.abstract
+    assert md.dataquality.lineage == full.dataquality.lineage
+
+    # the fields of the identification select its sections
+    md = MD_Metadata(md_resource, fields=['identifier', 'title', 'bbox'])
+    assert {'title', 'bbox'} <= vars(md.identification).keys()
+    assert not {'keywords2', 'accessconstraints', 'publisher'} & vars(md.identification).keys()
+    assert md.identification.title == 'Grondwatermeetnetten'
+    assert md.identification.bbox.minx == full.identification.bbox.minx
+
+    with pytest.raises(ValueError, match='known fields are .*identifier.*bbox'):
+        MD_Metadata(md_resource, fields=['nonexistent'])
+
+
+def test_md_parsing_compact():
+    """Test the records without retained XML, and the pickling of their __slots__ objects"""
+    md_resource = get_md_resource('tests/resources/csw_dov_getrecordbyid.xml')
+    md = MD_Metadata(md_resource, xml=False)
+    assert md.xml is None
+    assert not hasattr(md.contact[0], '__dict__')
+    assert md.contact[0].role is MD_Metadata(md_resource).contact[0].role
+
+    md2 = pickle.loads(pickle.dumps(md))
+    assert md2.contact[0].email == md.contact[0].email
+    assert md2.identification.bbox.minx == md.identification.bbox.minx
+    assert md2.distribution.online[0].url == md.distribution.online[0].url
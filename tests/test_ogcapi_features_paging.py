@@ -0,0 +1,99 @@
+import json
+
+from tests.utils import FakeSession
+
+from owslib.ogcapi import GeoJSONFeatureParser
+from owslib.ogcapi.features import Features
+
+SERVICE_URL = 'http://example.org/ogcapi'
+ITEMS_URL = SERVICE_URL + '/collections/lakes/items'
+FEATURES = [{'type': 'Feature', 'id': i} for i in range(25)]
+
+
+class ItemsSession(FakeSession):
+    """Serve FEATURES in pages, with rel=next links when links is True and at most max_limit features
+    per page when given, streamed in pieces of 7 bytes"""
+    def __init__(self, links=True, max_limit=None):
+        super(ItemsSession, self).__init__(content_type='application/geo+json', chunk_size=7)
+        self.links = links
+        self.max_limit = max_limit
+
+    def describe(self, method, url, params=None, **kwargs):
+        return url, params
+
+    def respond(self, method, url, params=None, **kwargs):
+        if '?' in url:  # next link
+            params = dict(p.split('=') for p in url.split('?')[1].split('&'))
+        startindex = int(params.get('startindex', 0))
+        limit = min(int(params['limit']), self.max_limit or len(FEATURES))
+        body = {
+            'type': 'FeatureCollection',
+            'features': FEATURES[startindex:startindex + limit],
+            'numberMatched': len(FEATURES),
+            'links': []
+        }
+        if self.links and startindex + limit < len(FEATURES):
+            body['links'].append({'rel': 'next', 'type': 'application/geo+json',
+                                  'href': '%s?startindex=%d&limit=%d' % (ITEMS_URL, startindex + limit, limit)})
+        return json.dumps(body).encode()
+
+
+def get_features(session):
+    return Features(SERVICE_URL, json_='{"links": []}', session=session)
+
+
+def test_ogcapi_features_iter_next_links():
+    session = ItemsSession()
+    features = list(get_features(session).iter_collection_items('lakes', limit=10))
+    assert features == FEATURES
+    assert session.calls[0] == (ITEMS_URL, {'limit': 10})
+    assert [url for url, params in session.calls[1:]] == [
+        ITEMS_URL + '?startindex=10&limit=10', ITEMS_URL + '?startindex=20&limit=10']
+
+
+def test_ogcapi_features_iter_startindex():
+    session = ItemsSession(links=False)
+    features = list(get_features(session).iter_collection_items('lakes', limit=10, prefetch=False))
+    assert features == FEATURES
+    assert [params for url, params in session.calls] == [
+        {'limit': 10}, {'limit': 10, 'startindex': 10}, {'limit': 10, 'startindex': 20}]
+
+
+def test_ogcapi_features_iter_clamped_limit():
+    session = ItemsSession(links=False, max_limit=4)
+    features = list(get_features(session).iter_collection_items('lakes', limit=10, prefetch=False))
+    assert features == FEATURES
+    assert [params.get('startindex', 0) for url, params in session.calls] == [0, 4, 8, 12, 16, 20, 24]
+
+
+def test_ogcapi_features_iter_max_features():
+    session = ItemsSession()
+    features = list(get_features(session).iter_collection_items('lakes', limit=10, max_features=15))
+    assert features == FEATURES[:15]
+    assert len(session.calls) == 2
+
+
+def test_ogcapi_features_iter_stream():
+    session = ItemsSession()
+    features = list(get_features(session).iter_collection_items('lakes', limit=10, stream=True))
+    assert features == FEATURES
+    assert len(session.calls) == 3
+
+
+def test_ogcapi_features_items_stream():
+    session = ItemsSession()
+    items = get_features(session).collection_items_stream('lakes', limit=30)
+    assert list(items) == FEATURES
+    assert items.metadata == {'type': 'FeatureCollection', 'features': [], 'numberMatched': 25, 'links': []}
+    assert items.response.closed
+
+
+def test_geojson_feature_parser():
+    collection = json.dumps({'features': [{'id': 1, 'properties': {'name': '"}]'}}, {'id': 2}],
+                             'type': 'FeatureCollection'}).encode()
+    parser = GeoJSONFeatureParser()
+    features = []
+    for i in range(len(collection)):
+        features.extend(parser.feed(collection[i:i + 1]))
+    assert features == [{'id': 1, 'properties': {'name': '"}]'}}, {'id': 2}]
+    assert parser.close() == {'features': [], 'type': 'FeatureCollection'}
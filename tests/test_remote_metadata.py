@@ -1,3 +1,5 @@
+from io import BytesIO
+
 import pytest
 
 import owslib
@@ -206,13 +208,11 @@ def mp_wms_130_nometadata(monkeypatch):
 
 @pytest.fixture
 def mp_remote_md(monkeypatch):
-    def openURL(*args, **kwargs):
-        with open('tests/resources/csw_dov_getrecordbyid.xml', 'r') as f:
-            data = f.read()
-            if type(data) is not bytes:
-                data = data.encode('utf-8')
-            data = etree.fromstring(data)
-        return data
+    def openURL(url, *args, **kwargs):
+        if 'GetRecordById' not in url:  # the HTML page of the record
+            return BytesIO(b'<!DOCTYPE html><html><body><p>Metadata</body></html>')
+        with open('tests/resources/csw_dov_getrecordbyid.xml', 'rb') as f:
+            return BytesIO(f.read())
 
     monkeypatch.setattr(owslib.util, 'openURL', openURL)
 
@@ -670,7 +670,7 @@ class TestOffline(object):
         assert type(mdrecords) is list
         assert len(mdrecords) == 0
 
-    def test_wms_130_remotemd_parse_all(self, mp_wms_130):
+    def test_wms_130_remotemd_parse_all(self, mp_wms_130, mp_remote_md):
         """Test the remote metadata parsing for WMS 1.3.0.
 
         Tests parsing the remote metadata for all layers.
@@ -682,6 +682,8 @@ class TestOffline(object):
         ----------
         mp_wms_130 : pytest.fixture
             Monkeypatch the call to the remote GetCapabilities request.
+        mp_remote_md : pytest.fixture
+            Monkeypatch the call to the remote metadata.
 
         """
         wms = WebMapService(url='http://localhost/not_applicable',
@@ -697,7 +699,7 @@ class TestOffline(object):
         for m in mdrecords:
             assert type(m) is owslib.iso.MD_Metadata
 
-    def test_wms_130_remotemd_parse_single(self, mp_wms_130):
+    def test_wms_130_remotemd_parse_single(self, mp_wms_130, mp_remote_md):
         """Test the remote metadata parsing for WMS 1.3.0.
 
         Tests parsing the remote metadata for a single layer.
@@ -709,6 +711,8 @@ class TestOffline(object):
         ----------
         mp_wms_130 : pytest.fixture
             Monkeypatch the call to the remote GetCapabilities request.
+        mp_remote_md : pytest.fixture
+            Monkeypatch the call to the remote metadata.
 
         """
         wms = WebMapService(url='http://localhost/not_applicable',
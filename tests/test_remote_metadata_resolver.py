@@ -0,0 +1,70 @@
+from tests.utils import FakeSession, resource_file
+
+from owslib.iso import MD_Metadata
+from owslib.wms import WebMapService
+from owslib.util import ServiceException, resolve_remote_metadata
+
+LAYER = """<Layer queryable="0">
+  <Name>%s</Name>
+  <Title>%s</Title>
+  <MetadataURL type="ISO19115:2003">
+    <Format>text/xml</Format>
+    <OnlineResource xlink:type="simple" xlink:href="%s"/>
+  </MetadataURL>
+</Layer>"""
+
+CAPABILITIES = """<WMS_Capabilities version="1.3.0" xmlns="http://www.opengis.net/wms"
+    xmlns:xlink="http://www.w3.org/1999/xlink">
+  <Service><Name>WMS</Name><Title>Test</Title></Service>
+  <Capability>
+    <Request/>
+    <Layer>
+      <Title>Root</Title>
+      %s
+    </Layer>
+  </Capability>
+</WMS_Capabilities>""" % '\n'.join([
+    LAYER % ('a', 'A', 'http://example.org/md/shared.xml'),
+    LAYER % ('b', 'B', 'http://example.org/md/shared.xml'),
+    LAYER % ('c', 'C', 'http://example.org/md/other.xml'),
+    LAYER % ('d', 'D', 'http://example.org/md/missing.xml')])
+
+
+class MetadataSession(FakeSession):
+    """Serve a metadata record for every URL but missing.xml"""
+    def describe(self, method, url, timeout=None, **kwargs):
+        return url, timeout
+
+    def respond(self, method, url, **kwargs):
+        if url.endswith('missing.xml'):
+            raise ServiceException('not found')
+        with open(resource_file('csw_dov_getrecordbyid.xml'), 'rb') as f:
+            return f.read()
+
+
+def test_wms_resolve_remote_metadata():
+    session = MetadataSession()
+    wms = WebMapService('http://example.org/wms', version='1.3.0', xml=CAPABILITIES.encode(),
+                        parse_remote_metadata=True, timeout=5, session=session)
+
+    # each URL is fetched once, with the service timeout
+    assert sorted(session.calls) == [('http://example.org/md/missing.xml', 5),
+                                     ('http://example.org/md/other.xml', 5),
+                                     ('http://example.org/md/shared.xml', 5)]
+    shared = wms['a'].get_metadata()
+    assert len(shared) == 1 and isinstance(shared[0], MD_Metadata)
+    assert wms['b'].get_metadata()[0] is shared[0]
+    assert wms['c'].get_metadata()[0] is not shared[0]
+    assert wms['d'].get_metadata() == []
+    assert wms['d'].metadataUrls[0]['metadata'] is None
+
+
+def test_resolve_remote_metadata_workers():
+    session = MetadataSession()
+    wms = WebMapService('http://example.org/wms', version='1.3.0', xml=CAPABILITIES.encode(), session=session)
+    assert session.calls == []
+
+    resolve_remote_metadata([wms['b'], wms['c']], max_workers=1, session=session)
+    assert len(session.calls) == 2
+    assert wms['b'].get_metadata()[0] is not wms['c'].get_metadata()[0]
+    assert wms['a'].get_metadata() == []
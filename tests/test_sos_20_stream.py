@@ -0,0 +1,72 @@
+from io import BytesIO
+
+import pytest
+
+from tests.utils import FakeSession, resource_file
+
+from owslib import ows
+from owslib.etree import etree
+from owslib.sos import SensorObservationService
+from owslib.swe.observation.sos200 import SOSGetObservationResponse, iter_observations
+from owslib.swe.observation.waterml2 import MeasurementTimeseriesObservation
+
+EXCEPTION_REPORT = b"""<ows:ExceptionReport xmlns:ows="http://www.opengis.net/ows/1.1" version="2.0.0">
+  <ows:Exception exceptionCode="InvalidParameterValue" locator="offering">
+    <ows:ExceptionText>Unknown offering</ows:ExceptionText>
+  </ows:Exception>
+</ows:ExceptionReport>"""
+
+
+@pytest.fixture
+def session():
+    with open(resource_file('sos_52n_get_observation_ioos_wml2.xml'), 'rb') as f:
+        return FakeSession(f.read())
+
+
+@pytest.mark.parametrize('filename', ['sos_52n_get_observation_ioos.xml', 'sos_52n_get_observation_ioos_wml2.xml'])
+def test_iter_observations(filename):
+    with open(resource_file(filename), 'rb') as f:
+        xml = f.read()
+    expected = SOSGetObservationResponse(etree.fromstring(xml)).observations
+    observations = list(iter_observations(BytesIO(xml)))
+    assert len(observations) == len(expected) == 21
+    for observation, other in zip(observations, expected):
+        assert type(observation) is type(other)
+        assert observation.procedure == other.procedure
+        assert observation.resultTime == other.resultTime
+        assert result_values(observation) == result_values(other)
+
+
+def result_values(observation):
+    result = observation.get_result()
+    if isinstance(observation, MeasurementTimeseriesObservation):
+        return result.columns()
+    return result.value, result.uom
+
+
+def test_iter_observations_bounded():
+    with open(resource_file('sos_52n_get_observation_ioos_wml2.xml'), 'rb') as f:
+        observations = iter_observations(f.read())
+        first = next(observations)
+        # the points of decoded observations remain available
+        assert len(first.get_result()) > 0
+        rest = list(observations)
+    assert len(rest) == 20
+
+
+def test_iter_observations_exception():
+    with pytest.raises(ows.ExceptionReport):
+        list(iter_observations(EXCEPTION_REPORT))
+
+
+def test_get_observation_stream(session):
+    with open(resource_file('sos_52n_getcapabilities.xml'), 'rb') as f:
+        service = SensorObservationService('http://sos.glos.us/52n/sos/kvp', version='2.0.0', xml=f.read(),
+                                           session=session)
+    observations = service.get_observation(offerings=['urn:ioos:station:test:8'],
+                                           observedProperties=['sea_water_temperature'], stream=True)
+    assert session.calls[0]['stream'] is True
+    assert session.calls[0]['params']['offering'] == 'urn:ioos:station:test:8'
+    observations = list(observations)
+    assert len(observations) == 21
+    assert all(isinstance(o, MeasurementTimeseriesObservation) for o in observations)
@@ -1,17 +1,56 @@
 from tests.utils import scratch_file
 from tests.utils import service_ok
+from tests.utils import FakeResponse, FakeSession
 
 import pytest
 
+from owslib.tms import TileMapService
+
 SERVICE_URL = 'http://geodata.nationaalgeoregister.nl/tiles/service/tms/1.0.0'
 
+CAPABILITIES = b"""<TileMapService version="1.0.0">
+  <Title>Test</Title>
+  <TileMaps>
+    <TileMap title="base" srs="EPSG:28992" profile="none" href="http://example.org/tms/1.0.0/base"/>
+  </TileMaps>
+</TileMapService>"""
+
+TILEMAP = b"""<TileMap version="1.0.0">
+  <Title>base</Title>
+  <SRS>EPSG:28992</SRS>
+  <BoundingBox minx="0" miny="0" maxx="1000" maxy="1000"/>
+  <Origin x="0" y="0"/>
+  <TileFormat width="256" height="256" mime-type="image/png" extension="png"/>
+  <TileSets profile="none">
+    <TileSet href="http://example.org/tms/1.0.0/base/4" units-per-pixel="1" order="4"/>
+  </TileSets>
+</TileMap>"""
+
+
+class TileMapSession(FakeSession):
+    """Serve the capabilities, tile map and tiles of a TMS"""
+    def describe(self, method, url, **kwargs):
+        return url
+
+    def respond(self, method, url, **kwargs):
+        if url.endswith('.png'):
+            return FakeResponse(url, b'tile', headers={'Content-Type': 'image/png'})
+        return TILEMAP if url.endswith('/base') else CAPABILITIES
+
+
+def test_tms_session():
+    session = TileMapSession()
+    tms = TileMapService('http://example.org/tms/1.0.0', session=session)
+    assert tms.gettile(7, 7, 4, title='base', srs='EPSG:28992').read() == b'tile'
+    assert session.calls == ['http://example.org/tms/1.0.0', 'http://example.org/tms/1.0.0/base',
+                             'http://example.org/tms/1.0.0/base/4/7/7.png']
+
 
 @pytest.mark.online
 @pytest.mark.skipif(not service_ok(SERVICE_URL),
                     reason="TMS service is unreachable")
 def test_tms():
     # Find out what a TMS has to offer. Service metadata:
-    from owslib.tms import TileMapService
     tms = TileMapService(SERVICE_URL)
 
     # Fetch a tile (using some defaults):
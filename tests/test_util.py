@@ -1,6 +1,13 @@
 # -*- coding: UTF-8 -*-
 import codecs
-from owslib.util import clean_ows_url, build_get_url, strip_bom
+import urllib.request
+
+import requests
+
+from tests.utils import FakeSession
+
+from owslib.util import (clean_ows_url, build_get_url, strip_bom, create_session, get_session, set_session,
+                         openURL, http_get, nspath, nspath_eval)
 
 
 def test_strip_bom():
@@ -44,3 +51,64 @@ def test_build_get_url_overwrite():
     # Use overwrite flag
     assert build_get_url("http://example.org/ows?SERVICE=WPS", {'SERVICE': 'WMS'}, overwrite=True) == \
         'http://example.org/ows?SERVICE=WMS'
+
+
+def test_create_session():
+    session = create_session(pool_maxsize=4, max_retries=2)
+    adapter = session.get_adapter('https://example.org/wms')
+    assert isinstance(session, requests.Session)
+    assert adapter._pool_maxsize == 4
+    assert adapter.max_retries.total == 2
+    assert 503 in adapter.max_retries.status_forcelist
+
+
+def test_get_session_shared():
+    set_session(None)
+    assert get_session() is get_session()
+    custom = FakeSession()
+    assert get_session(custom) is custom
+    set_session(custom)
+    try:
+        assert get_session() is custom
+    finally:
+        set_session(None)
+
+
+def test_get_session_rejects_cookies():
+    set_session(None)
+    cookies = get_session().cookies
+    cookies.set_cookie_if_ok(requests.cookies.create_cookie('session', 'a', domain='example.org'),
+                             urllib.request.Request('http://example.org/wms'))
+    assert len(cookies) == 0
+    # sessions created for a service keep them
+    cookies = create_session().cookies
+    cookies.set_cookie_if_ok(requests.cookies.create_cookie('session', 'a', domain='example.org'),
+                             urllib.request.Request('http://example.org/wms'))
+    assert len(cookies) == 1
+
+
+def test_session_injection():
+    session = FakeSession(b'<city>Toronto</city>', content_type='image/png')
+    u = openURL('http://example.org/wms', 'service=WMS', session=session)
+    assert u.read() == b'<city>Toronto</city>'
+    assert (session.calls[0]['method'], session.calls[0]['url']) == ('GET', 'http://example.org/wms')
+    assert session.calls[0]['params'] == 'service=WMS'
+
+    http_get('http://example.org/collections', session=session)
+    assert (session.calls[1]['method'], session.calls[1]['url']) == ('GET', 'http://example.org/collections')
+    assert 'session' not in session.calls[1]
+
+
+def test_nspath_eval():
+    namespaces = {'gmd': 'http://www.isotc211.org/2005/gmd', 'gco': 'http://www.isotc211.org/2005/gco'}
+    expected = '{http://www.isotc211.org/2005/gmd}fileIdentifier/{http://www.isotc211.org/2005/gco}CharacterString'
+    assert nspath_eval('gmd:fileIdentifier/gco:CharacterString', namespaces) == expected
+    assert nspath_eval('gmd:fileIdentifier/gco:CharacterString', namespaces) == expected
+    other = {'gmd': 'http://www.isotc211.org/2005/gmd', 'gco': 'http://example.org/gco'}
+    assert nspath_eval('gmd:fileIdentifier/gco:CharacterString', other) == \
+        '{http://www.isotc211.org/2005/gmd}fileIdentifier/{http://example.org/gco}CharacterString'
+    # expanded paths follow changes of the namespace map
+    assert nspath_eval('gco:CharacterString', other) == '{http://example.org/gco}CharacterString'
+    other['gco'] = 'http://example.org/gco/2'
+    assert nspath_eval('gco:CharacterString', other) == '{http://example.org/gco/2}CharacterString'
+    assert nspath('Layer/*', 'http://www.opengis.net/wms') == '{http://www.opengis.net/wms}Layer/*'
@@ -0,0 +1,70 @@
+from datetime import datetime
+
+import pytest
+
+from tests.utils import resource_file
+
+from owslib.etree import etree
+from owslib.waterml.wml import Values
+from owslib.waterml.wml11 import WaterML_1_1 as wml
+
+VALUES = """<values xmlns="http://www.cuahsi.org/waterML/1.1/">
+  <value censorCode="nc" dateTime="2005-08-05T00:00:00-07:00" dateTimeUTC="2005-08-05T07:00:00" methodID="1"
+      sourceID="3" qualityControlLevel="0">12.5</value>
+  <value censorCode="lt" dateTime="2005-08-05T00:30:00-07:00" dateTimeUTC="2005-08-05T07:30:00" methodID="2"
+      sourceID="3" qualityControlLevel="1">0.1</value>
+  <value censorCode="nc" dateTime="2005-08-05T01:00:00-07:00" dateTimeUTC="2005-08-05T08:00:00" methodID="1"
+      sourceID="3" qualityControlLevel="1"></value>
+</values>"""
+
+
+def get_values():
+    return Values(etree.fromstring(VALUES), 'wml1.1')
+
+
+def test_values_columns():
+    values = get_values()
+    assert len(values) == 3
+    assert values.columns['value'] == ['12.5', '0.1', None]
+    assert values.columns['method_id'] == ['1', '2', '1']
+    assert values.columns['censor_code'] == ['nc', 'lt', 'nc']
+    assert values.columns['date_time_utc'][1] == datetime(2005, 8, 5, 7, 30)
+    assert values.columns['date_time'][0].utcoffset().total_seconds() == -7 * 3600
+    # the Value objects are only built when asked for
+    assert values._values is None
+    assert [v.value for v in values] == values.columns['value']
+    assert values.values[1].date_time == values.columns['date_time'][1]
+
+
+def test_values_mask():
+    values = get_values()
+    assert values.mask(method_id='1') == [True, False, True]
+    assert values.mask(method_id='1', quality_level='1') == [False, False, True]
+    assert values.select(values.mask(censor_code='lt'))['value'] == ['0.1']
+    assert values.get_date_values(quality_level='1', utc=True) == [
+        (datetime(2005, 8, 5, 7, 30), '0.1'), (datetime(2005, 8, 5, 8, 0), None)]
+
+
+def test_values_get_date_values_resource():
+    with open(resource_file('cuahsi_example_get_values.xml'), 'rb') as f:
+        series = wml(f.read()).response
+    values = series.get_series_by_variable(var_code='USU4')[0].values[0]
+    assert values.get_date_values()[0] == (datetime(2005, 8, 5, 0, 0), '34.53')
+    assert values.get_date_values() == [(v.date_time, v.value) for v in values.values]
+
+
+def test_values_to_numpy():
+    np = pytest.importorskip('numpy')
+    array = get_values().to_numpy(mask=[True, False, True])
+    assert array['date_time_utc'].tolist() == [datetime(2005, 8, 5, 7, 0), datetime(2005, 8, 5, 8, 0)]
+    assert array['date_time'][0] == np.datetime64('2005-08-05T00:00:00')
+    assert array['value'][0] == 12.5
+    assert np.isnan(array['value'][1])
+    assert list(array['method_id']) == ['1', '1']
+
+
+def test_values_to_dataframe():
+    pytest.importorskip('pandas')
+    frame = get_values().to_dataframe()
+    assert list(frame.columns)[:3] == ['date_time', 'date_time_utc', 'value']
+    assert frame['value'].iloc[1] == 0.1
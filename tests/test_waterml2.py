@@ -0,0 +1,85 @@
+from datetime import datetime
+
+import pytest
+
+from tests.utils import resource_file
+
+from owslib.etree import etree
+from owslib.swe.observation.waterml2 import MeasurementTimeseries, TimeValuePair, namespaces, parse_time
+from owslib.util import nspath_eval
+
+TIMESERIES = """<wml2:MeasurementTimeseries xmlns:wml2="http://www.opengis.net/waterml/2.0"
+    xmlns:xlink="http://www.w3.org/1999/xlink">
+  <wml2:defaultPointMetadata>
+    <wml2:DefaultTVPMeasurementMetadata>
+      <wml2:uom code="m3/s"/>
+      <wml2:quality xlink:href="http://example.org/quality/good"/>
+    </wml2:DefaultTVPMeasurementMetadata>
+  </wml2:defaultPointMetadata>
+  <wml2:point>
+    <wml2:MeasurementTVP>
+      <wml2:time>2014-07-01T00:00:00+02:00</wml2:time>
+      <wml2:value>1.5</wml2:value>
+    </wml2:MeasurementTVP>
+  </wml2:point>
+  <wml2:point>
+    <wml2:MeasurementTVP>
+      <wml2:time>2014-07-01T00:15:00Z</wml2:time>
+      <wml2:value/>
+      <wml2:metadata>
+        <wml2:TVPMeasurementMetadata>
+          <wml2:quality xlink:href="http://example.org/quality/missing"/>
+        </wml2:TVPMeasurementMetadata>
+      </wml2:metadata>
+    </wml2:MeasurementTVP>
+  </wml2:point>
+</wml2:MeasurementTimeseries>"""
+
+
+def get_timeseries():
+    with open(resource_file('sos_52n_getobservation_wml2_response.xml'), 'rb') as f:
+        tree = etree.fromstring(f.read())
+    return MeasurementTimeseries(tree.find('.//' + nspath_eval('wml2:MeasurementTimeseries', namespaces)))
+
+
+def test_measurement_timeseries_points():
+    timeseries = get_timeseries()
+    assert timeseries._points is None
+    assert len(timeseries) == 6
+    assert [str(point) for point in timeseries][0] == '2014-07-01 00:01:42+00:00,12.2'
+    assert timeseries._points is None  # iterating does not keep the points
+    assert isinstance(timeseries.points[0], TimeValuePair)
+    assert timeseries.points[0].value == 12.2
+
+
+def test_measurement_timeseries_columns():
+    timeseries = MeasurementTimeseries(etree.fromstring(TIMESERIES))
+    assert timeseries.columns() == (
+        ['2014-07-01T00:00:00+02:00', '2014-07-01T00:15:00Z'],
+        ['1.5', None],
+        ['http://example.org/quality/good', 'http://example.org/quality/missing'])
+
+    timeseries.points = timeseries.points[:1]
+    timeseries.points[0].value = 2.5
+    assert timeseries.columns() == (
+        ['2014-07-01T00:00:00+02:00'], ['2.5'], ['http://example.org/quality/good'])
+    assert len(timeseries) == 1
+
+    assert parse_time('2014-07-01T00:00:00+02:00') == datetime(2014, 6, 30, 22, 0)
+    assert parse_time('2014-07-01T00:15:00.000Z') == datetime(2014, 7, 1, 0, 15)
+
+
+def test_measurement_timeseries_to_arrays():
+    np = pytest.importorskip('numpy')
+
+    arrays = get_timeseries().to_arrays()
+    assert arrays.time.dtype == np.dtype('datetime64[ms]')
+    assert arrays.time[0] == np.datetime64('2014-07-01T00:01:42')
+    assert arrays.value.dtype == np.float64
+    assert arrays.value[0] == 12.2
+    assert len(arrays.quality) == len(arrays.value) == 6
+
+    arrays = MeasurementTimeseries(etree.fromstring(TIMESERIES)).to_arrays()
+    assert list(arrays.time) == [np.datetime64('2014-06-30T22:00:00'), np.datetime64('2014-07-01T00:15:00')]
+    assert arrays.value[0] == 1.5 and np.isnan(arrays.value[1])
+    assert list(arrays.quality) == ['http://example.org/quality/good', 'http://example.org/quality/missing']
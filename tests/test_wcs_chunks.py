@@ -0,0 +1,130 @@
+import json
+import mimetypes
+import os
+from urllib.parse import unquote
+
+import pytest
+
+from tests.utils import FakeSession
+
+from owslib.coverage.tiling import split_subsets
+from owslib.coverage.wcsBase import DescribeCoverageCache
+from owslib.etree import etree
+from owslib.util import ServiceException
+from owslib.wcs import WebCoverageService
+
+SERVICE_URL = 'http://example.org/wcs'
+TIFF = mimetypes.guess_extension('image/tiff')
+
+CAPABILITIES = """<wcs:Capabilities xmlns:wcs="http://www.opengis.net/wcs/2.0"
+    xmlns:ows="http://www.opengis.net/ows/2.0" xmlns:xlink="http://www.w3.org/1999/xlink" version="2.0.1">
+  <ows:ServiceIdentification><ows:Title>Test</ows:Title></ows:ServiceIdentification>
+  <ows:ServiceProvider><ows:ProviderName>Test</ows:ProviderName></ows:ServiceProvider>
+  <ows:OperationsMetadata>
+    <ows:Operation name="GetCoverage">
+      <ows:DCP><ows:HTTP><ows:Get xlink:href="http://example.org/wcs"/></ows:HTTP></ows:DCP>
+    </ows:Operation>
+  </ows:OperationsMetadata>
+  <wcs:Contents>
+    <wcs:CoverageSummary><wcs:CoverageId>dem</wcs:CoverageId></wcs:CoverageSummary>
+  </wcs:Contents>
+</wcs:Capabilities>"""
+
+DESCRIBE_COVERAGE = """<wcs:CoverageDescriptions xmlns:wcs="http://www.opengis.net/wcs/2.0"
+    xmlns:gml="http://www.opengis.net/gml/3.2">
+  <wcs:CoverageDescription gml:id="dem">
+    <gml:domainSet>
+      <gml:RectifiedGrid dimension="2" gml:id="grid">
+        <gml:limits><gml:GridEnvelope><gml:low>0 0</gml:low><gml:high>99 199</gml:high></gml:GridEnvelope></gml:limits>
+        <gml:axisLabels>Lat Long</gml:axisLabels>
+        <gml:origin><gml:Point gml:id="origin"><gml:pos>59.995 0.005</gml:pos></gml:Point></gml:origin>
+        <gml:offsetVector>-0.01 0</gml:offsetVector>
+        <gml:offsetVector>0 0.01</gml:offsetVector>
+      </gml:RectifiedGrid>
+    </gml:domainSet>
+  </wcs:CoverageDescription>
+</wcs:CoverageDescriptions>"""
+
+
+class CoverageSession(FakeSession):
+    """Answer GetCoverage requests with their subsets, failing those listed in fail"""
+    def __init__(self, fail=()):
+        super(CoverageSession, self).__init__(content_type='image/tiff')
+        self.fail = fail
+
+    def describe(self, method, url, params=None, **kwargs):
+        return sorted(unquote(p.split('=', 1)[1]) for p in params.split('&') if p.lower().startswith('subset='))
+
+    def respond(self, method, url, params=None, **kwargs):
+        subsets = self.describe(method, url, params)
+        if any(subset in self.fail for subset in subsets):
+            content = b'<ows:ExceptionReport xmlns:ows="http://www.opengis.net/ows/2.0"><ows:Exception ' \
+                      b'exceptionCode="NoApplicableCode"><ows:ExceptionText>failed</ows:ExceptionText>' \
+                      b'</ows:Exception></ows:ExceptionReport>'
+        else:
+            content = ' '.join(subsets).encode()
+        return content
+
+
+def get_wcs(session):
+    wcs = WebCoverageService(SERVICE_URL, version='2.0.1', xml=CAPABILITIES, session=session)
+    key = DescribeCoverageCache.key(SERVICE_URL, '2.0.1', 'dem')
+    wcs.describe_coverage_cache.put(key, etree.fromstring(DESCRIBE_COVERAGE))
+    return wcs
+
+
+def test_split_subsets():
+    grid = get_wcs(None).contents['dem'].grid
+    chunks = split_subsets([('Lat', 59.5, 60), ('Long', 0, 1), ('time', '2020-01-01')], {'Long': 40}, grid)
+    assert chunks == [
+        ((0,), [('Lat', 59.5, 60), ('Long', 0.0, 0.4), ('time', '2020-01-01')]),
+        ((1,), [('Lat', 59.5, 60), ('Long', 0.4, 0.8), ('time', '2020-01-01')]),
+        ((2,), [('Lat', 59.5, 60), ('Long', 0.8, 1.0), ('time', '2020-01-01')])]
+
+    # the boundaries lie halfway between grid points, whatever the subsets
+    chunks = split_subsets([('Lat', 59.5, 60), ('Long', 0.003, 0.5)], {'Lat': 20, 'Long': 30}, grid)
+    assert len(chunks) == 6
+    assert [index for index, subsets in chunks] == [(0, 0), (0, 1), (1, 0), (1, 1), (2, 0), (2, 1)]
+    assert [subsets[1] for index, subsets in chunks[:2]] == [('Long', 0.003, 0.3), ('Long', 0.3, 0.5)]
+    assert [round(subsets[0][2], 6) for index, subsets in chunks[::2]] == [59.7, 59.9, 60]
+
+    with pytest.raises(ValueError):
+        split_subsets([('Lat', 59.5)], {'Lat': 10}, grid)
+    with pytest.raises(ValueError):
+        split_subsets([('time', '2020-01-01', '2020-02-01')], {'time': 10}, grid)
+
+
+def test_wcs_getcoverage_chunks(tmpdir):
+    session = CoverageSession()
+    wcs = get_wcs(session)
+    directory = str(tmpdir.join('dem'))
+    chunks = wcs.getCoverageChunks('dem', directory, subsets=[('Lat', 59.5, 60), ('Long', 0, 1)],
+                                   chunk_sizes={'Long': 40}, format='image/tiff', max_workers=2)
+    assert chunks.complete
+    assert len(chunks) == 3 and len(session.calls) == 3
+    assert [chunk['index'] for chunk in chunks] == [[0], [1], [2]]
+    with open(list(chunks)[1]['path'], 'rb') as f:
+        assert f.read() == b'Lat(59.5,60) Long(0.4,0.8)'
+    assert sorted(os.listdir(directory)) == ['chunk_0' + TIFF, 'chunk_1' + TIFF, 'chunk_2' + TIFF, 'manifest.json']
+    with open(os.path.join(directory, 'manifest.json')) as f:
+        assert json.load(f)['chunks'][2]['size'] == 26
+
+
+def test_wcs_getcoverage_chunks_resume(tmpdir):
+    directory = str(tmpdir.join('dem'))
+    request = dict(subsets=[('Lat', 59.5, 60), ('Long', 0, 1)], chunk_sizes={'Long': 40}, format='image/tiff')
+
+    session = CoverageSession(fail=['Long(0.8,1.0)'])
+    with pytest.raises(ServiceException):
+        get_wcs(session).getCoverageChunks('dem', directory, max_workers=1, **request)
+    assert sorted(os.listdir(directory)) == ['chunk_0' + TIFF, 'chunk_1' + TIFF, 'manifest.json']
+
+    session = CoverageSession()
+    chunks = get_wcs(session).getCoverageChunks('dem', directory, **request)
+    assert chunks.complete
+    assert session.calls == [['Lat(59.5,60)', 'Long(0.8,1.0)']]
+
+    # another request cannot reuse the directory
+    with pytest.raises(ValueError):
+        get_wcs(session).getCoverageChunks('dem', directory, subsets=[('Lat', 59, 60), ('Long', 0, 1)],
+                                           chunk_sizes={'Long': 40}, format='image/tiff')
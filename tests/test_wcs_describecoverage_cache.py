@@ -0,0 +1,98 @@
+from urllib.parse import parse_qsl
+
+from tests.utils import FakeSession
+
+from owslib.coverage.wcsBase import DescribeCoverageCache
+from owslib.wcs import WebCoverageService
+
+SERVICE_URL = 'http://example.org/wcs'
+COVERAGES = ['cov%d' % i for i in range(5)]
+
+CAPABILITIES = """<wcs:Capabilities xmlns:wcs="http://www.opengis.net/wcs/2.0"
+    xmlns:ows="http://www.opengis.net/ows/2.0" version="2.0.1">
+  <ows:ServiceIdentification><ows:Title>Test</ows:Title></ows:ServiceIdentification>
+  <ows:ServiceProvider><ows:ProviderName>Test</ows:ProviderName></ows:ServiceProvider>
+  <ows:OperationsMetadata/>
+  <wcs:Contents>%s</wcs:Contents>
+</wcs:Capabilities>""" % ''.join(
+    '<wcs:CoverageSummary><wcs:CoverageId>%s</wcs:CoverageId></wcs:CoverageSummary>' % c for c in COVERAGES)
+
+DESCRIPTION = """<wcs:CoverageDescription xmlns:gml="http://www.opengis.net/gml/3.2" gml:id="%s">
+    <wcs:CoverageId>%s</wcs:CoverageId>
+    <gml:domainSet>
+      <gml:RectifiedGrid dimension="2" gml:id="grid">
+        <gml:limits><gml:GridEnvelope><gml:low>0 0</gml:low><gml:high>9 9</gml:high></gml:GridEnvelope></gml:limits>
+        <gml:axisLabels>Lat Long</gml:axisLabels>
+        <gml:origin><gml:Point gml:id="origin"><gml:pos>%d 0</gml:pos></gml:Point></gml:origin>
+        <gml:offsetVector>-1 0</gml:offsetVector>
+        <gml:offsetVector>0 1</gml:offsetVector>
+      </gml:RectifiedGrid>
+    </gml:domainSet>
+  </wcs:CoverageDescription>"""
+
+
+class DescribeSession(FakeSession):
+    """Describe the requested coverages, at most limit of them per response"""
+    def __init__(self, limit=None):
+        super(DescribeSession, self).__init__()
+        self.limit = limit
+
+    def describe(self, method, url, **kwargs):
+        return dict(parse_qsl(url.split('?')[1]))['CoverageID'].split(',')
+
+    def respond(self, method, url, **kwargs):
+        content = '<wcs:CoverageDescriptions xmlns:wcs="http://www.opengis.net/wcs/2.0">%s' \
+                  '</wcs:CoverageDescriptions>' % ''.join(
+                      DESCRIPTION % (i, i, COVERAGES.index(i)) for i in self.describe(method, url)[:self.limit])
+        return content.encode()
+
+
+def get_wcs(session, cache=None):
+    return WebCoverageService(SERVICE_URL, version='2.0.1', xml=CAPABILITIES, session=session,
+                              describe_coverage_cache=cache)
+
+
+def test_wcs_prefetch_describecoverage():
+    session = DescribeSession()
+    wcs = get_wcs(session)
+    assert wcs.prefetchDescribeCoverage(batch_size=2) == 3
+    assert sorted(session.calls) == [['cov0', 'cov1'], ['cov2', 'cov3'], ['cov4']]
+    assert [wcs.contents[c].grid.origin for c in COVERAGES] == [[str(i), '0'] for i in range(5)]
+    assert len(session.calls) == 3
+    assert wcs.prefetchDescribeCoverage() == 0
+
+
+def test_wcs_prefetch_describecoverage_fallback():
+    session = DescribeSession(limit=1)
+    wcs = get_wcs(session)
+    assert wcs.prefetchDescribeCoverage(batch_size=5) == 5
+    assert session.calls[0] == COVERAGES
+    assert sorted(session.calls[1:]) == [[c] for c in COVERAGES[1:]]
+    assert wcs.contents['cov3'].grid.origin == ['3', '0']
+    assert len(session.calls) == 5
+
+
+def test_describecoverage_cache_lru():
+    session = DescribeSession()
+    cache = DescribeCoverageCache(maxsize=2)
+    wcs = get_wcs(session, cache)
+    for c in ['cov0', 'cov1', 'cov0', 'cov2']:
+        wcs.getDescribeCoverage(c)
+    assert len(cache) == 2
+    assert DescribeCoverageCache.key(SERVICE_URL, '2.0.1', 'cov1') not in cache
+    wcs.getDescribeCoverage('cov0')
+    assert len(session.calls) == 3
+
+    # the cache is shared with another instance of the service
+    get_wcs(session, cache).getDescribeCoverage('cov2')
+    assert len(session.calls) == 3
+
+
+def test_describecoverage_cache_disk(tmpdir):
+    session = DescribeSession()
+    get_wcs(session, DescribeCoverageCache(directory=str(tmpdir))).prefetchDescribeCoverage()
+    assert len(tmpdir.listdir()) == 5
+
+    wcs = get_wcs(session, DescribeCoverageCache(maxsize=1, directory=str(tmpdir)))
+    assert [wcs.contents[c].grid.origin[0] for c in COVERAGES] == ['0', '1', '2', '3', '4']
+    assert len(session.calls) == 1
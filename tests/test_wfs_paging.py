@@ -0,0 +1,86 @@
+from urllib.parse import parse_qsl
+
+import pytest
+
+from tests.utils import FakeSession, resource_file
+
+from owslib.wfs import WebFeatureService
+
+TYPENAME = 'gw_meetnetten:meetnetten'
+NUMBER_MATCHED = 25
+
+
+class FeatureSession(FakeSession):
+    """Answer hits and paged GetFeature requests of a feature type with NUMBER_MATCHED features"""
+    def __init__(self, version, hits=True):
+        super(FeatureSession, self).__init__()
+        self.version = version
+        self.hits = hits
+
+    def describe(self, method, url, params=None, **kwargs):
+        query = dict(parse_qsl(url.split('?')[1] if '?' in url else params))
+        return {key.lower(): value for key, value in query.items()}
+
+    def respond(self, method, url, params=None, **kwargs):
+        query = self.describe(method, url, params)
+        count_attribute = 'numberMatched' if self.version == '2.0.0' else 'numberOfFeatures'
+        if query.get('resulttype') == 'hits':
+            number = str(NUMBER_MATCHED) if self.hits else 'unknown'
+            content = '<FeatureCollection %s="%s"/>' % (count_attribute, number)
+        else:
+            start = int(query.get('startindex', 0))
+            count = int(query.get('count', query.get('maxfeatures')))
+            returned = max(0, min(count, NUMBER_MATCHED - start))
+            content = '<FeatureCollection start="%d" returned="%d">%s</FeatureCollection>' % (
+                start, returned, '<member/>' * returned)
+        return content.encode()
+
+
+def get_wfs(version, session):
+    filename = {
+        '2.0.0': 'wfs_dov_getcapabilities_200_nometadata.xml',
+        '1.1.0': 'wfs_dov_getcapabilities_110_nometadata.xml'
+    }[version]
+    with open(resource_file(filename), 'rb') as f:
+        return WebFeatureService('http://example.org/wfs', version=version, xml=f.read(), session=session)
+
+
+@pytest.mark.parametrize('version', ['2.0.0', '1.1.0'])
+def test_wfs_getfeature_hits(version):
+    session = FeatureSession(version)
+    wfs = get_wfs(version, session)
+    assert wfs.getfeature_hits(typename=TYPENAME, outputFormat='application/json') == NUMBER_MATCHED
+    assert session.calls[0]['resulttype'] == 'hits'
+    assert 'outputformat' not in session.calls[0]
+
+
+def test_wfs_getfeature_hits_url(monkeypatch):
+    session = FeatureSession('2.0.0')
+    wfs = get_wfs('2.0.0', session)
+    monkeypatch.setattr(wfs, '_getfeature_request', lambda **kwargs: ('http://example.org/wfs/hits', None))
+    assert wfs.getfeature_hits(typename=TYPENAME) == NUMBER_MATCHED
+    assert session.calls[0] == {'resulttype': 'hits'}
+
+
+@pytest.mark.parametrize('version', ['2.0.0', '1.1.0'])
+def test_wfs_iter_features(version):
+    session = FeatureSession(version)
+    wfs = get_wfs(version, session)
+    pages = list(wfs.iter_features(typename=TYPENAME, page_size=10, max_workers=2))
+    assert [page.read() for page in pages] == [
+        b'<FeatureCollection start="0" returned="10">' + b'<member/>' * 10 + b'</FeatureCollection>',
+        b'<FeatureCollection start="10" returned="10">' + b'<member/>' * 10 + b'</FeatureCollection>',
+        b'<FeatureCollection start="20" returned="5">' + b'<member/>' * 5 + b'</FeatureCollection>']
+    assert len(session.calls) == 4
+
+
+def test_wfs_getfeature_all_maxfeatures():
+    session = FeatureSession('2.0.0')
+    pages = get_wfs('2.0.0', session).getfeature_all(typename=TYPENAME, page_size=10, maxfeatures=12)
+    assert [page.read().count(b'<member/>') for page in pages] == [10, 2]
+
+
+def test_wfs_iter_features_unknown_hits():
+    session = FeatureSession('2.0.0', hits=False)
+    pages = list(get_wfs('2.0.0', session).iter_features(typename=TYPENAME, page_size=10))
+    assert [page.read().count(b'<member/>') for page in pages] == [10, 10, 5]
@@ -0,0 +1,55 @@
+import pytest
+
+from tests.utils import FakeSession, resource_file
+
+from owslib.util import ServiceException
+from owslib.wfs import WebFeatureService
+
+TYPENAME = 'gw_meetnetten:meetnetten'
+
+FEATURES = b'<?xml version="1.0"?>\n<wfs:FeatureCollection xmlns:wfs="http://www.opengis.net/wfs/2.0">' + \
+    b'<wfs:member/>' * 500 + b'</wfs:FeatureCollection>'
+
+OWS_EXCEPTION = b"""<?xml version="1.0" encoding="UTF-8"?>
+<ows:ExceptionReport xmlns:ows="http://www.opengis.net/ows/1.1" version="2.0.0">
+<ows:Exception exceptionCode="InvalidParameterValue" locator="typename">
+<ows:ExceptionText>Unknown feature type</ows:ExceptionText>
+</ows:Exception>
+</ows:ExceptionReport>"""
+
+OGC_EXCEPTION = b"""<?xml version="1.0" ?>
+<ServiceExceptionReport version="1.2.0" xmlns="http://www.opengis.net/ogc">
+<ServiceException code="InvalidParameterValue">Unknown feature type</ServiceException>
+</ServiceExceptionReport>"""
+
+
+def get_wfs(version, session):
+    filename = {
+        '2.0.0': 'wfs_dov_getcapabilities_200_nometadata.xml',
+        '1.1.0': 'wfs_dov_getcapabilities_110_nometadata.xml'
+    }[version]
+    with open(resource_file(filename), 'rb') as f:
+        return WebFeatureService('http://example.org/wfs', version=version, xml=f.read(), session=session)
+
+
+@pytest.mark.parametrize('version', ['2.0.0', '1.1.0'])
+def test_wfs_getfeature_stream(version):
+    session = FakeSession(FEATURES, chunk_size=100)
+    response = get_wfs(version, session).getfeature(typename=TYPENAME, stream=True)
+    assert session.calls[0]['stream'] is True
+    assert response.read(10) == FEATURES[:10]
+    assert b''.join(response.iter_content(chunk_size=256)) == FEATURES[10:]
+    response.close()
+
+
+def test_wfs_getfeature_stream_read():
+    response = get_wfs('2.0.0', FakeSession(FEATURES, chunk_size=100)).getfeature(typename=TYPENAME, stream=True)
+    assert response.read() == FEATURES
+
+
+@pytest.mark.parametrize('content', [OWS_EXCEPTION, OGC_EXCEPTION])
+def test_wfs_getfeature_stream_exception(content):
+    with pytest.raises(ServiceException) as excinfo:
+        get_wfs('2.0.0', FakeSession(content, chunk_size=100)).getfeature(typename=TYPENAME, stream=True)
+    assert 'Unknown feature type' in str(excinfo.value)
+    assert excinfo.value.code == 'InvalidParameterValue'
@@ -0,0 +1,125 @@
+from io import BytesIO
+from urllib.parse import parse_qsl
+
+import pytest
+
+from tests.utils import FakeSession, resource_file
+
+from owslib.map import tiling
+from owslib.map.tiling import split_getmap, tile_size_limits
+from owslib.wms import WebMapService
+
+Image = pytest.importorskip('PIL.Image')
+
+BBOX = (0, 0, 30, 20)
+SIZE = (300, 200)
+
+
+class MapSession(FakeSession):
+    """Render images whose pixels encode their position: red is x * 10 and green (top - y) * 10,
+    failing the requests of images of the size fail"""
+    def __init__(self, fail=None):
+        super(MapSession, self).__init__(content_type='image/png')
+        self.fail = fail
+
+    def describe(self, method, url, params=None, **kwargs):
+        return dict((k.lower(), v) for k, v in parse_qsl(params))
+
+    def respond(self, method, url, params=None, **kwargs):
+        query = self.describe(method, url, params)
+        if self.fail == (query['width'], query['height']):
+            raise IOError('tile failed')
+        bbox = [float(v) for v in query['bbox'].split(',')]
+        if query['version'] == '1.3.0' and query['crs'] == 'EPSG:4326':
+            bbox = [bbox[1], bbox[0], bbox[3], bbox[2]]
+        width, height = int(query['width']), int(query['height'])
+        dx, dy = (bbox[2] - bbox[0]) / width, (bbox[3] - bbox[1]) / height
+        pixels = [(int((bbox[0] + (i + 0.5) * dx) * 10) % 256, int((BBOX[3] - bbox[3] + (j + 0.5) * dy) * 10), 0)
+                  for j in range(height) for i in range(width)]
+        image = Image.new('RGB', (width, height))
+        image.putdata(pixels)
+        out = BytesIO()
+        image.save(out, 'PNG')
+        return out.getvalue()
+
+
+def get_wms(version, session):
+    filename = {'1.3.0': 'wms_nationalatlas_getcapabilities_130.xml', '1.1.1': 'wms_JPLCapabilities.xml'}[version]
+    with open(resource_file(filename), 'rb') as f:
+        return WebMapService('http://example.org/wms', version=version, xml=f.read(), session=session)
+
+
+def expected_image():
+    image = Image.new('RGB', SIZE)
+    image.putdata([(i % 256, j, 0) for j in range(SIZE[1]) for i in range(SIZE[0])])
+    return image
+
+
+def test_split_getmap():
+    tiles = split_getmap(BBOX, SIZE, (128, 128))
+    assert [tile['index'] for tile in tiles] == [[0, 0], [1, 0], [2, 0], [0, 1], [1, 1], [2, 1]]
+    assert [tile['size'] for tile in tiles[:3]] == [[128, 128], [128, 128], [44, 128]]
+    assert tiles[0]['bbox'] == [0, 20 - 12.8, 12.8, 20]
+    assert tiles[5]['index'] == [2, 1] and tiles[5]['offset'] == [256, 128] and tiles[5]['size'] == [44, 72]
+    assert tiles[5]['bbox'] == pytest.approx([25.6, 0, 30, 7.2])
+
+
+def test_tile_size_limits():
+    wms = get_wms('1.3.0', None)
+    assert (wms.identification.maxwidth, wms.identification.maxheight) == (2048, 2048)
+    assert tile_size_limits(wms) == (2048, 2048)
+    assert tile_size_limits(wms, (4096, 512)) == (2048, 512)
+    assert tile_size_limits(get_wms('1.1.1', None), (4096, 512)) == (4096, 512)
+
+
+@pytest.mark.parametrize('version', ['1.3.0', '1.1.1'])
+def test_wms_getmap_tiled(version):
+    session = MapSession()
+    wms = get_wms(version, session)
+    img = wms.getmap_tiled(layers=['states'], styles=[''], srs='EPSG:4326', bbox=BBOX, size=SIZE,
+                           format='image/png', tile_size=(128, 128), max_workers=3)
+    assert len(session.calls) == 6
+    assert Image.open(img).tobytes() == expected_image().tobytes()
+
+    # the bbox of the requests follows the axis order of the crs
+    top_left = [0.0, 20 - 12.8, 12.8, 20.0]
+    if version == '1.3.0':
+        top_left = [top_left[1], top_left[0], top_left[3], top_left[2]]
+    assert ','.join(repr(v) for v in top_left) in [call['bbox'] for call in session.calls]
+
+
+def test_wms_getmap_tiled_without_pillow(monkeypatch):
+    monkeypatch.setattr(tiling, 'Image', None)
+    session = MapSession()
+    with pytest.raises(ImportError):
+        get_wms('1.3.0', session).getmap_tiled(layers=['states'], styles=[''], srs='EPSG:4326', bbox=BBOX,
+                                               size=SIZE, format='image/png', tile_size=(128, 128))
+    assert session.calls == []
+
+
+def test_wms_getmap_tiled_failure():
+    session = MapSession(fail=('44', '72'))
+    with pytest.raises(IOError):
+        get_wms('1.3.0', session).getmap_tiled(layers=['states'], styles=[''], srs='EPSG:4326', bbox=BBOX,
+                                               size=SIZE, format='image/png', tile_size=(128, 128))
+
+
+def test_wms_getmap_tiled_directory(tmpdir):
+    directory = str(tmpdir.join('tiles'))
+    request = dict(layers=['states'], styles=[''], srs='EPSG:4326', bbox=BBOX, size=SIZE, format='image/png',
+                   tile_size=(128, 128))
+
+    session = MapSession(fail=('44', '72'))
+    with pytest.raises(IOError):
+        get_wms('1.3.0', session).getmap_tiled(directory=directory, max_workers=1, **request)
+
+    session = MapSession()
+    tiles = get_wms('1.3.0', session).getmap_tiled(directory=directory, **request)
+    assert len(session.calls) == 1
+    assert tiles.complete and len(tiles) == 6
+    assert [tile['offset'] for tile in tiles][-1] == [256, 128]
+    assert tiles.assemble(str(tmpdir.join('map.png'))).tobytes() == expected_image().tobytes()
+    assert Image.open(str(tmpdir.join('map.png'))).size == SIZE
+
+    with pytest.raises(ValueError):
+        get_wms('1.3.0', session).getmap_tiled(directory=directory, **dict(request, size=(600, 400)))
@@ -0,0 +1,43 @@
+from collections import OrderedDict
+
+from tests.utils import resource_file
+
+from owslib.map.common import LazyContents
+from owslib.wms import WebMapService
+
+
+def get_wms(version, filename):
+    with open(resource_file(filename), 'rb') as f:
+        return WebMapService('http://example.org/wms', version=version, xml=f.read())
+
+
+def built(contents):
+    """Names of the layers whose content metadata has been built"""
+    values = [OrderedDict.__getitem__(contents, key) for key in contents]
+    return [key for key, value in zip(contents, values) if getattr(value, 'metadata', value) is not None]
+
+
+def test_wms_130_lazy_contents():
+    wms = get_wms('1.3.0', 'wms_nationalatlas_getcapabilities_130.xml')
+    assert isinstance(wms.contents, LazyContents)
+    assert len(wms.contents) == 20
+    assert built(wms.contents) == []
+
+    layer = wms.contents['amtrak1m']
+    # the parent is built with the layer, for the inherited properties
+    assert built(wms.contents) == ['one_million', 'amtrak1m']
+    assert layer.parent is wms.contents['one_million']
+    assert layer.index == '1.2'
+    assert sorted(layer.crsOptions) == sorted(layer.parent.crsOptions)
+    assert layer in layer.parent.children
+    assert [child.id for child in layer.parent.children] == list(wms.contents)[1:20]
+    assert wms.contents.get('missing') is None
+
+
+def test_wms_111_lazy_contents():
+    wms = get_wms('1.1.1', 'wms_JPLCapabilities.xml')
+    assert built(wms.contents) == []
+    assert wms['global_mosaic'].title == 'WMS Global Mosaic, pan sharpened'
+    assert built(wms.contents) == ['global_mosaic']
+    assert dict(wms.items()) == wms.contents
+    assert len(built(wms.contents)) == len(wms.contents)
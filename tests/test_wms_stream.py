@@ -0,0 +1,68 @@
+import pytest
+
+from tests.utils import FakeSession, resource_file
+
+from owslib.util import ServiceException
+from owslib.wms import WebMapService
+
+
+def test_wms_130_stream():
+    with open(resource_file('wms_nationalatlas_getcapabilities_130.xml'), 'rb') as f:
+        xml = f.read()
+    session = FakeSession(xml)
+    wms = WebMapService('http://example.org/wms', version='1.3.0', session=session, stream=True)
+    assert session.calls[0]['stream'] is True
+
+    expected = WebMapService('http://example.org/wms', version='1.3.0', xml=xml)
+    assert list(wms.contents) == list(expected.contents)
+    assert wms.identification.title == expected.identification.title
+    assert [op.name for op in wms.operations] == [op.name for op in expected.operations]
+    assert wms.exceptions == expected.exceptions
+
+    layer = wms['amtrak1m']
+    assert layer.parent is wms['one_million']
+    assert layer.index == '1.2'
+    assert layer.title == expected['amtrak1m'].title
+    assert layer.boundingBoxWGS84 == expected['amtrak1m'].boundingBoxWGS84
+    assert sorted(layer.crsOptions) == sorted(expected['amtrak1m'].crsOptions)
+    assert [child.id for child in wms['one_million'].children] == list(wms.contents)[1:20]
+    assert [child.id for child in wms['one_million'].layers] == list(wms.contents)[1:20]
+
+    # the layer elements are dropped once parsed
+    assert wms._capabilities.findall('.//{http://www.opengis.net/wms}Layer') == []
+
+
+def test_wms_111_stream_xml():
+    with open(resource_file('wms_JPLCapabilities.xml'), 'rb') as f:
+        xml = f.read()
+    wms = WebMapService('http://example.org/wms', version='1.1.1', xml=xml, stream=True)
+    assert len(wms.contents) == 15
+    assert wms['global_mosaic'].title == 'WMS Global Mosaic, pan sharpened'
+    assert wms._capabilities.findall('.//Layer') == []
+
+
+def test_wms_stream_exception_report():
+    session = FakeSession(b"""<?xml version="1.0" encoding="UTF-8"?>
+<ServiceExceptionReport version="1.3.0" xmlns="http://www.opengis.net/ogc">
+<ServiceException code="InvalidFormat">Unknown service</ServiceException>
+</ServiceExceptionReport>""")
+    with pytest.raises(ServiceException, match='Unknown service'):
+        WebMapService('http://example.org/wms', version='1.3.0', session=session, stream=True)
+
+
+def test_wms_stream_xml_string_encoding():
+    with open(resource_file('wms_JPLCapabilities.xml'), 'rb') as f:
+        xml = f.read().decode('utf-8').replace('WMS Global Mosaic', 'WMS Mosaïque globale')
+    xml = '<?xml version="1.0" encoding="ISO-8859-1"?>\n' + xml.split('?>', 1)[1]
+    wms = WebMapService('http://example.org/wms', version='1.1.1', xml=xml, stream=True)
+    assert wms['global_mosaic'].title == 'WMS Mosaïque globale, pan sharpened'
+
+
+def test_wms_stream_bom():
+    with open(resource_file('wms_mesonet-caps-130_bom.xml'), 'rb') as f:
+        xml = f.read()
+    expected = WebMapService('http://example.org/wms', version='1.3.0', xml=xml)
+    wms = WebMapService('http://example.org/wms', version='1.3.0', session=FakeSession(xml), stream=True)
+    assert list(wms.contents) == list(expected.contents)
+    wms = WebMapService('http://example.org/wms', version='1.3.0', xml=xml, stream=True)
+    assert list(wms.contents) == list(expected.contents)
@@ -0,0 +1,85 @@
+from urllib.parse import parse_qs
+
+from tests.utils import FakeSession, resource_file
+
+from owslib.wmts import WebMapTileService
+
+LAYER = 'geonode:LMEs_64'
+
+
+class TileSession(FakeSession):
+    """Return the requested tile indices as tile content"""
+    def __init__(self):
+        super(TileSession, self).__init__(content_type='image/png')
+
+    def describe(self, method, url, params=None, **kwargs):
+        return params
+
+    def respond(self, method, url, params=None, **kwargs):
+        query = {k.lower(): v[0] for k, v in parse_qs(params).items()}
+        return '{tilematrix}/{tilerow}/{tilecol}'.format(**query).encode()
+
+
+def get_wmts(session=None):
+    with open(resource_file('geoserver21-wmts-cap.xml'), 'rb') as f:
+        return WebMapTileService('http://example.org/wmts', xml=f.read(), session=session)
+
+
+def test_wmts_tileindices():
+    wmts = get_wmts()
+    # whole matrix, clipped to the TileMatrixLimits (row 1, columns -1 to 3)
+    assert list(wmts.tileindices(LAYER, 'EPSG:4326', ['EPSG:4326:1'])) == [
+        ('EPSG:4326:1', 1, 0), ('EPSG:4326:1', 1, 1), ('EPSG:4326:1', 1, 2), ('EPSG:4326:1', 1, 3)]
+    # lon/lat bbox, TopLeftCorner in lat/lon order
+    assert list(wmts.tileindices(LAYER, 'EPSG:4326', ['EPSG:4326:1'], bbox=(-180, -90, 0, 0))) == [
+        ('EPSG:4326:1', 1, 0), ('EPSG:4326:1', 1, 1)]
+    assert list(wmts.tileindices(LAYER, 'EPSG:900913', ['EPSG:900913:2'], bbox=(0, 0, 20037508, 20037508))) == [
+        ('EPSG:900913:2', 1, 2), ('EPSG:900913:2', 1, 3)]
+
+
+def test_wmts_tilerange():
+    tm = get_wmts().tilematrixsets['EPSG:4326'].tilematrix['EPSG:4326:3']
+    # 22.5 degree tiles, TopLeftCorner (90, -180) in lat/lon order
+    assert tm.tilerange(None) == (0, 7, 0, 15)
+    assert tm.tilerange((-180, 67.5, -157.5, 90), 111319.49079327358, 'yx') == (0, 0, 0, 0)
+    assert tm.tilerange((-170, 60, -150, 80), 111319.49079327358, 'yx') == (0, 1, 0, 1)
+    assert tm.tilerange((-1000, -1000, 1000, 1000), 111319.49079327358, 'yx') == (0, 7, 0, 15)
+
+
+def test_wmts_gettiles():
+    session = TileSession()
+    wmts = get_wmts(session=session)
+    tiles = list(wmts.gettiles(LAYER, 'EPSG:4326', ['EPSG:4326:1', 'EPSG:4326:2'], max_workers=2))
+    assert sorted(tiles) == sorted(
+        (z, row, col, '{}/{}/{}'.format(z, row, col).encode())
+        for z, row, col in wmts.tileindices(LAYER, 'EPSG:4326', ['EPSG:4326:1', 'EPSG:4326:2']))
+    assert len(session.calls) == len(tiles) == 4 + 24
+    assert all('STYLE=LMEs_64' in call and 'FORMAT=image%2Fpng' in call for call in session.calls)
+
+
+def test_wmts_tilematrixset_crs_uri():
+    # a CRS in the OGC URI encoding, which Crs does not parse
+    xml = b"""<Capabilities xmlns="http://www.opengis.net/wmts/1.0" xmlns:ows="http://www.opengis.net/ows/1.1"
+        version="1.0.0">
+      <Contents>
+        <TileMatrixSet>
+          <ows:Identifier>WorldCRS84Quad</ows:Identifier>
+          <ows:SupportedCRS>http://www.opengis.net/def/crs/OGC/1.3/CRS84</ows:SupportedCRS>
+          <TileMatrix>
+            <ows:Identifier>1</ows:Identifier>
+            <ScaleDenominator>139770566.0071794390678</ScaleDenominator>
+            <TopLeftCorner>-180 90</TopLeftCorner>
+            <TileWidth>256</TileWidth>
+            <TileHeight>256</TileHeight>
+            <MatrixWidth>4</MatrixWidth>
+            <MatrixHeight>2</MatrixHeight>
+          </TileMatrix>
+        </TileMatrixSet>
+      </Contents>
+    </Capabilities>"""
+    tms = WebMapTileService('http://example.org/wmts', xml=xml).tilematrixsets['WorldCRS84Quad']
+    # lon/lat axis order and degrees, from pyproj
+    assert tms.axisorder == 'xy'
+    assert 111319 < tms.metersperunit < 111320
+    # 90 degree tiles, TopLeftCorner (-180, 90) in lon/lat order
+    assert tms.tilematrix['1'].tilerange((-170, 10, -80, 80), tms.metersperunit, tms.axisorder) == (0, 0, 0, 1)
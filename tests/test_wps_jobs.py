@@ -0,0 +1,108 @@
+from concurrent.futures import as_completed, wait
+
+import pytest
+
+from tests.utils import FakeSession, resource_file
+
+from owslib.util import set_session
+from owslib.wps import WebProcessingService, WPSJobManager
+
+with open(resource_file('wps_USGSExecuteResponse1a.xml'), 'rb') as f:
+    STARTED = f.read()
+with open(resource_file('wps_USGSExecuteResponse1b.xml'), 'rb') as f:
+    SUCCEEDED = f.read()
+
+
+def started(percent):
+    return STARTED.replace(b'<ns:ProcessStarted', b'<ns:ProcessStarted percentCompleted="%d"' % percent)
+
+
+class StatusSession(FakeSession):
+    """Serve the status documents of the jobs in turn, keyed on their status location"""
+    def __init__(self, statuses):
+        super(StatusSession, self).__init__()
+        self.statuses = statuses
+
+    def describe(self, method, url, params=None, **kwargs):
+        return params.split('job=')[1]
+
+    def respond(self, method, url, params=None, **kwargs):
+        with self.lock:
+            statuses = self.statuses[self.describe(method, url, params)]
+            content = statuses.pop(0) if len(statuses) > 1 else statuses[0]
+        if isinstance(content, Exception):
+            raise content
+        return content
+
+
+def execute(job):
+    wps = WebProcessingService('http://example.org/wps', skip_caps=True)
+    execution = wps.execute(None, [], request=b'<Execute/>', response=started(0))
+    execution.statusLocation = 'http://example.org/status?job=%s' % job
+    return execution
+
+
+@pytest.fixture
+def session():
+    session = StatusSession({
+        'a': [started(10), started(60), SUCCEEDED],
+        'b': [started(0), started(0), started(0), started(50), SUCCEEDED],
+        'c': [SUCCEEDED]})
+    set_session(session)
+    yield session
+    set_session(None)
+
+
+def test_wps_job_manager(session):
+    completed = []
+    with WPSJobManager(min_interval=0.01, max_interval=0.05) as manager:
+        futures = [manager.submit(execute(job), callback=completed.append) for job in 'abc']
+        results = [future.result(timeout=10) for future in as_completed(futures)]
+    assert all(execution.isSucceded() for execution in results)
+    assert all(b'ProcessSucceeded' in execution.response for execution in results)
+    assert sorted(id(e) for e in completed) == sorted(id(f.execution) for f in futures)
+    assert session.calls.count('b') == 5
+    assert len(manager) == 0
+
+
+def test_wps_job_manager_interval():
+    manager = WPSJobManager(min_interval=1, max_interval=60, backoff=2)
+    try:
+        job = manager.submit(execute('d'))
+        record = next(iter(manager._jobs))
+        assert record.future is job
+        # no progress: exponential backoff
+        assert manager._interval(record) == 2
+        record.interval = 40
+        assert manager._interval(record) == 60
+        # progress: halfway to the expected completion
+        record.progressed -= 10
+        record.execution.percentCompleted = 20
+        assert 19.9 < manager._interval(record) < 20.1
+        assert record.progress == 20
+    finally:
+        manager.shutdown(wait=False)
+    assert job.cancelled()
+    assert job in wait([job], timeout=1).done
+
+
+def test_wps_job_manager_cancel(session):
+    with WPSJobManager(min_interval=0.01, max_interval=0.01) as manager:
+        job = manager.submit(execute('c'))
+        assert job.cancel()
+        assert manager.wait(timeout=10)
+    assert job.cancelled()
+    assert job in wait([job], timeout=1).done
+    assert session.calls == ['c']
+
+
+def test_wps_job_manager_errors():
+    set_session(StatusSession({'e': [IOError('unreachable')]}))
+    try:
+        with WPSJobManager(min_interval=0.01, max_interval=0.01, max_errors=3) as manager:
+            job = manager.submit(execute('e'))
+            manager.wait(timeout=10)
+        with pytest.raises(IOError):
+            job.result()
+    finally:
+        set_session(None)
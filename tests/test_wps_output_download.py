@@ -0,0 +1,191 @@
+import re
+
+import pytest
+
+from tests.utils import FakeRaw, FakeResponse, FakeSession, resource_file
+
+from owslib.util import set_session
+from owslib.wps import WebProcessingService
+
+FILES = {
+    'result.nc': bytes(range(256)) * 1000,
+    'log.txt': b'done\n' * 100,
+}
+
+OUTPUTS = b"""<ns:ProcessOutputs>
+    <ns:Output>
+      <ns1:Identifier xmlns:ns1="http://www.opengis.net/ows/1.1">output</ns1:Identifier>
+      <ns:Reference mimeType="application/x-netcdf" href="http://example.org/outputs/result.nc"/>
+    </ns:Output>
+    <ns:Output>
+      <ns1:Identifier xmlns:ns1="http://www.opengis.net/ows/1.1">log</ns1:Identifier>
+      <ns:Reference mimeType="text/plain" href="http://example.org/outputs/log.txt"/>
+    </ns:Output>
+    <ns:Output>
+      <ns1:Identifier xmlns:ns1="http://www.opengis.net/ows/1.1">count</ns1:Identifier>
+      <ns:Data><ns:LiteralData>42</ns:LiteralData></ns:Data>
+    </ns:Output>
+  </ns:ProcessOutputs>"""
+
+
+class InterruptedRaw(FakeRaw):
+    """Body of a response whose connection is lost after size bytes"""
+    def __init__(self, content, size):
+        super(InterruptedRaw, self).__init__(content[:size])
+
+    def read(self, size=-1):
+        data = super(InterruptedRaw, self).read(size)
+        if not data:
+            raise IOError('connection lost')
+        return data
+
+
+class OutputSession(FakeSession):
+    """Serve files (FILES by default) with an ETag, honouring Range headers (when ranges is True) whose
+    If-Range matches it, and losing the connection of the next response after interrupt bytes"""
+    def __init__(self, ranges=True):
+        super(OutputSession, self).__init__(content_type='application/octet-stream')
+        self.ranges = ranges
+        self.files = dict(FILES)
+        self.etag = '"v1"'
+        self.interrupt = None
+
+    def describe(self, method, url, headers=None, stream=False, **kwargs):
+        return url, headers.get('Range'), headers.get('If-Range'), stream
+
+    def respond(self, method, url, params=None, headers=None, **kwargs):
+        content = self.files[re.split(r'[/\\=]', params or url)[-1]]
+        response_headers = {'Content-Type': self.content_type}
+        if self.etag:
+            response_headers['ETag'] = self.etag
+        match = re.match(r'bytes=(\d+)-', headers.get('Range', ''))
+        if self.ranges and match and headers.get('If-Range') == self.etag:
+            start = int(match.group(1))
+            if start >= len(content):
+                response_headers['Content-Range'] = 'bytes */%d' % len(content)
+                return FakeResponse(url, b'', 416, response_headers)
+            response_headers['Content-Range'] = 'bytes %d-%d/%d' % (start, len(content) - 1, len(content))
+            response = FakeResponse(url, content[start:], 206, response_headers)
+        else:
+            response = FakeResponse(url, content, 200, response_headers)
+        if self.interrupt is not None:
+            response.raw, self.interrupt = InterruptedRaw(response.content, self.interrupt), None
+        return response
+
+
+def get_execution(session=None):
+    with open(resource_file('wps_USGSExecuteResponse1b.xml'), 'rb') as f:
+        response = f.read()
+    response = re.sub(rb'<ns:ProcessOutputs>.*</ns:ProcessOutputs>', OUTPUTS, response, flags=re.S)
+    wps = WebProcessingService('http://example.org/wps', skip_caps=True, session=session)
+    return wps.execute(None, [], request=b'<Execute/>', response=response)
+
+
+@pytest.fixture
+def execution():
+    return get_execution()
+
+
+def use_session(session):
+    set_session(session)
+    return session
+
+
+@pytest.fixture(autouse=True)
+def reset_session():
+    yield
+    set_session(None)
+
+
+def test_wps_get_outputs(execution, tmpdir):
+    session = use_session(OutputSession())
+    paths = execution.getOutputs(directory=str(tmpdir), max_workers=2)
+    assert paths == {'output': str(tmpdir.join('result.nc')), 'log': str(tmpdir.join('log.txt')),
+                     'count': str(tmpdir.join('count'))}
+    assert tmpdir.join('result.nc').read_binary() == FILES['result.nc']
+    assert tmpdir.join('log.txt').read_binary() == FILES['log.txt']
+    assert tmpdir.join('count').read_binary() == b'42'
+    assert all(stream for url, range_, if_range, stream in session.calls)
+
+    paths = execution.getOutputs(directory=str(tmpdir), identifiers=['log'])
+    assert list(paths) == ['log']
+
+
+@pytest.mark.parametrize('ranges', [True, False])
+def test_wps_output_download_resume(execution, tmpdir, ranges):
+    session = use_session(OutputSession(ranges=ranges))
+    path = str(tmpdir.join('result.nc'))
+    session.interrupt = 1000
+    with pytest.raises(IOError):
+        execution.processOutputs[0].download(path, chunk_size=4096)
+    assert tmpdir.join('result.nc.part').size() == 1000
+
+    assert execution.processOutputs[0].download(path, chunk_size=4096) == path
+    assert tmpdir.join('result.nc').read_binary() == FILES['result.nc']
+    assert tmpdir.listdir() == [tmpdir.join('result.nc')]
+    assert session.calls[1] == ('http://example.org/outputs/result.nc', 'bytes=1000-', '"v1"', True)
+
+
+def test_wps_output_download_complete_part(execution, tmpdir):
+    session = use_session(OutputSession())
+    session.interrupt = len(FILES['log.txt'])
+    with pytest.raises(IOError):
+        execution.processOutputs[1].download(str(tmpdir.join('log.txt')))
+    execution.processOutputs[1].download(str(tmpdir.join('log.txt')))
+    assert tmpdir.join('log.txt').read_binary() == FILES['log.txt']
+
+    # a part that does not match the file is downloaded again
+    tmpdir.join('log.txt.part').write_binary(b'x' * 1000)
+    execution.processOutputs[1].download(str(tmpdir.join('log.txt')))
+    assert tmpdir.join('log.txt').read_binary() == FILES['log.txt']
+
+
+@pytest.mark.parametrize('etag', ['"v2"', None])
+def test_wps_output_download_other_part(execution, tmpdir, etag):
+    session = use_session(OutputSession())
+    path = str(tmpdir.join('log.txt'))
+    if etag is None:  # without validators, a part is never resumed
+        session.etag = None
+    session.interrupt = 100
+    with pytest.raises(IOError):
+        execution.processOutputs[1].download(path)
+
+    # the part was read from the output of another execution
+    session.files['log.txt'] = b'other\n' * 100
+    session.etag = etag
+    execution.processOutputs[1].download(path)
+    assert tmpdir.join('log.txt').read_binary() == b'other\n' * 100
+    assert tmpdir.listdir() == [tmpdir.join('log.txt')]
+
+
+@pytest.mark.parametrize('name', ['../../log.txt', '/tmp/log.txt', '..\\log.txt'])
+def test_wps_get_outputs_file_name(execution, tmpdir, name):
+    use_session(OutputSession())
+    directory = tmpdir.mkdir('a').mkdir('outputs')
+    execution.processOutputs[1].reference = 'http://example.org/outputs?file=%s' % name
+    paths = execution.getOutputs(directory=str(directory), identifiers=['log'])
+    assert paths == {'log': str(directory.join('log.txt'))}
+    assert directory.join('log.txt').read_binary() == FILES['log.txt']
+    assert not tmpdir.join('log.txt').exists()
+
+    execution.processOutputs[1].reference = 'http://example.org/outputs?file=..'
+    with pytest.raises(ValueError):
+        execution.getOutputs(directory=str(tmpdir), identifiers=['log'])
+
+
+def test_wps_get_output(execution, tmpdir, monkeypatch):
+    use_session(OutputSession())
+    monkeypatch.chdir(tmpdir)
+    execution.getOutput()
+    assert tmpdir.join('result.nc').read_binary() == FILES['result.nc']
+    execution.getOutput(identifier='count')
+    assert tmpdir.join('wps.out').read_binary() == b'42'
+
+
+def test_wps_outputs_session(tmpdir):
+    session = OutputSession()
+    execution = get_execution(session)
+    assert execution.session is session
+    execution.getOutputs(directory=str(tmpdir), identifiers=['log'])
+    assert execution.processOutputs[1].retrieveData(session=session) == FILES['log.txt']
+    assert [call[0] for call in session.calls] == ['http://example.org/outputs/log.txt'] * 2
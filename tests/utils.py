@@ -1,6 +1,9 @@
+import io
+import json
 import logging
 import os
 import sys
+import threading
 import requests
 from owslib.etree import etree, ElementType
 from urllib.parse import urlparse
@@ -95,3 +98,79 @@ def service_ok(url, timeout=5):
     except Exception:
         ok = False
     return ok
+
+
+class FakeRaw(io.BytesIO):
+    """Body of a streamed FakeResponse, handing out at most chunk_size bytes per read"""
+    def __init__(self, content, chunk_size=None):
+        super(FakeRaw, self).__init__(content)
+        self.chunk_size = chunk_size
+
+    def read(self, size=-1):
+        if self.chunk_size is not None and (size is None or size < 0 or size > self.chunk_size):
+            size = self.chunk_size
+        return super(FakeRaw, self).read(size)
+
+
+class FakeResponse(object):
+    """Stand-in for a requests.Response, holding content whole (content, text, json) and
+    streaming it (raw, iter_content) in pieces of at most chunk_size bytes when given"""
+    def __init__(self, url, content=b'', status_code=200, headers=None, chunk_size=None):
+        self.url = url
+        self.status_code = status_code
+        self.headers = dict({'Content-Type': 'text/xml'}, **(headers or {}))
+        self.content = content
+        self.chunk_size = chunk_size
+        self.raw = FakeRaw(content, chunk_size)
+        self.closed = False
+
+    @property
+    def text(self):
+        return self.content.decode('utf-8')
+
+    def json(self):
+        return json.loads(self.text)
+
+    def iter_content(self, chunk_size=1):
+        chunk_size = self.chunk_size or chunk_size
+        for i in range(0, len(self.content), chunk_size):
+            yield self.content[i:i + chunk_size]
+
+    def close(self):
+        self.closed = True
+
+
+class FakeSession(object):
+    """Stand-in for a requests.Session, answering every request with respond()
+
+    Tests serving more than a fixed content override respond(method, url, **kwargs), returning a
+    FakeResponse or its content, and describe(method, url, **kwargs), which returns what calls
+    records of a request.  Requests may come from several threads at a time.
+    """
+    def __init__(self, content=b'', content_type='text/xml', chunk_size=None):
+        self.content = content
+        self.content_type = content_type
+        self.chunk_size = chunk_size
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def respond(self, method, url, **kwargs):
+        return self.content
+
+    def describe(self, method, url, **kwargs):
+        return dict(kwargs, method=method, url=url)
+
+    def request(self, method, url, **kwargs):
+        with self.lock:
+            self.calls.append(self.describe(method, url, **kwargs))
+        response = self.respond(method, url, **kwargs)
+        if not isinstance(response, FakeResponse):
+            response = FakeResponse(url, response, headers={'Content-Type': self.content_type},
+                                    chunk_size=self.chunk_size)
+        return response
+
+    def get(self, url, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url, data=None, **kwargs):
+        return self.request('POST', url, data=data, **kwargs)